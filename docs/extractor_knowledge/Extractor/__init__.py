@@ -10,7 +10,7 @@ from v0min.matching_extract import (
     matching_schema_template,
     save_matching_report,
 )
-from v0min.varshaphal_extract import compute_varshaphal_snapshot
+from v0min.varshaphal_extract import compute_varshaphal_snapshot, compute_varshaphal_snapshots
 
 __all__ = [
     "BirthContext",
@@ -24,4 +24,5 @@ __all__ = [
     "save_matching_report",
     "matching_schema_template",
     "compute_varshaphal_snapshot",
+    "compute_varshaphal_snapshots",
 ]
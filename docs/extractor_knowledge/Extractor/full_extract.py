@@ -19,7 +19,7 @@ from v0min import panchanga_calendar_extract
 from v0min.strength import compute_strength_all
 from v0min.aspect_engine import compute_aspects_for_varga
 from v0min.varshaphal_extract import (
-    compute_varshaphal_snapshot,
+    compute_varshaphal_snapshots,
     compute_varshaphal_subperiods,
 )
 from v0min.dosha_extract import compute_dosha_block
@@ -446,9 +446,8 @@ def build_full_pyjhora_payload(
         include_sixty_hour = bool(varshaphal_cfg.get("include_sixty_hour"))
         maasa_months = varshaphal_cfg.get("maasa_months")
         sixty_indices = varshaphal_cfg.get("sixty_indices")
-        for year_value in years:
-            year_int = int(year_value)
-            snapshot = compute_varshaphal_snapshot(base_context, year_int)
+        snapshots = compute_varshaphal_snapshots(base_context, [int(year) for year in years])
+        for year_int, snapshot in snapshots.items():
             needs_maasa = include_maasa or bool(maasa_months)
             needs_sixty = include_sixty_hour or bool(sixty_indices)
             if needs_maasa or needs_sixty:
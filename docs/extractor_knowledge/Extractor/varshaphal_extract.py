@@ -2,12 +2,12 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterable, List, Optional
 
-from jhora import const, utils
-from jhora.horoscope.chart import charts
+from jhora import utils
 from jhora.horoscope.dhasa.annual import mudda
 from jhora.horoscope.dhasa.raasi import narayana as narayana_raasi
-from jhora.horoscope.transit import saham, tajaka
+from jhora.horoscope.transit import tajaka
 from jhora.panchanga import drik
+from refraction_engine.varshaphal import ITHASALA_TYPES, SAHAM_NAMES, AnnualChartTable, annual_chart_table
 
 from v0min.core_time import BirthContext
 
@@ -43,48 +43,66 @@ def compute_varshaphal_snapshot(
     Build a JSON-friendly snapshot of the annual Varshaphal/Tajaka chart.
     """
 
-    bc, place, years_from_dob = _prepare_base_context(context, year)
-    ayanamsa_mode = (context.get("ayanamsa_mode") or "LAHIRI").upper()
+    return compute_varshaphal_snapshots(context, [year], include=include)[year]
+
 
+def compute_varshaphal_snapshots(
+    context: Dict[str, Any],
+    years: Iterable[int],
+    include: Optional[Iterable[str]] = None,
+) -> Dict[int, Dict[str, Any]]:
+    """
+    Snapshots for several years from one batched annual chart table.
+    """
+
+    year_list = [int(year) for year in years]
+    if not year_list:
+        return {}
+    bases = [_prepare_base_context(context, year) for year in year_list]
+    bc, place, _ = bases[0]
+    ayanamsa_mode = (context.get("ayanamsa_mode") or "LAHIRI").upper()
     include_set = _OPTIONAL_KEYS if include is None else {item.lower() for item in include}
 
-    # Annual chart + return timing
-    chart_positions, _ = tajaka.varsha_pravesh(
+    table = annual_chart_table(
         bc.jd_local,
         place,
-        divisional_chart_factor=1,
-        years=years_from_dob,
+        [years_from_dob for _, _, years_from_dob in bases],
+        ayanamsa_mode=ayanamsa_mode,
+        ayanamsa_value=context.get("ayanamsa_value"),
     )
-    return_jd = drik.next_solar_date(bc.jd_local, place, years=years_from_dob)
-    ret_year, ret_month, ret_day, fh = utils.jd_to_gregorian(return_jd)
-    time_str = utils.to_dms(fh, as_string=True)
-    return_datetime_local = f"{ret_year:04d}-{ret_month:02d}-{ret_day:02d}T{time_str}"
-    night_time_birth = _is_night_time(return_jd, fh, place)
-
-    chart_block = _build_chart_block(chart_positions)
-    muntha_block = _build_muntha_block(chart_positions, chart_block, years_from_dob)
-    varshesh_block = _build_varshesh_block(bc.jd_local, place, years_from_dob, ayanamsa_mode)
-
-    snapshot: Dict[str, Any] = {
-        "schema_version": "varshaphal.v1",
-        "year": year,
-        "years_from_birth": years_from_dob,
-        "return_datetime_local": return_datetime_local,
-        "return_jd_local": return_jd,
-        "ayanamsa_mode": ayanamsa_mode,
-        "chart": chart_block,
-        "varshesh": varshesh_block,
-        "muntha": muntha_block,
-    }
+    snapshots: Dict[int, Dict[str, Any]] = {}
+    for row, (year, (_, _, years_from_dob)) in enumerate(zip(year_list, bases)):
+        chart_positions = table.planet_positions(row)
+        return_jd = float(table.return_jd_local[row])
+        ret_year, ret_month, ret_day, fh = utils.jd_to_gregorian(return_jd)
+        time_str = utils.to_dms(fh, as_string=True)
+        return_datetime_local = f"{ret_year:04d}-{ret_month:02d}-{ret_day:02d}T{time_str}"
 
-    if "sahams" in include_set:
-        snapshot["sahams"] = _compute_sahams(chart_positions, night_time_birth)
-    if "dashas" in include_set:
-        snapshot["dashas"] = _compute_dashas(context, years_from_dob)
-    if "tajaka_aspects" in include_set:
-        snapshot["tajaka_aspects"] = _compute_tajaka_aspects(chart_positions)
+        chart_block = _build_chart_block(chart_positions)
+        muntha_block = _build_muntha_block(int(table.muntha[row]), chart_block)
+        varshesh_block = _build_varshesh_block(int(table.lords[row]))
+
+        snapshot: Dict[str, Any] = {
+            "schema_version": "varshaphal.v1",
+            "year": year,
+            "years_from_birth": years_from_dob,
+            "return_datetime_local": return_datetime_local,
+            "return_jd_local": return_jd,
+            "ayanamsa_mode": ayanamsa_mode,
+            "chart": chart_block,
+            "varshesh": varshesh_block,
+            "muntha": muntha_block,
+        }
 
-    return snapshot
+        if "sahams" in include_set:
+            snapshot["sahams"] = _build_saham_entries(table.sahams[row])
+        if "dashas" in include_set:
+            snapshot["dashas"] = _compute_dashas(context, years_from_dob)
+        if "tajaka_aspects" in include_set:
+            snapshot["tajaka_aspects"] = _compute_tajaka_aspects(table, row)
+        snapshots[year] = snapshot
+
+    return snapshots
 
 
 def compute_maasa_snapshots(
@@ -209,10 +227,7 @@ def _angle_to_dict(sign_idx: float, degrees_in_sign: float) -> Dict[str, Any]:
     }
 
 
-def _build_muntha_block(chart_positions: List, chart_block: Dict[str, Any], years_from_dob: int) -> Dict[str, Any]:
-    p_to_h = utils.get_planet_house_dictionary_from_planet_positions(chart_positions)
-    asc_house_idx = p_to_h[const._ascendant_symbol]
-    muntha_idx = tajaka.muntha_house(asc_house_idx, years_from_dob) % 12
+def _build_muntha_block(muntha_idx: int, chart_block: Dict[str, Any]) -> Dict[str, Any]:
     lagna_sign_index = chart_block["lagna"]["sign_index"]
     muntha_sign_index = (lagna_sign_index + muntha_idx) % 12
     return {
@@ -223,13 +238,7 @@ def _build_muntha_block(chart_positions: List, chart_block: Dict[str, Any], year
     }
 
 
-def _build_varshesh_block(
-    jd_at_dob: float,
-    place: drik.Place,
-    years_from_dob: int,
-    ayanamsa_mode: str,
-) -> Dict[str, Any]:
-    planet_idx = _safe_lord_of_year(jd_at_dob, place, years_from_dob, ayanamsa_mode)
+def _build_varshesh_block(planet_idx: int) -> Dict[str, Any]:
     planet_name = _PLANET_NAMES[planet_idx] if planet_idx < len(_PLANET_NAMES) else str(planet_idx)
     return {
         "planet_id": planet_idx,
@@ -237,17 +246,10 @@ def _build_varshesh_block(
     }
 
 
-def _compute_sahams(chart_positions: List, night_time_birth: bool) -> List[Dict[str, Any]]:
+def _build_saham_entries(values: Iterable[float]) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
-    for saham_name in getattr(const, "_saham_list", []):
-        func_name = f"{saham_name}_saham"
-        fn = getattr(saham, func_name, None)
-        if fn is None:
-            continue
-        try:
-            value = fn(chart_positions, night_time_birth=night_time_birth)
-        except TypeError:
-            value = fn(chart_positions)
+    for saham_name, value in zip(SAHAM_NAMES, values):
+        value = float(value)
         sign_index = int(value // 30) % 12
         deg_in_sign = value % 30.0
         results.append(
@@ -315,27 +317,24 @@ def _compute_dashas(context: Dict[str, Any], years_from_dob: int) -> Dict[str, A
     }
 
 
-def _compute_tajaka_aspects(chart_positions: List) -> Dict[str, Any]:
-    house_planets = utils.get_house_planet_list_from_planet_positions(chart_positions)
+def _compute_tajaka_aspects(table: AnnualChartTable, row: int) -> Dict[str, Any]:
     benefic: Dict[str, Any] = {}
     malefic: Dict[str, Any] = {}
     for planet_id in range(0, min(7, len(_PLANET_NAMES))):
-        bah, _ = tajaka.benefic_aspects_of_the_planet(house_planets, planet_id)
-        mah, _ = tajaka.malefic_aspects_of_the_planet(house_planets, planet_id)
-        benefic[_PLANET_NAMES[planet_id]] = _format_house_entries(bah)
-        malefic[_PLANET_NAMES[planet_id]] = _format_house_entries(mah)
+        benefic[_PLANET_NAMES[planet_id]] = _format_house_entries(table.benefic_aspects[row, planet_id].tolist())
+        malefic[_PLANET_NAMES[planet_id]] = _format_house_entries(table.malefic_aspects[row, planet_id].tolist())
 
     ithasala = []
     for p1 in range(0, 7):
         for p2 in range(p1 + 1, 7):
-            match, ithasala_type = tajaka.both_planets_within_their_deeptamsa(chart_positions, p1, p2)
-            if not match:
+            ithasala_type = int(table.ithasala[row, p1, p2])
+            if not ithasala_type:
                 continue
             ithasala.append(
                 {
                     "planet1": _PLANET_NAMES[p1],
                     "planet2": _PLANET_NAMES[p2],
-                    "ithasala_type": _ithasala_label(ithasala_type),
+                    "ithasala_type": ITHASALA_TYPES[ithasala_type],
                 }
             )
     return {
@@ -359,24 +358,6 @@ def _format_house_entries(indices: Iterable[int]) -> List[Dict[str, Any]]:
     return entries
 
 
-def _ithasala_label(ithasala_type: Optional[int]) -> Optional[str]:
-    return {
-        1: "VARTHAMANA",
-        2: "POORNA",
-        3: "BHAVISHYA",
-    }.get(ithasala_type)
-
-
-def _is_night_time(jd_local: float, fh: float, place: drik.Place) -> bool:
-    sunrise_str = drik.sunrise(jd_local, place)[1]
-    sunset_str = drik.sunset(jd_local, place)[1]
-    sunrise_components = utils.from_dms_str_to_dms(sunrise_str)
-    sunset_components = utils.from_dms_str_to_dms(sunset_str)
-    sunrise_hours = sunrise_components[0] + sunrise_components[1] / 60.0 + sunrise_components[2] / 3600.0
-    sunset_hours = sunset_components[0] + sunset_components[1] / 60.0 + sunset_components[2] / 3600.0
-    return fh < sunrise_hours or fh > sunset_hours
-
-
 def _prepare_base_context(context: Dict[str, Any], year: int) -> tuple[BirthContext, drik.Place, int]:
     bc: BirthContext = context["birth_context"]
     years_from_dob = year - bc.dt_local.year
@@ -386,49 +367,9 @@ def _prepare_base_context(context: Dict[str, Any], year: int) -> tuple[BirthCont
     return bc, place, years_from_dob
 
 
-def _safe_lord_of_year(
-    jd_at_dob: float,
-    place: drik.Place,
-    years_from_dob: int,
-    ayanamsa_mode: str,
-) -> int:
-    try:
-        return tajaka.lord_of_the_year(jd_at_dob, place, years_from_dob)
-    except KeyError:
-        return _fallback_lord_of_year(jd_at_dob, place, years_from_dob, ayanamsa_mode)
-
-
-def _fallback_lord_of_year(
-    jd_at_dob: float,
-    place: drik.Place,
-    years_from_dob: int,
-    ayanamsa_mode: str,
-) -> int:
-    natal_chart = charts.divisional_chart(
-        jd_at_dob,
-        place,
-        ayanamsa_mode=ayanamsa_mode,
-        divisional_chart_factor=1,
-    )
-    natal_p_to_h = utils.get_planet_house_dictionary_from_planet_positions(natal_chart)
-    natal_lagna_house = natal_p_to_h[const._ascendant_symbol]
-    jd_at_years = drik.next_solar_date(jd_at_dob, place, years=years_from_dob)
-    tob_hours = utils.jd_to_gregorian(jd_at_years)[3]
-    night_time_birth = _is_night_time(jd_at_years, tob_hours, place)
-    annual_chart = charts.divisional_chart(
-        jd_at_years,
-        place,
-        ayanamsa_mode=ayanamsa_mode,
-        divisional_chart_factor=1,
-    )
-    candidates = tajaka._get_lord_candidates(annual_chart, years_from_dob, natal_lagna_house, night_time_birth)
-    filtered = [candidate for candidate in candidates if isinstance(candidate, int) and 0 <= candidate < 7]
-    candidates_to_use = filtered or [candidate for candidate in candidates if isinstance(candidate, int)] or [0]
-    return tajaka._get_the_lord_of_tajaka_chart(jd_at_years, place, candidates_to_use)
-
-
 __all__ = [
     "compute_varshaphal_snapshot",
+    "compute_varshaphal_snapshots",
     "compute_maasa_snapshots",
     "compute_sixty_hour_snapshots",
     "compute_varshaphal_subperiods",
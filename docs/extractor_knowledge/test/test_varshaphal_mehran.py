@@ -6,6 +6,10 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+import pytest
+from jhora import const, utils
+from jhora.horoscope.chart import charts
+from jhora.horoscope.transit import tajaka
 from jhora.panchanga import drik
 
 from v0min.core_time import BirthContext, make_birth_context
@@ -14,6 +18,7 @@ from v0min.varshaphal_extract import (
     compute_maasa_snapshots,
     compute_sixty_hour_snapshots,
     compute_varshaphal_snapshot,
+    compute_varshaphal_snapshots,
 )
 
 
@@ -52,6 +57,88 @@ def test_varshaphal_snapshot_structure() -> None:
     assert snapshot["tajaka_aspects"]["benefic_aspects"]
 
 
+@pytest.fixture
+def restore_ayanamsa():
+    mode, value = const._DEFAULT_AYANAMSA_MODE, drik._ayanamsa_value
+    yield
+    drik.set_ayanamsa_mode(mode, value)
+
+
+def _absolute(sign_and_degrees) -> float:
+    sign, degrees = sign_and_degrees
+    return sign * 30.0 + degrees
+
+
+def test_varshaphal_years_from_birth_are_varsha_pravesh_years() -> None:
+    ctx = _make_context()
+    bc, place = ctx["birth_context"], ctx["place"]
+    snapshots = compute_varshaphal_snapshots(ctx, [1997, 1998, 2025], include=[])
+    for year, snapshot in snapshots.items():
+        years_from_dob = year - 1997
+        assert snapshot["years_from_birth"] == years_from_dob
+        expected_jd = drik.next_solar_date(bc.jd_local, place, years=years_from_dob)
+        assert snapshot["return_jd_local"] == pytest.approx(expected_jd, abs=2e-5)
+        chart, _ = tajaka.varsha_pravesh(bc.jd_local, place, years=years_from_dob)
+        assert snapshot["chart"]["lagna"]["sign_index"] == chart[0][1][0]
+        assert [entry["sign_index"] for entry in snapshot["chart"]["planets"].values()] == [
+            sign for _, (sign, _) in chart[1:10]
+        ]
+    assert snapshots[1998]["return_jd_local"] == pytest.approx(bc.jd_local)
+    with pytest.raises(ValueError):
+        compute_varshaphal_snapshot(ctx, 1996)
+
+
+def test_varshaphal_lord_and_aspects_match_tajaka(monkeypatch) -> None:
+    # Uranus..Pluto in PyJHora charts would match the Moon in its string aspect lookups.
+    monkeypatch.setattr(drik, "planet_list", drik.planet_list[:9])
+    ctx = _make_context()
+    bc, place = ctx["birth_context"], ctx["place"]
+    years = list(range(2000, 2030))
+    snapshots = compute_varshaphal_snapshots(ctx, years, include=["tajaka_aspects"])
+    compared = 0
+    for year in years:
+        snapshot = snapshots[year]
+        try:
+            lord = tajaka.lord_of_the_year(bc.jd_local, place, year - 1997)
+        except KeyError:  # PyJHora has no pancha vargeeya bala for the nodes
+            lord = None
+        if lord is not None:
+            assert snapshot["varshesh"]["planet_id"] == lord
+            compared += 1
+        chart, _ = tajaka.varsha_pravesh(bc.jd_local, place, years=year - 1997)
+        house_planets = utils.get_house_planet_list_from_planet_positions(chart)
+        aspects = snapshot["tajaka_aspects"]
+        for planet_id, name in enumerate(["Sun", "Moon", "Mars", "Mercury", "Jupiter", "Venus", "Saturn"]):
+            benefic, _ = tajaka.benefic_aspects_of_the_planet(house_planets, planet_id)
+            malefic, _ = tajaka.malefic_aspects_of_the_planet(house_planets, planet_id)
+            assert [entry["house_index"] for entry in aspects["benefic_aspects"][name]] == benefic
+            assert [entry["house_index"] for entry in aspects["malefic_aspects"][name]] == malefic
+        pairs = {
+            (p1, p2): ithasala_type
+            for p1 in range(7)
+            for p2 in range(p1 + 1, 7)
+            for match, ithasala_type in [tajaka.both_planets_within_their_deeptamsa(chart, p1, p2)]
+            if match
+        }
+        assert len(aspects["ithasala"]) == len(pairs)
+    assert compared >= len(years) // 2
+
+
+def test_varshaphal_snapshot_uses_context_ayanamsa(restore_ayanamsa) -> None:
+    lahiri = compute_varshaphal_snapshot(_make_context(), 2025, include=[])
+    ctx = dict(_make_context(), ayanamsa_mode="RAMAN")
+    bc, place = ctx["birth_context"], ctx["place"]
+    raman = compute_varshaphal_snapshot(ctx, 2025, include=[])
+    assert raman["ayanamsa_mode"] == "RAMAN"
+    natal_sun = _absolute(charts.rasi_chart(bc.jd_local, place, ayanamsa_mode="RAMAN")[1][1])
+    assert raman["chart"]["planets"]["Sun"]["absolute_deg"] == pytest.approx(natal_sun, abs=1e-3)
+    annual = charts.rasi_chart(raman["return_jd_local"], place, ayanamsa_mode="RAMAN")
+    assert raman["chart"]["lagna"]["absolute_deg"] == pytest.approx(_absolute(annual[0][1]), abs=1e-3)
+    # Raman's ayanamsa is about 1.4 degrees below Lahiri's.
+    shift = (raman["chart"]["planets"]["Sun"]["absolute_deg"] - lahiri["chart"]["planets"]["Sun"]["absolute_deg"]) % 360
+    assert 0.5 < shift < 5.0
+
+
 def test_full_extract_varshaphal_gate() -> None:
     bc = _make_birth_context()
     payload_no_varshaphal = build_full_pyjhora_payload(bc, person="Mehran", location_name="Tehran")
@@ -0,0 +1,321 @@
+"""Benchmark harness for Refraction Engine extractors and PyJHora hot paths.
+
+Runs every case over the fixtures in ``references/in`` plus a deterministic set
+of synthetic births, records latency percentiles, throughput and peak traced
+memory to JSON, and optionally compares the run against a stored baseline.
+
+    python scripts/benchmark_suite.py --synthetic 1000 --output bench.json
+    python scripts/benchmark_suite.py --baseline references/benchmarks/baseline.json
+    python scripts/benchmark_suite.py --update-baseline
+
+The exit status is 1 when any metric regresses past its threshold.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone as dt_timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+import pytz  # noqa: E402
+from jhora import utils  # noqa: E402
+from jhora.horoscope.chart import charts, strength, yoga  # noqa: E402
+from jhora.panchanga import drik, vratha  # noqa: E402
+
+from refraction_engine import (  # noqa: E402
+    run_core_chart,
+    run_dashas_vimshottari,
+    run_panchanga,
+    run_refraction_core,
+    run_special_points,
+    run_strengths,
+    run_yogas,
+)
+
+FIXTURE_DIR = ROOT_DIR / "references" / "in"
+DEFAULT_BASELINE = ROOT_DIR / "references" / "benchmarks" / "baseline.json"
+BENCHMARK_SCHEMA_VERSION = "benchmark_report_v1"
+PERCENTILES = (50, 90, 95, 99)
+# Relative slack before a metric counts as a regression.
+DEFAULT_THRESHOLDS = {"latency": 0.20, "throughput": 0.20, "memory": 0.25}
+MEMORY_SAMPLE = 20
+FESTIVAL_WINDOW_DAYS = 7
+
+EXTRACTORS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "run_core_chart": run_core_chart,
+    "run_panchanga": run_panchanga,
+    "run_dashas_vimshottari": run_dashas_vimshottari,
+    "run_strengths": run_strengths,
+    "run_yogas": run_yogas,
+    "run_special_points": run_special_points,
+    "run_refraction_core": run_refraction_core,
+}
+
+
+def _jd_and_place(payload: Dict[str, Any]) -> Tuple[float, drik.Place]:
+    birth = payload["birth"]
+    local = datetime.fromisoformat(birth["datetime_local"])
+    aware = pytz.timezone(birth["timezone_name"]).localize(local)
+    offset = aware.utcoffset().total_seconds() / 3600.0
+    jd = utils.julian_day_number(
+        drik.Date(local.year, local.month, local.day),
+        (local.hour, local.minute, local.second),
+    )
+    location = birth["location"]
+    place = drik.Place(location.get("name") or "Benchmark", float(location["lat"]), float(location["lon"]), offset)
+    return jd, place
+
+
+def _festivals(payload: Dict[str, Any]) -> Any:
+    jd, place = _jd_and_place(payload)
+    start = utils.jd_to_gregorian(jd)
+    end = utils.jd_to_gregorian(jd + FESTIVAL_WINDOW_DAYS - 1)
+    return vratha.get_festivals_between_the_dates(
+        drik.Date(*start[:3]), drik.Date(*end[:3]), place
+    )
+
+
+HOT_PATHS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "charts.rasi_chart": lambda payload: charts.rasi_chart(*_jd_and_place(payload)),
+    "strength.shad_bala": lambda payload: strength.shad_bala(*_jd_and_place(payload)),
+    "yoga.get_yoga_details_for_all_charts": lambda payload: yoga.get_yoga_details_for_all_charts(
+        *_jd_and_place(payload)
+    ),
+    "drik.tithi": lambda payload: drik.tithi(*_jd_and_place(payload)),
+    "vratha.get_festivals_between_the_dates": _festivals,
+}
+
+
+def load_fixtures(directory: Path = FIXTURE_DIR) -> List[Dict[str, Any]]:
+    payloads = []
+    for path in sorted(directory.glob("*.json")):
+        with path.open("r", encoding="utf-8") as f:
+            payloads.append(json.load(f))
+    return payloads
+
+
+def synthetic_births(count: int, seed: int = 2024) -> List[Dict[str, Any]]:
+    """Deterministic births spread over 1900-2050 and latitudes within +/-60 degrees.
+
+    Each birth uses the whole-hour ``Etc/GMT`` zone nearest its longitude.
+    """
+    rng = random.Random(seed)
+    epoch = datetime(1900, 1, 1)
+    span_seconds = int((datetime(2050, 1, 1) - epoch).total_seconds())
+    payloads = []
+    for index in range(count):
+        lon = round(rng.uniform(-180.0, 180.0), 4)
+        hours = round(lon / 15.0)
+        # Etc/GMT zone names carry the opposite sign of the UTC offset.
+        zone = "Etc/GMT" if hours == 0 else f"Etc/GMT{-hours:+d}"
+        local = epoch + timedelta(seconds=rng.randrange(span_seconds))
+        payloads.append(
+            {
+                "person": {"id": f"synthetic-{index}", "label": f"Synthetic {index}"},
+                "birth": {
+                    "datetime_local": local.isoformat(),
+                    "timezone_name": zone,
+                    "location": {"lat": round(rng.uniform(-60.0, 60.0), 4), "lon": lon},
+                },
+                "config": {
+                    "zodiac_type": "SIDEREAL",
+                    "ayanamsa_mode": "LAHIRI",
+                    "house_system": "5",
+                    "node_mode": "TRUE",
+                },
+            }
+        )
+    return payloads
+
+
+def _percentile(sorted_values: Sequence[float], percentile: float) -> float:
+    """Linear-interpolated percentile of an already sorted sequence."""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * percentile / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def run_case(
+    func: Callable[[Dict[str, Any]], Any],
+    payloads: Sequence[Dict[str, Any]],
+    warmup: int = 1,
+    memory_sample: int = MEMORY_SAMPLE,
+) -> Dict[str, Any]:
+    """Latency percentiles (ms), throughput (calls/s) and peak traced memory (MiB)."""
+    for payload in payloads[:warmup]:
+        func(payload)
+    latencies: List[float] = []
+    errors = 0
+    started = time.perf_counter()
+    for payload in payloads:
+        call_start = time.perf_counter()
+        try:
+            func(payload)
+        except Exception:
+            errors += 1
+            continue
+        latencies.append((time.perf_counter() - call_start) * 1000.0)
+    elapsed = time.perf_counter() - started
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        for payload in payloads[:memory_sample]:
+            try:
+                func(payload)
+            except Exception:
+                pass
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    latencies.sort()
+    latency = {f"p{p}": _percentile(latencies, p) for p in PERCENTILES}
+    latency["mean"] = statistics.fmean(latencies) if latencies else 0.0
+    latency["max"] = latencies[-1] if latencies else 0.0
+    return {
+        "calls": len(payloads),
+        "errors": errors,
+        "latency_ms": latency,
+        "throughput_per_s": len(latencies) / elapsed if elapsed > 0 else 0.0,
+        "peak_memory_mib": peak / (1024 * 1024),
+    }
+
+
+def run_suite(
+    synthetic: int = 1000,
+    cases: Optional[Sequence[str]] = None,
+    max_inputs: Optional[int] = None,
+    seed: int = 2024,
+) -> Dict[str, Any]:
+    utils.set_language("en")
+    payloads = load_fixtures() + synthetic_births(synthetic, seed)
+    if max_inputs is not None:
+        payloads = payloads[:max_inputs]
+    registry = {**EXTRACTORS, **HOT_PATHS}
+    selected = list(cases) if cases else list(registry)
+    unknown = [name for name in selected if name not in registry]
+    if unknown:
+        raise ValueError(f"Unknown benchmark cases {unknown}; expected some of {sorted(registry)}")
+    return {
+        "meta": {
+            "schema_version": BENCHMARK_SCHEMA_VERSION,
+            "timestamp_utc": datetime.now(dt_timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "inputs": len(payloads),
+            "synthetic": synthetic,
+            "seed": seed,
+        },
+        "cases": {name: run_case(registry[name], payloads) for name in selected},
+    }
+
+
+def compare_to_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    thresholds: Optional[Dict[str, float]] = None,
+) -> List[Dict[str, Any]]:
+    """Regressions of ``report`` against ``baseline``; empty when everything is within bounds.
+
+    ``thresholds`` (CLI) override the baseline's own ``thresholds`` block, which
+    overrides ``DEFAULT_THRESHOLDS``. Cases missing on either side are skipped.
+    """
+    limits = {**DEFAULT_THRESHOLDS, **baseline.get("thresholds", {}), **(thresholds or {})}
+    regressions: List[Dict[str, Any]] = []
+
+    def _check(case: str, metric: str, current: float, reference: float, kind: str, higher_is_worse: bool) -> None:
+        if reference <= 0:
+            return
+        change = (current - reference) / reference
+        if (change if higher_is_worse else -change) > limits[kind]:
+            regressions.append(
+                {
+                    "case": case,
+                    "metric": metric,
+                    "baseline": reference,
+                    "current": current,
+                    "change": change,
+                    "threshold": limits[kind],
+                }
+            )
+
+    for case, current in report["cases"].items():
+        reference = baseline.get("cases", {}).get(case)
+        if reference is None:
+            continue
+        for key in ("p50", "p95"):
+            _check(case, f"latency_ms.{key}", current["latency_ms"][key], reference["latency_ms"][key], "latency", True)
+        _check(case, "throughput_per_s", current["throughput_per_s"], reference["throughput_per_s"], "throughput", False)
+        _check(case, "peak_memory_mib", current["peak_memory_mib"], reference["peak_memory_mib"], "memory", True)
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--synthetic", type=int, default=1000, help="synthetic births to add to the fixtures")
+    parser.add_argument("--max-inputs", type=int, default=None, help="cap on payloads per case")
+    parser.add_argument("--seed", type=int, default=2024)
+    parser.add_argument("--case", action="append", dest="cases", help="run only this case (repeatable)")
+    parser.add_argument("--output", type=Path, default=None, help="write the report JSON here")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the baseline")
+    for kind, default in DEFAULT_THRESHOLDS.items():
+        parser.add_argument(
+            f"--{kind}-threshold", type=float, default=None, help=f"allowed relative {kind} regression (default {default})"
+        )
+    args = parser.parse_args(argv)
+
+    report = run_suite(args.synthetic, args.cases, args.max_inputs, args.seed)
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    for name, case in report["cases"].items():
+        latency = case["latency_ms"]
+        print(
+            f"{name:42s} p50={latency['p50']:9.2f}ms p95={latency['p95']:9.2f}ms "
+            f"{case['throughput_per_s']:9.1f}/s peak={case['peak_memory_mib']:7.2f}MiB errors={case['errors']}"
+        )
+
+    if args.update_baseline:
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(report, indent=2), encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}; run with --update-baseline to create one.")
+        return 0
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    overrides = {
+        kind: value
+        for kind in DEFAULT_THRESHOLDS
+        if (value := getattr(args, f"{kind}_threshold")) is not None
+    }
+    regressions = compare_to_baseline(report, baseline, overrides)
+    for item in regressions:
+        print(
+            f"REGRESSION {item['case']} {item['metric']}: {item['baseline']:.3f} -> "
+            f"{item['current']:.3f} ({item['change']:+.1%}, limit {item['threshold']:.0%})"
+        )
+    if report.get("cases") and not regressions:
+        print("No regressions against baseline.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
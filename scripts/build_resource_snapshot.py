@@ -0,0 +1,32 @@
+"""Build the precompiled CorePrimitives / language table snapshot.
+
+    python scripts/build_resource_snapshot.py
+    python scripts/build_resource_snapshot.py --output /var/cache/refraction/resources.snapshot
+
+A snapshot outside the package is picked up through REFRACTION_RESOURCE_SNAPSHOT.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from pathlib import Path
+from typing import Optional, Sequence
+
+ROOT_DIR = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from refraction_engine import resource_snapshot  # noqa: E402
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", type=Path, default=None, help="snapshot path (default: package file)")
+    args = parser.parse_args(argv)
+    path = resource_snapshot.build_snapshot(args.output)
+    print(f"wrote {path} ({path.stat().st_size} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,6 @@
+@echo off
+setlocal enabledelayedexpansion
+set ROOT_DIR=%~dp0..
+cd /d "%ROOT_DIR%"
+python scripts\benchmark_suite.py %*
+endlocal
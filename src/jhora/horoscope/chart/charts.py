@@ -36,6 +36,8 @@
             1st/10th/7th/4th from base (fire,earth,air/water)
           count N divisions from end of the sign if sign is even
 """
+import datetime
+import functools
 from jhora.panchanga import drik
 from jhora import const,utils
 from jhora.horoscope.chart import house
@@ -62,6 +64,37 @@ def get_amsa_resources(language='en'):
     f = open(json_file,"r",encoding="utf-8")
     msgs = json.load(f)
     return msgs
+_tithi_pravesha_provider = None
+def set_tithi_pravesha_provider(provider=None):
+    """
+        Register a function provider(jd_at_dob,place_as_tuple,years,ayanamsa_mode,ayanamsa_value) returning the
+        Julian day of the tithi pravesha chart of the year (e.g. from a precomputed multi-year table) or None.
+        @param provider: the function or None to always use vratha.tithi_pravesha
+    """
+    global _tithi_pravesha_provider
+    _tithi_pravesha_provider = provider
+@functools.lru_cache(maxsize=256)
+def _vratha_tithi_pravesha_jd(jd_at_dob,place_as_tuple,years,ayanamsa_mode,ayanamsa_value):
+    """ Julian day of the tithi pravesha chart from vratha.tithi_pravesha. Cached so that every divisional
+        chart of the same pravesha reuses one search; the ayanamsa in effect is part of the key. """
+    from jhora.panchanga import vratha
+    bt_year,bt_month,bt_day,bt_hours = utils.jd_to_gregorian(jd_at_dob)
+    birth_date = drik.Date(bt_year,bt_month,bt_day); birth_time = tuple(utils.to_dms(bt_hours,as_string=False))
+    tp = vratha.tithi_pravesha(birth_date, birth_time, drik.Place(*place_as_tuple), bt_year + years - 1)
+    tp_date = tp[0][0]; tp_time = tp[0][1]; birth_time = tuple(utils.to_dms(tp_time,as_string=False))
+    tp_date_new = drik.Date(tp_date[0],tp_date[1],tp_date[2])
+    return utils.julian_day_number(tp_date_new, birth_time)
+def _tithi_pravesha_jd(jd_at_dob,place_as_tuple,years,ayanamsa_mode,ayanamsa_value):
+    """ Julian day of the tithi pravesha chart. As in vratha.tithi_pravesha, years up to the birth year
+        mean the current year. The registered provider is asked first (see set_tithi_pravesha_provider),
+        then vratha.tithi_pravesha is searched. """
+    if years <= 1:
+        years = datetime.date.today().year - utils.jd_to_gregorian(jd_at_dob)[0] + 1
+    if _tithi_pravesha_provider is not None:
+        jd_years = _tithi_pravesha_provider(jd_at_dob,place_as_tuple,years,ayanamsa_mode,ayanamsa_value)
+        if jd_years is not None:
+            return jd_years
+    return _vratha_tithi_pravesha_jd(jd_at_dob,place_as_tuple,years,ayanamsa_mode,ayanamsa_value)
 def rasi_chart(jd_at_dob,place_as_tuple,ayanamsa_mode=const._DEFAULT_AYANAMSA_MODE,years=1,months=1,sixty_hours=1
                ,calculation_type='drik',pravesha_type=0):
     """
@@ -80,16 +113,8 @@ def rasi_chart(jd_at_dob,place_as_tuple,ayanamsa_mode=const._DEFAULT_AYANAMSA_MO
     """
     jd_years = jd_at_dob if (years==1 and months==1 and sixty_hours==1) else drik.next_solar_date(jd_at_dob, place_as_tuple, years, months,sixty_hours)
     if pravesha_type==2:
-        from jhora.panchanga import vratha
-        bt_year,bt_month,bt_day,bt_hours = utils.jd_to_gregorian(jd_at_dob)
-        #print('bt_year,bt_month,bt_day,bt_hours',bt_year,bt_month,bt_day,bt_hours)
-        birth_date = drik.Date(bt_year,bt_month,bt_day); birth_time = tuple(utils.to_dms(bt_hours,as_string=False))
-        year_number = bt_year + years - 1
-        tp = vratha.tithi_pravesha(birth_date, birth_time, place_as_tuple, year_number)
-        #print('tithi pravesha',tp)
-        tp_date = tp[0][0]; tp_time = tp[0][1]; birth_time = tuple(utils.to_dms(tp_time,as_string=False))
-        tp_date_new = drik.Date(tp_date[0],tp_date[1],tp_date[2])
-        jd_years = utils.julian_day_number(tp_date_new, birth_time)
+        drik.set_ayanamsa_mode(ayanamsa_mode)
+        jd_years = _tithi_pravesha_jd(jd_at_dob, tuple(place_as_tuple), years, drik._ayanamsa_mode, drik._ayanamsa_value)
     if calculation_type.lower()=='ss':
         from jhora.panchanga import surya_sidhantha
         return surya_sidhantha.planet_positions(jd_years, place_as_tuple)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: UTF-8 -*-
+# Copyright (C) Open Astro Technologies, USA.
+# Modified by Sundar Sundaresan, USA. carnaticmusicguru2015@comcast.net
+# Downloaded from https://github.com/naturalstupid/PyJHora
+
+# This file is part of the "PyJHora" Python library
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+    Aspect (drishti) engine on integer charts
+
+    A chart is a vector of the raasis (0=Aries .. 11=Pisces) of the nine planets (0=Sun .. 8=Ketu),
+    or an array of shape (..., 9) for a batch of charts. Aspects come from two constant tables:
+        RAASI_DRISHTI[r1,r2] = raasi r1 has raasi drishti on raasi r2 (12x12)
+        GRAHA_DRISHTI[p,h] = planet p has graha drishti on the (h+1)th house from itself (9x12)
+    house.graha_drishti_from_chart and house.raasi_drishti_from_chart are wrappers over this module.
+"""
+import numpy as np
+from jhora import const
+
+_PLANETS = 9
+
+def _raasi_drishti_matrix():
+    matrix = np.zeros((12,12),dtype=bool)
+    for ms in const.movable_signs:
+        for fs in const.fixed_signs:
+            if fs != ms+1 and fs != ms-1:
+                matrix[ms,fs] = matrix[fs,ms] = True
+    for ds in const.dual_signs:
+        matrix[ds,[s for s in const.dual_signs if s != ds]] = True
+    return matrix
+def _graha_drishti_matrix():
+    matrix = np.zeros((_PLANETS,12),dtype=bool)
+    for p in range(_PLANETS):
+        matrix[p,[h-1 for h in const.graha_drishti[p]]] = True
+    return matrix
+RAASI_DRISHTI = _raasi_drishti_matrix(); RAASI_DRISHTI.setflags(write=False)
+GRAHA_DRISHTI = _graha_drishti_matrix(); GRAHA_DRISHTI.setflags(write=False)
+# Aspected raasis as lists, in the order the string API has always returned them:
+# raasi drishti by raasi, graha drishti by house counted from the planet.
+raasi_drishti_raasis = tuple(tuple(np.flatnonzero(row).tolist()) for row in RAASI_DRISHTI)
+graha_drishti_raasis = tuple(tuple(tuple(((np.flatnonzero(GRAHA_DRISHTI[p])+h)%12).tolist()) for h in range(12))
+                             for p in range(_PLANETS))
+
+def chart_from_house_to_planet_list(house_to_planet_list,separator='/'):
+    """
+        Integer chart from the string chart
+        @param house_to_planet_list: list of raasi with planet ids in them
+          Example: ['','','','','2','7','1/5','0','3/4','L','','6/8'] 1st element is Aries and last is Pisces
+        @param separator: separator character used separate planets in a house
+        @return: planet_houses, asc_house, house_planets
+            planet_houses = raasi of each planet as an integer array of 9 (-1 if the planet is not in the chart)
+            asc_house = raasi of the Lagnam (None if not in the chart)
+            house_planets = planets of each raasi as lists of int in the order they appear in the chart
+    """
+    planet_houses = np.full(_PLANETS,-1,dtype=np.int64); asc_house = None
+    for h,planets in enumerate(house_to_planet_list):
+        for p in range(_PLANETS):
+            if str(p) in planets:
+                planet_houses[p] = h
+        if const._ascendant_symbol in planets:
+            asc_house = h
+    house_planets = [[int(p) for p in planets.replace(const._ascendant_symbol,'').split(separator) if p != '']
+                     for planets in house_to_planet_list]
+    return planet_houses, asc_house, house_planets
+def chart_from_planet_positions(planet_positions):
+    """
+        Integer chart from planet positions
+        @param planet_positions: [['L',(h,long)],[0,(h,long)],...[8,(h,long)]]
+        @return: planet_houses, asc_house
+    """
+    return np.array([h for _,(h,_) in planet_positions[1:_PLANETS+1]],dtype=np.int64), planet_positions[0][1][0]
+def _check_planet_houses(planet_houses):
+    planet_houses = np.asarray(planet_houses)
+    if planet_houses.shape[-1:] != (_PLANETS,):
+        raise ValueError('planet_houses must have 9 raasis (Sun..Ketu) in its last axis')
+    if np.any((planet_houses < 0) | (planet_houses > 11)):
+        raise ValueError('planet raasis must be between 0 and 11')
+    return planet_houses.astype(np.int64)
+def graha_drishti_of_planets(planet_houses):
+    """
+        @param planet_houses: raasis of the nine planets, shape (..., 9)
+        @return: boolean array (..., 9, 12): [p,r] = planet p has graha drishti on raasi r
+    """
+    planet_houses = _check_planet_houses(planet_houses)
+    offsets = (np.arange(12)-planet_houses[...,None])%12
+    return GRAHA_DRISHTI[np.arange(_PLANETS)[:,None],offsets]
+def raasi_drishti_of_planets(planet_houses):
+    """
+        @param planet_houses: raasis of the nine planets, shape (..., 9)
+        @return: boolean array (..., 9, 12): [p,r] = raasi of planet p has raasi drishti on raasi r
+    """
+    return RAASI_DRISHTI[_check_planet_houses(planet_houses)]
+def aspects_to_planets(aspected_raasis,planet_houses):
+    """
+        @param aspected_raasis: boolean array (..., 9, 12) from graha/raasi_drishti_of_planets
+        @param planet_houses: raasis of the nine planets, shape (..., 9)
+        @return: boolean array (..., 9, 9): [p,q] = planet p aspects planet q
+    """
+    planet_houses = _check_planet_houses(planet_houses)
+    index = np.broadcast_to(planet_houses[...,None,:],aspected_raasis.shape[:-1]+(_PLANETS,))
+    return np.take_along_axis(aspected_raasis,index,axis=-1)
+def aspected_houses(aspected_raasis,asc_house):
+    """
+        @param aspected_raasis: boolean array (..., 9, 12)
+        @param asc_house: raasi of the Lagnam, scalar or shape (...)
+        @return: boolean array (..., 9, 12): [p,h] = aspect on the (h+1)th house from the Lagnam
+    """
+    raasis = (np.arange(12)+np.asarray(asc_house)[...,None,None])%12
+    return np.take_along_axis(aspected_raasis,np.broadcast_to(raasis,aspected_raasis.shape),axis=-1)
+def chart_aspects(planet_houses,drishti='graha'):
+    """
+        Aspect relations of a chart or of a batch of charts
+        @param planet_houses: raasis of the nine planets, shape (9,) or (N, 9)
+        @param drishti: 'graha', 'raasi' or 'both' (either of the two)
+        @return: aspected_raasis, aspects_to, aspected_by
+            aspected_raasis = (..., 9, 12) [p,r] = planet p aspects raasi r
+            aspects_to = (..., 9, 9) [p,q] = planet p aspects planet q
+            aspected_by = (..., 9, 9) [q,p] = planet q is aspected by planet p
+    """
+    if drishti == 'graha':
+        aspected_raasis = graha_drishti_of_planets(planet_houses)
+    elif drishti == 'raasi':
+        aspected_raasis = raasi_drishti_of_planets(planet_houses)
+    elif drishti == 'both':
+        aspected_raasis = graha_drishti_of_planets(planet_houses) | raasi_drishti_of_planets(planet_houses)
+    else:
+        raise ValueError("drishti must be 'graha', 'raasi' or 'both'")
+    aspects_to = aspects_to_planets(aspected_raasis,planet_houses)
+    return aspected_raasis, aspects_to, np.swapaxes(aspects_to,-1,-2)
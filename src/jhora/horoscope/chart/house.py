@@ -20,6 +20,7 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 from jhora import const, utils
 from jhora.panchanga import drik
+from jhora.horoscope.chart import drishti
 chara_karaka_names = const.chara_karaka_names
 planet_list = ['Sun','Moon','Mars','Mercury','Jupiter','Venus','Saturn','Rahu','Ketu']
 rasi_names_en = ['Aries','Taurus','Gemini','Cancer','Leo','Virgo','Libra','Scorpio','Sagittarius','Capricorn','Aquarius','Pisces']
@@ -148,18 +149,19 @@ def graha_drishti_from_chart(house_to_planet_dict,separator='/'):
             ahp = planets' graha drishti on houses. Example: [[0,1,],...]] Sun has graha drishti in 1st and 2nd houses
             app = planets' graha drishti on planets. Example: [[1,2,],...]] Sun has graha drishti on Moon and Mars
     """
-    h_to_p = house_to_planet_dict[:]
-    p_to_h = utils.get_planet_to_house_dict_from_chart(h_to_p)
-    asc_house = p_to_h[const._ascendant_symbol]
-    arp = {}
-    ahp = {}
-    app = {}
-    for p,_ in enumerate(planet_list):#[:7]):
-        house_of_the_planet = p_to_h[p]
-        arp[p] = [(h+house_of_the_planet-1)%12 for h in const.graha_drishti[p]]
+    return _drishti_from_chart(drishti.chart_from_house_to_planet_list(house_to_planet_dict,separator),graha_drishti=True)
+def _drishti_from_chart(chart,graha_drishti):
+    """ arp, ahp, app (graha or raasi drishti) of a chart from drishti.chart_from_house_to_planet_list """
+    planet_houses, asc_house, house_planets = chart
+    if asc_house is None:
+        raise KeyError(const._ascendant_symbol)
+    arp = {}; ahp = {}; app = {}
+    for p,ph in enumerate(planet_houses.tolist()):
+        if ph < 0:
+            raise KeyError(p)
+        arp[p] = list(drishti.graha_drishti_raasis[p][ph] if graha_drishti else drishti.raasi_drishti_raasis[ph])
         ahp[p] = [ (h-asc_house)%12+1 for h in arp[p]]
-        app[p] = sum([h_to_p[ar].replace(const._ascendant_symbol,'').split(separator) for ar in arp[p] if h_to_p[ar] !=''],[])
-        app[p] = [int(pp) for pp in app[p] if pp != '' ]
+        app[p] = [pp for ar in arp[p] for pp in house_planets[ar]]
     return arp,ahp,app
 def graha_drishti_of_the_planet(house_to_planet_dict,planet,separator='/'):
     """
@@ -171,64 +173,17 @@ def graha_drishti_of_the_planet(house_to_planet_dict,planet,separator='/'):
         @param separator: separator character used separate planets in a house
         @return: graha drishti of the planet as a list of planets
     """
-    #_,_,app =  graha_drishti_from_chart(house_to_planet_dict,separator)
-    #"""
-    p_to_h = utils.get_planet_to_house_dict_from_chart(house_to_planet_dict)
-    _,_,app =  graha_drishti_from_chart(house_to_planet_dict,separator)
-    #print(planet,'graha drishi of planets',app[planet])
-    arp,_,app1 = raasi_drishti_from_chart(house_to_planet_dict)
-    #print('rasi drishti of rasis',arp)
-    #print(planet,'rasi drishi of planets',app1[planet])
+    chart = drishti.chart_from_house_to_planet_list(house_to_planet_dict,separator)
+    _,_,app = _drishti_from_chart(chart,graha_drishti=True)
+    arp,_,app1 = _drishti_from_chart(chart,graha_drishti=False)
     app[planet] += app1[planet]
-    #print(planet,'combined drishti of planets',app[planet])
-    #print('arp',arp)
-    ppd = {}
-    hl = arp[planet]
-    hp = p_to_h[planet]
-    #print('planet',planet,'its rasi',p_to_h[planet],'its rasi drishti from its house',hl)
-    pp = []
-    for h in hl:
-        pl = house_to_planet_dict[(h+hp-1)%12].split('/')
-        pp += [int(p1) for p1 in pl if p1 not in ['','L']]
-        #print(planet,hp, h,pl,pp)
-    ppd[planet] = pp+app[planet]
-    return ppd[planet]
-    #"""
-    return app[planet]
-def _get_raasi_drishti_movable():
-    raasi_drishti = {}
-    for ms in const.movable_signs:
-        rd = []
-        for fs in const.fixed_signs:
-            if fs != ms+1 and fs != ms-1:
-                rd.append(fs)
-        raasi_drishti[ms] = rd
-    return raasi_drishti
-def _get_raasi_drishti_fixed():
-    raasi_drishti = {}
-    for fs in const.fixed_signs:
-        rd = []
-        for ms in const.movable_signs:
-            if ms != fs+1 and ms != fs-1:
-                rd.append(ms)
-        raasi_drishti[fs] = rd
-    return raasi_drishti
-def _get_raasi_drishti_dual():
-    raasi_drishti = {}
-    for fs in const.dual_signs:
-        rd = []
-        for ms in const.dual_signs:
-            if fs != ms:
-                rd.append(ms)
-        raasi_drishti[fs] = rd
-    return raasi_drishti
+    hp = int(chart[0][planet])
+    # planets in the houses counted from the planet by its raasi drishti raasis
+    pp = [p1 for h in arp[planet] for p1 in chart[2][(h+hp-1)%12]]
+    return pp+app[planet]
 def _get_raasi_drishti():
-    #print('movable rasi drishti',_get_raasi_drishti_movable())
-    #print('fixed rasi drishti',_get_raasi_drishti_fixed())
-    #print('dual rasi drishti',_get_raasi_drishti_dual())
-    _raasi_drishti = {**_get_raasi_drishti_movable(), **_get_raasi_drishti_fixed(), **_get_raasi_drishti_dual()}
-    _raasi_drishti = dict(sorted(_raasi_drishti.items()))
-    return _raasi_drishti
+    """ {raasi: [raasis it has raasi drishti on]} from drishti.RAASI_DRISHTI """
+    return {r:list(rd) for r,rd in enumerate(drishti.raasi_drishti_raasis)}
 #raasi_drishti = _get_raasi_drishti()    
 #print('raasi_drishti_map',raasi_drishti)
 def raasi_drishti_from_chart(house_to_planet_dict,separator='/'):
@@ -243,26 +198,7 @@ def raasi_drishti_from_chart(house_to_planet_dict,separator='/'):
             ahp = raasis' graha drishti on houses. Example: [[1,2,],...]] 1st house/Lagnam has raasi drishti in 2nd and 3rd houses
             app = raasis' graha drishti on planets. Example: [[1,2,],...]] Aries has graha raasi on Moon and Mars
     """
-    h_to_p = house_to_planet_dict[:]
-    #print('h_to_p',h_to_p)
-    p_to_h = utils.get_planet_to_house_dict_from_chart(h_to_p)
-    #print('p_to_h',p_to_h)
-    asc_house = p_to_h[const._ascendant_symbol]
-    rd = _get_raasi_drishti()
-    #print('raasi drishti',rd)
-    arp = {}
-    #print('rasi drishti',_get_raasi_drishti())
-    ahp = {}
-    app = {}
-    for p,_ in enumerate(planet_list[:9]):
-        ph = p_to_h[p]
-        #print(p,'its rasi',ph,'its aspected rasi',rd[ph])
-        arp[p] = rd[ph] #rd[p_to_h[p]] # raasi_drishti[p_to_h[p]]
-        ahp[p] = [ (h-asc_house) %12+1 for h in arp[p]]
-        #app[p] = sum([h_to_p[ar].replace(const._ascendant_symbol,'').split(separator) for ar in arp[p] if h_to_p[ar] !=''],[])
-        app[p] = sum([h_to_p[ar].split(separator) for ar in arp[p] if h_to_p[ar] !=''],[])
-        app[p] = [int(pp) for pp in app[p] if pp != '' and pp != const._ascendant_symbol]
-    return arp,ahp,app
+    return _drishti_from_chart(drishti.chart_from_house_to_planet_list(house_to_planet_dict,separator),graha_drishti=False)
 def raasi_drishti_of_the_planet(house_to_planet_dict,planet,separator='/'):
     arp,_,_ = raasi_drishti_from_chart(house_to_planet_dict,separator=separator)
     return arp[planet]
@@ -1099,7 +1035,7 @@ def baadhakas_of_raasi(planet_position,raasi):
     """ return [Baadhaka Sthaana/rasi, [baadhaka planets]]  of the given raasi"""
     return const.baadhakas[raasi]
 def planets_aspecting_the_planet(house_to_planet_dict,planet,separator='/'):
-    _,_,app = graha_drishti_from_chart(house_to_planet_dict)
+    _,_,app = graha_drishti_from_chart(house_to_planet_dict,separator)
     aspecting_planets = [k for k,v in app.items() if planet in v]
     return aspecting_planets
 def order_of_planets_by_strength(planet_positions):
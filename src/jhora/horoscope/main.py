@@ -27,6 +27,9 @@
     For example only charts? Dhasa Bhukthi as well, how about other TABS line dosha, compatibility etc
     Which TABS should always be based on NATAL CHART?
 """
+import contextlib
+import copy
+import functools
 import swisseph as swe
 from datetime import date
 from jhora import const, utils
@@ -36,7 +39,39 @@ from jhora.horoscope.chart import house,charts
 _lang_path = const._LANGUAGE_PATH
 chara_karakas = ['atma_karaka','amatya_karaka','bhratri_karaka','maitri_karaka','pitri_karaka','putra_karaka','jnaati_karaka','data_karaka']
 
+sub_planet_list_1 = {'kaala_str':'kaala_longitude','mrityu_str':'mrityu_longitude','artha_str':'artha_praharaka_longitude','yama_str':'yama_ghantaka_longitude',
+                     'gulika_str':'gulika_longitude','maandi_str':'maandi_longitude'}
+sub_planet_list_2 = ['dhuma','vyatipaata','parivesha','indrachaapa','upaketu']
+
 dhasavarga_dict = {}
+def _section(*state):
+    """
+        Memoize a Horoscope method per instance on its arguments, the current language and ayanamsa
+        @param state: names of attributes the method sets besides returning its value.
+            They are saved with the value and set again whenever the saved value is returned.
+        Every call returns its own copy, so callers may modify the result.
+        Calls with unhashable arguments are not memoized.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self,*args,**kwargs):
+            key = (method.__name__,const._DEFAULT_LANGUAGE,drik._ayanamsa_mode,drik._ayanamsa_value,
+                   args,tuple(sorted(kwargs.items())))
+            try:
+                hash(key)
+            except TypeError:
+                return method(self,*args,**kwargs)
+            if key not in self._sections:
+                value = method(self,*args,**kwargs)
+                saved_state = {name:getattr(self,name) for name in state if hasattr(self,name)}
+                self._sections[key] = copy.deepcopy((value,saved_state))
+                return value
+            value,saved_state = copy.deepcopy(self._sections[key])
+            for name,saved_value in saved_state.items():
+                setattr(self,name,saved_value)
+            return value
+        return wrapper
+    return decorator
 class Horoscope():  
     def __init__(self,place_with_country_code:str=None,latitude:float=None,longitude:float=None,timezone_offset:float=None,
                  date_in:drik.Date=None,birth_time:str=None,ayanamsa_mode:str="TRUE_CITRA",ayanamsa_value:float=None,
@@ -44,8 +79,20 @@ class Horoscope():
                  bhava_madhya_method = const.bhaava_madhya_method,language='en'):
         self._language = language
         self._bhava_madhya_method = bhava_madhya_method
+        self._ayanamsa_value_in = ayanamsa_value
+        """ Memoized sections: (method name, language, args, kwargs) -> (value, attributes it set) """
+        self._sections = {}
         utils.set_language(language)
         self.cal_key_list = utils.resource_strings
+        self._ascendant_str = self.cal_key_list['ascendant_str']
+        self._arudha_lagna_data = {}
+        self._sphuta_data = {}
+        self._graha_lagna_data = {}
+        self._hora_lagna_data = {}; self._ghati_lagna_data = {}; self._vighati_lagna_data = {}
+        self._pranapada_lagna_data = {}; self._indu_lagna_data = {}; self._bhrigu_bindhu_lagna_data = {}
+        self._bhava_lagna_data = {}; self._sree_lagna_data = {}; self._kunda_lagna_data = {}
+        self._varnada_lagna_data = {}
+        self._maandhi_data = {}
         self.place_name = place_with_country_code
         self.latitude = latitude
         self.longitude = longitude
@@ -108,19 +155,58 @@ class Horoscope():
         place = drik.Place(self.place_name,self.latitude,self.longitude,self.timezone_offset)
         self.julian_years = drik.next_solar_date(self.julian_day, place, years, months, sixty_hours)
         self.julian_years_utc = utils.julian_day_utc(self.julian_day,self.Place)
-        self.calendar_info = self.get_calendar_information()
-        self.bhava_chart,self.bhava_chart_info = self.get_bhava_chart_information(self.julian_years,place,self._bhava_madhya_method)
         return
+    def _apply_settings(self):
+        """ Set the global language and ayanamsa mode of this horoscope again """
+        utils.set_language(self._language)
+        if self.calculation_type == 'ss':
+            drik.set_ayanamsa_mode('SURYASIDDHANTA')
+        else:
+            drik.set_ayanamsa_mode(self.ayanamsa_mode,self._ayanamsa_value_in,self.julian_day)
+    @contextlib.contextmanager
+    def _own_settings(self):
+        """ Language and ayanamsa of this horoscope inside the block; the previous ones are set back after it """
+        language = const._DEFAULT_LANGUAGE
+        ayanamsa_mode, ayanamsa_value = drik._ayanamsa_mode, drik._ayanamsa_value
+        self._apply_settings()
+        try:
+            yield
+        finally:
+            utils.set_language(language)
+            if ayanamsa_mode.upper() in ['SENTHIL','SUNDAR_SS']:
+                """ These modes keep their value computed for a julian day; set it back as it was """
+                drik._ayanamsa_mode = const._DEFAULT_AYANAMSA_MODE = ayanamsa_mode
+                drik.reset_ayanamsa_mode()
+            else:
+                drik.set_ayanamsa_mode(ayanamsa_mode,ayanamsa_value)
+            drik._ayanamsa_value = ayanamsa_value
+    @property
+    def calendar_info(self):
+        """ Calendar information of the birth date, computed on first use """
+        return self._get_calendar_section()
+    @property
+    def bhava_chart(self):
+        return self._get_bhava_chart_section()[0]
+    @property
+    def bhava_chart_info(self):
+        return self._get_bhava_chart_section()[1]
+    @_section('_nakshatra_number','_paadha_number')
+    def _get_calendar_section(self):
+        """ Uses the language and ayanamsa the horoscope was created with """
+        with self._own_settings():
+            return self.get_calendar_information()
+    @_section()
+    def _get_bhava_chart_section(self):
+        with self._own_settings():
+            return self.get_bhava_chart_information(self.julian_years,self.Place,self._bhava_madhya_method)
     def _get_planet_list(self):
         return utils.PLANET_NAMES,utils.PLANET_SHORT_NAMES
     def _get_raasi_list(self):
         return utils.RAASI_LIST,utils.RAASI_SHORT_LIST
     def _get_calendar_resource_strings(self):#, language='en'):
-        list_file = _lang_path + 'list_values_'+self._language+'.txt'
-        msg_file = _lang_path + 'msg_strings_'+self._language+'.txt'
-        cal_key_list=utils._read_resource_messages_from_file(msg_file) #utils.get_resource_messages(msg_file)
-        _ = utils._read_resource_lists_from_file(list_file)#utils.get_resource_lists(list_file)
-        return cal_key_list
+        lists, cal_key_list = utils.language_resources(self._language)
+        utils._apply_resource_lists(lists)
+        return dict(cal_key_list)
     def get_calendar_information(self):#, language='en'):
         jd = self.julian_day # self.julian_day #jd = self.julian_years #
         place = drik.Place(self.place_name,self.latitude,self.longitude,self.timezone_offset)
@@ -631,17 +717,17 @@ class Horoscope():
             k = key_dhasa_factor+'-'+cal_key_list[spl+'_sphuta_str']+' '+cal_key_list['sphuta_str']
             horoscope_info[k] = utils.RAASI_LIST[vl[0]] +' '+utils.to_dms(vl[1],is_lat_long='plong') 
         return horoscope_info, horoscope_charts,horoscope_ascendant_house
-    def get_horoscope_information(self):#,language='en'):
+    def get_horoscope_information(self,sections=None):#,language='en'):
+        """
+            Information and charts of the rasi chart and of every dhasavarga chart
+            @param sections: divisional chart factors to include (1 = rasi chart). Default: None (all)
+                Each chart is computed once per instance and language and reused afterwards.
+            @return: horoscope_info, horoscope_charts, horoscope_ascendant_houses
+                Charts not in sections are left empty and their ascendant house is -1
+        """
         horoscope_info = {}
         self._vimsottari_balance = ();self._yoga_vimsottari_balance = ()
-        self._arudha_lagna_data = {}
-        self._sphuta_data = {}
-        self._graha_lagna_data = {}
-        self._hora_lagna_data = {}; self._ghati_lagna_data = {}; self._vighati_lagna_data = {}
-        self._pranapada_lagna_data = {}; self._indu_lagna_data = {}; self._bhrigu_bindhu_lagna_data = {}
-        self._bhava_lagna_data = {}; self._sree_lagna_data = {}; self._kunda_lagna_data = {}
-        self._varnada_lagna_data = {}
-        self._maandhi_data = {}; self._aayu_dhasa_type = -1; self._kaala_dhasa_type = -1
+        self._aayu_dhasa_type = -1; self._kaala_dhasa_type = -1
         cal_key_list = self.cal_key_list#self._get_calendar_resource_strings(language)
         global dhasavarga_dict
         dhasavarga_dict={2:cal_key_list['hora_str'],
@@ -667,6 +753,45 @@ class Horoscope():
                          108:cal_key_list['ashtotharamsa_str'],
                          144:cal_key_list['dwadas_dwadasamsa_str'],
         }
+        chart_factors = [1]+list(dhasavarga_dict.keys())
+        if sections is None:
+            sections = chart_factors
+        unknown = [dcf for dcf in sections if dcf not in chart_factors]
+        if unknown:
+            raise ValueError('Unknown horoscope sections '+str(unknown)+'. Available: '+str(chart_factors))
+        horoscope_charts = [[ ''  for _ in range(len(utils.RAASI_LIST))] for _ in range(len(dhasavarga_dict)+1)]
+        horoscope_ascendant_houses = [-1 for _ in range(len(const.division_chart_factors))]
+        for chart_counter,dhasavarga_factor in enumerate(chart_factors):
+            if dhasavarga_factor not in sections:
+                continue
+            if dhasavarga_factor == 1:
+                chart_info,chart,asc_house = self._get_rasi_chart_section()
+            else:
+                chart_info,chart,asc_house = self._get_dhasavarga_chart_section(dhasavarga_factor)
+            horoscope_info.update(chart_info)
+            horoscope_charts[chart_counter] = list(chart)
+            horoscope_ascendant_houses[chart_counter] = asc_house
+        return horoscope_info, horoscope_charts,horoscope_ascendant_houses
+    @_section()
+    def _get_rasi_planet_positions(self):
+        """ Rasi chart planet positions at birth, shared by the horoscope sections """
+        jd = self.julian_day
+        place = drik.Place(self.place_name,self.latitude,self.longitude,self.timezone_offset)
+        if self.calculation_type=='ss':
+            planet_positions = surya_sidhantha.planet_positions(jd, place)
+        else:
+            planet_positions = charts.rasi_chart(jd, place, ayanamsa_mode=self.ayanamsa_mode,
+                                                 years=self.years,months=self.months,sixty_hours=self.sixty_hours,
+                                                 pravesha_type=self.pravesha_type)
+        return planet_positions
+    @_section()
+    def _get_retrograde_planets(self):
+        return drik.planets_in_retrograde(self.julian_day, self.Place)
+    @_section('_arudha_menu_dict','_arudha_lagna_data_kundali')
+    def _get_rasi_chart_section(self):
+        """ @return: horoscope_info, chart and ascendant house of the rasi chart """
+        horoscope_info = {}
+        cal_key_list = self.cal_key_list
         jd = self.julian_day # V3.1.9 If Julian_Years to be used then years/months arguments should not be used
         place = drik.Place(self.place_name,self.latitude,self.longitude,self.timezone_offset)
         dob = drik.Date(self.Date.year,self.Date.month,self.Date.day)
@@ -677,19 +802,10 @@ class Horoscope():
             SS does not have Lagna/Ascendant in planet positions - should be included
             retrograde depends on return types of planet positions
         """
-        if self.calculation_type=='ss':
-            planet_positions = surya_sidhantha.planet_positions(jd, place)
-        else:
-            planet_positions = charts.rasi_chart(jd, place, ayanamsa_mode=self.ayanamsa_mode,
-                                                 years=self.years,months=self.months,sixty_hours=self.sixty_hours,
-                                                 pravesha_type=self.pravesha_type)
-        #retrograde_planets = charts.planets_in_retrograde(planet_positions)
-        retrograde_planets = drik.planets_in_retrograde(jd, place)
-        #print('rasi retrograde planets',retrograde_planets)
+        planet_positions = self._get_rasi_planet_positions()
+        retrograde_planets = self._get_retrograde_planets()
         _ascendant = planet_positions[0][1] #drik.ascendant(jd,place)
-        horoscope_charts = [[ ''  for _ in range(len(utils.RAASI_LIST))] for _ in range(len(dhasavarga_dict)+1)]
-        horoscope_ascendant_houses = [-1 for _ in range(len(const.division_chart_factors))]
-        chart_counter = 0
+        horoscope_chart = [ ''  for _ in range(len(utils.RAASI_LIST))]
         divisional_chart_factor=1
         jd = self.julian_day#jd = self.julian_years #
         #"""
@@ -752,8 +868,7 @@ class Horoscope():
         horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
         jd = self.julian_day # V3.1.9 revert to julian after special lagna calculations
         asc_house = _ascendant[0]
-        horoscope_ascendant_houses[chart_counter] = asc_house
-        horoscope_charts[chart_counter][asc_house] += cal_key_list['ascendant_str'] +"\n"
+        horoscope_chart[asc_house] += cal_key_list['ascendant_str'] +"\n"
         horoscope_info[cal_key_list['raasi_str']+'-'+cal_key_list['ascendant_str']] = utils.RAASI_LIST[asc_house] +' ' + utils.to_dms(_ascendant[1],is_lat_long='plong')
         chara_karaka_names = [x+'_str' for x in house.chara_karaka_names]
         chara_karaka_dict = house.chara_karakas(planet_positions)
@@ -769,15 +884,12 @@ class Horoscope():
                 ck_str = ' (' + cal_key_list[chara_karaka_names[ck_index]] +')'
             v = utils.RAASI_LIST[h]+' '+ utils.to_dms(long,is_lat_long='plong') + ck_str
             planet_house = h
-            horoscope_charts[chart_counter][planet_house] += planet_name + "\n"
+            horoscope_chart[planet_house] += planet_name + "\n"
             relative_planet_house = house.get_relative_house_of_planet(asc_house, planet_house)
             horoscope_info[k]=v # + str(relative_planet_house)
         # Shadow Sub Planet information
         #k = cal_key_list['raasi_str']+'-'+cal_key_list['upagraha_str']
         #horoscope_info[k]=''
-        sub_planet_list_1 = {'kaala_str':'kaala_longitude','mrityu_str':'mrityu_longitude','artha_str':'artha_praharaka_longitude','yama_str':'yama_ghantaka_longitude',
-                           'gulika_str':'gulika_longitude','maandi_str':'maandi_longitude'}
-        sub_planet_list_2 = ['dhuma','vyatipaata','parivesha','indrachaapa','upaketu']
         place = drik.Place(self.place_name,self.latitude,self.longitude,self.timezone_offset)
         sun_long = planet_positions[1][1][0]*30+planet_positions[1][1][1]
         for sp,sp_func in sub_planet_list_1.items():
@@ -788,105 +900,114 @@ class Horoscope():
             k = cal_key_list['raasi_str']+'-'+cal_key_list[sp+'_str']+' ('+cal_key_list[sp+'_short_str']+')'
             v = eval('drik.'+'solar_upagraha_longitudes(sun_long,sp,divisional_chart_factor=divisional_chart_factor)')
             horoscope_info[k]= utils.RAASI_LIST[v[0]] +' '+utils.to_dms(v[1],is_lat_long='plong')
-        ## Dhasavarga Charts
+        return horoscope_info, horoscope_chart, asc_house
+    @_section('_arudha_menu_dict','_arudha_lagna_data_kundali')
+    def _get_dhasavarga_chart_section(self,dhasavarga_factor):
+        """ @return: horoscope_info, chart and ascendant house of one dhasavarga chart """
+        horoscope_info = {}
+        cal_key_list = self.cal_key_list
+        place = drik.Place(self.place_name,self.latitude,self.longitude,self.timezone_offset)
+        dob = drik.Date(self.Date.year,self.Date.month,self.Date.day)
+        tob=self.birth_time
+        retrograde_planets = self._get_retrograde_planets()
+        chara_karaka_names = [x+'_str' for x in house.chara_karaka_names]
+        divisional_chart_factor=1
+        horoscope_chart = [ ''  for _ in range(len(utils.RAASI_LIST))]
         jd = self.julian_day  #V3.1.9
-        for dhasavarga_factor in dhasavarga_dict.keys():
-            " planet_positions lost: [planet_id, planet_constellation, planet_longitude] " 
-            chart_counter += 1
-            planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=self.ayanamsa_mode,
-                                                       divisional_chart_factor=dhasavarga_factor,
-                                                       years=self.years,months=self.months,sixty_hours=self.sixty_hours,
-                                                       calculation_type=self.calculation_type,pravesha_type=self.pravesha_type)
-            chara_karaka_dict = house.chara_karakas(planet_positions)
-            ascendant_navamsa = planet_positions[0][1]
-            asc_house = ascendant_navamsa[0]
-            horoscope_ascendant_houses[chart_counter] = asc_house
-            ascendant_longitude = ascendant_navamsa[1]
-            jd = self.julian_day #V3.1.9
-            horoscope_charts[chart_counter][asc_house] += cal_key_list['ascendant_str'] +"\n"
-            self._get_sphuta(dob, tob, place, divisional_chart_factor=dhasavarga_factor)
-            abl = self._get_arudha_padhas(dob, tob, place, divisional_chart_factor=dhasavarga_factor,
-                                      years=self.years,months=self.months,sixty_hours=self.sixty_hours,
-                                      pravesha_type=self.pravesha_type)
-            for bli,blk in const._arudha_lagnas_included_in_chart.items():
-                key = list(abl)[bli-1]
-                #print('arudha padha key',key,'value',abl[key])
-                value = abl[key]
-                horoscope_info[key] = value
-            jd = self.julian_years # V3.1.9 Special Lagna do not take years arguments - so use julian years
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['bhava_lagna_str']+' ('+cal_key_list['bhava_lagna_short_str']+')'
-            value = drik.bhava_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._bhava_lagna_data[dhasavarga_factor] = value[0] # V3.1.9
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['hora_lagna_str']+' ('+cal_key_list['hora_lagna_short_str']+')'
-            value = drik.hora_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._hora_lagna_data[dhasavarga_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['ghati_lagna_str']+' ('+cal_key_list['ghati_lagna_short_str']+')'
-            value = drik.ghati_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._ghati_lagna_data[dhasavarga_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['vighati_lagna_str']+' ('+cal_key_list['vighati_lagna_short_str']+')'
-            value = drik.vighati_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._vighati_lagna_data[dhasavarga_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['pranapada_lagna_str']+' ('+cal_key_list['pranapada_lagna_short_str']+')'
-            value = drik.pranapada_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
-            self._pranapada_lagna_data[divisional_chart_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['indu_lagna_str']+' ('+cal_key_list['indu_lagna_short_str']+')'
-            value = drik.indu_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
-            self._indu_lagna_data[divisional_chart_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['bhrigu_bindhu_lagna_str']+' ('+cal_key_list['bhrigu_bindhu_lagna_short_str']+')'
-            value = drik.bhrigu_bindhu_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
-            self._bhrigu_bindhu_lagna_data[divisional_chart_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['kunda_lagna_str']+' ('+cal_key_list['kunda_lagna_short_str']+')'
-            value = drik.kunda_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
-            self._kunda_lagna_data[divisional_chart_factor] = value[0]
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['sree_lagna_str']+' ('+cal_key_list['sree_lagna_short_str']+')'
-            jd = self.julian_day # V3.1.9 revert to julian after special lagna calculations
-            value = drik.sree_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._sree_lagna_data[dhasavarga_factor] = value[0] # V3.1.9
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['varnada_lagna_str']
-            value = charts.varnada_lagna(dob, tob, place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._varnada_lagna_data[dhasavarga_factor]=value[0]            
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['maandi_str']+' ('+cal_key_list['maandi_short_str']+')'
-            value = drik.maandi_longitude(dob,tob,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
-            self._maandhi_data[dhasavarga_factor]=value[0]            
-            horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
-            horoscope_info[dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['ascendant_str']] = \
-                utils.RAASI_LIST[ascendant_navamsa[0]]+' '+utils.to_dms(ascendant_navamsa[1],True,'plong')
-            for p,(h,long) in planet_positions[1:]:
-                ret_str = ''
-                if p in retrograde_planets:
-                    ret_str = const._retrogade_symbol
-                planet_name = utils.PLANET_NAMES[p]+ret_str
-                #print('dhasavarga_factor',dhasavarga_factor,'planet_name',planet_name)
-                k = dhasavarga_dict[dhasavarga_factor]+'-'+planet_name
-                planet_house = h
-                ck_str = ''
-                if p !='L' and p < 8:
-                    #print('D'+str(dhasavarga_factor),planet_name,chara_karaka_dict[p])
-                    ck_str = ' (' + cal_key_list[chara_karaka_names[chara_karaka_dict[p]]] +')'
-                v = utils.RAASI_LIST[h]+' ' +utils.to_dms(long,is_lat_long='plong') + ck_str
-                horoscope_charts[chart_counter][planet_house] += planet_name +'\n'
-                relative_planet_house = house.get_relative_house_of_planet(asc_house, planet_house)
-                horoscope_info[k]= v #+ [relative_planet_house]
-            sun_long = planet_positions[1][1][0]*30+planet_positions[1][1][1]
-            for sp,sp_func in sub_planet_list_1.items():
-                k = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list[sp]+' ('+cal_key_list[sp.replace('_str','_short_str')]+')'
-                v = eval('drik.'+sp_func+'(dob,tob,place,divisional_chart_factor=dhasavarga_factor)')
-                horoscope_info[k] = utils.RAASI_LIST[v[0]] +' '+utils.to_dms(v[1],is_lat_long='plong') 
-            for sp in sub_planet_list_2:
-                k = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list[sp+'_str']+' ('+cal_key_list[sp+'_short_str']+')'
-                v = eval('drik.'+'solar_upagraha_longitudes(sun_long,sp,divisional_chart_factor=divisional_chart_factor)')
-                horoscope_info[k] = utils.RAASI_LIST[v[0]] +' '+utils.to_dms(v[1],is_lat_long='plong')
-        return horoscope_info, horoscope_charts,horoscope_ascendant_houses#, vimsottari_dhasa_bhukti_info,ashtottari_dhasa_bhukti_info,narayana_dhasa_info
+        " planet_positions lost: [planet_id, planet_constellation, planet_longitude] "
+        planet_positions = charts.divisional_chart(jd, place, ayanamsa_mode=self.ayanamsa_mode,
+                                                   divisional_chart_factor=dhasavarga_factor,
+                                                   years=self.years,months=self.months,sixty_hours=self.sixty_hours,
+                                                   calculation_type=self.calculation_type,pravesha_type=self.pravesha_type)
+        chara_karaka_dict = house.chara_karakas(planet_positions)
+        ascendant_navamsa = planet_positions[0][1]
+        asc_house = ascendant_navamsa[0]
+        ascendant_longitude = ascendant_navamsa[1]
+        jd = self.julian_day #V3.1.9
+        horoscope_chart[asc_house] += cal_key_list['ascendant_str'] +"\n"
+        self._get_sphuta(dob, tob, place, divisional_chart_factor=dhasavarga_factor)
+        abl = self._get_arudha_padhas(dob, tob, place, divisional_chart_factor=dhasavarga_factor,
+                                  years=self.years,months=self.months,sixty_hours=self.sixty_hours,
+                                  pravesha_type=self.pravesha_type)
+        for bli,blk in const._arudha_lagnas_included_in_chart.items():
+            key = list(abl)[bli-1]
+            #print('arudha padha key',key,'value',abl[key])
+            value = abl[key]
+            horoscope_info[key] = value
+        jd = self.julian_years # V3.1.9 Special Lagna do not take years arguments - so use julian years
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['bhava_lagna_str']+' ('+cal_key_list['bhava_lagna_short_str']+')'
+        value = drik.bhava_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._bhava_lagna_data[dhasavarga_factor] = value[0] # V3.1.9
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['hora_lagna_str']+' ('+cal_key_list['hora_lagna_short_str']+')'
+        value = drik.hora_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._hora_lagna_data[dhasavarga_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['ghati_lagna_str']+' ('+cal_key_list['ghati_lagna_short_str']+')'
+        value = drik.ghati_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._ghati_lagna_data[dhasavarga_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['vighati_lagna_str']+' ('+cal_key_list['vighati_lagna_short_str']+')'
+        value = drik.vighati_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._vighati_lagna_data[dhasavarga_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['pranapada_lagna_str']+' ('+cal_key_list['pranapada_lagna_short_str']+')'
+        value = drik.pranapada_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
+        self._pranapada_lagna_data[divisional_chart_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['indu_lagna_str']+' ('+cal_key_list['indu_lagna_short_str']+')'
+        value = drik.indu_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
+        self._indu_lagna_data[divisional_chart_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['bhrigu_bindhu_lagna_str']+' ('+cal_key_list['bhrigu_bindhu_lagna_short_str']+')'
+        value = drik.bhrigu_bindhu_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
+        self._bhrigu_bindhu_lagna_data[divisional_chart_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list['kunda_lagna_str']+' ('+cal_key_list['kunda_lagna_short_str']+')'
+        value = drik.kunda_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=divisional_chart_factor)
+        self._kunda_lagna_data[divisional_chart_factor] = value[0]
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['sree_lagna_str']+' ('+cal_key_list['sree_lagna_short_str']+')'
+        jd = self.julian_day # V3.1.9 revert to julian after special lagna calculations
+        value = drik.sree_lagna(jd,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._sree_lagna_data[dhasavarga_factor] = value[0] # V3.1.9
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['varnada_lagna_str']
+        value = charts.varnada_lagna(dob, tob, place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._varnada_lagna_data[dhasavarga_factor]=value[0]            
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        key = dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['maandi_str']+' ('+cal_key_list['maandi_short_str']+')'
+        value = drik.maandi_longitude(dob,tob,place,ayanamsa_mode=self.ayanamsa_mode,divisional_chart_factor=dhasavarga_factor)
+        self._maandhi_data[dhasavarga_factor]=value[0]            
+        horoscope_info[key] = utils.RAASI_LIST[value[0]] +' ' + utils.to_dms(value[1],is_lat_long='plong')
+        horoscope_info[dhasavarga_dict[dhasavarga_factor] +'-'+cal_key_list['ascendant_str']] = \
+            utils.RAASI_LIST[ascendant_navamsa[0]]+' '+utils.to_dms(ascendant_navamsa[1],True,'plong')
+        for p,(h,long) in planet_positions[1:]:
+            ret_str = ''
+            if p in retrograde_planets:
+                ret_str = const._retrogade_symbol
+            planet_name = utils.PLANET_NAMES[p]+ret_str
+            #print('dhasavarga_factor',dhasavarga_factor,'planet_name',planet_name)
+            k = dhasavarga_dict[dhasavarga_factor]+'-'+planet_name
+            planet_house = h
+            ck_str = ''
+            if p !='L' and p < 8:
+                #print('D'+str(dhasavarga_factor),planet_name,chara_karaka_dict[p])
+                ck_str = ' (' + cal_key_list[chara_karaka_names[chara_karaka_dict[p]]] +')'
+            v = utils.RAASI_LIST[h]+' ' +utils.to_dms(long,is_lat_long='plong') + ck_str
+            horoscope_chart[planet_house] += planet_name +'\n'
+            relative_planet_house = house.get_relative_house_of_planet(asc_house, planet_house)
+            horoscope_info[k]= v #+ [relative_planet_house]
+        sun_long = planet_positions[1][1][0]*30+planet_positions[1][1][1]
+        for sp,sp_func in sub_planet_list_1.items():
+            k = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list[sp]+' ('+cal_key_list[sp.replace('_str','_short_str')]+')'
+            v = eval('drik.'+sp_func+'(dob,tob,place,divisional_chart_factor=dhasavarga_factor)')
+            horoscope_info[k] = utils.RAASI_LIST[v[0]] +' '+utils.to_dms(v[1],is_lat_long='plong') 
+        for sp in sub_planet_list_2:
+            k = dhasavarga_dict[dhasavarga_factor]+'-'+cal_key_list[sp+'_str']+' ('+cal_key_list[sp+'_short_str']+')'
+            v = eval('drik.'+'solar_upagraha_longitudes(sun_long,sp,divisional_chart_factor=divisional_chart_factor)')
+            horoscope_info[k] = utils.RAASI_LIST[v[0]] +' '+utils.to_dms(v[1],is_lat_long='plong')
+        return horoscope_info, horoscope_chart, asc_house
     def get_varnada_lagna_for_chart(self,dob, tob, place, divisional_chart_factor=1, chart_method=None,
                                     varnada_method=1, base_rasi=None, count_from_end_of_sign=None):
         _vl_chart = ['' for _ in range(12)]
@@ -908,10 +1029,12 @@ class Horoscope():
             _vl_chart[vl[0]] += 'V'+str(h+1)+'\n'
         _varnada_chart_dict = {self.cal_key_list['varnada_lagna_str']:_vl_chart}
         return _varnada_chart_dict
+    @_section()
     def _get_shad_bala(self,dob,tob,place):
         from jhora.horoscope.chart import strength
         jd = utils.julian_day_number(dob, tob)
         return strength.shad_bala(jd, place)
+    @_section()
     def _get_bhava_bala(self,dob,tob,place):
         from jhora.horoscope.chart import strength
         jd = utils.julian_day_number(dob, tob)
@@ -921,6 +1044,7 @@ class Horoscope():
         bb = list(np.array(bb).T)
         #print('main bhava bala info',bb)
         return bb
+    @_section()
     def _get_other_bala(self,dob,tob,place):
         #from jhora.horoscope.transit import tajaka
         from jhora.horoscope.chart import strength
@@ -932,6 +1056,7 @@ class Horoscope():
         dvb = strength.dwadhasa_vargeeya_bala(jd, place)
         dvb1 = {utils.PLANET_NAMES[p]:dvb[p] for p in range(7)}
         return [hb1, pvb1, dvb1]
+    @_section()
     def _get_vimsopaka_bala(self,dob,tob,place_as_tuple):
         jd_at_dob = utils.julian_day_number(dob, tob)
         sv = charts.vimsopaka_shadvarga_of_planets(jd_at_dob, place_as_tuple)
@@ -951,6 +1076,7 @@ class Horoscope():
         for p in range(9):
             sv3[utils.PLANET_NAMES[p]]=utils.SHODASAVARGAMSA_NAMES[sv[p][0]]+'\n('+sv[p][1]+ ')\n'+str(round(sv[p][2],1))
         return [sv1,sv2,dv,sv3]
+    @_section()
     def _get_vaiseshikamsa_bala(self,dob,tob,place_as_tuple):
         jd_at_dob = utils.julian_day_number(dob, tob)
         sv = charts.vaiseshikamsa_shadvarga_of_planets(jd_at_dob, place_as_tuple)
@@ -970,6 +1096,7 @@ class Horoscope():
         for p in range(9):
             sv3[utils.PLANET_NAMES[p]]=utils.SHODASAVARGAMSA_NAMES[sv[p][0]]+'\n('+sv[p][1]+ ')\n'+str(round(sv[p][2],1))
         return [sv1,sv2,dv,sv3]
+    @_section()
     def _get_sphuta_mixed_chart(self,dob,tob,place,varga_factor_1=1,chart_method_1=1,varga_factor_2=1,chart_method_2=1):
         from jhora.horoscope.chart import sphuta
         _sphuta_dict = {}
@@ -980,6 +1107,7 @@ class Horoscope():
             _sphuta_dict[key] = utils.RAASI_LIST[value[0]]+' '+utils.to_dms(value[1], is_lat_long='plong')
         #self._sphuta_data.update(_sphuta_dict)
         return _sphuta_dict
+    @_section()
     def _get_sphuta(self,dob,tob,place,divisional_chart_factor=1,chart_method=1,
                                         base_rasi=None,count_from_end_of_sign=None):
         from jhora.horoscope.chart import sphuta
@@ -991,6 +1119,7 @@ class Horoscope():
             _sphuta_dict[key] = utils.RAASI_LIST[value[0]]+' '+utils.to_dms(value[1], is_lat_long='plong')
         #self._sphuta_data.update(_sphuta_dict)
         return _sphuta_dict
+    @_section('_arudha_menu_dict')
     def _get_arudha_padhas_mixed_chart(self,dob,tob,place,varga_factor_1=1,chart_method_1=1,varga_factor_2=1,chart_method_2=1):
         from jhora.horoscope.chart import arudhas
         jd_at_dob = utils.julian_day_number(dob, tob)
@@ -1029,6 +1158,7 @@ class Horoscope():
             arudha_menu_dict[key] = ba_chart
         #arudha_menu_dict = {self.cal_key_list['arudhas_str']:arudha_menu_dict}
         return arudha_menu_dict
+    @_section('_arudha_menu_dict','_arudha_lagna_data_kundali')
     def _get_arudha_padhas(self,dob,tob,place,divisional_chart_factor=1,chart_method=1,
                            years=1,months=1,sixty_hours=1,pravesha_type=0,
                            base_rasi=None,count_from_end_of_sign=None):
@@ -1079,11 +1209,13 @@ class Horoscope():
             _drig_dhasa_bhukthi_info, _nirayana_dhasa_bhukthi_info, _shoola_dhasa_bhukthi_info, \
             _kendraadhi_karaka_dhasa_bhukthi_info, _chara_dhasa_bhukthi_info, _lagnamsaka_dhasa_bhukthi_info, \
             _padhanadhamsa_dhasa_bhukthi_info]
+    @_section()
     def _get_annual_dhasa_bhukthi(self,divisional_chart_factor=1):
         _patyayini_dhasa_bhukthi_info = self._get_patyatini_dhasa_bhukthi(divisional_chart_factor=divisional_chart_factor)
         _mudda_dhasa_bhukthi_info = self._get_varsha_vimsottari_dhasa(self.julian_day, self.Place, self.years-1,divisional_chart_factor=divisional_chart_factor)
         _varsha_narayana_dhasa_bhukthi_info = self._get_varsha_narayana_dhasa(self.Date, self.birth_time, self.Place, self.years,divisional_chart_factor=divisional_chart_factor)
         return [_patyayini_dhasa_bhukthi_info,_mudda_dhasa_bhukthi_info,_varsha_narayana_dhasa_bhukthi_info]
+    @_section()
     def _get_varsha_narayana_dhasa(self,dob,tob,place,years,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import narayana
         db = narayana.varsha_narayana_dhasa_bhukthi(dob, tob, place, years, divisional_chart_factor=divisional_chart_factor,include_antardhasa=True)
@@ -1093,6 +1225,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_varsha_vimsottari_dhasa(self,jd, place, years,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.annual import mudda
         md = mudda.varsha_vimsottari_dhasa_bhukthi(jd, place, years,divisional_chart_factor=divisional_chart_factor)
@@ -1102,6 +1235,7 @@ class Horoscope():
             bhukthi_lord = utils.PLANET_NAMES[pb]
             dhasa_bhukti_info.append((dhasa_lord+'-'+bhukthi_lord,bs))
         return dhasa_bhukti_info
+    @_section()
     def _get_patyatini_dhasa_bhukthi(self,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.annual import patyayini
         self.julian_years = drik.next_solar_date(self.julian_day, self.Place, self.years, self.months, self.sixty_hours)
@@ -1123,6 +1257,7 @@ class Horoscope():
                 dhasa_bhukti_info.append((dhasa_lord+'-'+bhukthi_lord,bs))
                 #print('key',dhasa_lord+'-'+bhukthi_lord,'value',bs)
         return dhasa_bhukti_info
+    @_section()
     def _get_tara_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import tara
         db = tara.get_dhasa_bhukthi(dob, tob, place,include_antardasa=True,**kwargs)
@@ -1132,6 +1267,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.DHASA_LIST[dhasa_lord]+'-'+utils.BHUKTHI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_karaka_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         jd = utils.julian_day_number(dob, tob)
         from jhora.horoscope.dhasa.graha import karaka
@@ -1145,6 +1281,7 @@ class Horoscope():
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'\n'+self.cal_key_list[chara_karaka_names[chara_karaka_dict[dhasa_lord]]]+'\n'
                                       +'-'+utils.PLANET_NAMES[bukthi_lord]+'\n'+self.cal_key_list[chara_karaka_names[chara_karaka_dict[bukthi_lord]]]+'\n',bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_naisargika_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import naisargika
         db = naisargika.get_dhasa_bhukthi(dob, tob, place,include_antardhasa=True,**kwargs)
@@ -1155,6 +1292,7 @@ class Horoscope():
             bukthi_str=self.cal_key_list['ascendant_str'] if bukthi_lord == const._ascendant_symbol else utils.PLANET_NAMES[bukthi_lord]
             dhasa_bhukti_info.append((dhasa_str+'-'+bukthi_str,bukthi_start))
         return dhasa_bhukti_info
+    @_section('_aayu_dhasa_type')
     def _get_aayu_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         jd = utils.julian_day_number(dob, tob)
         from jhora.horoscope.dhasa.graha import aayu
@@ -1166,6 +1304,7 @@ class Horoscope():
             bukthi_str=self._ascendant_str if bukthi_lord==const._ascendant_symbol else utils.PLANET_NAMES[bukthi_lord]                
             dhasa_bhukti_info.append((dhasa_str+'-'+bukthi_str,bukthi_start))
         return dhasa_bhukti_info
+    @_section('_vimsottari_balance')
     def _get_vimsottari_dhasa_bhukthi(self,dob,tob,place,**kwargs):#,divisional_chart_factor=1):
         jd = utils.julian_day_number(dob, tob)
         from jhora.horoscope.dhasa.graha import vimsottari
@@ -1176,6 +1315,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.DHASA_LIST[dhasa_lord]+'-'+utils.BHUKTHI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section('_kaala_dhasa_type')
     def _get_kaala_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import kaala
         self._kaala_dhasa_type,db = kaala.get_dhasa_antardhasa(dob,tob, place,include_antardhasa=True,**kwargs)
@@ -1184,6 +1324,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_chakra_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import chakra
         db = chakra.get_dhasa_antardhasa(dob,tob, place,include_antardhasa=True,divisional_chart_factor=divisional_chart_factor)
@@ -1192,6 +1333,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_sandhya_panchaka_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import sandhya
         db = sandhya.get_dhasa_antardhasa(dob,tob, place,use_panchaka_variation=True,divisional_chart_factor=divisional_chart_factor)
@@ -1200,6 +1342,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_rasi_bhukthi_vimsottari_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         jd = utils.julian_day_number(dob, tob)
         from jhora.horoscope.dhasa.graha import vimsottari
@@ -1209,6 +1352,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section('_yoga_vimsottari_balance')
     def _get_yoga_vimsottari_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         jd = utils.julian_day_number(dob, tob)
         from jhora.horoscope.dhasa.graha import yoga_vimsottari
@@ -1219,6 +1363,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.DHASA_LIST[dhasa_lord]+'-'+utils.BHUKTHI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_ashtottari_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import ashtottari
         jd = utils.julian_day_number(dob,tob)
@@ -1230,6 +1375,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_tithi_ashtottari_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import tithi_ashtottari
         jd = utils.julian_day_number(dob,tob)
@@ -1243,6 +1389,7 @@ class Horoscope():
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         #print(dhasa_bhukti_info)
         return dhasa_bhukti_info
+    @_section()
     def _get_buddhi_gathi_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import buddhi_gathi
         jd = utils.julian_day_number(dob,tob)
@@ -1254,6 +1401,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_yogini_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import yogini
         db = yogini.get_dhasa_bhukthi(dob,tob, place,include_antardhasa=True,**kwargs)
@@ -1264,6 +1412,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_tithi_yogini_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import tithi_yogini
         db = tithi_yogini.get_dhasa_bhukthi(dob,tob, place,include_antardhasa=True,**kwargs)
@@ -1274,6 +1423,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_shodasottari_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import shodasottari
         db = shodasottari.get_dhasa_bhukthi(dob,tob, place,include_antardhasa=True,**kwargs)
@@ -1284,6 +1434,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_dwadasottari_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import dwadasottari
         db = dwadasottari.get_dhasa_bhukthi(dob,tob, place,include_antardhasa=True,**kwargs)
@@ -1294,6 +1445,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_dwisatpathi_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import dwisatpathi
         db = dwisatpathi.get_dhasa_bhukthi(dob,tob, place,include_antardhasa=True,**kwargs)
@@ -1304,6 +1456,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_panchottari_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import panchottari
         db = panchottari.get_dhasa_bhukthi(dob,tob, place,include_antardhasa=True,**kwargs)
@@ -1314,6 +1467,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_satabdika_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import sataatbika
         db = sataatbika.get_dhasa_bhukthi(dob,tob, place,include_antardhasa=True,**kwargs)
@@ -1324,6 +1478,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_chaturaaseeti_sama_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import chathuraaseethi_sama
         db = chathuraaseethi_sama.get_dhasa_bhukthi(dob,tob, place,include_antardhasa=True,**kwargs)
@@ -1334,6 +1489,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_karana_chaturaaseeti_sama_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import karana_chathuraaseethi_sama
         db = karana_chathuraaseethi_sama.get_dhasa_bhukthi(dob,tob, place,include_antardhasa=True,**kwargs)
@@ -1344,6 +1500,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_shashtisama_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import shastihayani
         db = shastihayani.get_dhasa_bhukthi(dob,tob, place,include_antardhasa=True,**kwargs)
@@ -1354,6 +1511,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_shattrimsa_sama_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import shattrimsa_sama
         db = shattrimsa_sama.get_dhasa_bhukthi(dob,tob, place,include_antardhasa=True,**kwargs)
@@ -1364,6 +1522,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.PLANET_NAMES[dhasa_lord]+'-'+utils.PLANET_NAMES[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_saptharishi_nakshathra_dhasa_bhukthi(self,dob,tob,place,**kwargs):
         from jhora.horoscope.dhasa.graha import saptharishi_nakshathra
         db = saptharishi_nakshathra.get_dhasa_bhukthi(dob,tob, place,include_antardhasa=True,**kwargs)
@@ -1374,6 +1533,7 @@ class Horoscope():
             [dhasa_lord, bukthi_lord,bukthi_start,_]=db[i]
             dhasa_bhukti_info.append((utils.NAKSHATRA_LIST[dhasa_lord]+'-'+utils.NAKSHATRA_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_narayana_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import narayana
         db = narayana.narayana_dhasa_for_rasi_chart(dob, tob, place,include_antardhasa=True)
@@ -1383,6 +1543,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_kendraadhi_rasi_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import kendradhi_rasi
         db = kendradhi_rasi.kendradhi_rasi_dhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor)
@@ -1392,6 +1553,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_sudasa_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import sudasa
         db = sudasa.sudasa_dhasa_bhukthi(dob, tob, place, divisional_chart_factor)
@@ -1401,6 +1563,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_drig_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import drig
         db = drig.drig_dhasa_bhukthi(dob, tob, place, divisional_chart_factor)
@@ -1410,6 +1573,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_nirayana_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import nirayana
         db = nirayana.nirayana_shoola_dhasa_bhukthi(dob, tob, place, divisional_chart_factor)
@@ -1419,6 +1583,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_shoola_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import shoola
         db = shoola.shoola_dhasa_bhukthi(dob, tob, place, divisional_chart_factor)
@@ -1428,6 +1593,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_kendraadhi_karaka_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import kendradhi_rasi
         db = kendradhi_rasi.karaka_kendradhi_rasi_dhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor, karaka_index=1)
@@ -1437,6 +1603,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_chara_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import chara
         db = chara.get_dhasa_antardhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor, chara_method=1)
@@ -1448,6 +1615,7 @@ class Horoscope():
             #dhasa_start = '%04d-%02d-%02d' %(y,m,d) +' '+utils.to_dms(fh, as_string=True)
             dhasa_bhukti_info.append((dhasa_lord+'-'+bukthi_lord,dhasa_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_lagnamsaka_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import lagnamsaka
         db = lagnamsaka.get_dhasa_antardhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor)
@@ -1457,6 +1625,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_padhanadhamsa_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import padhanadhamsa
         db = padhanadhamsa.get_dhasa_antardhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor)
@@ -1466,6 +1635,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_mandooka_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import mandooka
         db = mandooka.get_dhasa_antardhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor)
@@ -1475,6 +1645,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_sthira_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import sthira
         db = sthira.get_dhasa_antardhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor)
@@ -1484,6 +1655,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_tara_lagna_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import tara_lagna
         db = tara_lagna.get_dhasa_antardhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor)
@@ -1493,6 +1665,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_brahma_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import brahma
         db = brahma.get_dhasa_antardhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor)
@@ -1502,6 +1675,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_varnada_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import varnada
         db = varnada.get_dhasa_antardhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor)
@@ -1511,6 +1685,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_yogardha_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import yogardha
         db = yogardha.get_dhasa_antardhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor)
@@ -1520,6 +1695,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_navamsa_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import navamsa
         db = navamsa.get_dhasa_antardhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor)
@@ -1529,6 +1705,7 @@ class Horoscope():
             #dhasa_bhukti_info[utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord]]=bukthi_start
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_paryaaya_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import paryaaya
         db = paryaaya.get_dhasa_antardhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor)
@@ -1539,6 +1716,7 @@ class Horoscope():
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
             #dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_trikona_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import trikona
         db = trikona.get_dhasa_antardhasa(dob, tob, place, divisional_chart_factor=divisional_chart_factor)
@@ -1549,6 +1727,7 @@ class Horoscope():
             dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
             #dhasa_bhukti_info.append((utils.RAASI_LIST[dhasa_lord]+'-'+utils.RAASI_LIST[bukthi_lord],bukthi_start))
         return dhasa_bhukti_info
+    @_section()
     def _get_kalachakra_dhasa(self,dob,tob,place,divisional_chart_factor=1):
         from jhora.horoscope.dhasa.raasi import kalachakra
         jd_at_dob = utils.julian_day_number(dob, tob)
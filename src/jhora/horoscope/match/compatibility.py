@@ -21,7 +21,6 @@
 import os
 import string
 import numpy as np
-import pandas as pd 
 from jhora import const, utils
 # Column IDs in the match database
 _BOY_STAR_COL=0
@@ -607,6 +606,7 @@ class Match:
             self.data_file = db_file
         else:
             Exception("database file:"+db_file+" not found.")
+        import pandas as pd # imported here so that importing this module does not load pandas
         self.match_db=pd.read_csv(db_file,header=None,encoding='utf-8')
         self._gender = 'Female'
         self.boy_nakshatra_number = boy_nakshatra_number
@@ -62,6 +62,10 @@ def set_sideral_planets():
 #PLANET_NAMES= ['Suriyan', 'Chandran', 'Sevvay','Budhan','Viyaazhan','VeLLi','Sani','Raahu','Kethu','Uranus','Neptune']
 _ayanamsa_mode = const._DEFAULT_AYANAMSA_MODE
 _ayanamsa_value = None
+# Solar return search: the guess in next_solar_date is within a few days of the crossing
+_solar_return_window_days = 8.0
+_solar_return_max_iterations = 50
+_solar_return_tolerance_days = 1e-7
 def _ayanamsa_surya_siddhantha_model(jd):
     maha_yuga_years = 4320000
     completed_maha_yuga_years = 3888000
@@ -2222,32 +2226,37 @@ def next_sankranti_date(panchanga_date,place):
     return sank_date, solar_hour1,tamil_month,tamil_day # V2.3.0 date returned as tuple
 def __next_solar_jd(jd,place,sun_long):
     """
-        TODO: Handle While loop if not converging - provide max count to stop
+        Julian day (local) nearest to jd at which the sun's longitude is sun_long
+        The crossing is bracketed within _solar_return_window_days of jd and refined
+        by false position (Illinois) with at most _solar_return_max_iterations steps
+        @param jd: Julian Day Number of the approximate date/time
+        @param place: Place Struct ('place',latitude,longitude,timezone)
+        @param sun_long: target sidereal longitude of the sun
+        @return: julian number (local) of the solar date
     """
-    jd_next = jd
-    sl = solar_longitude(jd_next)
-    while True:
-        #print(jd_next,sl,sun_long,jd_to_gregorian(jd_next))
-        sank_date = swe.revjul(jd_next)
-        #print('sank_date',sank_date,sun_long,sl,sun_long+1)
-        if sl<sun_long+1 and sl>sun_long:
-            jd_next -= 1
-            break
-        jd_next += 1
-        sl = solar_longitude(jd_next)
-    sank_date = jd_to_gregorian(jd_next)
-    #print('sank_date',sank_date)
-    sank_sunrise = sunrise(jd_next,place)[2]
-    sank_date = Date(sank_date[0],sank_date[1],sank_date[2])
-    offsets = [0.0, 0.25, 0.5, 0.75, 1.0] 
-    solar_longs = [ (solar_longitude(sank_sunrise + t)) for t in offsets ]
-    #print(solar_longs,sun_long)
-    solar_hour = utils.inverse_lagrange(offsets, solar_longs, sun_long) # Do not move % 360 above
-    #print('solar_hour',solar_hour)
-    sank_jd_utc = utils.gregorian_to_jd(sank_date)
-    solar_hour1 = (sank_sunrise + solar_hour - sank_jd_utc)*24+place.timezone
-    next_solar_jd = swe.julday(sank_date[0],sank_date[1],sank_date[2],solar_hour1)
-    return next_solar_jd    
+    jd_utc = jd - place.timezone/24
+    def _sun_offset(jd_utc):
+        return (solar_longitude(jd_utc) - sun_long + 180) % 360 - 180
+    lower = jd_utc - _solar_return_window_days; f_lower = _sun_offset(lower)
+    upper = jd_utc + _solar_return_window_days; f_upper = _sun_offset(upper)
+    if f_lower > 0 or f_upper < 0:
+        raise ValueError('Sun does not reach longitude '+str(sun_long)+' near jd '+str(jd))
+    side = 0; next_solar_jd_utc = lower
+    for _ in range(_solar_return_max_iterations):
+        previous = next_solar_jd_utc
+        next_solar_jd_utc = (lower*f_upper - upper*f_lower)/(f_upper - f_lower)
+        if abs(next_solar_jd_utc - previous) < _solar_return_tolerance_days: break
+        f_next = _sun_offset(next_solar_jd_utc)
+        if f_next == 0: break
+        if f_next > 0:
+            upper, f_upper = next_solar_jd_utc, f_next
+            if side == 1: f_lower /= 2
+            side = 1
+        else:
+            lower, f_lower = next_solar_jd_utc, f_next
+            if side == -1: f_upper /= 2
+            side = -1
+    return next_solar_jd_utc + place.timezone/24
 def next_solar_date(jd_at_dob,place,years=1,months=1,sixty_hours=1):
     """
         returns the next date at which sun's longitue is same as at jd_at_dob (at birth say)
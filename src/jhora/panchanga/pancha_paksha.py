@@ -22,9 +22,10 @@
     Module for Pancha Paksha Sastra
 """
 
+import csv
 import sys
-import pandas as pd
 from datetime import datetime
+import numpy as np
 from jhora import utils, const
 from jhora.panchanga import drik, pancha_paksha
 
@@ -67,26 +68,82 @@ def _get_paksha(jd,place):
     return 1 if _tithi <= 15 else 2
 def _get_birth_bird_from_nakshathra(birth_star,_paksha):
     return pancha_pakshi_stars_birds_paksha[birth_star-1][_paksha-1]
+# Shape of the compiled database: bird, weekday, paksha, day/night, yama, sub period, column.
+# Rows keep the order of PP_DB_FILE, so a yama is its position in the day (or night), not its activity.
+_PP_TABLE_SHAPE = (5, 7, 2, 2, 5, 5, _LAST_COL_FOR_READING+1)
+_pp_table = None
+def get_pancha_pakshi_table():
+    """
+        Pancha Pakshi database as a float array of shape _PP_TABLE_SHAPE.
+        PP_DB_FILE is read once per process.
+    """
+    global _pp_table
+    if _pp_table is None:
+        with open(PP_DB_FILE, encoding='utf-8-sig', newline='') as f:
+            reader = csv.reader(f); next(reader)
+            rows = [row[:_LAST_COL_FOR_READING+1] for row in reader]
+        table = np.empty(_PP_TABLE_SHAPE)
+        counts = {}
+        for row in rows:
+            values = [float(v) for v in row]
+            key = (int(values[_NAK_BIRD_INDEX]),int(values[_WEEK_DAY_INDEX]),int(values[_PAKSHA_INDEX]),
+                   int(values[_DAYNIGHT_INDEX]))
+            n = counts.get(key,0); counts[key] = n+1
+            table[key+divmod(n,5)] = values
+        if len(counts) != np.prod(_PP_TABLE_SHAPE[:4]) or set(counts.values()) != {25}:
+            raise ValueError('Pancha Pakshi database '+PP_DB_FILE+' does not have 25 rows for each bird, weekday, paksha and day/night')
+        table.setflags(write=False)
+        _pp_table = table
+    return _pp_table
+def get_pancha_pakshi_day_schedules(bird_indices,weekday_indices,paksha_indices):
+    """
+        Database rows of the day and night of many births/dates at once.
+        @param bird_indices: nakshathra birds 1..5 (scalar or array)
+        @param weekday_indices: weekdays 1..7 (Sunday=1)
+        @param paksha_indices: 1 = sukla, 2 = krishna
+        @return: array of shape (..., 2, 5, 5, _LAST_COL_FOR_READING+1) indexed by day/night, yama, sub period
+    """
+    bird_indices, weekday_indices, paksha_indices = np.broadcast_arrays(bird_indices,weekday_indices,paksha_indices)
+    for name,values,count in (('bird',bird_indices,5),('weekday',weekday_indices,7),('paksha',paksha_indices,2)):
+        if np.any((values < 1) | (values > count)):
+            raise ValueError(name+' index must be between 1 and '+str(count))
+    return get_pancha_pakshi_table()[bird_indices.astype(int)-1,weekday_indices.astype(int)-1,paksha_indices.astype(int)-1]
 def get_matching_pancha_pakshi_data_from_db(bird_index,weekday_index,paksha_index):
-    pp_db = pd.read_csv(PP_DB_FILE,index_col=None, encoding='utf-8',usecols=range(_LAST_COL_FOR_READING+1))
-    search_criteria = (
-        (pp_db.iloc[:,_NAK_BIRD_INDEX] == bird_index - 1) &
-        (pp_db.iloc[:,_WEEK_DAY_INDEX] == weekday_index - 1) &
-        (pp_db.iloc[:,_PAKSHA_INDEX] == paksha_index - 1)
-    )
-    search_results = pp_db[search_criteria]
-    result_list = search_results.values.tolist()
-    return result_list
-def construct_pancha_pakshi_information(dob=None,tob=None,place=None,nakshathra_bird_index=None):
-    jd = utils.julian_day_number(dob,tob)
+    """ Rows of PP_DB_FILE for the bird, weekday and paksha (all 1-based), in file order """
+    return get_pancha_pakshi_day_schedules(bird_index,weekday_index,paksha_index).reshape(-1,_PP_TABLE_SHAPE[-1]).tolist()
+def _get_pancha_pakshi_day(jd,place):
+    """ (sunrise_jd, weekday_index, paksha_index, day_length, night_length) of the Pancha Pakshi day holding jd """
     sunrise_jd = drik.sunrise(jd, place)[-1]
     if jd < sunrise_jd:
         jd -= 1
         sunrise_jd = drik.sunrise(jd, place)[-1]
     weekday_index = drik.vaara(jd)+1
     paksha_index = pancha_paksha._get_paksha(jd, place)
-    day_length = drik.day_length(jd, place)
-    night_length = drik.night_length(jd, place)
+    return sunrise_jd, weekday_index, paksha_index, drik.day_length(jd, place), drik.night_length(jd, place)
+def get_pancha_pakshi_schedules(jds,places,nakshathra_bird_indices):
+    """
+        Full day and night activity schedule of many dates and births.
+        @param jds: julian day numbers (local time)
+        @param places: a drik.Place or one per jd
+        @param nakshathra_bird_indices: nakshathra bird 1..5 or one per jd
+        @return: (rows, starts_jd, ends_jd)
+            rows: array of shape (N, 2, 5, 5, _LAST_COL_FOR_READING+1) of database rows by day/night, yama, sub period
+            starts_jd, ends_jd: arrays of shape (N, 2, 5, 5) with the julian days each sub period starts and ends
+    """
+    jds = np.atleast_1d(np.asarray(jds,dtype=float))
+    if isinstance(places,drik.Place): places = [places]*len(jds)
+    days = np.array([_get_pancha_pakshi_day(jd,place) for jd,place in zip(jds,places)]).reshape(-1,5)
+    if len(days) != len(jds):
+        raise ValueError('places must be a drik.Place or one per jd')
+    sunrise_jd, weekday_index, paksha_index, day_length, night_length = days.T
+    rows = get_pancha_pakshi_day_schedules(np.broadcast_to(nakshathra_bird_indices,jds.shape),weekday_index,paksha_index)
+    yama_days = np.stack([day_length,night_length],axis=-1)/5.0/24
+    durations = (yama_days[:,:,None,None]*rows[...,_DURATION_FACTOR]).reshape(len(jds),-1)
+    ends_jd = np.cumsum(np.concatenate([sunrise_jd[:,None],durations],axis=1),axis=1)
+    return rows, ends_jd[:,:-1].reshape(rows.shape[:-1]), ends_jd[:,1:].reshape(rows.shape[:-1])
+def construct_pancha_pakshi_information(dob=None,tob=None,place=None,nakshathra_bird_index=None):
+    jd = utils.julian_day_number(dob,tob)
+    sunrise_jd, weekday_index, paksha_index, day_length, night_length = _get_pancha_pakshi_day(jd, place)
     day_inc = day_length/5.0; night_inc = night_length/5.0
     result_list = pancha_paksha.get_matching_pancha_pakshi_data_from_db(nakshathra_bird_index,weekday_index,paksha_index)
     headers = ['starts_at','ends_at','duration','main_bird','main_activity','sub_bird','sub_activity','relation',
@@ -23,17 +23,16 @@
     contains common functions used by various PyJHora modules
 """
 import os
+import sys
 import codecs
 import warnings
-import geocoder
-import requests
 from pytz import timezone, utc
-from timezonefinder import TimezoneFinder
+# geocoder, requests, geopy, timezonefinder and pandas are imported inside the location
+# lookup functions that need them; they are slow to import and charts never use them.
 #import pandas as pd
 import csv
 import numpy as np
 import swisseph as swe
-from geopy.geocoders import Nominatim
 from jhora import const
 from jhora.panchanga import drik as drig_panchanga
 import json
@@ -69,6 +68,7 @@ def save_location_to_database(location_data):
 " Flatten a list of lists "
 flatten_list = lambda list: [item for sublist in list for item in sublist]
 def _get_place_from_ipinfo():
+    import requests
     url = 'http://ipinfo.io/json'
     response = requests.get(url)
     data = json.loads(response.text)
@@ -86,6 +86,7 @@ def get_place_from_user_ip_address():
     g = ''
     try:
         print("Trying to get using IP Address of the user")
+        import geocoder
         g = geocoder.ip('me') #ipinfo('me')
         #print('g',g,g.city,g.country,g.latlng)
         if g==None or g=='':
@@ -119,6 +120,8 @@ def get_elevation(lat = None, long = None):
     
     query = const._open_elevation_api_url(lat,long) 
     
+    import requests
+    import pandas as pd
     # Request with a timeout for slow responses
     r = requests.get(query, timeout = 20)
 
@@ -233,6 +236,7 @@ def scrap_google_map_for_latlongtz_from_city_with_country(city_with_country):
             Example: Chennai, India
         @return [city,latitude,longitude,time_zone_offset]
     """
+    import requests
     url = google_maps_url+city_with_country
     resp=requests.request(method="GET",url=url)
     r = requests.get(url)
@@ -259,6 +263,7 @@ def get_location_using_nominatim(place_with_country_code):
         @return [city,latitude,longitude,time_zone_offset]
     """
     #[city,latitude,longitude,tz_offset]=''
+    from geopy.geocoders import Nominatim
     geolocator = Nominatim(user_agent="Astro") #,format_string="%s, Bangalore")
     while True:
         try:
@@ -279,6 +284,7 @@ def get_location_using_nominatim(place_with_country_code):
 def _scrap_google_map_for_latlongtz_from_city_with_country(city_with_country):
     url = "https://www.google.cl/maps/place/"+city_with_country#+' time zone'
     try:
+        import requests
         resp=requests.request(method="GET",url=url)
         r = requests.get(url)
         txt = r.text
@@ -314,6 +320,7 @@ def get_place_timezone_offset(latitude, longitude):
         @return [city,latitude,longitude,time_zone_offset]
     """
     try:
+        from timezonefinder import TimezoneFinder
         tf = TimezoneFinder()
         today = datetime.datetime.now()
         tz_target = timezone(tf.timezone_at(lng=longitude, lat=latitude))
@@ -375,18 +382,46 @@ def get_house_planet_list_from_planet_positions(planet_positions):
     return h_to_p
 def set_ephemeris_data_path(data_path=const._ephe_path):
     swe.set_ephe_path(data_path)
+_language_resource_provider = None
+_language_resources_cache = {}
+def set_language_resource_provider(provider=None):
+    """
+        Register a function provider(language) returning (lists, messages) dictionaries of a language
+        (e.g. from a precompiled snapshot) or None to fall back to the text resource files.
+        @param provider: the function or None to always read the text files
+    """
+    global _language_resource_provider
+    _language_resource_provider = provider
+    _language_resources_cache.clear()
+def language_resources(language=const._DEFAULT_LANGUAGE):
+    """
+        Resource lists and messages of a language, read only once per process
+        @param language: two letter language code (see const.available_languages)
+        @return: (lists, messages) - lists maps list names (PLANET_NAMES, ...) to values,
+                 messages maps message keys to strings. Treat both as read-only.
+    """
+    if language not in _language_resources_cache:
+        resources = _language_resource_provider(language) if _language_resource_provider else None
+        if resources is None:
+            language_list_file = const._LANGUAGE_PATH+const._DEFAULT_LANGUAGE_LIST_STR+language+'.txt'
+            language_message_file = const._LANGUAGE_PATH+const._DEFAULT_LANGUAGE_MSG_STR+language+'.txt'
+            resources = (_parse_resource_lists(language_list_file),
+                         _read_resource_messages_from_file(language_message_file))
+        _language_resources_cache[language] = resources
+    return _language_resources_cache[language]
+def _apply_resource_lists(lists):
+    module = sys.modules[__name__]
+    for var_name, var_value in lists.items():
+        setattr(module, var_name, list(var_value))
 def set_language(language=const._DEFAULT_LANGUAGE):
     global resource_strings
     #print('language',language)
     if language in const.available_languages.values():
         #print('default language set to',language)
         const._DEFAULT_LANGUAGE = language
-        language_list_file = const._LANGUAGE_PATH+const._DEFAULT_LANGUAGE_LIST_STR+language+'.txt'
-        #print('language_list_file',language_list_file)
-        language_message_file = const._LANGUAGE_PATH+const._DEFAULT_LANGUAGE_MSG_STR+language+'.txt'
-        
-        get_resource_lists(language_list_file)
-        resource_strings = get_resource_messages(language_message_file=language_message_file)
+        lists, messages = language_resources(language)
+        _apply_resource_lists(lists)
+        resource_strings = dict(messages)
 def _read_resource_messages_from_file(message_file):
     if not os.path.exists(message_file):
         print('Error: List Types File:'+message_file+' does not exist. Script aborted.')
@@ -412,14 +447,19 @@ def get_resource_messages(language_message_file=const._LANGUAGE_PATH + const._DE
     """
     res = _read_resource_messages_from_file(language_message_file)
     return res
-resource_strings = get_resource_messages(const._LANGUAGE_PATH+const._DEFAULT_LANGUAGE_MSG_STR+const._DEFAULT_LANGUAGE+'.txt')
-def _read_resource_lists_from_file(language_list_file):
-    import sys,os
-    module = sys.modules[__name__]
+def __getattr__(name):
+    """ resource_strings of the default language is read on first use instead of at import;
+        set_language() replaces it. """
+    global resource_strings
+    if name == 'resource_strings':
+        resource_strings = dict(language_resources(const._DEFAULT_LANGUAGE)[1])
+        return resource_strings
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+def _parse_resource_lists(language_list_file):
     file_path = language_list_file
     if not os.path.exists(file_path):
         raise FileNotFoundError(f"The file {file_path} does not exist.")
-    #print('_read_resource_lists_from_file')
+    lists = {}
     with open(file_path, 'r',encoding='utf-8') as file: # V4.5.0
         for line in file:
             line = line.strip()
@@ -427,10 +467,10 @@ def _read_resource_lists_from_file(language_list_file):
                 continue
             elif "=" in line:
                 var_name, var_value = line.split("=")
-                var_name = var_name.strip()
-                var_value = var_value.split(',')
-                setattr(module, var_name, var_value)
-                #print('length of',var_name,len(var_value))
+                lists[var_name.strip()] = var_value.split(',')
+    return lists
+def _read_resource_lists_from_file(language_list_file):
+    _apply_resource_lists(_parse_resource_lists(language_list_file))
 def get_resource_lists(language_list_file=const._LANGUAGE_PATH + const._DEFAULT_LANGUAGE_LIST_STR + const._DEFAULT_LANGUAGE + '.txt'):
     """
         Retrieve resource list from language specific resource list file
@@ -1,24 +1,48 @@
 # Refraction Engine extractors package.
+#
+# The run_* extractors are imported on first access so that importing the
+# package does not load PyJHora, numpy or swisseph; `import refraction_engine;
+# run_core_chart(...)` loads only the modules the core chart needs.
+
+from importlib import import_module
 
 from .constants import *
-from .core_chart import run_core_chart
-from .dashas import run_dashas_vimshottari
-from .panchanga import run_panchanga
 from .planet_utils import *
-from .pipeline import run_refraction_core
-from .special_points import run_special_points
-from .strengths import run_strengths
-from .transit import run_transit
 from .validators import *
-from .yogas import run_yogas
-
-__all__ = [
-    "run_core_chart",
-    "run_panchanga",
-    "run_dashas_vimshottari",
-    "run_strengths",
-    "run_transit",
-    "run_special_points",
-    "run_yogas",
-    "run_refraction_core",
-]
+
+_EXTRACTOR_MODULES = {
+    "run_core_chart": ".core_chart",
+    "run_panchanga": ".panchanga",
+    "run_dashas_vimshottari": ".dashas",
+    "run_strengths": ".strengths",
+    "run_transit": ".transit",
+    "run_special_points": ".special_points",
+    "run_yogas": ".yogas",
+    "run_refraction_core": ".pipeline",
+    "run_gochara": ".gochara",
+    "run_event_scan": ".events",
+    "run_muhurta": ".muhurta",
+    "run_panchanga_calendar": ".panchanga_calendar",
+    "run_solar_ingress": ".solar_ingress",
+    "run_varshaphal": ".varshaphal",
+    "run_tithi_pravesha": ".tithi_pravesha",
+    "run_lunar_calendar": ".lunations",
+    "run_rectification": ".rectification",
+    "run_daily_muhurta": ".daily_muhurta",
+    "run_bhava_systems": ".house_cusps",
+}
+
+__all__ = list(_EXTRACTOR_MODULES)
+
+
+def __getattr__(name):
+    module = _EXTRACTOR_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXTRACTOR_MODULES))
@@ -0,0 +1,244 @@
+"""Array-based ashtakavarga engine with batch charts and transit bindu timelines.
+
+Charts are described by a compact sign vector of shape ``(..., 10)``: the nine
+grahas in PyJHora order (Sun..Ketu) followed by the lagna, each a 0-based rasi.
+Every table keeps the leading batch dimensions of that vector.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from jhora import const
+
+from .ephemeris import sidereal_positions
+
+ASHTAKAVARGA_PLANETS = ["SUN", "MOON", "MARS", "MERCURY", "JUPITER", "VENUS", "SATURN"]
+CHART_POINTS = ASHTAKAVARGA_PLANETS + ["RAHU", "KETU", "LAGNA"]
+LAGNA = CHART_POINTS.index("LAGNA")
+
+RASIMANA_MULTIPLIERS = np.array([7, 10, 8, 4, 10, 6, 7, 8, 9, 5, 11, 12])
+GRAHAMANA_MULTIPLIERS = np.array([5, 5, 8, 5, 10, 7, 5])
+# Signs owned by Mars..Saturn, the planets ekadhipatya sodhana applies to.
+_EKADHIPATYA_SIGNS = {2: (0, 7), 3: (2, 5), 4: (8, 11), 5: (1, 6), 6: (9, 10)}
+
+
+def _bindu_table() -> np.ndarray:
+    """8x8x12 table: [owner, contributor, sign offset] -> bindu (0/1)."""
+    table = np.zeros((8, 8, 12), dtype=np.int8)
+    for owner, contributors in const.ashtaka_varga_dict.items():
+        for contributor, houses in enumerate(contributors):
+            for house in houses:
+                table[int(owner), contributor, (house - 1) % 12] = 1
+    return table
+
+
+BINDU_TABLE = _bindu_table()
+_CONTRIBUTORS = list(range(len(ASHTAKAVARGA_PLANETS))) + [LAGNA]
+
+
+def signs_from_chart(house_to_planet_list: Sequence[str]) -> np.ndarray:
+    """Sign vector from a PyJHora ``house_to_planet_list`` (e.g. ``['', '2/L', ...]``)."""
+    signs = np.full(len(CHART_POINTS), -1, dtype=np.int64)
+    for rasi, occupants in enumerate(house_to_planet_list):
+        for token in str(occupants).split("/"):
+            token = token.strip()
+            if token == const._ascendant_symbol:
+                signs[LAGNA] = rasi
+            elif token.isdigit() and int(token) < LAGNA:
+                signs[int(token)] = rasi
+    if (signs < 0).any():
+        raise ValueError(f"Chart does not place every graha and lagna: {house_to_planet_list}")
+    return signs
+
+
+def signs_from_longitudes(longitudes: np.ndarray, ascendant: np.ndarray) -> np.ndarray:
+    """Sign vectors from ``(..., 9)`` graha longitudes and ``(...)`` ascendants."""
+    points = np.concatenate(
+        [np.asarray(longitudes, dtype=float), np.asarray(ascendant, dtype=float)[..., None]],
+        axis=-1,
+    )
+    return (np.mod(points, 360.0) // 30).astype(np.int64)
+
+
+def prastara_ashtakavarga(signs: np.ndarray) -> np.ndarray:
+    """``(..., 8, 8, 12)`` prastara: [owner, contributor, rasi] with Lagna as 8th entry."""
+    signs = np.asarray(signs, dtype=np.int64)
+    contributor_signs = signs[..., _CONTRIBUTORS]
+    offsets = (np.arange(12) - contributor_signs[..., None]) % 12
+    contributor_index = np.arange(len(_CONTRIBUTORS))[:, None]
+    # BINDU_TABLE[:, c, offsets[..., c, r]] for every owner at once.
+    prastara = BINDU_TABLE[:, contributor_index, offsets]
+    return np.moveaxis(prastara, 0, -3)
+
+
+def binna_ashtakavarga(signs: np.ndarray) -> np.ndarray:
+    """``(..., 8, 12)`` BAV of Sun..Saturn and Lagna (same rows as PyJHora)."""
+    return prastara_ashtakavarga(signs).sum(axis=-2, dtype=np.int16)
+
+
+def samudaya_ashtakavarga(binna: np.ndarray) -> np.ndarray:
+    """``(..., 12)`` SAV; the Lagna row of ``binna`` is excluded."""
+    return binna[..., : len(ASHTAKAVARGA_PLANETS), :].sum(axis=-2)
+
+
+def trikona_sodhana(binna: np.ndarray) -> np.ndarray:
+    """Trikona reduction of the Sun..Saturn rows; Lagna row is passed through.
+
+    The three classical rules reduce to subtracting each trine's minimum: a zero
+    minimum leaves the trine unchanged and equal values collapse to zero.
+    """
+    reduced = np.array(binna, copy=True)
+    planets = reduced[..., : len(ASHTAKAVARGA_PLANETS), :]
+    trines = planets.reshape(planets.shape[:-1] + (3, 4))
+    trines -= trines.min(axis=-2, keepdims=True)
+    reduced[..., : len(ASHTAKAVARGA_PLANETS), :] = trines.reshape(planets.shape)
+    return reduced
+
+
+def _occupied_signs(signs: np.ndarray) -> np.ndarray:
+    signs = np.asarray(signs, dtype=np.int64)
+    return (signs[..., :, None] == np.arange(12)).any(axis=-2)
+
+
+def ekadhipatya_sodhana(binna_after_trikona: np.ndarray, signs: np.ndarray) -> np.ndarray:
+    """Ekadhipatya reduction for the two signs owned by each of Mars..Saturn."""
+    reduced = np.array(binna_after_trikona, copy=True)
+    occupied = _occupied_signs(signs)
+    for planet, (r1, r2) in _EKADHIPATYA_SIGNS.items():
+        a = reduced[..., planet, r1]
+        b = reduced[..., planet, r2]
+        o1 = occupied[..., r1]
+        o2 = occupied[..., r2]
+        skip = (a == 0) | (b == 0) | (o1 & o2)
+        both_empty = ~skip & ~o1 & ~o2
+        lower = np.where(a != b, np.minimum(a, b), 0)
+        new_a = np.select(
+            [skip, both_empty, o1], [a, lower, a], default=np.where(a < b, 0, b)
+        )
+        new_b = np.select(
+            [skip, both_empty, o2], [b, lower, b], default=np.where(b < a, 0, a)
+        )
+        reduced[..., planet, r1] = new_a
+        reduced[..., planet, r2] = new_b
+    return reduced
+
+
+def sodhya_pindas(
+    binna: np.ndarray, signs: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Raasi, graha and sodhya pindas ``(..., 7)`` from an unreduced BAV."""
+    signs = np.asarray(signs, dtype=np.int64)
+    sodhita = ekadhipatya_sodhana(trikona_sodhana(binna), signs)
+    planets = sodhita[..., : len(ASHTAKAVARGA_PLANETS), :].astype(np.int64)
+    raasi_pindas = planets @ RASIMANA_MULTIPLIERS
+    planet_signs = signs[..., None, : len(ASHTAKAVARGA_PLANETS)]
+    graha_bindus = np.take_along_axis(
+        planets, np.broadcast_to(planet_signs, planets.shape[:-1] + (7,)), axis=-1
+    )
+    graha_pindas = graha_bindus @ GRAHAMANA_MULTIPLIERS
+    return raasi_pindas, graha_pindas, raasi_pindas + graha_pindas
+
+
+@dataclass
+class AshtakavargaTables:
+    signs: np.ndarray
+    prastara: np.ndarray
+    binna: np.ndarray
+    samudaya: np.ndarray
+
+    @property
+    def batch_shape(self) -> Tuple[int, ...]:
+        return self.signs.shape[:-1]
+
+    def sodhya_pindas(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        return sodhya_pindas(self.binna, self.signs)
+
+
+def compute_ashtakavarga(signs: np.ndarray) -> AshtakavargaTables:
+    """BAV, SAV and prastara tables for one sign vector or a batch of them."""
+    signs = np.asarray(signs, dtype=np.int64)
+    if signs.shape[-1] != len(CHART_POINTS):
+        raise ValueError(
+            f"sign vectors must have {len(CHART_POINTS)} entries "
+            f"({', '.join(CHART_POINTS)}), got shape {signs.shape}"
+        )
+    if ((signs < 0) | (signs > 11)).any():
+        raise ValueError("sign indices must be within 0..11")
+    prastara = prastara_ashtakavarga(signs)
+    binna = prastara.sum(axis=-2, dtype=np.int16)
+    return AshtakavargaTables(
+        signs=signs,
+        prastara=prastara,
+        binna=binna,
+        samudaya=samudaya_ashtakavarga(binna),
+    )
+
+
+@dataclass
+class BinduTimeline:
+    """Transit bindus sampled at ``jd_utc``; ``bav``/``sav`` are ``(..., T, 7)``."""
+
+    jd_utc: np.ndarray
+    transit_signs: np.ndarray
+    bav: np.ndarray
+    sav: np.ndarray
+
+    def segments(self, chart: int | Tuple[int, ...] = ()) -> List[Dict[str, Any]]:
+        """Sign stays of each transiting planet with their bindus for one chart.
+
+        ``chart`` indexes the batch dimensions; leave it empty for a single chart.
+        """
+        bav = self.bav[chart]
+        sav = self.sav[chart]
+        records: List[Dict[str, Any]] = []
+        for col, planet in enumerate(ASHTAKAVARGA_PLANETS):
+            signs = self.transit_signs[:, col]
+            starts = np.flatnonzero(np.r_[True, signs[1:] != signs[:-1]])
+            ends = np.r_[starts[1:], signs.size] - 1
+            for start, end in zip(starts, ends):
+                records.append(
+                    {
+                        "planet": planet,
+                        "sign_index": int(signs[start]),
+                        "start_jd_utc": float(self.jd_utc[start]),
+                        "end_jd_utc": float(self.jd_utc[end]),
+                        "bav_bindus": int(bav[start, col]),
+                        "sav_bindus": int(sav[start, col]),
+                    }
+                )
+        records.sort(key=lambda item: (item["start_jd_utc"], item["planet"]))
+        return records
+
+
+def transit_bindu_timeline(
+    tables: AshtakavargaTables,
+    start_jd_utc: float,
+    end_jd_utc: float,
+    step_days: float = 1.0,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> BinduTimeline:
+    """BAV/SAV bindus of transiting Sun..Saturn over a date range.
+
+    The natal tables are computed once by the caller; each sample only adds
+    one batched ephemeris lookup and a table gather.
+    """
+    if end_jd_utc < start_jd_utc:
+        raise ValueError("end_jd_utc must not precede start_jd_utc")
+    if step_days <= 0:
+        raise ValueError("step_days must be positive")
+    jd_utc = np.arange(start_jd_utc, end_jd_utc + step_days / 2, step_days)
+    longitudes, _ = sidereal_positions(
+        jd_utc,
+        ASHTAKAVARGA_PLANETS,
+        ayanamsa_mode=ayanamsa_mode,
+        ayanamsa_value=ayanamsa_value,
+    )
+    transit_signs = (longitudes // 30).astype(np.int64)
+    planet_index = np.arange(len(ASHTAKAVARGA_PLANETS))
+    bav = tables.binna[..., planet_index, transit_signs]
+    sav = tables.samudaya[..., transit_signs]
+    return BinduTimeline(jd_utc=jd_utc, transit_signs=transit_signs, bav=bav, sav=sav)
@@ -0,0 +1,321 @@
+"""Columnar (Arrow/Parquet/Feather) export of Refraction Engine V1 bundles.
+
+``run_refraction_core`` bundles are flattened into four tables keyed by
+``chart_id``: ``positions`` (ascendant and planets of every core chart frame),
+``dashas`` (vimshottari periods of every level), ``strengths`` (shadbala per
+graha) and ``yogas``. Column names and Arrow types are fixed by
+``TABLE_COLUMNS`` and stamped with ``COLUMNAR_SCHEMA_VERSION``, so files
+written by different jobs concatenate. Names that follow from an index
+(``sign_name``, ``nakshatra_name``) are not stored.
+
+``ColumnarWriter`` buffers at most ``chunk_size`` bundles, writes them as one
+record batch (a Parquet row group or an Arrow IPC batch) per table and drops
+them, so memory stays bounded however many bundles are exported.
+``read_tables`` reads the files back.
+
+``pyarrow`` is only needed to build batches and write or read files;
+``bundle_columns`` works without it.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+COLUMNAR_SCHEMA_VERSION = "columnar_export_spec_v1"
+FORMATS = ("parquet", "feather")
+_SUFFIXES = {"parquet": ".parquet", "feather": ".feather"}
+DEFAULT_CHUNK_SIZE = 10_000
+
+TABLE_COLUMNS: Dict[str, Tuple[Tuple[str, str], ...]] = {
+    "positions": (
+        ("chart_id", "string"),
+        ("frame_id", "string"),
+        ("body", "string"),
+        ("longitude_deg", "float64"),
+        ("degree_in_sign", "float64"),
+        ("sign_index", "int8"),
+        ("house_index", "int8"),
+        ("nakshatra_index", "int8"),
+        ("nakshatra_pada", "int8"),
+        ("speed_deg_per_day", "float64"),
+        ("retrograde", "bool"),
+    ),
+    "dashas": (
+        ("chart_id", "string"),
+        ("frame_id", "string"),
+        ("level", "string"),
+        ("order_index", "int16"),
+        ("planet_id", "string"),
+        ("start", "timestamp"),
+        ("end", "timestamp"),
+        ("duration_years", "float64"),
+        ("is_current", "bool"),
+    ),
+    "strengths": (
+        ("chart_id", "string"),
+        ("planet_id", "string"),
+        ("total_shadbala", "float64"),
+        ("strength_ratio", "float64"),
+        ("is_strong", "bool"),
+        ("is_weak", "bool"),
+    ),
+    "yogas": (
+        ("chart_id", "string"),
+        ("yoga_id", "string"),
+        ("name", "string"),
+        ("category", "string"),
+        ("tier", "int8"),
+        ("strength", "string"),
+        ("active", "bool"),
+        ("planets", "list<string>"),
+        ("formation_details", "json"),
+    ),
+}
+TABLES = tuple(TABLE_COLUMNS)
+ASCENDANT_BODY = "ASCENDANT"
+
+
+def _arrow_type(name: str) -> Any:
+    import pyarrow as pa
+
+    return {
+        "string": pa.string(),
+        "json": pa.string(),
+        "float64": pa.float64(),
+        "int8": pa.int8(),
+        "int16": pa.int16(),
+        "bool": pa.bool_(),
+        "timestamp": pa.timestamp("us", tz="UTC"),
+        "list<string>": pa.list_(pa.string()),
+    }[name]
+
+
+def table_schema(table: str) -> Any:
+    """``pyarrow.Schema`` of one of ``TABLES``."""
+    import pyarrow as pa
+
+    if table not in TABLE_COLUMNS:
+        raise ValueError(f"Unknown columnar table '{table}'")
+    return pa.schema(
+        [pa.field(column, _arrow_type(kind)) for column, kind in TABLE_COLUMNS[table]],
+        metadata={"schema_version": COLUMNAR_SCHEMA_VERSION, "table": table},
+    )
+
+
+def _empty_columns() -> Dict[str, Dict[str, List[Any]]]:
+    return {table: {column: [] for column, _ in columns} for table, columns in TABLE_COLUMNS.items()}
+
+
+def _chart_id(bundle: Dict[str, Any], index: int) -> str:
+    chart_id = (bundle.get("person") or {}).get("id")
+    if chart_id is None:
+        raise ValueError(f"Bundle {index} has no person.id; pass chart_ids")
+    return str(chart_id)
+
+
+def _timestamp(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _append_bundle(columns: Dict[str, Dict[str, List[Any]]], bundle: Dict[str, Any], chart_id: str) -> None:
+    frames = bundle.get("frames") or {}
+
+    positions = columns["positions"]
+    for frame in (frames.get("core_chart") or {}).get("frames") or []:
+        bodies = [(ASCENDANT_BODY, frame["ascendant"])] if frame.get("ascendant") else []
+        bodies += [(planet["id"], planet) for planet in frame.get("planets") or []]
+        for body, entry in bodies:
+            positions["chart_id"].append(chart_id)
+            positions["frame_id"].append(frame.get("frame_id"))
+            positions["body"].append(body)
+            for column in TABLE_COLUMNS["positions"][3:]:
+                positions[column[0]].append(entry.get(column[0]))
+
+    dashas = columns["dashas"]
+    for frame in (frames.get("dashas_vimshottari") or {}).get("frames") or []:
+        for level in frame.get("levels") or []:
+            for period in level.get("periods") or []:
+                dashas["chart_id"].append(chart_id)
+                dashas["frame_id"].append(frame.get("frame_id"))
+                dashas["level"].append(level.get("level"))
+                dashas["order_index"].append(period.get("order_index"))
+                dashas["planet_id"].append(period.get("planet_id"))
+                dashas["start"].append(_timestamp(period.get("start")))
+                dashas["end"].append(_timestamp(period.get("end")))
+                dashas["duration_years"].append(period.get("duration_years"))
+                dashas["is_current"].append(period.get("is_current"))
+
+    strength_frames = (frames.get("strengths") or {}).get("frames") or {}
+    summary = strength_frames.get("summary") or {}
+    strong, weak = set(summary.get("strong_planets") or []), set(summary.get("weak_planets") or [])
+    strengths = columns["strengths"]
+    for planet in strength_frames.get("planets") or []:
+        strengths["chart_id"].append(chart_id)
+        strengths["planet_id"].append(planet.get("planet_id"))
+        strengths["total_shadbala"].append(planet.get("total_shadbala"))
+        strengths["strength_ratio"].append(planet.get("strength_ratio"))
+        strengths["is_strong"].append(planet.get("planet_id") in strong)
+        strengths["is_weak"].append(planet.get("planet_id") in weak)
+
+    yogas = columns["yogas"]
+    for yoga in ((frames.get("yogas") or {}).get("frames") or {}).get("yogas") or []:
+        yogas["chart_id"].append(chart_id)
+        yogas["yoga_id"].append(yoga.get("id"))
+        for column in ("name", "category", "tier", "strength", "active", "planets"):
+            yogas[column].append(yoga.get(column))
+        details = yoga.get("formation_details")
+        yogas["formation_details"].append(None if details is None else json.dumps(details, sort_keys=True))
+
+
+def bundle_columns(
+    bundles: Iterable[Dict[str, Any]], chart_ids: Optional[Sequence[str]] = None
+) -> Dict[str, Dict[str, List[Any]]]:
+    """Python column lists of every table for ``bundles``.
+
+    ``chart_ids`` overrides each bundle's ``person.id``.
+    """
+    columns = _empty_columns()
+    for index, bundle in enumerate(bundles):
+        chart_id = str(chart_ids[index]) if chart_ids is not None else _chart_id(bundle, index)
+        _append_bundle(columns, bundle, chart_id)
+    return columns
+
+
+def _record_batch(table: str, columns: Dict[str, List[Any]]) -> Any:
+    import pyarrow as pa
+
+    return pa.RecordBatch.from_pydict(columns, schema=table_schema(table))
+
+
+def record_batches(
+    bundles: Iterable[Dict[str, Any]], chart_ids: Optional[Sequence[str]] = None
+) -> Dict[str, Any]:
+    """One ``pyarrow.RecordBatch`` per table for ``bundles``."""
+    return {
+        table: _record_batch(table, columns)
+        for table, columns in bundle_columns(bundles, chart_ids).items()
+    }
+
+
+def table_path(directory: Path, table: str, fmt: str = "parquet") -> Path:
+    if fmt not in _SUFFIXES:
+        raise ValueError(f"Unknown columnar format '{fmt}'; expected one of {FORMATS}")
+    return Path(directory) / f"{table}{_SUFFIXES[fmt]}"
+
+
+class ColumnarWriter:
+    """Streams bundles into one file per table under ``directory``.
+
+    Use as a context manager or call ``close``; files are complete only
+    after it.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        fmt: str = "parquet",
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        compression: Optional[str] = "zstd",
+    ):
+        import pyarrow as pa
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.fmt = fmt
+        self.chunk_size = chunk_size
+        self.paths = {table: table_path(self.directory, table, fmt) for table in TABLES}
+        self.bundles_written = 0
+        self._pending = 0
+        self._columns = _empty_columns()
+        self._writers: Dict[str, Any] = {}
+        for table, path in self.paths.items():
+            schema = table_schema(table)
+            if fmt == "parquet":
+                import pyarrow.parquet as pq
+
+                self._writers[table] = pq.ParquetWriter(path, schema, compression=compression or "none")
+            else:
+                options = pa.ipc.IpcWriteOptions(compression=compression)
+                self._writers[table] = pa.ipc.new_file(str(path), schema, options=options)
+
+    def write(self, bundle: Dict[str, Any], chart_id: Optional[str] = None) -> None:
+        if self._writers is None:
+            raise ValueError("ColumnarWriter is closed")
+        chart_id = str(chart_id) if chart_id is not None else _chart_id(bundle, self.bundles_written)
+        _append_bundle(self._columns, bundle, chart_id)
+        self.bundles_written += 1
+        self._pending += 1
+        if self._pending >= self.chunk_size:
+            self.flush()
+
+    def write_many(
+        self, bundles: Iterable[Dict[str, Any]], chart_ids: Optional[Iterable[str]] = None
+    ) -> None:
+        if chart_ids is None:
+            for bundle in bundles:
+                self.write(bundle)
+        else:
+            for bundle, chart_id in zip(bundles, chart_ids):
+                self.write(bundle, chart_id)
+
+    def flush(self) -> None:
+        """Write the buffered bundles as one batch per table."""
+        if not self._pending:
+            return
+        for table, columns in self._columns.items():
+            if columns["chart_id"]:
+                self._writers[table].write_batch(_record_batch(table, columns))
+        self._columns = _empty_columns()
+        self._pending = 0
+
+    def close(self) -> Dict[str, Path]:
+        if self._writers is not None:
+            self.flush()
+            for writer in self._writers.values():
+                writer.close()
+            self._writers = None
+        return self.paths
+
+    def __enter__(self) -> "ColumnarWriter":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def export_bundles(
+    bundles: Iterable[Dict[str, Any]],
+    directory: Path,
+    fmt: str = "parquet",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    chart_ids: Optional[Iterable[str]] = None,
+    compression: Optional[str] = "zstd",
+) -> Dict[str, Path]:
+    """Write ``bundles`` (any iterable, consumed once) to ``directory``; returns the paths."""
+    with ColumnarWriter(directory, fmt, chunk_size, compression) as writer:
+        writer.write_many(bundles, chart_ids)
+    return writer.paths
+
+
+def read_tables(
+    directory: Path, fmt: str = "parquet", tables: Sequence[str] = TABLES
+) -> Dict[str, Any]:
+    """``pyarrow.Table`` of each exported table under ``directory``."""
+    import pyarrow as pa
+
+    result = {}
+    for table in tables:
+        path = table_path(directory, table, fmt)
+        if fmt == "parquet":
+            import pyarrow.parquet as pq
+
+            result[table] = pq.read_table(path, schema=table_schema(table))
+        else:
+            with pa.OSFile(str(path), "rb") as source:
+                result[table] = pa.ipc.open_file(source).read_all()
+    return result
@@ -6,7 +6,6 @@ import json
 from dataclasses import dataclass
 from datetime import datetime, timezone as dt_timezone
 from functools import lru_cache
-from pathlib import Path
 from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import pytz
@@ -15,6 +14,7 @@ from jhora import const, utils
 from jhora.panchanga import drik
 from jhora.horoscope.chart import charts
 
+from .ephemeris import calc_ut
 from .graha import (
     GrahaID,
     GRAHA_ORDER,
@@ -27,21 +27,19 @@ from .graha import (
     rasi_index_from_longitude,
     rasi_index_to_name,
 )
+from .profiling import instrumented
+from .resource_snapshot import CORE_PRIMITIVES_PATH, core_primitives
 
 CORE_SCHEMA_VERSION = "core_chart_spec_v1"
-CORE_PRIMITIVES_PATH = (
-    Path(__file__).resolve().parents[2]
-    / "docs"
-    / "pyjhora_knowledge"
-    / "primitives"
-    / "CorePrimitives.json"
-)
 
 DEFAULT_INCLUDE_BODIES = [graha_id_to_string(graha) for graha in GRAHA_ORDER]
 
 
 @lru_cache(maxsize=1)
 def _load_core_primitives() -> Dict[str, Any]:
+    primitives = core_primitives()
+    if primitives is not None:
+        return primitives
     with CORE_PRIMITIVES_PATH.open() as f:
         return json.load(f)
 
@@ -369,7 +367,7 @@ def _compute_raw_d1_chart(
     def _true_rahu_longitude() -> float:
         jd_ut = jd - tz_offset / 24.0
         flags = swe.FLG_SWIEPH | swe.FLG_SIDEREAL
-        longitudes, _ = swe.calc_ut(jd_ut, swe.TRUE_NODE, flags=flags)
+        longitudes, _ = calc_ut(jd_ut, swe.TRUE_NODE, flags=flags)
         return _normalize_angle(longitudes[0])
 
     bodies: List[RawBodyPosition] = []
@@ -449,6 +447,7 @@ def _build_position_record(
     return base_record
 
 
+@instrumented("core_chart")
 def run_core_chart(payload: Dict[str, Any]) -> Dict[str, Any]:
     normalized = _parse_core_chart_input(payload)
     config = normalized["config"]
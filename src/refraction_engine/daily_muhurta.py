@@ -0,0 +1,369 @@
+"""Daily muhurta windows for Refraction Engine V1.
+
+The ``drik`` window functions (``gauri_choghadiya``, ``shubha_hora``,
+``trikalam``, ``durmuhurtam``, ``abhijit_muhurta``, ``brahma_muhurtha``,
+``nishita_kaala``, ``muhurthas``, ``amrita_gadiya``, ``varjyam``) each search
+sunrise, sunset and the next sunrise again and format their results as
+strings. ``DailyMuhurtaContext`` holds those instants for a whole date range,
+together with the nakshatra spans covering it, and derives every window from
+them with NumPy as ``[start, end]`` Julian days (UTC). Formatting happens only
+in ``daily_muhurta_entries``.
+
+The day and night divisions follow drik, including its quirks: durmuhurtam
+always lasts 0.8/12 of the day, and brahma muhurtha counts back from sunrise
+in muhurtas of the night that follows the day. Amrita gadiya and varjyam are
+placed in the nakshatra span they belong to, solved exactly, and reported on
+the day (sunrise to next sunrise) in which they begin; ``drik.nakshatra``
+approximates the span ends and guesses its start, so drik's times can be off
+by several minutes.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, timezone as dt_timezone
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pytz
+from jhora import const
+
+from .core_chart import _language_list
+from .ephemeris import jd_to_datetime, sidereal_positions
+from .graha import GrahaID, graha_id_to_string, nakshatra_index_to_name
+from .panchanga_calendar import (
+    TRIKALAM_TAGS,
+    CalendarDays,
+    CalendarLocation,
+    _parse_location,
+    compute_calendar_days,
+)
+from .profiling import instrumented
+from .solar_ingress import unwrapped_crossings
+
+DAILY_MUHURTA_SCHEMA_VERSION = "daily_muhurta_spec_v1"
+
+# Names of the const.gauri_choghadiya_types indices.
+CHOGHADIYA_TYPES = ("UDVEG", "CHARA", "LAABHA", "AMRIT", "KAALA", "SHUBHA", "ROG")
+AMRIT_CHOGHADIYA = 3
+CHOGHADIYA_DAY_TABLE = np.array(const.gauri_choghadiya_day_table)
+CHOGHADIYA_NIGHT_TABLE = np.array(const.gauri_choghadiya_night_table)
+# Hora lords as PyJHora planet indices, rows = weekday.
+HORA_DAY_TABLE = np.array(const.shubha_hora_day_table).T
+HORA_NIGHT_TABLE = np.array(const.shubha_hora_night_table).T
+HORA_LORDS = tuple(graha_id_to_string(GrahaID(index)) for index in range(7))
+MUHURTHA_NAMES = tuple(name.upper() for name in const.muhurthas_of_the_day)
+MUHURTHA_AUSPICIOUS = np.array(list(const.muhurthas_of_the_day.values()), dtype=bool)
+# Twelfths of the day after sunrise per weekday; 0 = no second durmuhurtam.
+# Tuesday's second one counts twelfths of the night after sunset.
+DURMUHURTAM_OFFSETS = np.array(
+    [[10.4, 0.0], [6.4, 8.8], [2.4, 4.8], [5.6, 0.0], [4.0, 8.8], [2.4, 6.4], [1.6, 0.0]]
+)
+_TUESDAY = 2
+NAKSHATRA_SPAN_DEG = 360.0 / 27.0
+# The Moon covers at most ~15.5 degrees a day: a 6 hour grid leaves each
+# nakshatra boundary alone in its cell, and a nakshatra never lasts 1.5 days.
+_MOON_GRID_DAYS = 0.25
+_NAKSHATRA_MARGIN_DAYS = 1.5
+# Amrita gadiya / varjyam start, in 24ths of the nakshatra, and length.
+_GADIYA_FRACTION = 1.6 / 24.0
+
+
+def _divisions(start: np.ndarray, length: np.ndarray, parts: int) -> np.ndarray:
+    """``(D, parts, 2)`` equal divisions of ``[start, start + length]``."""
+    edges = start[:, None] + length[:, None] * (np.arange(parts + 1) / parts)
+    return np.stack([edges[:, :-1], edges[:, 1:]], axis=-1)
+
+
+def _span(start: np.ndarray, end: np.ndarray) -> np.ndarray:
+    return np.stack([start, end], axis=-1)
+
+
+def nakshatra_spans(
+    start_jd_utc: float,
+    end_jd_utc: float,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Nakshatras (1-27) and their ``(N, 2)`` start/end JD (UTC) covering the span.
+
+    Only complete nakshatras are returned; the first starts at or before
+    ``start_jd_utc`` and the last ends at or after ``end_jd_utc``.
+    """
+    grid = np.arange(
+        start_jd_utc - _NAKSHATRA_MARGIN_DAYS,
+        end_jd_utc + _NAKSHATRA_MARGIN_DAYS + _MOON_GRID_DAYS,
+        _MOON_GRID_DAYS,
+    )
+    longitudes, _ = sidereal_positions(
+        grid, ["MOON"], ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value
+    )
+    moon = longitudes[:, 0]
+
+    def _moon_at(jd_utc: float) -> float:
+        position, _ = sidereal_positions(
+            [jd_utc], ["MOON"], ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value
+        )
+        return float(position[0, 0])
+
+    crossings = unwrapped_crossings(
+        grid, np.unwrap(moon, period=360.0), NAKSHATRA_SPAN_DEG, 0.0, _moon_at
+    )
+    times = crossings["jd_utc"]
+    first = int(moon[0] // NAKSHATRA_SPAN_DEG)
+    numbers = (first + 1 + np.arange(len(times) - 1)) % 27 + 1
+    return numbers, _span(times[:-1], times[1:])
+
+
+@dataclass
+class DailyMuhurtaContext:
+    """Sunrises, weekdays and nakshatra spans of a date range, computed once.
+
+    Window methods return ``[..., 2]`` arrays of start/end JD (UTC) with one
+    leading row per date; absent windows are NaN.
+    """
+
+    days: CalendarDays
+    nakshatra: np.ndarray
+    nakshatra_spans: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    @property
+    def day_length(self) -> np.ndarray:
+        return self.days.day_length
+
+    @property
+    def night_length(self) -> np.ndarray:
+        return self.days.next_sunrise_jd_utc - self.days.sunset_jd_utc
+
+    def choghadiya(self) -> Tuple[np.ndarray, np.ndarray]:
+        """``(D, 16, 2)`` day then night choghadiyas and their ``CHOGHADIYA_TYPES`` indices."""
+        windows = np.concatenate(
+            [
+                _divisions(self.days.sunrise_jd_utc, self.day_length, 8),
+                _divisions(self.days.sunset_jd_utc, self.night_length, 8),
+            ],
+            axis=1,
+        )
+        types = np.concatenate(
+            [CHOGHADIYA_DAY_TABLE[self.days.weekday], CHOGHADIYA_NIGHT_TABLE[self.days.weekday]],
+            axis=1,
+        )
+        return windows, types
+
+    def amrit_kaalam(self) -> np.ndarray:
+        """``(D, 16, 2)`` choghadiyas of the Amrit type, NaN elsewhere."""
+        windows, types = self.choghadiya()
+        return np.where((types == AMRIT_CHOGHADIYA)[..., None], windows, np.nan)
+
+    def horas(self) -> Tuple[np.ndarray, np.ndarray]:
+        """``(D, 24, 2)`` day then night horas and their ``HORA_LORDS`` indices."""
+        windows = np.concatenate(
+            [
+                _divisions(self.days.sunrise_jd_utc, self.day_length, 12),
+                _divisions(self.days.sunset_jd_utc, self.night_length, 12),
+            ],
+            axis=1,
+        )
+        lords = np.concatenate(
+            [HORA_DAY_TABLE[self.days.weekday], HORA_NIGHT_TABLE[self.days.weekday]], axis=1
+        )
+        return windows, lords
+
+    def muhurthas(self) -> np.ndarray:
+        """``(D, 30, 2)`` muhurthas in ``MUHURTHA_NAMES`` order."""
+        return np.concatenate(
+            [
+                _divisions(self.days.sunrise_jd_utc, self.day_length, 15),
+                _divisions(self.days.sunset_jd_utc, self.night_length, 15),
+            ],
+            axis=1,
+        )
+
+    def trikalam(self) -> np.ndarray:
+        """``(D, 3, 2)`` blocks in ``TRIKALAM_TAGS`` order."""
+        return self.days.trikalam_blocks()
+
+    def durmuhurtam(self) -> np.ndarray:
+        offsets = DURMUHURTAM_OFFSETS[self.days.weekday]
+        base = np.repeat(self.days.sunrise_jd_utc[:, None], 2, axis=1)
+        unit = np.repeat(self.day_length[:, None], 2, axis=1) / 12.0
+        tuesday = self.days.weekday == _TUESDAY
+        base[tuesday, 1] = self.days.sunset_jd_utc[tuesday]
+        unit[tuesday, 1] = self.night_length[tuesday] / 12.0
+        start = np.where(offsets != 0.0, base + unit * offsets, np.nan)
+        return _span(start, start + self.day_length[:, None] * 0.8 / 12.0)
+
+    def abhijit_muhurta(self) -> np.ndarray:
+        return self.muhurthas()[:, 7]
+
+    def brahma_muhurtha(self) -> np.ndarray:
+        night_muhurtha = self.night_length / 15.0
+        sunrise = self.days.sunrise_jd_utc
+        return _span(sunrise - 2 * night_muhurtha, sunrise - night_muhurtha)
+
+    def nishita_kaala(self) -> np.ndarray:
+        ghati = self.night_length / 30.0
+        sunset = self.days.sunset_jd_utc
+        return _span(sunset + 7 * ghati, sunset + 8 * ghati)
+
+    def _gadiya(self, column: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Windows starting in each day, ``(D, K, 2)``, and their nakshatras ``(D, K)``."""
+        factors = np.array(
+            [
+                entry[column] if isinstance(entry[column], tuple) else (entry[column], np.nan)
+                for entry in const.amrita_gadiya_varjyam_star_map
+            ]
+        )[self.nakshatra - 1]
+        span_start = self.nakshatra_spans[:, :1]
+        duration = self.nakshatra_spans[:, 1:] - span_start
+        start = (span_start + duration * factors / 24.0).ravel()
+        end = start + np.repeat(duration[:, 0] * _GADIYA_FRACTION, 2)
+        nakshatra = np.repeat(self.nakshatra, 2)
+        keep = ~np.isnan(start)
+        order = np.argsort(start[keep], kind="stable")
+        start, end, nakshatra = start[keep][order], end[keep][order], nakshatra[keep][order]
+        first = np.searchsorted(start, self.days.sunrise_jd_utc)
+        stop = np.searchsorted(start, self.days.next_sunrise_jd_utc)
+        width = int(max((stop - first).max(), 1))
+        windows = np.full((len(self), width, 2), np.nan)
+        numbers = np.zeros((len(self), width), dtype=np.int64)
+        for row, (lo, hi) in enumerate(zip(first, stop)):
+            windows[row, : hi - lo] = _span(start[lo:hi], end[lo:hi])
+            numbers[row, : hi - lo] = nakshatra[lo:hi]
+        return windows, numbers
+
+    def amrita_gadiya(self) -> Tuple[np.ndarray, np.ndarray]:
+        return self._gadiya(0)
+
+    def varjyam(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Mula carries two varjyams, so a day may hold more than one."""
+        return self._gadiya(1)
+
+
+def daily_muhurta_context(
+    start_date: date,
+    end_date: date,
+    location: CalendarLocation,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> DailyMuhurtaContext:
+    """One sunrise/sunset search per date and one Moon sweep for the whole range."""
+    days = compute_calendar_days(start_date, end_date, location)
+    numbers, spans = nakshatra_spans(
+        float(days.sunrise_jd_utc[0]),
+        float(days.next_sunrise_jd_utc[-1]),
+        ayanamsa_mode,
+        ayanamsa_value,
+    )
+    return DailyMuhurtaContext(days=days, nakshatra=numbers, nakshatra_spans=spans)
+
+
+def _local_iso(jd_utc: float, tz: Any) -> Optional[str]:
+    if np.isnan(jd_utc):
+        return None
+    return jd_to_datetime(float(jd_utc)).astimezone(tz).isoformat()
+
+
+def _window(window: np.ndarray, tz: Any, **labels: Any) -> Dict[str, Any]:
+    return {**labels, "start": _local_iso(window[0], tz), "end": _local_iso(window[1], tz)}
+
+
+def daily_muhurta_entries(
+    context: DailyMuhurtaContext, timezone_name: str
+) -> Dict[str, Dict[str, Any]]:
+    """Day records keyed by ISO date with every window as local ISO timestamps."""
+    tz = pytz.timezone(timezone_name)
+    choghadiya, choghadiya_types = context.choghadiya()
+    horas, hora_lords = context.horas()
+    muhurthas = context.muhurthas()
+    trikalam = context.trikalam()
+    durmuhurtam = context.durmuhurtam()
+    brahma = context.brahma_muhurtha()
+    nishita = context.nishita_kaala()
+    amrita, amrita_stars = context.amrita_gadiya()
+    varjyam, varjyam_stars = context.varjyam()
+    weekday_names = _language_list("DAYS_LIST")
+    entries: Dict[str, Dict[str, Any]] = {}
+    for row, day in enumerate(context.days.dates):
+        weekday = int(context.days.weekday[row])
+        entries[day.isoformat()] = {
+            "vaara": {"index": weekday, "name": weekday_names[weekday]},
+            "sunrise": _local_iso(context.days.sunrise_jd_utc[row], tz),
+            "sunset": _local_iso(context.days.sunset_jd_utc[row], tz),
+            "next_sunrise": _local_iso(context.days.next_sunrise_jd_utc[row], tz),
+            "choghadiya": [
+                _window(window, tz, type=CHOGHADIYA_TYPES[kind], night=col >= 8)
+                for col, (window, kind) in enumerate(zip(choghadiya[row], choghadiya_types[row]))
+            ],
+            "hora": [
+                _window(window, tz, lord=HORA_LORDS[lord], night=col >= 12)
+                for col, (window, lord) in enumerate(zip(horas[row], hora_lords[row]))
+            ],
+            "muhurtha": [
+                _window(window, tz, name=name, auspicious=bool(auspicious))
+                for window, name, auspicious in zip(
+                    muhurthas[row], MUHURTHA_NAMES, MUHURTHA_AUSPICIOUS
+                )
+            ],
+            "trikalam": [
+                _window(window, tz, tag=tag) for window, tag in zip(trikalam[row], TRIKALAM_TAGS)
+            ],
+            "durmuhurtam": [
+                _window(window, tz) for window in durmuhurtam[row] if not np.isnan(window[0])
+            ],
+            "abhijit_muhurta": _window(muhurthas[row, 7], tz),
+            "brahma_muhurtha": _window(brahma[row], tz),
+            "nishita_kaala": _window(nishita[row], tz),
+            "amrita_gadiya": [
+                _window(window, tz, nakshatra=nakshatra_index_to_name(int(star)))
+                for window, star in zip(amrita[row], amrita_stars[row])
+                if star
+            ],
+            "varjyam": [
+                _window(window, tz, nakshatra=nakshatra_index_to_name(int(star)))
+                for window, star in zip(varjyam[row], varjyam_stars[row])
+                if star
+            ],
+        }
+    return entries
+
+
+@instrumented("daily_muhurta")
+def run_daily_muhurta(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload wrapper: ``daily_muhurta`` holds the date range and location."""
+    section = payload.get("daily_muhurta")
+    if not section:
+        raise ValueError("Missing 'daily_muhurta' section in payload")
+    if not section.get("location"):
+        raise ValueError("daily_muhurta.location is required")
+    location = _parse_location(section["location"], section.get("timezone_name"))
+    try:
+        start_date = date.fromisoformat(section["start_date"])
+    except KeyError as exc:
+        raise ValueError(f"Missing daily_muhurta field: {exc}") from exc
+    end_date = date.fromisoformat(section.get("end_date") or section["start_date"])
+
+    config = payload.get("config") or {}
+    ayanamsa_mode = config.get("ayanamsa_mode") or const._DEFAULT_AYANAMSA_MODE
+    if str(config.get("zodiac_type", "SIDEREAL")).upper() != "SIDEREAL":
+        ayanamsa_mode = None
+    context = daily_muhurta_context(
+        start_date, end_date, location, ayanamsa_mode, config.get("ayanamsa_value_deg")
+    )
+    return {
+        "meta": {
+            "schema_version": DAILY_MUHURTA_SCHEMA_VERSION,
+            "timestamp_utc": datetime.now(dt_timezone.utc).isoformat(),
+            "range": {"start": start_date.isoformat(), "end": end_date.isoformat()},
+        },
+        "place": {
+            "name": location.place_name,
+            "latitude_deg": location.latitude,
+            "longitude_deg": location.longitude,
+            "timezone": location.timezone_name,
+        },
+        "days": daily_muhurta_entries(context, location.timezone_name),
+    }
@@ -11,6 +11,7 @@ from jhora.horoscope.dhasa.graha import vimsottari
 from jhora.panchanga import drik
 
 from .core_chart import _load_core_primitives, _parse_core_chart_input
+from .profiling import instrumented
 
 def _birth_context(birth: Any, location: Any) -> Dict[str, Any]:
     dt = birth.aware_datetime
@@ -128,6 +129,7 @@ def _build_periods(
     return periods, current
 
 
+@instrumented("dashas_vimshottari")
 def run_dashas_vimshottari(payload: Dict[str, Any]) -> Dict[str, Any]:
     normalized = _parse_core_chart_input(payload)
     birth = normalized["birth"]
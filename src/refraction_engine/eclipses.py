@@ -0,0 +1,288 @@
+"""Precomputed eclipse catalog with range queries for Refraction Engine V1.
+
+Global solar and lunar eclipses are enumerated once per block of years and kept
+as one sorted structured array, so a range query is a ``searchsorted`` slice
+instead of a chain of ``*_when`` searches. Local circumstances for a place are
+computed only when asked for and cached per (eclipse, place).
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import swisseph as swe
+
+from .ephemeris import year_start_jd
+
+SOLAR = 0
+LUNAR = 1
+ECLIPSE_KINDS = ("SOLAR", "LUNAR")
+DEFAULT_SPAN = (1800, 2200)
+BLOCK_YEARS = 10
+
+ECLIPSE_DTYPE = np.dtype(
+    [
+        ("kind", "u1"),
+        ("flags", "i4"),
+        ("jd_max", "f8"),
+        ("jd_begin", "f8"),
+        ("jd_end", "f8"),
+        ("magnitude", "f4"),
+        ("saros", "i2"),
+        ("saros_member", "i2"),
+        ("central_lat", "f4"),
+        ("central_lon", "f4"),
+    ]
+)
+
+_SOLAR_TYPES = (
+    (swe.ECL_ANNULAR_TOTAL, "HYBRID"),
+    (swe.ECL_TOTAL, "TOTAL"),
+    (swe.ECL_ANNULAR, "ANNULAR"),
+    (swe.ECL_PARTIAL, "PARTIAL"),
+)
+_LUNAR_TYPES = (
+    (swe.ECL_TOTAL, "TOTAL"),
+    (swe.ECL_PARTIAL, "PARTIAL"),
+    (swe.ECL_PENUMBRAL, "PENUMBRAL"),
+)
+# lun_eclipse_how needs a geopos, but the magnitudes used here do not depend on it.
+_ORIGIN = (0.0, 0.0, 0.0)
+
+
+def eclipse_type(kind: int, flags: int) -> str:
+    for flag, name in _SOLAR_TYPES if kind == SOLAR else _LUNAR_TYPES:
+        if flags & flag:
+            return name
+    return "UNKNOWN"
+
+
+def _solar_row(flags: int, tret: Tuple[float, ...]) -> Tuple[Any, ...]:
+    _, geopos, attrs = swe.sol_eclipse_where(tret[0])
+    central = bool(flags & swe.ECL_CENTRAL)
+    return (
+        SOLAR,
+        flags,
+        tret[0],
+        tret[2],
+        tret[3],
+        attrs[8],
+        attrs[9],
+        attrs[10],
+        geopos[1] if central else np.nan,
+        geopos[0] if central else np.nan,
+    )
+
+
+def _lunar_row(flags: int, tret: Tuple[float, ...]) -> Tuple[Any, ...]:
+    _, attrs = swe.lun_eclipse_how(tret[0], _ORIGIN)
+    magnitude = attrs[0] if flags & (swe.ECL_TOTAL | swe.ECL_PARTIAL) else attrs[1]
+    return (LUNAR, flags, tret[0], tret[6], tret[7], magnitude, attrs[9], attrs[10], np.nan, np.nan)
+
+
+def compute_global_eclipses(start_jd_utc: float, end_jd_utc: float) -> np.ndarray:
+    """Every global eclipse with maximum in ``[start, end)``, sorted by maximum."""
+    rows: List[Tuple[Any, ...]] = []
+    for search, build_row in (
+        (swe.sol_eclipse_when_glob, _solar_row),
+        (swe.lun_eclipse_when, _lunar_row),
+    ):
+        cursor = start_jd_utc
+        while True:
+            flags, tret = search(cursor)
+            if tret[0] >= end_jd_utc:
+                break
+            rows.append(build_row(flags, tret))
+            cursor = tret[0] + 1.0
+    table = np.array(rows, dtype=ECLIPSE_DTYPE)
+    return table[np.argsort(table["jd_max"], kind="stable")]
+
+
+class EclipseCatalog:
+    """Global eclipses of ``span`` years, filled in ``BLOCK_YEARS`` blocks on demand.
+
+    ``precompute()`` fills the whole span; ``save``/``load`` persist it as a
+    compressed ``.npz``.
+    """
+
+    def __init__(self, span: Tuple[int, int] = DEFAULT_SPAN) -> None:
+        start_year, end_year = span
+        if end_year <= start_year:
+            raise ValueError("eclipse catalog span must cover at least one year")
+        self.span = (int(start_year), int(end_year))
+        self._blocks: Dict[int, np.ndarray] = {}
+        self._table: Optional[np.ndarray] = None
+        self._local: Dict[Tuple[float, int, float, float, float], Optional[Dict[str, Any]]] = {}
+
+    @property
+    def start_jd_utc(self) -> float:
+        return year_start_jd(self.span[0])
+
+    @property
+    def end_jd_utc(self) -> float:
+        return year_start_jd(self.span[1])
+
+    def _block_starts(self, start_jd_utc: float, end_jd_utc: float) -> List[int]:
+        first_year, last_year = self.span
+        return [
+            year
+            for year in range(first_year, last_year, BLOCK_YEARS)
+            if year_start_jd(year) < end_jd_utc
+            and year_start_jd(min(year + BLOCK_YEARS, last_year)) > start_jd_utc
+        ]
+
+    def _ensure(self, start_jd_utc: float, end_jd_utc: float) -> np.ndarray:
+        if start_jd_utc < self.start_jd_utc or end_jd_utc > self.end_jd_utc:
+            raise ValueError(
+                f"range lies outside the eclipse catalog span {self.span[0]}-{self.span[1]}"
+            )
+        missing = [
+            year for year in self._block_starts(start_jd_utc, end_jd_utc) if year not in self._blocks
+        ]
+        for year in missing:
+            self._blocks[year] = compute_global_eclipses(
+                year_start_jd(year), year_start_jd(min(year + BLOCK_YEARS, self.span[1]))
+            )
+        if missing or self._table is None:
+            blocks = [self._blocks[year] for year in sorted(self._blocks)]
+            self._table = np.concatenate(blocks) if blocks else np.empty(0, ECLIPSE_DTYPE)
+        return self._table
+
+    def precompute(self) -> "EclipseCatalog":
+        self._ensure(self.start_jd_utc, self.end_jd_utc)
+        return self
+
+    @property
+    def table(self) -> np.ndarray:
+        """Currently computed rows (call ``precompute`` for the whole span)."""
+        return self._table if self._table is not None else np.empty(0, ECLIPSE_DTYPE)
+
+    def between(
+        self, start_jd_utc: float, end_jd_utc: float, kind: Optional[str] = None
+    ) -> np.ndarray:
+        """Rows with maximum in ``[start, end]``; ``kind`` is ``SOLAR``/``LUNAR``."""
+        table = self._ensure(start_jd_utc, end_jd_utc)
+        lo = np.searchsorted(table["jd_max"], start_jd_utc, side="left")
+        hi = np.searchsorted(table["jd_max"], end_jd_utc, side="right")
+        rows = table[lo:hi]
+        if kind is not None:
+            rows = rows[rows["kind"] == ECLIPSE_KINDS.index(kind.upper())]
+        return rows
+
+    def local_circumstances(
+        self, row: np.void, latitude: float, longitude: float, altitude: float = 0.0
+    ) -> Optional[Dict[str, Any]]:
+        """Local contacts and magnitude of one catalog eclipse, or None if not visible."""
+        key = (float(row["jd_max"]), int(row["kind"]), latitude, longitude, altitude)
+        if key not in self._local:
+            self._local[key] = _local_circumstances(row, (longitude, latitude, altitude))
+        return self._local[key]
+
+    def visible_between(
+        self,
+        start_jd_utc: float,
+        end_jd_utc: float,
+        latitude: float,
+        longitude: float,
+        altitude: float = 0.0,
+        kind: Optional[str] = None,
+    ) -> List[Tuple[np.void, Dict[str, Any]]]:
+        result = []
+        for row in self.between(start_jd_utc, end_jd_utc, kind):
+            local = self.local_circumstances(row, latitude, longitude, altitude)
+            if local is not None:
+                result.append((row, local))
+        return result
+
+    def save(self, path: str | Path) -> None:
+        np.savez_compressed(
+            path, span=np.array(self.span), years=np.array(sorted(self._blocks)), table=self.table
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "EclipseCatalog":
+        with np.load(path) as data:
+            catalog = cls(tuple(int(year) for year in data["span"]))
+            table = data["table"]
+            for year in data["years"]:
+                end = min(int(year) + BLOCK_YEARS, catalog.span[1])
+                mask = (table["jd_max"] >= year_start_jd(int(year))) & (table["jd_max"] < year_start_jd(end))
+                catalog._blocks[int(year)] = table[mask]
+            catalog._table = table
+        return catalog
+
+
+def _local_circumstances(row: np.void, geopos: Tuple[float, float, float]) -> Optional[Dict[str, Any]]:
+    # The *_when_loc searches return the next eclipse visible here; starting just
+    # before the global begin, this eclipse is visible only if it is that one.
+    search_from = float(row["jd_begin"]) - 0.05
+    if row["kind"] == SOLAR:
+        flags, tret, attrs = swe.sol_eclipse_when_loc(search_from, geopos)
+        begin, end = tret[1], tret[4]
+        obscuration = attrs[2]
+    else:
+        flags, tret, attrs = swe.lun_eclipse_when_loc(search_from, geopos)
+        begin, end = tret[6], tret[7]
+        obscuration = None
+    if flags < 0 or abs(tret[0] - float(row["jd_max"])) > 0.5:
+        return None
+    return {
+        "jd_max": tret[0],
+        "jd_begin": begin or None,
+        "jd_end": end or None,
+        "magnitude": attrs[0] if row["kind"] == SOLAR else (attrs[0] or attrs[1]),
+        "obscuration": obscuration,
+        "altitude_deg": attrs[5],
+        "type": eclipse_type(int(row["kind"]), flags),
+    }
+
+
+@lru_cache(maxsize=4)
+def default_catalog(span: Tuple[int, int] = DEFAULT_SPAN) -> EclipseCatalog:
+    """Process-wide catalog; blocks are filled as queries reach them."""
+    return EclipseCatalog(span)
+
+
+def eclipse_record(row: np.void, local: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    kind = int(row["kind"])
+    record: Dict[str, Any] = {
+        "subtype": ECLIPSE_KINDS[kind],
+        "jd_utc": float(row["jd_max"]),
+        "eclipse_type": eclipse_type(kind, int(row["flags"])),
+        "jd_begin": float(row["jd_begin"]),
+        "jd_end": float(row["jd_end"]),
+        "magnitude": float(row["magnitude"]),
+        "saros": int(row["saros"]),
+        "saros_member": int(row["saros_member"]),
+    }
+    if not np.isnan(row["central_lat"]):
+        record["central_point"] = {
+            "latitude": float(row["central_lat"]),
+            "longitude": float(row["central_lon"]),
+        }
+    if local is not None:
+        record["local"] = local
+    return record
+
+
+def find_eclipses(
+    start_jd_utc: float,
+    end_jd_utc: float,
+    kind: Optional[str] = None,
+    location: Optional[Tuple[float, float]] = None,
+    catalog: Optional[EclipseCatalog] = None,
+) -> List[Dict[str, Any]]:
+    """Eclipse records in a range; with ``location`` only locally visible ones."""
+    catalog = catalog or default_catalog()
+    if location is None:
+        return [eclipse_record(row) for row in catalog.between(start_jd_utc, end_jd_utc, kind)]
+    latitude, longitude = location
+    return [
+        eclipse_record(row, local)
+        for row, local in catalog.visible_between(
+            start_jd_utc, end_jd_utc, latitude, longitude, kind=kind
+        )
+    ]
@@ -0,0 +1,233 @@
+"""Batched sidereal ephemeris sampling shared by the Refraction Engine range engines."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Any, Callable, Optional, Sequence, Tuple
+
+import numpy as np
+import swisseph as swe
+from jhora import const
+from jhora.panchanga import drik
+
+from . import profiling
+from .graha import GrahaID, graha_id_to_string
+
+EPHEMERIS_BODIES = [graha_id_to_string(graha) for graha in GrahaID]
+
+_SWE_BODIES = {
+    "SUN": swe.SUN,
+    "MOON": swe.MOON,
+    "MARS": swe.MARS,
+    "MERCURY": swe.MERCURY,
+    "JUPITER": swe.JUPITER,
+    "VENUS": swe.VENUS,
+    "SATURN": swe.SATURN,
+}
+_NODE_BODIES = {"TRUE": swe.TRUE_NODE, "MEAN": swe.MEAN_NODE}
+# Ayanamsa models PyJHora evaluates itself instead of through swe.set_sid_mode.
+_MODELLED_AYANAMSAS = {
+    "SENTHIL": drik._calculate_ayanamsa_senthil_from_jd,
+    "SUNDAR_SS": drik._ayanamsa_surya_siddhantha_model,
+}
+_J2000_JD = 2451545.0
+_J2000_UTC = datetime(2000, 1, 1, 12, tzinfo=dt_timezone.utc)
+
+
+def calc_ut(*args: Any, **kwargs: Any) -> Any:
+    """``swe.calc_ut``, counted in any open profile."""
+    profiling.count("calc_ut")
+    return swe.calc_ut(*args, **kwargs)
+
+
+def rise_trans(*args: Any, **kwargs: Any) -> Any:
+    """``swe.rise_trans``, counted in any open profile."""
+    profiling.count("rise_trans")
+    return swe.rise_trans(*args, **kwargs)
+
+
+def houses_ex(*args: Any, **kwargs: Any) -> Any:
+    """``swe.houses_ex``, counted in any open profile."""
+    profiling.count("houses_ex")
+    return swe.houses_ex(*args, **kwargs)
+
+
+def _swe_body(body: str, node_mode: str) -> int:
+    if body in ("RAHU", "KETU"):
+        return _NODE_BODIES[node_mode]
+    try:
+        return _SWE_BODIES[body]
+    except KeyError as exc:
+        raise ValueError(f"Unsupported ephemeris body '{body}'") from exc
+
+
+def _ayanamsa_offsets(
+    jd_utc: np.ndarray, ayanamsa_mode: str, ayanamsa_value: Optional[float]
+) -> Optional[np.ndarray]:
+    """Per-sample ayanamsa for modes swisseph cannot apply itself, else None."""
+    if ayanamsa_mode in _MODELLED_AYANAMSAS:
+        model = _MODELLED_AYANAMSAS[ayanamsa_mode]
+        return np.array([model(jd) for jd in jd_utc])
+    if ayanamsa_mode in ("SIDM_USER", "USER_DEFINED"):
+        if ayanamsa_value is None:
+            raise ValueError("ayanamsa_value is required for user defined ayanamsa")
+        return np.full(jd_utc.shape, float(ayanamsa_value))
+    return None
+
+
+def sidereal_positions(
+    jd_utc: Sequence[float] | np.ndarray | float,
+    bodies: Sequence[str] = EPHEMERIS_BODIES,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+    node_mode: str = "TRUE",
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Longitudes and daily speeds of ``bodies`` at every UTC Julian day.
+
+    Returns two ``(T, B)`` arrays. ``ayanamsa_mode=None`` yields tropical
+    positions. Ketu is derived from Rahu, so each node is sampled only once.
+    """
+    jd_utc = np.atleast_1d(np.asarray(jd_utc, dtype=float))
+    bodies = [str(body).upper() for body in bodies]
+    node_mode = node_mode.upper()
+    longitudes = np.empty((jd_utc.size, len(bodies)), dtype=float)
+    speeds = np.empty_like(longitudes)
+
+    offsets = None
+    # Same flags as drik.sidereal_longitude, so results agree with PyJHora.
+    flags = swe.FLG_SWIEPH | drik._rise_flags
+    if ayanamsa_mode:
+        ayanamsa_mode = ayanamsa_mode.upper()
+        offsets = _ayanamsa_offsets(jd_utc, ayanamsa_mode, ayanamsa_value)
+        if offsets is None:
+            if ayanamsa_mode not in const.available_ayanamsa_modes:
+                raise ValueError(f"Unknown ayanamsa_mode '{ayanamsa_mode}'")
+            swe.set_sid_mode(const.available_ayanamsa_modes[ayanamsa_mode])
+            flags |= swe.FLG_SIDEREAL
+
+    sampled = {}
+    try:
+        for col, body in enumerate(bodies):
+            swe_body = _swe_body(body, node_mode)
+            if swe_body not in sampled:
+                values = np.array([calc_ut(jd, swe_body, flags)[0] for jd in jd_utc])
+                sampled[swe_body] = (values[:, 0], values[:, 3])
+            lon, speed = sampled[swe_body]
+            longitudes[:, col] = lon + 180.0 if body == "KETU" else lon
+            speeds[:, col] = speed
+    finally:
+        drik.reset_ayanamsa_mode()
+
+    if offsets is not None:
+        longitudes -= offsets[:, None]
+    return np.mod(longitudes, 360.0), speeds
+
+
+def sidereal_ascendants(
+    jd_utc: Sequence[float] | np.ndarray | float,
+    latitude: float,
+    longitude: float,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> np.ndarray:
+    """Ascendant longitude at every UTC Julian day, matching ``drik.ascendant``."""
+    jd_utc = np.atleast_1d(np.asarray(jd_utc, dtype=float))
+    offsets = None
+    flags = swe.FLG_SWIEPH
+    if ayanamsa_mode:
+        ayanamsa_mode = ayanamsa_mode.upper()
+        offsets = _ayanamsa_offsets(jd_utc, ayanamsa_mode, ayanamsa_value)
+        if offsets is None:
+            if ayanamsa_mode not in const.available_ayanamsa_modes:
+                raise ValueError(f"Unknown ayanamsa_mode '{ayanamsa_mode}'")
+            swe.set_sid_mode(const.available_ayanamsa_modes[ayanamsa_mode])
+            flags = swe.FLG_SIDEREAL
+    try:
+        ascendants = np.array(
+            [houses_ex(jd, latitude, longitude, flags=flags)[1][0] for jd in jd_utc]
+        )
+    finally:
+        drik.reset_ayanamsa_mode()
+    if offsets is not None:
+        ascendants -= offsets
+    return np.mod(ascendants, 360.0)
+
+
+def sidereal_position(
+    jd_utc: float,
+    body: str,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+    node_mode: str = "TRUE",
+) -> Tuple[float, float]:
+    """Scalar ``(longitude, speed)`` of one body; used by the root refiners."""
+    longitudes, speeds = sidereal_positions(
+        [jd_utc], [body], ayanamsa_mode, ayanamsa_value, node_mode
+    )
+    return float(longitudes[0, 0]), float(speeds[0, 0])
+
+
+def jd_to_datetime(jd_utc: float) -> datetime:
+    """Aware UTC datetime of a UTC Julian day."""
+    return _J2000_UTC + timedelta(days=float(jd_utc) - _J2000_JD)
+
+
+def datetime_to_jd(value: datetime) -> float:
+    """UTC Julian day of an aware datetime."""
+    return _J2000_JD + (value - _J2000_UTC).total_seconds() / 86400.0
+
+
+def year_start_jd(year: int) -> float:
+    """UTC Julian day of 1 January of ``year``."""
+    return swe.julday(year, 1, 1, 0.0)
+
+
+def wrap_degrees(value: np.ndarray | float) -> np.ndarray | float:
+    """Map an angle difference into [-180, 180)."""
+    return np.mod(np.asarray(value) + 180.0, 360.0) - 180.0
+
+
+def bracketed_root(
+    func: Callable[[float], float],
+    lower: float,
+    upper: float,
+    f_lower: Optional[float] = None,
+    f_upper: Optional[float] = None,
+    tol_days: float = 1e-6,
+    max_iter: int = 80,
+) -> float:
+    """Root of ``func`` inside a sign-changing bracket (Illinois false position).
+
+    Converges superlinearly for the smooth ephemeris functions used here while
+    never leaving the bracket, so a sampled sign change always refines to the
+    event inside that sample interval.
+    """
+    f_lower = func(lower) if f_lower is None else f_lower
+    f_upper = func(upper) if f_upper is None else f_upper
+    if f_lower == 0.0:
+        return lower
+    if f_upper == 0.0:
+        return upper
+    if np.sign(f_lower) == np.sign(f_upper):
+        raise ValueError("bracketed_root requires a sign change between the bounds")
+    side = 0
+    guess = lower
+    for _ in range(max_iter):
+        previous = guess
+        guess = (lower * f_upper - upper * f_lower) / (f_upper - f_lower)
+        if abs(guess - previous) < tol_days or upper - lower < tol_days:
+            return guess
+        f_guess = func(guess)
+        if f_guess == 0.0:
+            return guess
+        if np.sign(f_guess) == np.sign(f_upper):
+            upper, f_upper = guess, f_guess
+            if side == 1:
+                f_lower /= 2.0
+            side = 1
+        else:
+            lower, f_lower = guess, f_guess
+            if side == -1:
+                f_upper /= 2.0
+            side = -1
+    return guess
@@ -0,0 +1,493 @@
+"""Single-sweep transit event scanner for Refraction Engine V1.
+
+All requested bodies are sampled together on one adaptive grid; sign entries,
+stations, pair conjunctions and house entries are detected from those shared
+samples and only the bracketing intervals are refined with root finding.
+
+The grid never steps further than ``sweep_step_days`` (at most
+``DEGREES_PER_STEP`` of motion for the fastest body) unless no body can reach
+a sign boundary and no pair can reach conjunction before the next sample, in
+which case it jumps straight to that earliest possible event (capped at
+``MAX_HORIZON_DAYS``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+from itertools import combinations
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pytz
+from jhora import const
+
+from .ephemeris import (
+    EPHEMERIS_BODIES,
+    bracketed_root,
+    datetime_to_jd,
+    jd_to_datetime,
+    sidereal_ascendants,
+    sidereal_position,
+    sidereal_positions,
+    wrap_degrees,
+)
+from .eclipses import default_catalog, find_eclipses
+from .graha import rasi_index_to_name
+from .profiling import instrumented
+from .stations import RETROGRADE, STATION_PLANETS, find_stations, vakra_periods
+
+EVENTS_SCHEMA_VERSION = "events_spec_v1"
+
+EVENT_TYPES = [
+    "SIGN_ENTRY",
+    "SANKRANTI",
+    "RETROGRADE_START",
+    "RETROGRADE_END",
+    "CONJUNCTION",
+    "HOUSE_ENTRY",
+    "RETROGRADE_SEGMENT",
+    "ECLIPSE",
+]
+
+# Upper bounds of geocentric daily motion (deg/day) used to size the sweep step.
+MAX_DAILY_MOTION = {
+    "SUN": 1.02,
+    "MOON": 15.4,
+    "MARS": 0.8,
+    "MERCURY": 2.2,
+    "JUPITER": 0.25,
+    "VENUS": 1.26,
+    "SATURN": 0.13,
+    "RAHU": 0.25,
+    "KETU": 0.25,
+}
+DEGREES_PER_STEP = 6.0
+MAX_STEP_DAYS = 1.0
+MAX_HORIZON_DAYS = 30.0
+# Fixed steps sampled per batched ephemeris call while events are close.
+SWEEP_BLOCK = 32
+
+
+@dataclass
+class EventScanSettings:
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE
+    ayanamsa_value: Optional[float] = None
+    node_mode: str = "TRUE"
+    tol_days: float = 1e-6
+
+
+def sweep_step_days(bodies: Sequence[str]) -> float:
+    """Sample spacing that keeps every body under ``DEGREES_PER_STEP`` per step."""
+    fastest = max(MAX_DAILY_MOTION.get(body, MAX_DAILY_MOTION["MOON"]) for body in bodies)
+    return min(MAX_STEP_DAYS, DEGREES_PER_STEP / fastest)
+
+
+def _max_motion(bodies: Sequence[str]) -> np.ndarray:
+    return np.array([MAX_DAILY_MOTION.get(body, MAX_DAILY_MOTION["MOON"]) for body in bodies])
+
+
+def event_horizon_days(
+    longitudes: np.ndarray,
+    bodies: Sequence[str],
+    sign_bodies: Sequence[str] = (),
+    pairs: Sequence[Tuple[str, str]] = (),
+) -> np.ndarray:
+    """Days before any of ``sign_bodies`` can change sign or any of ``pairs`` can conjoin.
+
+    ``longitudes`` is ``(..., B)`` over ``bodies``; the result has shape
+    ``(...)``. The bound uses ``MAX_DAILY_MOTION`` and holds in either
+    direction of motion.
+    """
+    bodies = list(bodies)
+    longitudes = np.asarray(longitudes)
+    horizon = np.full(longitudes.shape[:-1], np.inf)
+    motion = _max_motion(bodies)
+    if len(sign_bodies):
+        cols = [bodies.index(body) for body in sign_bodies]
+        offset = longitudes[..., cols] % 30.0
+        horizon = np.minimum(horizon, (np.minimum(offset, 30.0 - offset) / motion[cols]).min(axis=-1))
+    if len(pairs):
+        first = [bodies.index(a) for a, _ in pairs]
+        second = [bodies.index(b) for _, b in pairs]
+        separation = np.abs(wrap_degrees(longitudes[..., first] - longitudes[..., second]))
+        horizon = np.minimum(horizon, (separation / (motion[first] + motion[second])).min(axis=-1))
+    return horizon
+
+
+class _EventSweep:
+    def __init__(
+        self,
+        start_jd_utc: float,
+        end_jd_utc: float,
+        bodies: Sequence[str],
+        settings: EventScanSettings,
+        sign_bodies: Sequence[str] = (),
+        pairs: Sequence[Tuple[str, str]] = (),
+    ) -> None:
+        self.bodies = list(bodies)
+        self.settings = settings
+        step_days = sweep_step_days(self.bodies)
+        grid = np.array([start_jd_utc])
+        longitudes, speeds = self._positions(grid)
+        horizons = event_horizon_days(longitudes, self.bodies, sign_bodies, pairs)
+        blocks = [(grid, longitudes, speeds)]
+        while grid[-1] < end_jd_utc:
+            last = grid[-1]
+            if horizons[-1] > step_days:
+                grid = np.array([min(end_jd_utc, last + min(MAX_HORIZON_DAYS, horizons[-1]))])
+            else:
+                grid = np.minimum(end_jd_utc, last + step_days * np.arange(1, SWEEP_BLOCK + 1))
+                grid = grid[: np.searchsorted(grid, end_jd_utc) + 1]
+            longitudes, speeds = self._positions(grid)
+            horizons = event_horizon_days(longitudes, self.bodies, sign_bodies, pairs)
+            # Cut the block at the first sample whose jump would land beyond it.
+            jumps = (horizons > step_days) & (grid + np.minimum(MAX_HORIZON_DAYS, horizons) > grid[-1])
+            keep = int(np.argmax(jumps)) + 1 if jumps.any() else grid.size
+            grid, longitudes, speeds, horizons = grid[:keep], longitudes[:keep], speeds[:keep], horizons[:keep]
+            blocks.append((grid, longitudes, speeds))
+        self.grid = np.concatenate([block[0] for block in blocks])
+        self.longitudes = np.concatenate([block[1] for block in blocks])
+        self.speeds = np.concatenate([block[2] for block in blocks])
+        self.signs = (self.longitudes // 30).astype(np.int64)
+
+    def _positions(self, jd_utc: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        return sidereal_positions(
+            jd_utc,
+            self.bodies,
+            ayanamsa_mode=self.settings.ayanamsa_mode,
+            ayanamsa_value=self.settings.ayanamsa_value,
+            node_mode=self.settings.node_mode,
+        )
+
+    def _position(self, jd_utc: float, body: str) -> Tuple[float, float]:
+        return sidereal_position(
+            jd_utc,
+            body,
+            ayanamsa_mode=self.settings.ayanamsa_mode,
+            ayanamsa_value=self.settings.ayanamsa_value,
+            node_mode=self.settings.node_mode,
+        )
+
+    def _refine(self, func: Callable[[float], float], step: int) -> float:
+        return float(
+            bracketed_root(
+                func, self.grid[step], self.grid[step + 1], tol_days=self.settings.tol_days
+            )
+        )
+
+    def sign_entries(self) -> List[Tuple[float, str, int, int]]:
+        """``(jd_utc, body, from_sign, to_sign)`` for every sampled sign change."""
+        found = []
+        steps, cols = np.nonzero(self.signs[1:] != self.signs[:-1])
+        for step, col in zip(steps, cols):
+            body = self.bodies[col]
+            from_sign = int(self.signs[step, col])
+            to_sign = int(self.signs[step + 1, col])
+            forward = wrap_degrees(
+                self.longitudes[step + 1, col] - self.longitudes[step, col]
+            ) > 0
+            boundary = (to_sign if forward else from_sign) * 30.0
+            jd = self._refine(
+                lambda jd, body=body, boundary=boundary: float(
+                    wrap_degrees(self._position(jd, body)[0] - boundary)
+                ),
+                step,
+            )
+            found.append((jd, body, from_sign, to_sign))
+        return found
+
+    def initial_direction(self, body: str) -> int:
+        return -1 if self.speeds[0, self.bodies.index(body)] < 0 else 1
+
+    def conjunctions(
+        self, pairs: Sequence[Tuple[str, str]]
+    ) -> List[Tuple[float, str, str]]:
+        found = []
+        for first, second in pairs:
+            i, j = self.bodies.index(first), self.bodies.index(second)
+            separation = wrap_degrees(self.longitudes[:, i] - self.longitudes[:, j])
+            crossing = (separation[1:] * separation[:-1] <= 0) & (
+                np.abs(separation[1:] - separation[:-1]) < 180.0
+            )
+            for step in np.flatnonzero(crossing):
+                if separation[step] == 0.0 and step > 0:
+                    continue
+                jd = self._refine(
+                    lambda jd, first=first, second=second: float(
+                        wrap_degrees(self._position(jd, first)[0] - self._position(jd, second)[0])
+                    ),
+                    step,
+                )
+                found.append((jd, first, second))
+        return found
+
+
+def _transit_houses(
+    sweep: _EventSweep,
+    entries: Sequence[Tuple[float, str, int, int]],
+    bodies: Sequence[str],
+    location: Tuple[float, float],
+    settings: EventScanSettings,
+) -> List[Optional[Tuple[int, int]]]:
+    """``(from_house, to_house)`` per sign entry from the transit lagna, or None if unchanged.
+
+    One batched ascendant call covers the scan start and every entry; the
+    lagna is taken just after the entry, like ``_house_info_at`` does.
+    """
+    latitude, longitude = location
+    ascendants = sidereal_ascendants(
+        [sweep.grid[0]] + [jd + 1e-6 for jd, _, _, _ in entries],
+        latitude,
+        longitude,
+        ayanamsa_mode=settings.ayanamsa_mode,
+        ayanamsa_value=settings.ayanamsa_value,
+    )
+    lagnas = (ascendants // 30).astype(np.int64)
+    previous = {
+        body: int((sweep.signs[0, sweep.bodies.index(body)] - lagnas[0]) % 12 + 1) for body in bodies
+    }
+    houses: List[Optional[Tuple[int, int]]] = []
+    for (_, body, _, to_sign), lagna in zip(entries, lagnas[1:]):
+        house = int((to_sign - lagna) % 12 + 1)
+        houses.append((previous[body], house) if house != previous[body] else None)
+        previous[body] = house
+    return houses
+
+
+def _default_pairs(bodies: Sequence[str]) -> List[Tuple[str, str]]:
+    if len(bodies) == 1:
+        return [("SUN", bodies[0])] if bodies[0] != "SUN" else []
+    return [
+        (first, second)
+        for first, second in combinations(bodies, 2)
+        if {first, second} != {"RAHU", "KETU"}
+    ]
+
+
+def _event_record(
+    event_type: str, jd_utc: float, tz: Optional[Any], **fields: Any
+) -> Dict[str, Any]:
+    record: Dict[str, Any] = {"type": event_type, "jd_utc": jd_utc}
+    if tz is not None:
+        record["datetime_local"] = jd_to_datetime(jd_utc).astimezone(tz).isoformat()
+    record.update({key: value for key, value in fields.items() if value is not None})
+    return record
+
+
+def _vakra_record(body: str, period: Dict[str, Any], tz: Optional[Any]) -> Dict[str, Any]:
+    points = []
+    if period["start_station"] is not None:
+        points.append({"jd_utc": period["start_station"], "kind": "STATIONARY_RETROGRADE"})
+    if period["end_station"] is not None:
+        points.append({"jd_utc": period["end_station"], "kind": "STATIONARY_DIRECT"})
+    return _event_record(
+        "RETROGRADE_SEGMENT",
+        period["jd_start"],
+        tz,
+        planet=body,
+        jd_start=period["jd_start"],
+        jd_end=period["jd_end"],
+        stationary_points=points or None,
+    )
+
+
+def scan_events(
+    start_jd_utc: float,
+    end_jd_utc: float,
+    planets: Optional[Sequence[str]] = None,
+    event_types: Optional[Sequence[str]] = None,
+    lagna_sign: Optional[int] = None,
+    pairs: Optional[Sequence[Tuple[str, str]]] = None,
+    max_events: Optional[int] = None,
+    timezone_name: Optional[str] = None,
+    settings: Optional[EventScanSettings] = None,
+    location: Optional[Tuple[float, float]] = None,
+) -> List[Dict[str, Any]]:
+    """Scan all requested event types in one ephemeris sweep.
+
+    HOUSE_ENTRY events need a lagna. With ``lagna_sign`` (0-based) houses are
+    counted from that fixed sign (a natal or other reference lagna), so each
+    house entry is a sign entry with house numbers. Otherwise, given a
+    ``(latitude, longitude)`` ``location``, houses are counted from the transit
+    lagna at each sign entry, as ``event_scan_extract`` does: an event is
+    reported when a planet's house differs from the one it had at the previous
+    entry (or at the start). Without either, house entries are skipped.
+    Eclipses come from the eclipse catalog (clipped to its span) and, given a
+    ``location``, only locally visible ones are reported.
+    """
+    if end_jd_utc <= start_jd_utc:
+        raise ValueError("end_jd_utc must be after start_jd_utc")
+    bodies = [str(body).upper() for body in (planets or EPHEMERIS_BODIES)]
+    unknown = [body for body in bodies if body not in EPHEMERIS_BODIES]
+    if unknown:
+        raise ValueError(f"Unsupported planets: {unknown}")
+    requested = {str(evt).upper() for evt in (event_types or EVENT_TYPES)}
+    if "RETROGRADE" in requested:
+        requested |= {"RETROGRADE_START", "RETROGRADE_END"}
+    settings = settings or EventScanSettings()
+    tz = pytz.timezone(timezone_name) if timezone_name else None
+
+    sweep_bodies = list(bodies)
+    pair_list = list(pairs) if pairs is not None else _default_pairs(bodies)
+    sweep_pairs = pair_list if "CONJUNCTION" in requested else []
+    for pair in sweep_pairs:
+        sweep_bodies.extend(body for body in pair if body not in sweep_bodies)
+    sign_requested = bool(requested & {"SIGN_ENTRY", "SANKRANTI", "HOUSE_ENTRY"})
+    sweep = _EventSweep(
+        start_jd_utc,
+        end_jd_utc,
+        sweep_bodies,
+        settings,
+        sign_bodies=bodies if sign_requested else (),
+        pairs=sweep_pairs,
+    )
+
+    events: List[Dict[str, Any]] = []
+    if sign_requested:
+        entries = [entry for entry in sweep.sign_entries() if entry[1] in bodies]
+        entries.sort(key=lambda entry: entry[0])
+        transit_houses = None
+        if "HOUSE_ENTRY" in requested and lagna_sign is None and location is not None:
+            transit_houses = _transit_houses(sweep, entries, bodies, location, settings)
+        for index, (jd, body, from_sign, to_sign) in enumerate(entries):
+            fields = dict(
+                planet=body,
+                subtype="D1",
+                from_sign=rasi_index_to_name(from_sign + 1),
+                to_sign=rasi_index_to_name(to_sign + 1),
+            )
+            if "SIGN_ENTRY" in requested:
+                events.append(_event_record("SIGN_ENTRY", jd, tz, **fields))
+            if "SANKRANTI" in requested and body == "SUN":
+                events.append(_event_record("SANKRANTI", jd, tz, **fields))
+            if "HOUSE_ENTRY" in requested and lagna_sign is not None:
+                events.append(
+                    _event_record(
+                        "HOUSE_ENTRY",
+                        jd,
+                        tz,
+                        from_house=(from_sign - lagna_sign) % 12 + 1,
+                        to_house=(to_sign - lagna_sign) % 12 + 1,
+                        **fields,
+                    )
+                )
+            elif transit_houses is not None and transit_houses[index] is not None:
+                from_house, to_house = transit_houses[index]
+                events.append(
+                    _event_record(
+                        "HOUSE_ENTRY", jd, tz, from_house=from_house, to_house=to_house, **fields
+                    )
+                )
+
+    station_bodies = [body for body in bodies if body in STATION_PLANETS]
+    if station_bodies and requested & {"RETROGRADE_START", "RETROGRADE_END", "RETROGRADE_SEGMENT"}:
+        stations = find_stations(
+            start_jd_utc,
+            end_jd_utc,
+            station_bodies,
+            ayanamsa_mode=settings.ayanamsa_mode,
+            ayanamsa_value=settings.ayanamsa_value,
+        )
+        for row in stations:
+            event_type = "RETROGRADE_START" if row["direction"] == RETROGRADE else "RETROGRADE_END"
+            if event_type in requested:
+                events.append(
+                    _event_record(
+                        event_type,
+                        float(row["jd_utc"]),
+                        tz,
+                        planet=STATION_PLANETS[row["planet"]],
+                    )
+                )
+        if "RETROGRADE_SEGMENT" in requested:
+            for body in station_bodies:
+                periods = vakra_periods(
+                    stations,
+                    start_jd_utc,
+                    end_jd_utc,
+                    body,
+                    initially_retrograde=sweep.initial_direction(body) < 0,
+                )
+                events.extend(_vakra_record(body, period, tz) for period in periods)
+
+    if "CONJUNCTION" in requested:
+        for jd, first, second in sweep.conjunctions(pair_list):
+            events.append(_event_record("CONJUNCTION", jd, tz, planet=first, planet2=second))
+
+    eclipse_kinds = [
+        kind
+        for kind in ("SOLAR", "LUNAR")
+        if requested & {"ECLIPSE", f"{kind}_ECLIPSE"}
+    ]
+    if eclipse_kinds:
+        catalog = default_catalog()
+        first = max(start_jd_utc, catalog.start_jd_utc)
+        last = min(end_jd_utc, catalog.end_jd_utc)
+        for eclipse in find_eclipses(first, last, location=location) if first < last else []:
+            if eclipse["subtype"] in eclipse_kinds:
+                jd = eclipse.pop("jd_utc")
+                events.append(_event_record("ECLIPSE", jd, tz, **eclipse))
+
+    events.sort(key=lambda event: event["jd_utc"])
+    if max_events is not None:
+        events = events[:max_events]
+    return events
+
+
+def _scan_location(location: Optional[Dict[str, Any]]) -> Optional[Tuple[float, float]]:
+    if not location:
+        return None
+    try:
+        return float(location["latitude"]), float(location["longitude"])
+    except KeyError as exc:
+        raise ValueError(f"Missing location coordinate: {exc}") from exc
+
+
+@instrumented("event_scan")
+def run_event_scan(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload wrapper: ``scan`` holds the range, planets and event types."""
+    scan = payload.get("scan")
+    if not scan:
+        raise ValueError("Missing 'scan' section in payload")
+    timezone_name = scan.get("timezone_name")
+    if not timezone_name:
+        raise ValueError("scan.timezone_name is required")
+    tz = pytz.timezone(timezone_name)
+
+    def _to_jd_utc(value: str) -> float:
+        parsed = datetime.fromisoformat(value)
+        parsed = tz.localize(parsed) if parsed.tzinfo is None else parsed
+        return datetime_to_jd(parsed)
+
+    config = payload.get("config") or {}
+    zodiac_type = str(config.get("zodiac_type", "SIDEREAL")).upper()
+    settings = EventScanSettings(
+        ayanamsa_mode=(config.get("ayanamsa_mode") or const._DEFAULT_AYANAMSA_MODE)
+        if zodiac_type == "SIDEREAL"
+        else None,
+        ayanamsa_value=config.get("ayanamsa_value_deg"),
+        node_mode=str(config.get("node_mode", "TRUE")),
+    )
+    start = _to_jd_utc(scan["start_datetime"])
+    end = _to_jd_utc(scan["end_datetime"])
+    events = scan_events(
+        start,
+        end,
+        planets=scan.get("planets"),
+        event_types=scan.get("event_types"),
+        lagna_sign=scan.get("lagna_sign"),
+        max_events=scan.get("max_events"),
+        timezone_name=timezone_name,
+        settings=settings,
+        location=_scan_location(scan.get("location")),
+    )
+    return {
+        "meta": {
+            "schema_version": EVENTS_SCHEMA_VERSION,
+            "timestamp_utc": datetime.now(dt_timezone.utc).isoformat(),
+            "start_jd_utc": start,
+            "end_jd_utc": end,
+        },
+        "events": events,
+    }
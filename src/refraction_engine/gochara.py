@@ -0,0 +1,287 @@
+"""Gochara (transit-to-natal overlay) engine for Refraction Engine V1."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pytz
+from jhora import const
+
+from .ashtakavarga import ASHTAKAVARGA_PLANETS, compute_ashtakavarga, signs_from_longitudes
+from .core_chart import CoreChartBirth, _build_pyjhora_config, _compute_raw_d1_chart
+from .graha import GrahaID, graha_id_to_string
+from .profiling import instrumented
+from .transit import _parse_transit_input
+
+GOCHARA_SCHEMA_VERSION = "gochara_spec_v1"
+
+GOCHARA_BODIES = [graha_id_to_string(graha) for graha in GrahaID]
+NATAL_POINTS = GOCHARA_BODIES + ["ASCENDANT"]
+
+TARA_NAMES = [
+    "JANMA",
+    "SAMPAT",
+    "VIPAT",
+    "KSHEMA",
+    "PRATYAK",
+    "SADHANA",
+    "NAIDHANA",
+    "MITRA",
+    "PARAMA_MITRA",
+]
+FAVOURABLE_TARAS = (2, 4, 6, 8, 9)
+
+_NAKSHATRA_SPAN = 360.0 / 27
+_ASHTAKAVARGA_PLANETS = len(ASHTAKAVARGA_PLANETS)
+_MOON = GOCHARA_BODIES.index("MOON")
+
+
+def _graha_drishti_matrix() -> np.ndarray:
+    """9x12 boolean matrix: [planet, sign offset] -> planet aspects that offset."""
+    matrix = np.zeros((len(GOCHARA_BODIES), 12), dtype=bool)
+    for planet in range(len(GOCHARA_BODIES)):
+        for house in const.graha_drishti[planet]:
+            matrix[planet, (house - 1) % 12] = True
+    return matrix
+
+
+_GRAHA_DRISHTI = _graha_drishti_matrix()
+
+
+@dataclass
+class TransitSnapshot:
+    jd_utc: float
+    datetime_utc: str
+    longitudes: np.ndarray
+    speeds: np.ndarray
+
+    @property
+    def signs(self) -> np.ndarray:
+        return (self.longitudes // 30).astype(np.int64) % 12
+
+
+@dataclass
+class NatalBatch:
+    """Natal longitudes for N charts, columns in ``GOCHARA_BODIES`` (PyJHora) order."""
+
+    longitudes: np.ndarray
+    ascendant: np.ndarray
+    chart_ids: Optional[List[Any]] = None
+
+    def __post_init__(self) -> None:
+        self.longitudes = np.mod(np.asarray(self.longitudes, dtype=float), 360.0)
+        self.ascendant = np.mod(np.asarray(self.ascendant, dtype=float), 360.0)
+        if self.longitudes.ndim != 2 or self.longitudes.shape[1] != len(GOCHARA_BODIES):
+            raise ValueError(
+                f"natal longitudes must have shape (N, {len(GOCHARA_BODIES)}), "
+                f"got {self.longitudes.shape}"
+            )
+        if self.ascendant.shape != (self.longitudes.shape[0],):
+            raise ValueError("ascendant must have one entry per natal chart")
+
+    def __len__(self) -> int:
+        return self.longitudes.shape[0]
+
+    @property
+    def signs(self) -> np.ndarray:
+        return (self.longitudes // 30).astype(np.int64) % 12
+
+    @property
+    def lagna_sign(self) -> np.ndarray:
+        return (self.ascendant // 30).astype(np.int64) % 12
+
+    @property
+    def moon_sign(self) -> np.ndarray:
+        return self.signs[:, _MOON]
+
+    @property
+    def moon_nakshatra(self) -> np.ndarray:
+        return (self.longitudes[:, _MOON] // _NAKSHATRA_SPAN).astype(np.int64) % 27
+
+    @property
+    def point_longitudes(self) -> np.ndarray:
+        """(N, 10) longitudes of the nine grahas followed by the ascendant."""
+        return np.column_stack([self.longitudes, self.ascendant])
+
+    @classmethod
+    def from_core_charts(
+        cls,
+        core_charts: Sequence[Dict[str, Any]],
+        chart_ids: Optional[Sequence[Any]] = None,
+    ) -> "NatalBatch":
+        """Build a batch from ``run_core_chart`` outputs."""
+        longitudes = np.empty((len(core_charts), len(GOCHARA_BODIES)), dtype=float)
+        ascendant = np.empty(len(core_charts), dtype=float)
+        for row, chart in enumerate(core_charts):
+            frame = chart["frames"][0]
+            by_id = {planet["id"]: planet["longitude_deg"] for planet in frame["planets"]}
+            missing = [body for body in GOCHARA_BODIES if body not in by_id]
+            if missing:
+                raise ValueError(f"core chart {row} is missing bodies: {missing}")
+            longitudes[row] = [by_id[body] for body in GOCHARA_BODIES]
+            ascendant[row] = frame["ascendant"]["longitude_deg"]
+        if chart_ids is None:
+            chart_ids = [(chart.get("person") or {}).get("name") for chart in core_charts]
+        return cls(longitudes=longitudes, ascendant=ascendant, chart_ids=list(chart_ids))
+
+
+@dataclass
+class GocharaOverlay:
+    """Vectorized transit overlay; every array has N rows (one per natal chart)."""
+
+    transit: TransitSnapshot
+    houses_from_moon: np.ndarray
+    houses_from_lagna: np.ndarray
+    tara_index: np.ndarray
+    tara_favourable: np.ndarray
+    bav_bindus: np.ndarray
+    sav_bindus: np.ndarray
+    aspects: np.ndarray
+    conjunctions: np.ndarray
+
+    def __len__(self) -> int:
+        return self.houses_from_moon.shape[0]
+
+    def record(self, row: int) -> Dict[str, Any]:
+        """Per-chart report record for row ``row``."""
+        tara = int(self.tara_index[row])
+        planets = []
+        for col, body in enumerate(GOCHARA_BODIES):
+            entry: Dict[str, Any] = {
+                "id": body,
+                "house_from_moon": int(self.houses_from_moon[row, col]),
+                "house_from_lagna": int(self.houses_from_lagna[row, col]),
+                "sav_bindus": int(self.sav_bindus[row, col]),
+                "aspects": [
+                    NATAL_POINTS[target]
+                    for target in np.flatnonzero(self.aspects[row, col])
+                ],
+                "conjunctions": [
+                    NATAL_POINTS[target]
+                    for target in np.flatnonzero(self.conjunctions[row, col])
+                ],
+            }
+            if col < _ASHTAKAVARGA_PLANETS:
+                entry["bav_bindus"] = int(self.bav_bindus[row, col])
+            planets.append(entry)
+        return {
+            "tara": {
+                "index": tara,
+                "name": TARA_NAMES[tara - 1],
+                "favourable": bool(self.tara_favourable[row]),
+            },
+            "planets": planets,
+        }
+
+
+def compute_transit_snapshot(payload: Dict[str, Any]) -> TransitSnapshot:
+    """Compute transit longitudes once for the payload's reference instant."""
+    parsed = _parse_transit_input(payload)
+    config = parsed["config"]
+    config.include_bodies = list(GOCHARA_BODIES)
+    raw_chart = _compute_raw_d1_chart(
+        birth=CoreChartBirth(
+            datetime_local=parsed["reference"].datetime_local,
+            timezone=parsed["reference"].timezone,
+            aware_datetime=parsed["reference"].aware_datetime,
+        ),
+        location=parsed["location"],
+        pyjhora_config=_build_pyjhora_config(config),
+    )
+    by_id = {body.id: body for body in raw_chart.bodies}
+    longitudes = np.array([by_id[body].longitude_deg for body in GOCHARA_BODIES])
+    speeds = np.array(
+        [
+            by_id[body].speed_deg_per_day
+            if by_id[body].speed_deg_per_day is not None
+            else np.nan
+            for body in GOCHARA_BODIES
+        ]
+    )
+    return TransitSnapshot(
+        jd_utc=raw_chart.jd_utc,
+        datetime_utc=parsed["reference"].aware_datetime.astimezone(pytz.utc).isoformat(),
+        longitudes=longitudes,
+        speeds=speeds,
+    )
+
+
+def compute_gochara(
+    transit: TransitSnapshot, natal: NatalBatch, conjunction_orb_deg: float = 8.0
+) -> GocharaOverlay:
+    """Overlay one transit snapshot on every chart of ``natal`` at once."""
+    transit_signs = transit.signs
+    houses_from_moon = (transit_signs[None, :] - natal.moon_sign[:, None]) % 12 + 1
+    houses_from_lagna = (transit_signs[None, :] - natal.lagna_sign[:, None]) % 12 + 1
+
+    transit_nakshatra = int(transit.longitudes[_MOON] // _NAKSHATRA_SPAN) % 27
+    tara_index = (transit_nakshatra - natal.moon_nakshatra) % 27 % 9 + 1
+    tara_favourable = np.isin(tara_index, FAVOURABLE_TARAS)
+
+    tables = compute_ashtakavarga(signs_from_longitudes(natal.longitudes, natal.ascendant))
+    bav = tables.binna
+    sav = tables.samudaya
+    rows = np.arange(len(natal))[:, None]
+    bav_bindus = bav[
+        rows,
+        np.arange(_ASHTAKAVARGA_PLANETS)[None, :],
+        transit_signs[None, :_ASHTAKAVARGA_PLANETS],
+    ]
+    sav_bindus = sav[rows, transit_signs[None, :]]
+
+    point_longitudes = natal.point_longitudes
+    point_signs = (point_longitudes // 30).astype(np.int64) % 12
+    sign_offsets = (point_signs[:, None, :] - transit_signs[None, :, None]) % 12
+    aspects = _GRAHA_DRISHTI[np.arange(len(GOCHARA_BODIES))[None, :, None], sign_offsets]
+
+    separation = np.abs(point_longitudes[:, None, :] - transit.longitudes[None, :, None])
+    separation = np.minimum(separation, 360.0 - separation)
+    conjunctions = separation <= conjunction_orb_deg
+
+    return GocharaOverlay(
+        transit=transit,
+        houses_from_moon=houses_from_moon,
+        houses_from_lagna=houses_from_lagna,
+        tara_index=tara_index,
+        tara_favourable=tara_favourable,
+        bav_bindus=bav_bindus,
+        sav_bindus=sav_bindus,
+        aspects=aspects,
+        conjunctions=conjunctions,
+    )
+
+
+@instrumented("gochara")
+def run_gochara(
+    payload: Dict[str, Any],
+    natal: NatalBatch | Sequence[Dict[str, Any]],
+    conjunction_orb_deg: float = 8.0,
+) -> Dict[str, Any]:
+    """Transit-to-natal report for many charts sharing one transit ephemeris."""
+    if not isinstance(natal, NatalBatch):
+        natal = NatalBatch.from_core_charts(natal)
+    transit = compute_transit_snapshot(payload)
+    overlay = compute_gochara(transit, natal, conjunction_orb_deg=conjunction_orb_deg)
+    chart_ids = natal.chart_ids or [None] * len(natal)
+    return {
+        "meta": {
+            "schema_version": GOCHARA_SCHEMA_VERSION,
+            "timestamp_utc": datetime.now(dt_timezone.utc).isoformat(),
+            "transit_jd_utc": transit.jd_utc,
+            "chart_count": len(natal),
+        },
+        "transit": {
+            "datetime_utc": transit.datetime_utc,
+            "planets": [
+                {"id": body, "longitude_deg": float(longitude)}
+                for body, longitude in zip(GOCHARA_BODIES, transit.longitudes)
+            ],
+        },
+        "charts": [
+            {"chart_id": chart_ids[row], **overlay.record(row)}
+            for row in range(len(natal))
+        ],
+    }
@@ -0,0 +1,277 @@
+"""Batched house cusps for every bhava system of Refraction Engine V1.
+
+``drik._bhaava_madhya_new`` handles one chart and one method per call: each
+call sets the ayanamsa, runs ``swe.houses_ex`` (which recomputes sidereal
+time, obliquity and nutation) and also builds the planet chart. Here the
+sidereal time (ARMC), true obliquity and ayanamsa are computed once per
+instant; ``swe.houses_armc`` then yields the tropical cusps of each western
+system from them, and the Indian methods are derived from the ascendant and
+the Placidus cusps with NumPy.
+
+``house_cusps`` accepts arrays of (jd, latitude, longitude) and returns a
+dense ``(N, S, 12, 3)`` array of (start, cusp, end) per house, exactly the
+tuples ``drik._bhaava_madhya_new`` lists, including its midpoint of the
+Sripati cusps that does not account for a wrap past 360 degrees.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pytz
+import swisseph as swe
+from jhora import const
+from jhora.panchanga import drik
+
+from .ephemeris import _ayanamsa_offsets, calc_ut, datetime_to_jd
+from .graha import rasi_index_to_name
+from .profiling import instrumented
+
+BHAVA_SYSTEMS_SCHEMA_VERSION = "bhava_systems_spec_v1"
+
+INDIAN_HOUSE_SYSTEMS = tuple(const.indian_house_systems)
+WESTERN_HOUSE_SYSTEMS = tuple(const.western_house_systems)
+HOUSE_SYSTEMS = INDIAN_HOUSE_SYSTEMS + WESTERN_HOUSE_SYSTEMS
+BHAVA_COLUMNS = ("start", "cusp", "end")
+# drik's KP method, its Sripati method and the ascendant all use Placidus.
+_PLACIDUS = "P"
+_SRIPATI_QUADRANTS = ((0, 3), (3, 6), (6, 9), (9, 0))
+
+
+@dataclass
+class HouseCusps:
+    """Houses of N instants under ``systems``; all angles in degrees.
+
+    ``bhavas[n, s, h]`` is the (start, cusp, end) of house ``h + 1`` and
+    ``rasi[n, s, h]`` the sign (0 = Aries) drik assigns to that house.
+    """
+
+    systems: Tuple[Any, ...]
+    armc: np.ndarray
+    obliquity: np.ndarray
+    ayanamsa: np.ndarray
+    ascendant: np.ndarray
+    mc: np.ndarray
+    bhavas: np.ndarray
+    rasi: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.armc)
+
+    def system(self, code: Any) -> np.ndarray:
+        """``(N, 12, 3)`` bhavas of one system."""
+        try:
+            return self.bhavas[:, self.systems.index(code)]
+        except ValueError as exc:
+            raise ValueError(f"House system {code!r} was not computed") from exc
+
+
+def resolve_house_system(code: Any) -> Any:
+    """Key of ``const.available_house_systems`` for an int, digit string or letter."""
+    if isinstance(code, str):
+        code = code.strip()
+        code = int(code) if code.isdigit() else code.upper()
+    if code not in const.available_house_systems:
+        raise ValueError(f"Unknown house system {code!r}")
+    return code
+
+
+def _ayanamsas(
+    jd_utc: np.ndarray, ayanamsa_mode: Optional[str], ayanamsa_value: Optional[float]
+) -> np.ndarray:
+    if not ayanamsa_mode:
+        return np.zeros_like(jd_utc)
+    ayanamsa_mode = ayanamsa_mode.upper()
+    offsets = _ayanamsa_offsets(jd_utc, ayanamsa_mode, ayanamsa_value)
+    if offsets is not None:
+        return offsets
+    if ayanamsa_mode not in const.available_ayanamsa_modes:
+        raise ValueError(f"Unknown ayanamsa_mode '{ayanamsa_mode}'")
+    swe.set_sid_mode(const.available_ayanamsa_modes[ayanamsa_mode])
+    try:
+        # The value swe.houses_ex subtracts with FLG_SIDEREAL.
+        return np.array([swe.get_ayanamsa_ex_ut(jd, swe.FLG_SIDEREAL)[1] for jd in jd_utc])
+    finally:
+        drik.reset_ayanamsa_mode()
+
+
+def _quadrant_bhavas(cusps: np.ndarray) -> np.ndarray:
+    following = np.roll(cusps, -1, axis=-1)
+    following = np.where(following < cusps, following + 360.0, following)
+    return np.stack([cusps, 0.5 * (cusps + following), following], axis=-1) % 360.0
+
+
+def _sripati_cusps(placidus: np.ndarray) -> np.ndarray:
+    """``drik.bhaava_madhya_sripathi``: trisect each quadrant between the angles."""
+    cusps = placidus.copy()
+    for first, second in _SRIPATI_QUADRANTS:
+        lower, upper = cusps[:, first], cusps[:, second]
+        third = np.abs(np.where(upper < lower, upper + 360.0, upper) - lower) / 3.0
+        cusps[:, first + 1] = (lower + third) % 360.0
+        cusps[:, (second - 1) % 12] = (upper - third) % 360.0
+    return cusps
+
+
+def _indian_bhavas(
+    code: int, ascendant: np.ndarray, placidus: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    houses = np.arange(12)
+    if code == 1:
+        cusp = (ascendant[:, None] + 30.0 * houses) % 360.0
+        bhavas = np.stack([(cusp - 15.0) % 360.0, cusp, (cusp + 15.0) % 360.0], axis=-1)
+        return bhavas, (cusp // 30).astype(np.int64)
+    if code == 2:
+        start = (ascendant[:, None] + 30.0 * houses) % 360.0
+        cusp = (start + 15.0) % 360.0
+        bhavas = np.stack([start, cusp, (cusp + 15.0) % 360.0], axis=-1)
+        return bhavas, (start // 30).astype(np.int64)
+    if code == 3:
+        cusps = _sripati_cusps(placidus)
+        following = np.roll(cusps, -1, axis=-1)
+        bhavas = np.stack([cusps, 0.5 * (cusps + following), following], axis=-1) % 360.0
+        return bhavas, (cusps // 30).astype(np.int64)
+    if code == 4:
+        return _quadrant_bhavas(placidus), (placidus // 30).astype(np.int64)
+    sign = (ascendant // 30).astype(np.int64)
+    rasi = (sign[:, None] + houses) % 12
+    start = rasi * 30.0
+    cusp = (start + (ascendant - sign * 30.0)[:, None]) % 360.0
+    bhavas = np.stack([start, cusp, ((rasi + 1) % 12) * 30.0], axis=-1)
+    return bhavas, rasi
+
+
+def house_cusps(
+    jd_utc: Any,
+    latitude: Any,
+    longitude: Any,
+    systems: Sequence[Any] = HOUSE_SYSTEMS,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> HouseCusps:
+    """Houses of every system at every (jd_utc, latitude, longitude); inputs broadcast.
+
+    ``ayanamsa_mode=None`` yields tropical houses.
+    """
+    systems = tuple(resolve_house_system(code) for code in systems)
+    jd_utc, latitude, longitude = (
+        np.atleast_1d(array).astype(float)
+        for array in np.broadcast_arrays(jd_utc, latitude, longitude)
+    )
+    count = jd_utc.size
+    western = [code for code in WESTERN_HOUSE_SYSTEMS if code in systems]
+    if _PLACIDUS not in western:
+        western.append(_PLACIDUS)
+
+    armc = np.empty(count)
+    obliquity = np.empty(count)
+    tropical = {code: np.empty((count, 12)) for code in western}
+    ascendant = np.empty(count)
+    mc = np.empty(count)
+    for row in range(count):
+        obliquity[row] = calc_ut(jd_utc[row], swe.ECL_NUT)[0][0]
+        armc[row] = (swe.sidtime(jd_utc[row]) * 15.0 + longitude[row]) % 360.0
+        for code in western:
+            cusps, angles = swe.houses_armc(armc[row], latitude[row], obliquity[row], code.encode("ascii"))
+            tropical[code][row] = cusps[:12]
+            if code == _PLACIDUS:
+                ascendant[row], mc[row] = angles[0], angles[1]
+
+    ayanamsa = _ayanamsas(jd_utc, ayanamsa_mode, ayanamsa_value)
+    sidereal = {code: (cusps - ayanamsa[:, None]) % 360.0 for code, cusps in tropical.items()}
+    ascendant = (ascendant - ayanamsa) % 360.0
+    mc = (mc - ayanamsa) % 360.0
+
+    bhavas = np.empty((count, len(systems), 12, 3))
+    rasi = np.empty((count, len(systems), 12), dtype=np.int64)
+    for col, code in enumerate(systems):
+        if code in sidereal:
+            bhavas[:, col] = _quadrant_bhavas(sidereal[code])
+            rasi[:, col] = sidereal[code] // 30
+        else:
+            bhavas[:, col], rasi[:, col] = _indian_bhavas(code, ascendant, sidereal[_PLACIDUS])
+    return HouseCusps(
+        systems=systems,
+        armc=armc,
+        obliquity=obliquity,
+        ayanamsa=ayanamsa,
+        ascendant=ascendant,
+        mc=mc,
+        bhavas=bhavas,
+        rasi=rasi,
+    )
+
+
+def _parse_chart(data: Dict[str, Any], timezone_name: Optional[str]) -> Tuple[float, float, float]:
+    timezone_name = data.get("timezone_name") or timezone_name
+    location = data.get("location") or {}
+    if not timezone_name or "latitude" not in location or "longitude" not in location:
+        raise ValueError("Every bhava_systems chart needs timezone_name and location")
+    try:
+        moment = datetime.fromisoformat(data["datetime"])
+    except KeyError as exc:
+        raise ValueError(f"Missing bhava_systems field: {exc}") from exc
+    if moment.tzinfo is None:
+        moment = pytz.timezone(timezone_name).localize(moment)
+    return datetime_to_jd(moment), float(location["latitude"]), float(location["longitude"])
+
+
+def _system_record(houses: HouseCusps, row: int, col: int) -> Dict[str, Any]:
+    code = houses.systems[col]
+    return {
+        "code": str(code),
+        "name": const.available_house_systems[code],
+        "houses": [
+            {
+                "house": house + 1,
+                "rasi": rasi_index_to_name(int(houses.rasi[row, col, house]) + 1),
+                **{
+                    f"{column}_deg": float(houses.bhavas[row, col, house, index])
+                    for index, column in enumerate(BHAVA_COLUMNS)
+                },
+            }
+            for house in range(12)
+        ],
+    }
+
+
+@instrumented("bhava_systems")
+def run_bhava_systems(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload wrapper: ``bhava_systems`` holds one chart or a ``charts`` list."""
+    section = payload.get("bhava_systems")
+    if not section:
+        raise ValueError("Missing 'bhava_systems' section in payload")
+    charts: List[Dict[str, Any]] = section.get("charts") or [section]
+    instants = np.array([_parse_chart(chart, section.get("timezone_name")) for chart in charts])
+    systems = section.get("systems") or HOUSE_SYSTEMS
+
+    config = payload.get("config") or {}
+    ayanamsa_mode = config.get("ayanamsa_mode") or const._DEFAULT_AYANAMSA_MODE
+    if str(config.get("zodiac_type", "SIDEREAL")).upper() != "SIDEREAL":
+        ayanamsa_mode = None
+    houses = house_cusps(
+        instants[:, 0],
+        instants[:, 1],
+        instants[:, 2],
+        systems=systems,
+        ayanamsa_mode=ayanamsa_mode,
+        ayanamsa_value=config.get("ayanamsa_value_deg"),
+    )
+    return {
+        "meta": {
+            "schema_version": BHAVA_SYSTEMS_SCHEMA_VERSION,
+            "timestamp_utc": datetime.now(dt_timezone.utc).isoformat(),
+        },
+        "charts": [
+            {
+                "id": chart.get("id"),
+                "ascendant_deg": float(houses.ascendant[row]),
+                "mc_deg": float(houses.mc[row]),
+                "ayanamsa_deg": float(houses.ayanamsa[row]),
+                "systems": [_system_record(houses, row, col) for col in range(len(houses.systems))],
+            }
+            for row, chart in enumerate(charts)
+        ],
+    }
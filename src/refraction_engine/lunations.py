@@ -0,0 +1,356 @@
+"""Lunation catalog and lunar calendar for Refraction Engine V1.
+
+Every new and full moon is a crossing of a multiple of 180 degrees by the
+Sun-Moon elongation. They are solved once per 10-year block by root finding
+(the elongation does not depend on the ayanamsa, so the blocks are shared by
+every mode). A ``LunarCalendar`` labels the lunations of a span with the
+amanta month, adhika/nija flags and samvatsara from one vectorised pass over
+the Sun's sign at each new moon, after which month, date and next/previous
+month or year lookups are binary searches.
+
+``drik.lunar_month`` finds the same month from two ``new_moon`` searches and
+recurses a month back until it meets an adhika month; here the previous
+lunation is simply the previous row.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pytz
+from jhora import const, utils
+from jhora.panchanga import drik
+
+from .ephemeris import datetime_to_jd, jd_to_datetime, sidereal_positions, year_start_jd
+from .profiling import instrumented
+from .solar_ingress import BLOCK_YEARS, CACHED_SPAN, sankrantis
+from .tithi_pravesha import TITHI_SPAN_DEG, elongation_crossings
+
+LUNAR_CALENDAR_SCHEMA_VERSION = "lunar_calendar_spec_v1"
+SYZYGY_STEP_DEG = 180.0
+# Margins that give the first lunation of a span its predecessor (for nija) and
+# the last one its successor (for adhika).
+_MARGIN_DAYS = 62.0
+SAHASRA_FULL_MOONS = 1000
+_SYNODIC_MONTH_DAYS = 29.530589
+
+
+@lru_cache(maxsize=None)
+def _syzygy_block(year: int) -> np.ndarray:
+    end_year = min(year + BLOCK_YEARS, CACHED_SPAN[1])
+    table = elongation_crossings(
+        year_start_jd(year), year_start_jd(end_year), step_deg=SYZYGY_STEP_DEG, ayanamsa_mode=None
+    )
+    table.setflags(write=False)
+    return table
+
+
+def syzygies(start_jd_utc: float, end_jd_utc: float) -> np.ndarray:
+    """New moons (``longitude`` 0) and full moons (180) in ``[start, end)``.
+
+    Rows are ``CROSSING_DTYPE``; inside ``CACHED_SPAN`` they come from cached
+    10-year blocks.
+    """
+    if end_jd_utc <= start_jd_utc:
+        raise ValueError("end_jd_utc must be after start_jd_utc")
+    if not (year_start_jd(CACHED_SPAN[0]) <= start_jd_utc and end_jd_utc <= year_start_jd(CACHED_SPAN[1])):
+        return elongation_crossings(
+            start_jd_utc, end_jd_utc, step_deg=SYZYGY_STEP_DEG, ayanamsa_mode=None
+        )
+    table = np.concatenate(
+        [
+            _syzygy_block(year)
+            for year in range(CACHED_SPAN[0], CACHED_SPAN[1], BLOCK_YEARS)
+            if year_start_jd(year) < end_jd_utc
+            and year_start_jd(min(year + BLOCK_YEARS, CACHED_SPAN[1])) > start_jd_utc
+        ]
+    )
+    return table[(table["jd_utc"] >= start_jd_utc) & (table["jd_utc"] < end_jd_utc)]
+
+
+@dataclass
+class LunarCalendar:
+    """Amanta lunations of a span; row ``i`` runs from ``new_moon[i]`` to ``end[i]``.
+
+    ``month`` is 1 = Chaitra ... 12 = Phalguna, named after the sign the Sun
+    enters during the lunation as in ``drik.lunar_month``. ``samvatsara`` is
+    ``drik.lunar_year_index`` of the lunation (0 = Prabhava).
+    """
+
+    new_moon: np.ndarray
+    end: np.ndarray
+    full_moon: np.ndarray
+    month: np.ndarray
+    adhika: np.ndarray
+    nija: np.ndarray
+    samvatsara: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.new_moon)
+
+    def index(self, jd_utc: Any) -> Any:
+        """Row of the lunation holding each ``jd_utc``."""
+        rows = np.searchsorted(self.new_moon, jd_utc, side="right") - 1
+        if np.any(rows < 0) or np.any(np.asarray(jd_utc) >= self.end[-1]):
+            raise ValueError("jd_utc lies outside the lunar calendar span")
+        return rows
+
+    def lunar_month(self, jd_utc: float) -> List[Any]:
+        """``[month, adhika, nija]`` at ``jd_utc``, as ``drik.lunar_month``."""
+        row = int(self.index(jd_utc))
+        return [int(self.month[row]), bool(self.adhika[row]), bool(self.nija[row])]
+
+    def next_new_moon(self, jd_utc: float, direction: int = 1) -> float:
+        """First new moon after ``jd_utc`` (``direction=-1``: last one before it)."""
+        return self._step(self.new_moon, jd_utc, direction)
+
+    def next_full_moon(self, jd_utc: float, direction: int = 1, count: int = 1) -> float:
+        """The ``count``-th full moon after (or before) ``jd_utc``."""
+        return self._step(self.full_moon, jd_utc, direction, count)
+
+    def year_starts(self) -> np.ndarray:
+        """New moons that open a lunar year: the first Chaitra after a Phalguna."""
+        first = (self.month == 1) & np.concatenate([[False], self.month[:-1] != 1])
+        return self.new_moon[first]
+
+    def next_year_start(self, jd_utc: float, direction: int = 1) -> float:
+        return self._step(self.year_starts(), jd_utc, direction)
+
+    @staticmethod
+    def _step(times: np.ndarray, jd_utc: float, direction: int, count: int = 1) -> float:
+        if direction == 1:
+            row = int(np.searchsorted(times, jd_utc, side="right")) + count - 1
+        else:
+            row = int(np.searchsorted(times, jd_utc, side="left")) - count
+        if not 0 <= row < len(times):
+            raise ValueError("requested lunation lies outside the lunar calendar span")
+        return float(times[row])
+
+
+def lunar_calendar(
+    start_jd_utc: float,
+    end_jd_utc: float,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> LunarCalendar:
+    """Every lunation overlapping ``[start, end)``, labelled in one pass."""
+    table = syzygies(start_jd_utc - _MARGIN_DAYS, end_jd_utc + _MARGIN_DAYS)
+    new = table["jd_utc"][table["longitude"] < 90.0]
+    full = table["jd_utc"][table["longitude"] >= 90.0]
+    suns, _ = sidereal_positions(new, ["SUN"], ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value)
+    sign = (suns[:, 0] // 30.0).astype(np.int64)
+    month = (sign[:-1] + 1) % 12 + 1
+    adhika = sign[:-1] == sign[1:]
+    nija = np.zeros_like(adhika)
+    nija[1:] = ~adhika[1:] & adhika[:-1] & (month[1:] == month[:-1])
+    # The flags above saw the neighbouring lunations; now drop the margins.
+    keep = slice(
+        max(int(np.searchsorted(new, start_jd_utc, side="right")) - 1, 0),
+        int(np.searchsorted(new, end_jd_utc, side="left")),
+    )
+    new, end, month, adhika, nija = new[:-1][keep], new[1:][keep], month[keep], adhika[keep], nija[keep]
+    full_moon = full[np.minimum(np.searchsorted(full, new), len(full) - 1)]
+    samvatsara = np.array(
+        [drik.lunar_year_index(jd + 15.0, int(m)) for jd, m in zip(new, month)], dtype=np.int64
+    )
+    return LunarCalendar(
+        new_moon=new,
+        end=end,
+        full_moon=full_moon,
+        month=month,
+        adhika=adhika,
+        nija=nija,
+        samvatsara=samvatsara,
+    )
+
+
+def _calendar_around(
+    jd_utc: float, ayanamsa_mode: Optional[str], ayanamsa_value: Optional[float]
+) -> LunarCalendar:
+    return lunar_calendar(
+        jd_utc - _SYNODIC_MONTH_DAYS, jd_utc + _SYNODIC_MONTH_DAYS, ayanamsa_mode, ayanamsa_value
+    )
+
+
+def _local_date_hours(jd_utc: float, place: drik.Place) -> Tuple[drik.Date, float]:
+    y, m, d, h = utils.jd_to_gregorian(jd_utc + place.timezone / 24.0)
+    return drik.Date(y, m, d), h
+
+
+def _sunrise_utc(jd: float, place: drik.Place) -> float:
+    return drik.sunrise(jd, place)[2] - place.timezone / 24.0
+
+
+def lunar_month(
+    jd: float,
+    place: drik.Place,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> List[Any]:
+    """``[month, adhika, nija]`` of the lunation at sunrise, as ``drik.lunar_month``.
+
+    ``jd`` is local as in PyJHora. ``drik`` compares the local sunrise Julian
+    day with new moons in UT, so on the day of a new moon falling less than
+    the zone offset after sunrise it already reports the next month. Its nija
+    flag also looks back exactly 30 days and misses most nija months.
+    """
+    critical = _sunrise_utc(jd, place)
+    return _calendar_around(critical, ayanamsa_mode, ayanamsa_value).lunar_month(critical)
+
+
+def lunar_month_date(
+    jd: float,
+    place: drik.Place,
+    use_purnimanta_system: bool = False,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> List[Any]:
+    """``[month, lunar_day, samvatsara, adhika, nija]`` as ``drik.lunar_month_date``."""
+    critical = _sunrise_utc(jd, place)
+    calendar = _calendar_around(critical, ayanamsa_mode, ayanamsa_value)
+    row = int(calendar.index(critical))
+    longitudes, _ = sidereal_positions([critical], ["SUN", "MOON"], ayanamsa_mode=None)
+    lunar_day = int(((longitudes[0, 1] - longitudes[0, 0]) % 360.0) // TITHI_SPAN_DEG) + 1
+    month = int(calendar.month[row])
+    if use_purnimanta_system:
+        if lunar_day > 15:
+            month = month % 12 + 1
+        lunar_day = (lunar_day - 16) % 30 + 1
+    return [month, lunar_day, int(calendar.samvatsara[row]), bool(calendar.adhika[row]), bool(calendar.nija[row])]
+
+
+def vedic_date(
+    jd: float,
+    place: drik.Place,
+    calendar_type: int = 0,
+    tamil_month_method: int = const.tamil_month_method,
+    base_time: int = 0,
+    use_utc: bool = True,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> List[Any]:
+    """As ``drik.vedic_date``; the lunar calendars (1, 2) come from the catalog."""
+    if calendar_type == 0:
+        return drik.vedic_date(jd, place, calendar_type, tamil_month_method, base_time, use_utc)
+    return lunar_month_date(jd, place, calendar_type == 2, ayanamsa_mode, ayanamsa_value)
+
+
+def next_lunar_month(
+    jd: float,
+    place: drik.Place,
+    lunar_month_type: int = 0,
+    direction: int = 1,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> Tuple[drik.Date, float]:
+    """Local date and hours of the next (``direction=-1``: previous) month start.
+
+    ``lunar_month_type`` is 0 = amanta (new moon), 1 = purnimanta (full moon),
+    2 = solar (sankranti), as in ``drik.next_lunar_month``.
+    """
+    jd_utc = jd - place.timezone / 24.0
+    if lunar_month_type == 2:
+        entries = sankrantis(jd_utc - 33.0, jd_utc + 33.0, ayanamsa_mode, ayanamsa_value)["jd_utc"]
+        row = np.searchsorted(entries, jd_utc, side="right" if direction == 1 else "left")
+        return _local_date_hours(float(entries[row if direction == 1 else row - 1]), place)
+    calendar = _calendar_around(jd_utc, ayanamsa_mode, ayanamsa_value)
+    if lunar_month_type == 0:
+        start = calendar.next_new_moon(jd_utc, direction)
+    else:
+        start = calendar.next_full_moon(jd_utc, direction)
+    return _local_date_hours(start, place)
+
+
+def next_lunar_year(
+    jd: float,
+    place: drik.Place,
+    lunar_month_type: int = 0,
+    direction: int = 1,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> Tuple[drik.Date, float]:
+    """Local date and hours at which the next (or previous) lunar year begins.
+
+    Amanta and purnimanta years both begin at the new moon opening Chaitra
+    (the adhika Chaitra when there is one); solar years at Mesha sankranti.
+    ``drik.next_lunar_year`` tests the nija flag where it means the lunar day
+    and returns the start of Vaisakha, or None.
+    """
+    jd_utc = jd - place.timezone / 24.0
+    if lunar_month_type == 2:
+        entries = sankrantis(jd_utc - 370.0, jd_utc + 370.0, ayanamsa_mode, ayanamsa_value)
+        entries = entries["jd_utc"][np.round(entries["longitude"]) % 360.0 == 0.0]
+        row = np.searchsorted(entries, jd_utc, side="right" if direction == 1 else "left")
+        return _local_date_hours(float(entries[row if direction == 1 else row - 1]), place)
+    span = 2 * 13 * _SYNODIC_MONTH_DAYS
+    calendar = lunar_calendar(jd_utc - span, jd_utc + span, ayanamsa_mode, ayanamsa_value)
+    return _local_date_hours(calendar.next_year_start(jd_utc, direction), place)
+
+
+def sahasra_chandrodayam(jd: float, place: drik.Place) -> Tuple[int, int, int]:
+    """Local date of the 1000th full moon after ``jd``, as ``drik.sahasra_chandrodayam``."""
+    jd_utc = jd - place.timezone / 24.0
+    table = syzygies(jd_utc, jd_utc + (SAHASRA_FULL_MOONS + 2) * _SYNODIC_MONTH_DAYS)
+    full = table["jd_utc"][table["longitude"] >= 90.0]
+    return tuple(_local_date_hours(float(full[SAHASRA_FULL_MOONS - 1]), place)[0])
+
+
+def _lunation_record(calendar: LunarCalendar, row: int, tz: Any) -> Dict[str, Any]:
+    def _moment(jd_utc: float) -> str:
+        return jd_to_datetime(jd_utc).astimezone(tz).isoformat()
+
+    return {
+        "start": _moment(calendar.new_moon[row]),
+        "full_moon": _moment(calendar.full_moon[row]),
+        "end": _moment(calendar.end[row]),
+        "month": int(calendar.month[row]),
+        "adhika": bool(calendar.adhika[row]),
+        "nija": bool(calendar.nija[row]),
+        "samvatsara": int(calendar.samvatsara[row]),
+    }
+
+
+@instrumented("lunar_calendar")
+def run_lunar_calendar(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload wrapper: ``lunar_calendar`` holds the date range and timezone."""
+    section = payload.get("lunar_calendar")
+    if not section:
+        raise ValueError("Missing 'lunar_calendar' section in payload")
+    timezone_name = section.get("timezone_name")
+    if not timezone_name:
+        raise ValueError("lunar_calendar.timezone_name is required")
+    tz = pytz.timezone(timezone_name)
+
+    def _to_jd_utc(value: str) -> float:
+        parsed = datetime.fromisoformat(value)
+        parsed = tz.localize(parsed) if parsed.tzinfo is None else parsed
+        return datetime_to_jd(parsed)
+
+    config = payload.get("config") or {}
+    zodiac_type = str(config.get("zodiac_type", "SIDEREAL")).upper()
+    start = _to_jd_utc(section["start_datetime"])
+    end = _to_jd_utc(section["end_datetime"])
+    if end <= start:
+        raise ValueError("lunar_calendar.end_datetime must be after start_datetime")
+    calendar = lunar_calendar(
+        start,
+        end,
+        ayanamsa_mode=(config.get("ayanamsa_mode") or const._DEFAULT_AYANAMSA_MODE)
+        if zodiac_type == "SIDEREAL"
+        else None,
+        ayanamsa_value=config.get("ayanamsa_value_deg"),
+    )
+    rows = np.flatnonzero((calendar.end > start) & (calendar.new_moon < end))
+    return {
+        "meta": {
+            "schema_version": LUNAR_CALENDAR_SCHEMA_VERSION,
+            "timestamp_utc": datetime.now(dt_timezone.utc).isoformat(),
+            "start_jd_utc": start,
+            "end_jd_utc": end,
+        },
+        "lunations": [_lunation_record(calendar, int(row), tz) for row in rows],
+    }
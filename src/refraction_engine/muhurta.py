@@ -0,0 +1,446 @@
+"""Vectorized muhurta window scoring for Refraction Engine V1.
+
+Per-day data (sunrise, sunset, weekday and the rahu kalam / yamaganda / gulika
+blocks) is computed once per local date as Julian-day intervals, together with
+the tithi and nakshatra spans and the lagna timeline of the whole range. Every
+window then reads its tithi, nakshatra and lagna from those timelines and its
+houses from one batched ephemeris sample, so no per-window datetime parsing or
+chart construction is needed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pytz
+from jhora import const
+
+from .ephemeris import (
+    EPHEMERIS_BODIES,
+    datetime_to_jd,
+    jd_to_datetime,
+    sidereal_ascendants,
+    sidereal_positions,
+    wrap_degrees,
+)
+from .panchanga_calendar import CalendarLocation, compute_calendar_days, panchanga_transitions
+from .profiling import instrumented
+
+MUHURTA_SCHEMA_VERSION = "muhurta_spec_v1"
+
+BENEFICS = ("JUPITER", "VENUS", "MERCURY", "MOON")
+MALEFICS = ("SATURN", "MARS", "RAHU", "KETU", "SUN")
+
+# Same table as muhurta_extract. Its "YAMAKANDA" key does not match the
+# "YAMAGANDA" rule, so yamaganda is reported as a reason but scores 0 unless a
+# "YAMAGANDA" weight is configured.
+DEFAULT_RULE_WEIGHTS = {
+    "RAHUKALAM": -80.0,
+    "YAMAKANDA": -60.0,
+    "GULIKA": -50.0,
+    "FAVORABLE_TITHI": 15.0,
+    "UNFAVORABLE_TITHI": -20.0,
+    "BENEFIC_LAGNA": 20.0,
+    "MALEFIC_LAGNA": -25.0,
+    "BENEFIC_ANGLES": 12.0,
+    "MALEFIC_ANGLES": -18.0,
+    "TRAVEL_HOUSES_BENEFIC": 12.0,
+    "TRAVEL_HOUSES_MALEFIC": -14.0,
+}
+# Column order of the rule flag matrix; reasons are reported in this order.
+RULES = [
+    "FAVORABLE_TITHI",
+    "UNFAVORABLE_TITHI",
+    "RAHUKALAM",
+    "YAMAGANDA",
+    "GULIKA",
+    "BENEFIC_LAGNA",
+    "MALEFIC_LAGNA",
+    "BENEFIC_ANGLES",
+    "MALEFIC_ANGLES",
+    "TRAVEL_HOUSES_BENEFIC",
+    "TRAVEL_HOUSES_MALEFIC",
+]
+
+ACTIVITY_PROFILES = {
+    "CLASS_START": {
+        "favorable_tithis": {2, 3, 5, 6, 10, 11},
+        "avoid_tithis": {4, 8, 12, 14, 29, 30},
+        "use_angle_rules": True,
+        "use_travel_rules": False,
+    },
+    "PROJECT_LAUNCH": {
+        "favorable_tithis": {2, 3, 5, 6, 10, 11, 16},
+        "avoid_tithis": {4, 8, 12, 14, 29, 30},
+        "use_angle_rules": True,
+        "use_travel_rules": False,
+    },
+    "TRAVEL": {
+        "favorable_tithis": {3, 5, 7, 9, 15, 17},
+        "avoid_tithis": {1, 4, 8, 12, 29, 30},
+        "use_angle_rules": False,
+        "use_travel_rules": True,
+    },
+    "GENERIC": {
+        "favorable_tithis": {2, 3, 5, 7, 10, 11, 13},
+        "avoid_tithis": {4, 8, 12, 29, 30},
+        "use_angle_rules": True,
+        "use_travel_rules": False,
+    },
+}
+
+TRIKALAM_BLOCKS = ("RAHUKALAM", "YAMAGANDA", "GULIKA")
+# Ascendant sampling step of the lagna timeline; sign changes between samples
+# are refined by bisection, several per interval if signs rise quickly.
+LAGNA_SAMPLE_MINUTES = 15.0
+
+_BENEFIC_MASK = np.isin(EPHEMERIS_BODIES, BENEFICS)
+_MALEFIC_MASK = np.isin(EPHEMERIS_BODIES, MALEFICS)
+
+
+@dataclass
+class MuhurtaConfig:
+    activity_type: str
+    start_date: str
+    end_date: str
+    step_minutes: int = 30
+    max_windows: Optional[int] = 50
+    weights: Optional[Dict[str, float]] = None
+
+    @staticmethod
+    def from_dict(data: Dict[str, Any]) -> "MuhurtaConfig":
+        return MuhurtaConfig(
+            activity_type=str(data.get("activity_type", "CLASS_START")),
+            start_date=str(data["start_date"]),
+            end_date=str(data["end_date"]),
+            step_minutes=int(data.get("step_minutes", 30)),
+            max_windows=data.get("max_windows"),
+            weights=data.get("weights"),
+        )
+
+
+@dataclass
+class MuhurtaTimeline:
+    """Piecewise-constant element: ``index[k]`` holds until ``end_jd_utc[k]``."""
+
+    end_jd_utc: np.ndarray
+    index: np.ndarray
+
+    def at(self, jd_utc: np.ndarray) -> np.ndarray:
+        """Element index prevailing at each instant."""
+        position = np.searchsorted(self.end_jd_utc, jd_utc, side="right")
+        return self.index[np.minimum(position, len(self.index) - 1)]
+
+
+@dataclass
+class MuhurtaDayTable:
+    """Per local date arrays; ``blocks`` is ``(D, 3, 2)`` in ``TRIKALAM_BLOCKS`` order.
+
+    ``tithi`` (1-30) and ``nakshatra`` (1-27) are the spans and ``lagna`` (0-11)
+    the rising-sign timeline from the first day start to ``end_jd_utc``.
+    """
+
+    dates: List[str]
+    day_start_jd_utc: np.ndarray
+    sunrise_jd_utc: np.ndarray
+    sunset_jd_utc: np.ndarray
+    weekday: np.ndarray
+    blocks: np.ndarray
+    end_jd_utc: float
+    tithi: MuhurtaTimeline
+    nakshatra: MuhurtaTimeline
+    lagna: MuhurtaTimeline
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def day_index(self, jd_utc: np.ndarray) -> np.ndarray:
+        """Index of the local date containing each instant."""
+        return np.searchsorted(self.day_start_jd_utc, jd_utc, side="right") - 1
+
+
+@dataclass
+class MuhurtaScores:
+    """Score and rule flags for every window; ``flags`` columns follow ``RULES``."""
+
+    start_jd_utc: np.ndarray
+    end_jd_utc: np.ndarray
+    score: np.ndarray
+    flags: np.ndarray
+    tithi: np.ndarray
+    nakshatra: np.ndarray
+    lagna_sign: np.ndarray
+
+    def __len__(self) -> int:
+        return self.score.shape[0]
+
+    def top(self, count: Optional[int]) -> np.ndarray:
+        """Indices of the ``count`` best windows, best first, earliest on ties.
+
+        Only the selected windows are sorted; the rest are left partitioned.
+        """
+        total = len(self)
+        if count is None or count >= total:
+            return np.lexsort((self.start_jd_utc, -self.score))
+        if count <= 0:
+            return np.empty(0, dtype=np.int64)
+        candidates = np.argpartition(-self.score, count - 1)[:count]
+        threshold = self.score[candidates].min()
+        above = np.flatnonzero(self.score > threshold)
+        ties = np.flatnonzero(self.score == threshold)[: count - above.size]
+        chosen = np.concatenate([above, ties])
+        return chosen[np.lexsort((self.start_jd_utc[chosen], -self.score[chosen]))]
+
+
+@dataclass
+class MuhurtaWindow:
+    start_iso: str
+    end_iso: str
+    score: float
+    tier: str
+    reasons: List[str] = field(default_factory=list)
+
+
+def _local_midnight(day: date, tz: Any) -> datetime:
+    return tz.localize(datetime.combine(day, datetime.min.time()))
+
+
+def _span_timeline(
+    per_day: List[List[Any]], next_sunrise_jd_utc: np.ndarray
+) -> MuhurtaTimeline:
+    ends, indices = [], []
+    for row, spans in enumerate(per_day):
+        for index, end in spans:
+            ends.append(next_sunrise_jd_utc[row] if end is None else end)
+            indices.append(index)
+    return MuhurtaTimeline(np.array(ends), np.array(indices, dtype=np.int64))
+
+
+def lagna_timeline(
+    start_jd_utc: float,
+    end_jd_utc: float,
+    latitude: float,
+    longitude: float,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+    tol_days: float = 1e-6,
+) -> MuhurtaTimeline:
+    """Rising sign (0-11) between two instants with its entry times.
+
+    The ascendant is sampled every ``LAGNA_SAMPLE_MINUTES`` and all sign
+    boundaries crossed are bisected together in batched ascendant calls.
+    """
+    step = LAGNA_SAMPLE_MINUTES / 1440.0
+    grid = np.append(np.arange(start_jd_utc, end_jd_utc, step), end_jd_utc)
+
+    def _ascendants(jd_utc: np.ndarray) -> np.ndarray:
+        return sidereal_ascendants(
+            jd_utc, latitude, longitude, ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value
+        )
+
+    signs = (_ascendants(grid) // 30).astype(np.int64) % 12
+    # The ascendant only advances, so every sign between two samples was entered.
+    crossed = (signs[1:] - signs[:-1]) % 12
+    rows = np.repeat(np.arange(crossed.size), crossed)
+    nth = np.arange(rows.size) - np.repeat(np.cumsum(crossed) - crossed, crossed) + 1
+    entered = (signs[rows] + nth) % 12
+    lower, upper = grid[rows], grid[rows + 1]
+    while rows.size and np.max(upper - lower) > tol_days:
+        middle = 0.5 * (lower + upper)
+        past = wrap_degrees(_ascendants(middle) - entered * 30.0) >= 0.0
+        upper = np.where(past, middle, upper)
+        lower = np.where(past, lower, middle)
+    return MuhurtaTimeline(
+        end_jd_utc=np.append(upper, end_jd_utc),
+        index=np.concatenate([signs[:1], entered]),
+    )
+
+
+def build_day_table(
+    start_date: date,
+    end_date: date,
+    latitude: float,
+    longitude: float,
+    timezone_name: str,
+    place_name: Optional[str] = None,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> MuhurtaDayTable:
+    """Sunrise/sunset, weekday and trikalam blocks for each local date, once.
+
+    The day before ``start_date`` is included for the spans only, so the hours
+    before the first sunrise read the tithi and nakshatra prevailing then.
+    """
+    days = compute_calendar_days(
+        start_date - timedelta(days=1),
+        end_date,
+        CalendarLocation(latitude, longitude, timezone_name, place_name),
+    )
+    spans = panchanga_transitions(
+        days, ayanamsa_mode, ayanamsa_value, elements=("tithi", "nakshatra")
+    )
+    end_jd_utc = datetime_to_jd(
+        _local_midnight(end_date + timedelta(days=1), pytz.timezone(timezone_name))
+    )
+    return MuhurtaDayTable(
+        dates=[day.isoformat() for day in days.dates[1:]],
+        day_start_jd_utc=days.day_start_jd_utc[1:],
+        sunrise_jd_utc=days.sunrise_jd_utc[1:],
+        sunset_jd_utc=days.sunset_jd_utc[1:],
+        weekday=days.weekday[1:],
+        blocks=days.trikalam_blocks()[1:],
+        end_jd_utc=end_jd_utc,
+        tithi=_span_timeline(spans["tithi"], days.next_sunrise_jd_utc),
+        nakshatra=_span_timeline(spans["nakshatra"], days.next_sunrise_jd_utc),
+        lagna=lagna_timeline(
+            days.day_start_jd_utc[1], end_jd_utc, latitude, longitude, ayanamsa_mode, ayanamsa_value
+        ),
+    )
+
+
+def _rule_weights(config: MuhurtaConfig) -> np.ndarray:
+    weights = dict(DEFAULT_RULE_WEIGHTS)
+    if config.weights:
+        weights.update(config.weights)
+    return np.array([float(weights.get(rule, 0.0)) for rule in RULES])
+
+
+def score_muhurta_windows(
+    config: MuhurtaConfig,
+    days: MuhurtaDayTable,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> MuhurtaScores:
+    """Score every ``step_minutes`` window of the day table's range.
+
+    ``ayanamsa_mode`` and ``ayanamsa_value`` must be the ones the table was built with.
+    """
+    if config.step_minutes <= 0:
+        raise ValueError("step_minutes must be positive")
+    profile = ACTIVITY_PROFILES.get(config.activity_type.upper(), ACTIVITY_PROFILES["GENERIC"])
+    step = config.step_minutes / 1440.0
+    start = days.day_start_jd_utc[0]
+    count = int(np.ceil((days.end_jd_utc - start) / step - 1e-9))
+    starts = start + np.arange(count) * step
+    ends = np.minimum(starts + step, days.end_jd_utc)
+
+    longitudes, _ = sidereal_positions(
+        starts, EPHEMERIS_BODIES, ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value
+    )
+    tithi = days.tithi.at(starts)
+    lagna_sign = days.lagna.at(starts)
+    houses = ((longitudes // 30).astype(np.int64) - lagna_sign[:, None]) % 12 + 1
+
+    flags = np.zeros((count, len(RULES)), dtype=bool)
+    flags[:, 0] = np.isin(tithi, list(profile["favorable_tithis"]))
+    flags[:, 1] = np.isin(tithi, list(profile["avoid_tithis"]))
+
+    blocks = days.blocks[days.day_index(starts)]
+    flags[:, 2:5] = (ends[:, None] > blocks[..., 0]) & (starts[:, None] < blocks[..., 1])
+
+    if profile["use_angle_rules"]:
+        in_lagna = houses == 1
+        in_angle = in_lagna | (houses == 10)
+        flags[:, 5] = (in_lagna & _BENEFIC_MASK).any(axis=1)
+        flags[:, 6] = (in_lagna & _MALEFIC_MASK).any(axis=1)
+        flags[:, 7] = (in_angle & _BENEFIC_MASK).any(axis=1)
+        flags[:, 8] = (in_angle & _MALEFIC_MASK).any(axis=1)
+    if profile["use_travel_rules"]:
+        in_travel = np.isin(houses, (3, 9, 12))
+        flags[:, 9] = (in_travel & _BENEFIC_MASK).any(axis=1)
+        flags[:, 10] = (in_travel & _MALEFIC_MASK).any(axis=1)
+
+    score = np.round(flags @ _rule_weights(config), 2)
+    return MuhurtaScores(
+        start_jd_utc=starts,
+        end_jd_utc=ends,
+        score=score,
+        flags=flags,
+        tithi=tithi,
+        nakshatra=days.nakshatra.at(starts),
+        lagna_sign=lagna_sign,
+    )
+
+
+def tier_for_score(score: float) -> str:
+    if score <= -30:
+        return "AVOID"
+    if score < 10:
+        return "NEUTRAL"
+    if score < 40:
+        return "GOOD"
+    return "EXCELLENT"
+
+
+def muhurta_windows(
+    scores: MuhurtaScores, count: Optional[int], tz: Any
+) -> List[MuhurtaWindow]:
+    """Materialize only the selected top windows as records."""
+    windows = []
+    for index in scores.top(count):
+        windows.append(
+            MuhurtaWindow(
+                start_iso=jd_to_datetime(scores.start_jd_utc[index]).astimezone(tz).isoformat(),
+                end_iso=jd_to_datetime(scores.end_jd_utc[index]).astimezone(tz).isoformat(),
+                score=float(scores.score[index]),
+                tier=tier_for_score(scores.score[index]),
+                reasons=[RULES[col] for col in np.flatnonzero(scores.flags[index])],
+            )
+        )
+    return windows
+
+
+@instrumented("muhurta")
+def run_muhurta(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload wrapper: ``muhurta`` holds the config, location and timezone."""
+    section = payload.get("muhurta")
+    if not section:
+        raise ValueError("Missing 'muhurta' section in payload")
+    timezone_name = section.get("timezone_name")
+    location = section.get("location")
+    if not timezone_name or not location:
+        raise ValueError("muhurta.timezone_name and muhurta.location are required")
+    try:
+        lat = float(location["latitude"])
+        lon = float(location["longitude"])
+    except KeyError as exc:
+        raise ValueError(f"Missing location coordinate: {exc}") from exc
+    config = MuhurtaConfig.from_dict(section)
+    core_config = payload.get("config") or {}
+    ayanamsa_mode = core_config.get("ayanamsa_mode") or const._DEFAULT_AYANAMSA_MODE
+    if str(core_config.get("zodiac_type", "SIDEREAL")).upper() != "SIDEREAL":
+        ayanamsa_mode = None
+
+    tz = pytz.timezone(timezone_name)
+    start_date = datetime.strptime(config.start_date, "%Y-%m-%d").date()
+    end_date = datetime.strptime(config.end_date, "%Y-%m-%d").date()
+    ayanamsa_value = core_config.get("ayanamsa_value_deg")
+    days = build_day_table(
+        start_date,
+        end_date,
+        lat,
+        lon,
+        timezone_name,
+        location.get("place_name"),
+        ayanamsa_mode=ayanamsa_mode,
+        ayanamsa_value=ayanamsa_value,
+    )
+    scores = score_muhurta_windows(
+        config, days, ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value
+    )
+    max_windows = None if config.max_windows is None else int(config.max_windows)
+    windows = muhurta_windows(scores, max_windows, tz)
+    return {
+        "meta": {
+            "schema_version": MUHURTA_SCHEMA_VERSION,
+            "timestamp_utc": datetime.now(dt_timezone.utc).isoformat(),
+            "window_count": len(scores),
+        },
+        "activity_type": config.activity_type,
+        "range": {"start_date": config.start_date, "end_date": config.end_date},
+        "step_minutes": config.step_minutes,
+        "windows": [window.__dict__ for window in windows],
+    }
@@ -22,6 +22,7 @@ from .graha import (
     nakshatra_from_longitude,
     nakshatra_index_to_name,
 )
+from .profiling import instrumented
 
 
 def _hours_to_local_iso(base_dt: datetime, hours: float) -> str:
@@ -150,6 +151,7 @@ def _compute_hora_lord(birth_dt: datetime, sunrise_hours: float) -> str:
     return hora_sequence[(start_idx + hora_idx) % len(hora_sequence)]
 
 
+@instrumented("panchanga")
 def run_panchanga(payload: Dict[str, Any]) -> Dict[str, Any]:
     normalized = _parse_core_chart_input(payload)
     config = normalized["config"]
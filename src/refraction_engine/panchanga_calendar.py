@@ -0,0 +1,413 @@
+"""Day-wise Panchanga calendar builder for Refraction Engine V1.
+
+Each local date gets its sunrise, sunset and next sunrise exactly once; the
+panchanga elements prevailing between two sunrises and the trikalam blocks are
+derived from those instants, and the lunar month and samvatsara at sunrise are
+looked up in the ``lunations`` catalog. Date ranges are split into chunks that can run in
+a process pool, so multi-year and multi-city calendars stay practical.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pytz
+from jhora import const, utils
+from jhora.panchanga import drik
+
+from .core_chart import _get_karana_names, _get_tithi_names, _get_yoga_names, _language_list
+from .ephemeris import (
+    bracketed_root,
+    datetime_to_jd,
+    jd_to_datetime,
+    sidereal_positions,
+    wrap_degrees,
+)
+from .graha import nakshatra_index_to_name
+from .lunations import LunarCalendar, lunar_calendar
+from .profiling import instrumented
+
+PANCHANGA_CALENDAR_SCHEMA_VERSION = "panchanga_calendar_spec_v1"
+
+# Fractions of the day length after sunrise per weekday (0 = Sunday); the
+# tables of drik.trikalam, rows in TRIKALAM_TAGS order.
+TRIKALAM_TAGS = ("RAHU_KALAM", "YAMAGANDA", "GULIKAI")
+TRIKALAM_OFFSETS = np.array(
+    [
+        [0.875, 0.125, 0.75, 0.5, 0.625, 0.375, 0.25],
+        [0.5, 0.375, 0.25, 0.125, 0.0, 0.75, 0.625],
+        [0.75, 0.625, 0.5, 0.375, 0.25, 0.125, 0.0],
+    ]
+)
+
+# element -> (number of divisions, span in degrees)
+PANCHANGA_ELEMENTS = {
+    "tithi": (30, 12.0),
+    "nakshatra": (27, 360.0 / 27),
+    "yoga": (27, 360.0 / 27),
+    "karana": (60, 6.0),
+}
+DEFAULT_CHUNK_DAYS = 31
+
+
+@dataclass
+class CalendarLocation:
+    latitude: float
+    longitude: float
+    timezone_name: str
+    place_name: Optional[str] = None
+
+
+@dataclass
+class CalendarDays:
+    """Per local date astronomy; every array has one entry per date."""
+
+    dates: List[date]
+    tz_offset_hours: np.ndarray
+    day_start_jd_utc: np.ndarray
+    sunrise_jd_utc: np.ndarray
+    sunset_jd_utc: np.ndarray
+    next_sunrise_jd_utc: np.ndarray
+    weekday: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def day_length(self) -> np.ndarray:
+        return self.sunset_jd_utc - self.sunrise_jd_utc
+
+    def trikalam_blocks(self) -> np.ndarray:
+        """``(D, 3, 2)`` start/end JD (UTC) of each block in ``TRIKALAM_TAGS`` order."""
+        day_length = self.day_length[:, None]
+        start = self.sunrise_jd_utc[:, None] + day_length * TRIKALAM_OFFSETS[:, self.weekday].T
+        return np.stack([start, start + 0.125 * day_length], axis=-1)
+
+
+def compute_calendar_days(
+    start_date: date, end_date: date, location: CalendarLocation
+) -> CalendarDays:
+    """Sunrise, sunset and next sunrise of every date, one swisseph search each."""
+    if end_date < start_date:
+        raise ValueError("end_date must not precede start_date")
+    tz = pytz.timezone(location.timezone_name)
+    count = (end_date - start_date).days + 1
+    dates = [start_date + timedelta(days=n) for n in range(count + 1)]
+    tz_offset = np.empty(count + 1)
+    day_start = np.empty(count + 1)
+    sunrise = np.empty(count + 1)
+    sunset = np.empty(count)
+    weekday = np.empty(count, dtype=np.int64)
+    for row, day in enumerate(dates):
+        midnight = tz.localize(datetime.combine(day, datetime.min.time()))
+        tz_offset[row] = (midnight + timedelta(hours=12)).utcoffset().total_seconds() / 3600
+        place = drik.Place(
+            location.place_name or "Refraction",
+            location.latitude,
+            location.longitude,
+            tz_offset[row],
+        )
+        jd_local = utils.julian_day_number((day.year, day.month, day.day), (0, 0, 0))
+        local_zero_utc = jd_local - tz_offset[row] / 24.0
+        day_start[row] = datetime_to_jd(midnight)
+        sunrise[row] = local_zero_utc + drik.sunrise(jd_local, place)[0] / 24.0
+        if row < count:
+            sunset[row] = local_zero_utc + drik.sunset(jd_local, place)[0] / 24.0
+            weekday[row] = drik.vaara(jd_local)
+    return CalendarDays(
+        dates=dates[:count],
+        tz_offset_hours=tz_offset[:count],
+        day_start_jd_utc=day_start[:count],
+        sunrise_jd_utc=sunrise[:count],
+        sunset_jd_utc=sunset,
+        next_sunrise_jd_utc=sunrise[1:],
+        weekday=weekday,
+    )
+
+
+def _element_angles(longitudes: np.ndarray) -> Dict[str, np.ndarray]:
+    sun, moon = longitudes[..., 0], longitudes[..., 1]
+    phase = np.mod(moon - sun, 360.0)
+    return {
+        "tithi": phase,
+        "nakshatra": moon,
+        "yoga": np.mod(moon + sun, 360.0),
+        "karana": phase,
+    }
+
+
+def panchanga_transitions(
+    days: CalendarDays,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+    tol_days: float = 1e-6,
+    elements: Sequence[str] = tuple(PANCHANGA_ELEMENTS),
+) -> Dict[str, List[List[Tuple[int, Optional[float]]]]]:
+    """Elements prevailing from each sunrise to the next, with their end instants.
+
+    Returns ``{element: [[(index, end_jd_utc), ...] per day]}`` for the requested
+    ``elements``; the first entry is the element at sunrise and ``end_jd_utc`` is
+    None when it outlasts the next sunrise. All elements advance monotonically,
+    so every boundary crossed between two sunrises has a single bracketed root.
+    """
+    instants = np.append(days.sunrise_jd_utc, days.next_sunrise_jd_utc[-1:])
+    longitudes, _ = sidereal_positions(
+        instants, ["SUN", "MOON"], ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value
+    )
+    angles = _element_angles(longitudes)
+
+    def _angle(element: str, jd_utc: float) -> float:
+        position, _ = sidereal_positions(
+            [jd_utc], ["SUN", "MOON"], ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value
+        )
+        return float(_element_angles(position)[element][0])
+
+    result: Dict[str, List[List[Tuple[int, Optional[float]]]]] = {}
+    for element in elements:
+        divisions, span = PANCHANGA_ELEMENTS[element]
+        angle = angles[element]
+        advance = np.mod(angle[1:] - angle[:-1], 360.0)
+        first = (angle[:-1] // span).astype(np.int64)
+        crossings = ((angle[:-1] + advance) // span).astype(np.int64) - first
+        per_day = []
+        for row in range(len(days)):
+            spans: List[Tuple[int, Optional[float]]] = []
+            for step in range(int(crossings[row]) + 1):
+                index = int(first[row] + step) % divisions
+                end = None
+                if step < crossings[row]:
+                    boundary = ((index + 1) % divisions) * span
+                    end = float(
+                        bracketed_root(
+                            lambda jd, element=element, boundary=boundary: float(
+                                wrap_degrees(_angle(element, jd) - boundary)
+                            ),
+                            days.sunrise_jd_utc[row],
+                            days.next_sunrise_jd_utc[row],
+                            tol_days=tol_days,
+                        )
+                    )
+                spans.append((index + 1, end))
+            per_day.append(spans)
+        result[element] = per_day
+    return result
+
+
+def _element_names() -> Dict[str, List[str]]:
+    return {
+        "tithi": _get_tithi_names(),
+        "nakshatra": [nakshatra_index_to_name(index) for index in range(1, 28)],
+        "yoga": _get_yoga_names(),
+        "karana": _get_karana_names(),
+    }
+
+
+def _local_iso(jd_utc: Optional[float], tz: Any) -> Optional[str]:
+    if jd_utc is None:
+        return None
+    return jd_to_datetime(jd_utc).astimezone(tz).isoformat()
+
+
+def build_calendar_entries(
+    days: CalendarDays,
+    transitions: Dict[str, List[List[Tuple[int, Optional[float]]]]],
+    timezone_name: str,
+    lunations: Optional[LunarCalendar] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """Day records keyed by ISO date; ``lunations`` adds the lunar month at sunrise."""
+    tz = pytz.timezone(timezone_name)
+    names = _element_names()
+    weekday_names = _language_list("DAYS_LIST")
+    blocks = days.trikalam_blocks()
+    if lunations is not None:
+        lunation_rows = lunations.index(days.sunrise_jd_utc)
+        month_names, year_names = _language_list("MONTH_LIST"), _language_list("YEAR_LIST")
+    entries: Dict[str, Dict[str, Any]] = {}
+    for row, day in enumerate(days.dates):
+        entry: Dict[str, Any] = {
+            "vaara": {
+                "index": int(days.weekday[row]),
+                "name": weekday_names[int(days.weekday[row])],
+            },
+        }
+        for key, values in (
+            ("sunrise", days.sunrise_jd_utc),
+            ("sunset", days.sunset_jd_utc),
+            ("next_sunrise", days.next_sunrise_jd_utc),
+        ):
+            entry[key] = {"local": _local_iso(values[row], tz), "jd_utc": float(values[row])}
+        for element, per_day in transitions.items():
+            entry[element] = [
+                {
+                    "index": index,
+                    "name": names[element][index - 1],
+                    "end": _local_iso(end, tz),
+                    "end_jd_utc": end,
+                }
+                for index, end in per_day[row]
+            ]
+        entry["inauspicious_windows"] = [
+            {
+                "start": _local_iso(blocks[row, col, 0], tz),
+                "end": _local_iso(blocks[row, col, 1], tz),
+                "tag": tag,
+            }
+            for col, tag in enumerate(TRIKALAM_TAGS)
+        ]
+        if lunations is not None:
+            lunation = int(lunation_rows[row])
+            month = int(lunations.month[lunation])
+            samvatsara = int(lunations.samvatsara[lunation])
+            entry["lunar_month"] = {
+                "index": month,
+                "name": month_names[month - 1],
+                "adhika": bool(lunations.adhika[lunation]),
+                "nija": bool(lunations.nija[lunation]),
+            }
+            entry["samvatsara"] = {"index": samvatsara, "name": year_names[samvatsara]}
+        entries[day.isoformat()] = entry
+    return entries
+
+
+def _calendar_chunk(
+    task: Tuple[date, date, CalendarLocation, Optional[str], Optional[float]]
+) -> Dict[str, Dict[str, Any]]:
+    start_date, end_date, location, ayanamsa_mode, ayanamsa_value = task
+    days = compute_calendar_days(start_date, end_date, location)
+    transitions = panchanga_transitions(days, ayanamsa_mode, ayanamsa_value)
+    lunations = lunar_calendar(
+        days.sunrise_jd_utc[0], days.next_sunrise_jd_utc[-1], ayanamsa_mode, ayanamsa_value
+    )
+    return build_calendar_entries(days, transitions, location.timezone_name, lunations)
+
+
+def _date_chunks(start_date: date, end_date: date, chunk_days: int) -> List[Tuple[date, date]]:
+    if chunk_days <= 0:
+        raise ValueError("chunk_days must be positive")
+    chunks = []
+    current = start_date
+    while current <= end_date:
+        last = min(current + timedelta(days=chunk_days - 1), end_date)
+        chunks.append((current, last))
+        current = last + timedelta(days=1)
+    return chunks
+
+
+def build_panchanga_calendars(
+    locations: Sequence[CalendarLocation],
+    start_date: date,
+    end_date: date,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+    workers: int = 1,
+    chunk_days: int = DEFAULT_CHUNK_DAYS,
+) -> List[Dict[str, Dict[str, Any]]]:
+    """Day records for every location; chunks of all locations share one pool.
+
+    ``workers <= 1`` runs in-process, which is cheaper for short ranges.
+    """
+    if end_date < start_date:
+        raise ValueError("end_date must not precede start_date")
+    chunks = _date_chunks(start_date, end_date, chunk_days)
+    tasks = [
+        (first, last, location, ayanamsa_mode, ayanamsa_value)
+        for location in locations
+        for first, last in chunks
+    ]
+    if workers > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_calendar_chunk, tasks))
+    else:
+        results = [_calendar_chunk(task) for task in tasks]
+    calendars = []
+    for offset in range(0, len(results), len(chunks)):
+        merged: Dict[str, Dict[str, Any]] = {}
+        for chunk in results[offset : offset + len(chunks)]:
+            merged.update(chunk)
+        calendars.append(merged)
+    return calendars
+
+
+def build_panchanga_calendar(
+    location: CalendarLocation,
+    start_date: date,
+    end_date: date,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+    workers: int = 1,
+    chunk_days: int = DEFAULT_CHUNK_DAYS,
+) -> Dict[str, Dict[str, Any]]:
+    return build_panchanga_calendars(
+        [location], start_date, end_date, ayanamsa_mode, ayanamsa_value, workers, chunk_days
+    )[0]
+
+
+def _parse_location(data: Dict[str, Any], timezone_name: Optional[str]) -> CalendarLocation:
+    timezone_name = data.get("timezone_name") or timezone_name
+    if not timezone_name:
+        raise ValueError("timezone_name is required for every calendar location")
+    try:
+        return CalendarLocation(
+            latitude=float(data["latitude"]),
+            longitude=float(data["longitude"]),
+            timezone_name=timezone_name,
+            place_name=data.get("place_name"),
+        )
+    except KeyError as exc:
+        raise ValueError(f"Missing location coordinate: {exc}") from exc
+
+
+@instrumented("panchanga_calendar")
+def run_panchanga_calendar(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload wrapper: ``calendar`` holds the date range and one or more locations."""
+    section = payload.get("calendar")
+    if not section:
+        raise ValueError("Missing 'calendar' section in payload")
+    raw_locations = section.get("locations") or (
+        [section["location"]] if section.get("location") else []
+    )
+    if not raw_locations:
+        raise ValueError("calendar.location or calendar.locations is required")
+    locations = [_parse_location(item, section.get("timezone_name")) for item in raw_locations]
+    try:
+        start_date = date.fromisoformat(section["start_date"])
+        end_date = date.fromisoformat(section["end_date"])
+    except KeyError as exc:
+        raise ValueError(f"Missing calendar field: {exc}") from exc
+
+    config = payload.get("config") or {}
+    ayanamsa_mode = config.get("ayanamsa_mode") or const._DEFAULT_AYANAMSA_MODE
+    if str(config.get("zodiac_type", "SIDEREAL")).upper() != "SIDEREAL":
+        ayanamsa_mode = None
+    calendars = build_panchanga_calendars(
+        locations,
+        start_date,
+        end_date,
+        ayanamsa_mode=ayanamsa_mode,
+        ayanamsa_value=config.get("ayanamsa_value_deg"),
+        workers=int(section.get("workers", 1)),
+        chunk_days=int(section.get("chunk_days", DEFAULT_CHUNK_DAYS)),
+    )
+    return {
+        "meta": {
+            "schema_version": PANCHANGA_CALENDAR_SCHEMA_VERSION,
+            "timestamp_utc": datetime.now(dt_timezone.utc).isoformat(),
+            "range": {"start": start_date.isoformat(), "end": end_date.isoformat()},
+        },
+        "calendars": [
+            {
+                "place": {
+                    "name": location.place_name,
+                    "latitude_deg": location.latitude,
+                    "longitude_deg": location.longitude,
+                    "timezone": location.timezone_name,
+                },
+                "days": days,
+            }
+            for location, days in zip(locations, calendars)
+        ],
+    }
@@ -9,6 +9,7 @@ from .core_chart import _parse_core_chart_input
 from .core_chart import run_core_chart
 from .dashas import run_dashas_vimshottari
 from .panchanga import run_panchanga
+from .profiling import instrumented
 from .strengths import run_strengths
 from .yogas import run_yogas
 
@@ -37,6 +38,7 @@ def _build_config_echo(normalized: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+@instrumented("refraction_core")
 def run_refraction_core(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Run all core extractors and bundle their outputs."""
     normalized = _parse_core_chart_input(payload)
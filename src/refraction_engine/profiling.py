@@ -0,0 +1,144 @@
+"""Opt-in timing and ephemeris call counts for Refraction Engine V1 extractors.
+
+Profiling is off unless a payload sets ``config.profile`` to true or the call
+runs inside ``profiling()``. When on, every ``run_*`` extractor records wall and
+CPU time and the number of ``calc_ut``, ``rise_trans`` and ``houses_ex`` calls
+made through the ``ephemeris`` wrappers (plus any ``count()`` events such as
+result cache hits) into ``meta.profile``. Swiss Ephemeris calls PyJHora makes
+itself are timed but not counted. Extractors called by another extractor appear
+as its ``stages``. Registered metrics hooks receive every finished profile.
+
+Open profiles live in a ``contextvars`` variable, so a profile only counts the
+calls of its own thread (or task), and nothing global is patched. While
+nothing is being profiled an extractor call costs one extra context lookup.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import time
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+COUNTED_SWE_FUNCTIONS = ("calc_ut", "rise_trans", "houses_ex")
+
+MetricsHook = Callable[[str, Dict[str, Any]], None]
+
+_hooks: List[MetricsHook] = []
+
+
+class _Frame:
+    __slots__ = ("name", "wall", "cpu", "counts", "stages")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.wall = time.perf_counter()
+        self.cpu = time.process_time()
+        self.counts: Counter = Counter()
+        self.stages: List[Dict[str, Any]] = []
+
+    def finish(self) -> Dict[str, Any]:
+        profile: Dict[str, Any] = {
+            "name": self.name,
+            "wall_s": time.perf_counter() - self.wall,
+            "cpu_s": time.process_time() - self.cpu,
+            "calls": {name: self.counts.get(name, 0) for name in COUNTED_SWE_FUNCTIONS},
+        }
+        profile["calls"].update(
+            (name, value) for name, value in self.counts.items() if name not in profile["calls"]
+        )
+        if self.stages:
+            profile["stages"] = self.stages
+        return profile
+
+
+# Profiles open in the current context, outermost first.
+_frames: contextvars.ContextVar[Tuple[_Frame, ...]] = contextvars.ContextVar(
+    "refraction_profile_frames", default=()
+)
+_forced: contextvars.ContextVar[bool] = contextvars.ContextVar("refraction_profile_forced", default=False)
+
+
+def count(event: str, amount: int = 1) -> None:
+    """Add ``amount`` to ``event`` in every profile open in the current context."""
+    for frame in _frames.get():
+        frame.counts[event] += amount
+
+
+@contextmanager
+def _profiled_stage(name: str) -> Iterator[Dict[str, Any]]:
+    frame = _Frame(name)
+    token = _frames.set(_frames.get() + (frame,))
+    result: Dict[str, Any] = {}
+    try:
+        yield result
+    finally:
+        _frames.reset(token)
+        result.update(frame.finish())
+        enclosing = _frames.get()
+        if enclosing:
+            enclosing[-1].stages.append(result)
+        for hook in list(_hooks):
+            hook(name, result)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[Optional[Dict[str, Any]]]:
+    """Time a block as a stage of the enclosing profile; a no-op when not profiling.
+
+    Yields the dict that receives the stage's profile once the block exits.
+    """
+    if not (_frames.get() or _forced.get()):
+        yield None
+        return
+    with _profiled_stage(name) as result:
+        yield result
+
+
+@contextmanager
+def profiling() -> Iterator[None]:
+    """Profile every extractor called inside the block, whatever its payload says."""
+    token = _forced.set(True)
+    try:
+        yield
+    finally:
+        _forced.reset(token)
+
+
+def _requested(payload: Any) -> bool:
+    if _forced.get() or _frames.get():
+        return True
+    config = payload.get("config") if isinstance(payload, dict) else None
+    return isinstance(config, dict) and config.get("profile") is True
+
+
+def instrumented(name: str) -> Callable[[Callable[..., Dict[str, Any]]], Callable[..., Dict[str, Any]]]:
+    """Decorator for ``run_*`` extractors; adds ``meta.profile`` when profiling."""
+
+    def decorate(func: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+        @functools.wraps(func)
+        def wrapper(payload: Any, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+            if not _requested(payload):
+                return func(payload, *args, **kwargs)
+            with _profiled_stage(name) as profile:
+                result = func(payload, *args, **kwargs)
+            meta = result.get("meta") if isinstance(result, dict) else None
+            if isinstance(meta, dict):
+                meta["profile"] = profile
+            return result
+
+        return wrapper
+
+    return decorate
+
+
+def add_metrics_hook(hook: MetricsHook) -> None:
+    """Call ``hook(stage_name, profile)`` whenever a profiled stage finishes."""
+    _hooks.append(hook)
+
+
+def remove_metrics_hook(hook: MetricsHook) -> None:
+    if hook in _hooks:
+        _hooks.remove(hook)
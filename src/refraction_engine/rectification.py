@@ -0,0 +1,347 @@
+"""Birth-time rectification windows for Refraction Engine V1.
+
+The ``drik._birthtime_rectification_*`` checks step the birth time a quarter
+minute at a time and stop at the first candidate that passes. Every input of
+those checks is piecewise constant in time, so this module instead solves the
+instants where any input changes and returns, for a window around the birth,
+every interval in which each criterion holds:
+
+* Nakshatra suddhi: the Moon's nakshatra agrees (mod 9) with the count of
+  quarter ghatis since sunrise.
+* Lagna suddhi: the lagna is 1/5/7/9 from the Moon or from Maandi in the rasi
+  or the navamsa chart.
+* Janma suddhi: the vighatis since sunrise, modulo 225, fall in a band of the
+  native's gender.
+
+Lagna and Moon navamsa boundaries come from one coarse sweep of each refined
+by root finding (sign and nakshatra boundaries are navamsa boundaries too),
+the ghati bands from the sunrises of the days in the window, and Maandi from
+one ``drik.maandi_longitude`` call per day, night and pre-dawn segment.
+
+Ghatis are counted exactly. ``utils.udhayadhi_nazhikai`` weighs each second
+since sunrise as one tharparai instead of 2.5, so drik's janma suddhi bands
+can sit up to ~35 seconds away from these.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pytz
+from jhora import const, utils
+from jhora.panchanga import drik
+
+from .ephemeris import (
+    datetime_to_jd,
+    jd_to_datetime,
+    sidereal_ascendants,
+    sidereal_position,
+    sidereal_positions,
+)
+from .profiling import instrumented
+from .solar_ingress import unwrapped_crossings
+
+RECTIFICATION_SCHEMA_VERSION = "rectification_spec_v1"
+CRITERIA = ("nakshatra_suddhi", "lagna_suddhi", "janma_suddhi")
+NAVAMSA_SPAN_DEG = 30.0 / 9.0
+LAGNA_SUDDHI_HOUSES = (1, 5, 7, 9)
+# Vighati remainders (mod 225) per gender, 0 = male and 1 = female; as in drik
+# a remainder equal to either bound matches neither gender.
+JANMA_SUDDHI_BANDS = {0: ((0, 15), (46, 90), (151, 224)), 1: ((16, 45), (91, 150))}
+QUARTER_GHATI_DAYS = 1.0 / 240.0
+VIGHATI_DAYS = 1.0 / 3600.0
+DEFAULT_WINDOW_HOURS = 0.5
+# The lagna gains at most a few degrees a minute and the Moon ~0.6 deg an hour,
+# both far below the 180 degrees unwrapping tolerates.
+_LAGNA_GRID_DAYS = 2.0 / 1440.0
+_MOON_GRID_DAYS = 1.0 / 24.0
+
+
+def _merge(intervals: List[Tuple[float, float]]) -> np.ndarray:
+    """Sorted, non-overlapping ``(k, 2)`` array of the union of ``intervals``."""
+    merged: List[List[float]] = []
+    for start, end in sorted(i for i in intervals if i[1] > i[0]):
+        if merged and start <= merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return np.array(merged, dtype=float).reshape(-1, 2)
+
+
+def intersect_intervals(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Intersection of two sorted interval arrays."""
+    rows, i, j = [], 0, 0
+    while i < len(a) and j < len(b):
+        start, end = max(a[i, 0], b[j, 0]), min(a[i, 1], b[j, 1])
+        if end > start:
+            rows.append((start, end))
+        if a[i, 1] < b[j, 1]:
+            i += 1
+        else:
+            j += 1
+    return np.array(rows, dtype=float).reshape(-1, 2)
+
+
+def _navamsa_timeline(
+    jd_utc: np.ndarray, longitudes: np.ndarray, angle_at: Any
+) -> Tuple[float, np.ndarray]:
+    """Navamsa index (0-107) at the first sample and the times it advances."""
+    unwrapped = np.unwrap(longitudes, period=360.0)
+    crossings = unwrapped_crossings(jd_utc, unwrapped, NAVAMSA_SPAN_DEG, 0.0, angle_at)
+    first = int(longitudes[0] // NAVAMSA_SPAN_DEG)
+    times = crossings["jd_utc"] if crossings.size else np.empty(0)
+    return first, times
+
+
+def _navamsa_at(first: int, times: np.ndarray, jd_utc: np.ndarray) -> np.ndarray:
+    return (first + np.searchsorted(times, jd_utc, side="right")) % 108
+
+
+def _periodic_bands(
+    epoch: float,
+    lower: float,
+    upper: float,
+    unit_days: float,
+    period: int,
+    bands: Sequence[Tuple[int, int]],
+) -> List[Tuple[float, float]]:
+    """Parts of ``[lower, upper)`` where ``floor((t - epoch) / unit) % period`` lies in a band.
+
+    Bands are half-open ``[first, stop)`` ranges of the remainder.
+    """
+    intervals = []
+    first_cycle = int(np.floor((lower - epoch) / unit_days / period))
+    last_cycle = int(np.floor((upper - epoch) / unit_days / period))
+    for cycle in range(first_cycle, last_cycle + 1):
+        for first, stop in bands:
+            start = epoch + (cycle * period + first) * unit_days
+            end = epoch + (cycle * period + stop) * unit_days
+            intervals.append((max(start, lower), min(end, upper)))
+    return intervals
+
+
+def _local_days(start_utc: float, end_utc: float, place: drik.Place) -> List[Tuple[drik.Date, float]]:
+    """Local dates touching the span (plus the day before) with their local-midnight UTC JD."""
+    tz_days = place.timezone / 24.0
+    first = utils.jd_to_gregorian(start_utc + tz_days)
+    days = []
+    jd = utils.julian_day_number(drik.Date(*first[:3]), (0, 0, 0)) - 1.0
+    while jd - tz_days < end_utc:
+        y, m, d, _ = utils.jd_to_gregorian(jd)
+        days.append((drik.Date(y, m, d), jd - tz_days))
+        jd += 1.0
+    return days
+
+
+@dataclass
+class RectificationWindows:
+    """Valid intervals (UTC Julian days) of each criterion within ``[start, end)``."""
+
+    birth_jd_utc: float
+    start_jd_utc: float
+    end_jd_utc: float
+    intervals: Dict[str, np.ndarray]
+
+    def valid(self, criteria: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Intervals in which every one of ``criteria`` (default: all computed) holds."""
+        criteria = list(self.intervals) if criteria is None else list(criteria)
+        unknown = set(criteria) - set(self.intervals)
+        if unknown:
+            raise ValueError(f"Criteria not computed: {sorted(unknown)}")
+        result = np.array([[self.start_jd_utc, self.end_jd_utc]])
+        for name in criteria:
+            result = intersect_intervals(result, self.intervals[name])
+        return result
+
+    def nearest(self, criteria: Optional[Sequence[str]] = None) -> Optional[float]:
+        """Valid instant closest to the birth time, or None when there is none."""
+        intervals = self.valid(criteria)
+        if not len(intervals):
+            return None
+        candidates = np.clip(self.birth_jd_utc, intervals[:, 0], np.nextafter(intervals[:, 1], -np.inf))
+        return float(candidates[np.argmin(np.abs(candidates - self.birth_jd_utc))])
+
+
+def rectification_windows(
+    jd: float,
+    place: drik.Place,
+    hours: float = DEFAULT_WINDOW_HOURS,
+    gender: Optional[int] = None,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> RectificationWindows:
+    """Valid intervals of each criterion within ``hours`` of the birth ``jd`` (local, as in PyJHora).
+
+    Janma suddhi needs ``gender`` (0 = male, 1 = female) and is left out
+    without it.
+    """
+    if hours <= 0:
+        raise ValueError("hours must be positive")
+    if gender is not None and gender not in JANMA_SUDDHI_BANDS:
+        raise ValueError("gender must be 0 (male) or 1 (female)")
+    if not ayanamsa_mode:
+        raise ValueError("rectification needs a sidereal ayanamsa_mode (Maandi is sidereal in drik)")
+    birth = jd - place.timezone / 24.0
+    start, end = birth - hours / 24.0, birth + hours / 24.0
+
+    days = _local_days(start, end, place)
+    rises, segments = [], []
+    for date, midnight in days:
+        noon = utils.julian_day_number(date, (12, 0, 0))
+        rise = midnight + drik.sunrise(noon, place)[0] / 24.0
+        set_ = midnight + drik.sunset(noon, place)[0] / 24.0
+        rises.append(rise)
+        # drik.maandi_longitude only depends on the date and on whether the
+        # birth is before sunrise, in the day or after sunset.
+        segments += [(date, midnight, midnight, rise), (date, midnight, rise, set_), (date, midnight, set_, midnight + 1.0)]
+    rises = np.array(rises)
+    epochs = [
+        (rises[i], rises[i + 1] if i + 1 < len(rises) else np.inf)
+        for i in range(len(rises))
+        if (rises[i + 1] if i + 1 < len(rises) else np.inf) > start and rises[i] < end
+    ]
+
+    grid = np.append(np.arange(start, end, _LAGNA_GRID_DAYS), end)
+    lagna_first, lagna_times = _navamsa_timeline(
+        grid,
+        sidereal_ascendants(grid, place.latitude, place.longitude, ayanamsa_mode, ayanamsa_value),
+        lambda t: float(
+            sidereal_ascendants([t], place.latitude, place.longitude, ayanamsa_mode, ayanamsa_value)[0]
+        ),
+    )
+    grid = np.append(np.arange(start, end, _MOON_GRID_DAYS), end)
+    moon, _ = sidereal_positions(grid, ["MOON"], ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value)
+    moon_first, moon_times = _navamsa_timeline(
+        grid,
+        moon[:, 0],
+        lambda t: sidereal_position(t, "MOON", ayanamsa_mode, ayanamsa_value)[0],
+    )
+
+    intervals: Dict[str, np.ndarray] = {}
+
+    # Nakshatra suddhi: the nakshatra is fixed between Moon boundaries, so the
+    # matching quarter ghati of every 9 is a periodic band there.
+    moon_breaks = np.concatenate([[start], moon_times[(moon_times > start) & (moon_times < end)], [end]])
+    nakshatra = []
+    for lower, upper in zip(moon_breaks[:-1], moon_breaks[1:]):
+        residue = (int(_navamsa_at(moon_first, moon_times, lower)) // 4) % 9
+        for rise, next_rise in epochs:
+            lo, hi = max(lower, rise), min(upper, next_rise)
+            if hi > lo:
+                nakshatra += _periodic_bands(rise, lo, hi, QUARTER_GHATI_DAYS, 9, [(residue, residue + 1)])
+    intervals["nakshatra_suddhi"] = _merge(nakshatra)
+
+    # Lagna suddhi: constant between lagna, Moon and Maandi changes.
+    maandi_breaks, maandi_navamsa = [], []
+    try:
+        for date, midnight, lower, upper in segments:
+            if upper <= start or lower >= end:
+                continue
+            middle = 0.5 * (max(lower, start) + min(upper, end))
+            tob = tuple(utils.to_dms((middle - midnight) * 24.0, as_string=False))
+            sign, longitude = drik.maandi_longitude(date, tob, place, ayanamsa_mode=ayanamsa_mode)
+            maandi_breaks.append(max(lower, start))
+            maandi_navamsa.append(int((sign * 30.0 + longitude) // NAVAMSA_SPAN_DEG))
+    finally:
+        drik.reset_ayanamsa_mode()
+    breaks = np.unique(np.concatenate([[start, end], lagna_times, moon_times, maandi_breaks]))
+    breaks = breaks[(breaks >= start) & (breaks <= end)]
+    middles = 0.5 * (breaks[:-1] + breaks[1:])
+    lagna = _navamsa_at(lagna_first, lagna_times, middles)
+    moon_navamsa = _navamsa_at(moon_first, moon_times, middles)
+    maandi = np.asarray(maandi_navamsa)[np.searchsorted(maandi_breaks, middles, side="right") - 1]
+    houses = np.array([house - 1 for house in LAGNA_SUDDHI_HOUSES])
+
+    def _in_trine(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return np.isin((b - a) % 12, houses)
+
+    valid = (
+        _in_trine(lagna // 9, moon_navamsa // 9)
+        | _in_trine(lagna // 9, maandi // 9)
+        | _in_trine(lagna % 12, moon_navamsa % 12)
+        | _in_trine(lagna % 12, maandi % 12)
+    )
+    intervals["lagna_suddhi"] = _merge(
+        [(float(a), float(b)) for a, b, ok in zip(breaks[:-1], breaks[1:], valid) if ok]
+    )
+
+    # Janma suddhi: vighatis since sunrise modulo 225, bounds excluded.
+    if gender is not None:
+        bands = [(low + 1, high) for low, high in JANMA_SUDDHI_BANDS[gender]]
+        janma = []
+        for rise, next_rise in epochs:
+            lo, hi = max(start, rise), min(end, next_rise)
+            if hi > lo:
+                janma += _periodic_bands(rise, lo, hi, VIGHATI_DAYS, 225, bands)
+        intervals["janma_suddhi"] = _merge(janma)
+
+    return RectificationWindows(
+        birth_jd_utc=birth, start_jd_utc=start, end_jd_utc=end, intervals=intervals
+    )
+
+
+@instrumented("rectification")
+def run_rectification(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload wrapper: ``rectification`` holds the birth, place, window and gender."""
+    section = payload.get("rectification")
+    if not section:
+        raise ValueError("Missing 'rectification' section in payload")
+    timezone_name = section.get("timezone_name")
+    location = section.get("location") or {}
+    if not timezone_name or "latitude" not in location or "longitude" not in location:
+        raise ValueError("rectification.timezone_name and rectification.location are required")
+    tz = pytz.timezone(timezone_name)
+    birth = datetime.fromisoformat(section["birth_datetime"])
+    birth = tz.localize(birth) if birth.tzinfo is None else birth
+    tz_offset = birth.utcoffset().total_seconds() / 3600.0
+    place = drik.Place(
+        location.get("place_name") or "Refraction",
+        float(location["latitude"]),
+        float(location["longitude"]),
+        tz_offset,
+    )
+    gender = section.get("gender")
+    if isinstance(gender, str):
+        genders = {"MALE": 0, "FEMALE": 1}
+        if gender.upper() not in genders:
+            raise ValueError("rectification.gender must be 'male' or 'female'")
+        gender = genders[gender.upper()]
+
+    config = payload.get("config") or {}
+    windows = rectification_windows(
+        datetime_to_jd(birth) + tz_offset / 24.0,
+        place,
+        hours=float(section.get("hours", DEFAULT_WINDOW_HOURS)),
+        gender=gender,
+        ayanamsa_mode=config.get("ayanamsa_mode") or const._DEFAULT_AYANAMSA_MODE,
+        ayanamsa_value=config.get("ayanamsa_value_deg"),
+    )
+
+    def _intervals(rows: np.ndarray) -> List[Dict[str, str]]:
+        return [
+            {
+                "start": jd_to_datetime(start).astimezone(tz).isoformat(),
+                "end": jd_to_datetime(end).astimezone(tz).isoformat(),
+            }
+            for start, end in rows
+        ]
+
+    nearest = windows.nearest()
+    return {
+        "meta": {
+            "schema_version": RECTIFICATION_SCHEMA_VERSION,
+            "timestamp_utc": datetime.now(dt_timezone.utc).isoformat(),
+            "criteria": list(windows.intervals),
+        },
+        "criteria": {name: _intervals(rows) for name, rows in windows.intervals.items()},
+        "valid": _intervals(windows.valid()),
+        "nearest": None
+        if nearest is None
+        else {
+            "datetime": jd_to_datetime(nearest).astimezone(tz).isoformat(),
+            "adjustment_minutes": (nearest - windows.birth_jd_utc) * 1440.0,
+        },
+    }
@@ -0,0 +1,152 @@
+"""Precompiled snapshot of CorePrimitives and the PyJHora language tables.
+
+``build_snapshot`` parses ``CorePrimitives.json`` and every language's
+``list_values_*.txt`` / ``msg_strings_*.txt`` once and writes them to a single
+pickle. Each section is pickled separately inside it, so loading the file
+only reads bytes and a section is unpickled the first time it is asked for:
+a worker that only needs English never decodes the other languages.
+
+The header records ``SNAPSHOT_FORMAT_VERSION``, the PyJHora version and the
+size and mtime of every source file. A snapshot that does not match is
+ignored and the sources are parsed as before, so a stale or missing snapshot
+only costs speed. Importing this module registers the snapshot as
+``jhora.utils``' language resource provider.
+
+Build it with ``python scripts/build_resource_snapshot.py``; set
+``REFRACTION_RESOURCE_SNAPSHOT`` to use a file outside the package.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from jhora import const, utils
+from jhora._package_info import version as JHORA_VERSION
+
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_ENV_VAR = "REFRACTION_RESOURCE_SNAPSHOT"
+DEFAULT_SNAPSHOT_PATH = Path(__file__).resolve().parent / "_resources.snapshot"
+CORE_PRIMITIVES_PATH = (
+    Path(__file__).resolve().parents[2]
+    / "docs"
+    / "pyjhora_knowledge"
+    / "primitives"
+    / "CorePrimitives.json"
+)
+PRIMITIVES_SECTION = "primitives"
+
+
+def snapshot_path() -> Path:
+    return Path(os.environ.get(SNAPSHOT_ENV_VAR) or DEFAULT_SNAPSHOT_PATH)
+
+
+def _language_files(language: str) -> Tuple[Path, Path]:
+    lang_dir = Path(const._LANGUAGE_PATH)
+    return (
+        lang_dir / f"{const._DEFAULT_LANGUAGE_LIST_STR}{language}.txt",
+        lang_dir / f"{const._DEFAULT_LANGUAGE_MSG_STR}{language}.txt",
+    )
+
+
+def _source_files() -> Dict[str, Path]:
+    sources = {PRIMITIVES_SECTION: CORE_PRIMITIVES_PATH}
+    for language in sorted(set(const.available_languages.values())):
+        list_file, message_file = _language_files(language)
+        sources[f"lists:{language}"] = list_file
+        sources[f"messages:{language}"] = message_file
+    return sources
+
+
+def _fingerprint(sources: Dict[str, Path]) -> Dict[str, Tuple[int, int]]:
+    fingerprint = {}
+    for name, path in sources.items():
+        stat = path.stat()
+        fingerprint[name] = (stat.st_size, stat.st_mtime_ns)
+    return fingerprint
+
+
+def build_snapshot(path: Optional[Path] = None) -> Path:
+    """Parse every source and write the snapshot atomically; returns its path."""
+    path = Path(path) if path is not None else snapshot_path()
+    sources = _source_files()
+    with CORE_PRIMITIVES_PATH.open() as f:
+        sections = {PRIMITIVES_SECTION: pickle.dumps(json.load(f), protocol=pickle.HIGHEST_PROTOCOL)}
+    for language in sorted(set(const.available_languages.values())):
+        list_file, message_file = _language_files(language)
+        tables = {
+            "lists": utils._parse_resource_lists(str(list_file)),
+            "messages": utils._read_resource_messages_from_file(str(message_file)),
+        }
+        sections[f"lang:{language}"] = pickle.dumps(tables, protocol=pickle.HIGHEST_PROTOCOL)
+    snapshot = {
+        "format_version": SNAPSHOT_FORMAT_VERSION,
+        "jhora_version": JHORA_VERSION,
+        "fingerprint": _fingerprint(sources),
+        "sections": sections,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    with temporary.open("wb") as f:
+        pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary, path)
+    _load_snapshot.cache_clear()
+    _section.cache_clear()
+    utils.set_language_resource_provider(language_resources)
+    return path
+
+
+@lru_cache(maxsize=4)
+def _load_snapshot(path: Path) -> Optional[Dict[str, bytes]]:
+    """Sections of a current snapshot at ``path``, or None when missing or stale."""
+    try:
+        with path.open("rb") as f:
+            snapshot = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    if (
+        not isinstance(snapshot, dict)
+        or snapshot.get("format_version") != SNAPSHOT_FORMAT_VERSION
+        or snapshot.get("jhora_version") != JHORA_VERSION
+    ):
+        return None
+    try:
+        if snapshot.get("fingerprint") != _fingerprint(_source_files()):
+            return None
+    except OSError:
+        return None
+    return snapshot["sections"]
+
+
+@lru_cache(maxsize=None)
+def _section(path: Path, name: str) -> Any:
+    sections = _load_snapshot(path)
+    if sections is None or name not in sections:
+        return None
+    return pickle.loads(sections[name])
+
+
+def snapshot_section(name: str, path: Optional[Path] = None) -> Any:
+    """Unpickled section ``name``, or None without a current snapshot."""
+    return _section(Path(path) if path is not None else snapshot_path(), name)
+
+
+def core_primitives(path: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    return snapshot_section(PRIMITIVES_SECTION, path)
+
+
+def language_resources(
+    language: str, path: Optional[Path] = None
+) -> Optional[Tuple[Dict[str, List[str]], Dict[str, str]]]:
+    """``(lists, messages)`` of one language in the form ``utils.language_resources`` uses."""
+    tables = snapshot_section(f"lang:{language}", path)
+    if tables is None:
+        return None
+    return tables["lists"], tables["messages"]
+
+
+utils.set_language_resource_provider(language_resources)
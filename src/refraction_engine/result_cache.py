@@ -0,0 +1,311 @@
+"""Content-addressed cache of extractor outputs for Refraction Engine V1.
+
+Results are keyed by a SHA-256 over the normalized payload of
+``_parse_core_chart_input``, the extractor name, the runner that computed it,
+its schema version and ``ENGINE_VERSION``. Equivalent payloads (key order,
+``10:34`` vs ``10:34:00``, lower-case config values) therefore share one
+entry. ``meta.profile`` is not stored, so only a miss returns it; every
+``timestamp_utc`` the output carries is restamped with the time of the call,
+and no stamp is added where the extractor wrote none.
+
+Two backends are provided: ``MemoryBackend`` (LRU in process) and
+``SQLiteBackend`` (one file, shared between processes). Both evict the least
+recently used entries once their serialized size exceeds ``max_bytes``.
+Bumping ``ENGINE_VERSION`` (or passing ``version=``) invalidates every entry;
+on-disk entries of other versions are purged when the cache is opened.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone as dt_timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from . import profiling
+from .core_chart import CORE_SCHEMA_VERSION, _parse_core_chart_input, run_core_chart
+from .dashas import run_dashas_vimshottari
+from .panchanga import run_panchanga
+from .pipeline import run_refraction_core
+from .strengths import run_strengths
+from .yogas import run_yogas
+
+# Bump whenever a change alters extractor output without a schema version change.
+ENGINE_VERSION = "refraction_engine_v1.1"
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+_VOLATILE_META_KEYS = ("profile",)
+
+# Extractors whose input is the core chart payload: name -> (runner, schema version).
+CACHEABLE_EXTRACTORS: Dict[str, Tuple[Callable[[Dict[str, Any]], Dict[str, Any]], str]] = {
+    "core_chart": (run_core_chart, CORE_SCHEMA_VERSION),
+    "panchanga": (run_panchanga, "panchanga_spec_v1"),
+    "dashas_vimshottari": (run_dashas_vimshottari, "dashas_vimshottari_spec_v1"),
+    "strengths": (run_strengths, "strengths_spec_v1"),
+    "yogas": (run_yogas, "yogas_spec_v1"),
+    "refraction_core": (run_refraction_core, "refraction_core_bundle_spec_v1"),
+}
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def canonical_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """JSON-ready form of the normalized core payload used for hashing."""
+    normalized = _parse_core_chart_input(payload)
+    birth = normalized["birth"]
+    return {
+        "birth": {
+            "datetime": birth.aware_datetime.isoformat(),
+            "timezone": birth.timezone,
+        },
+        "location": asdict(normalized["location"]),
+        "config": asdict(normalized["config"]),
+        "person": normalized.get("person"),
+    }
+
+
+def _runner_identity(runner: Callable[..., Any]) -> str:
+    return f"{runner.__module__}.{runner.__qualname__}"
+
+
+def cache_key(
+    extractor: str,
+    payload: Dict[str, Any],
+    schema_version: str,
+    version: str = ENGINE_VERSION,
+    runner: Optional[str] = None,
+) -> str:
+    """``runner`` defaults to the identity of the registered runner of ``extractor``."""
+    if runner is None and extractor in CACHEABLE_EXTRACTORS:
+        runner = _runner_identity(CACHEABLE_EXTRACTORS[extractor][0])
+    document = {
+        "extractor": extractor,
+        "runner": runner,
+        "schema_version": schema_version,
+        "engine_version": version,
+        "input": canonical_payload(payload),
+    }
+    encoded = json.dumps(document, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def _strip_volatile(value: Any) -> Any:
+    """Drop per-call ``meta`` fields (profile) before storing."""
+    if isinstance(value, dict):
+        return {
+            key: _strip_volatile(item)
+            for key, item in value.items()
+            if not (key in _VOLATILE_META_KEYS and "schema_version" in value)
+        }
+    if isinstance(value, list):
+        return [_strip_volatile(item) for item in value]
+    return value
+
+
+def _stamp(value: Any, timestamp: str) -> None:
+    """Refresh the ``meta.timestamp_utc`` fields that are present."""
+    if isinstance(value, dict):
+        if "schema_version" in value and "timestamp_utc" in value:
+            value["timestamp_utc"] = timestamp
+        for item in value.values():
+            _stamp(item, timestamp)
+    elif isinstance(value, list):
+        for item in value:
+            _stamp(item, timestamp)
+
+
+class MemoryBackend:
+    """In-process LRU store of serialized results."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, value: bytes, version: str) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous[1])
+            if len(value) > self.max_bytes:
+                return
+            self._entries[key] = (version, value)
+            self._size += len(value)
+            while self._size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def retain_version(self, version: str) -> None:
+        with self._lock:
+            for key in [key for key, (own, _) in self._entries.items() if own != version]:
+                self._size -= len(self._entries.pop(key)[1])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def usage(self) -> Tuple[int, int]:
+        return len(self._entries), self._size
+
+
+class SQLiteBackend:
+    """Single-file store; ``accessed`` orders entries for LRU eviction."""
+
+    def __init__(self, path: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS results ("
+                "key TEXT PRIMARY KEY, version TEXT NOT NULL, value BLOB NOT NULL, "
+                "size INTEGER NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS results_accessed ON results (accessed)")
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock, self._db:
+            row = self._db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            self._db.execute(
+                "UPDATE results SET accessed = ? WHERE key = ?", (time.time(), key)
+            )
+            return bytes(row[0])
+
+    def put(self, key: str, value: bytes, version: str) -> None:
+        if len(value) > self.max_bytes:
+            return
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (key, version, value, size, accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, version, sqlite3.Binary(value), len(value), time.time()),
+            )
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            for evicted, size in self._db.execute(
+                "SELECT key, size FROM results ORDER BY accessed"
+            ).fetchall():
+                self._db.execute("DELETE FROM results WHERE key = ?", (evicted,))
+                self.evictions += 1
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+    def retain_version(self, version: str) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM results WHERE version != ?", (version,))
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM results")
+
+    def usage(self) -> Tuple[int, int]:
+        with self._lock:
+            count, size = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM results"
+            ).fetchone()
+        return int(count), int(size)
+
+    def close(self) -> None:
+        self._db.close()
+
+
+class ResultCache:
+    """Front end over a backend; ``run`` returns cached or freshly computed output."""
+
+    def __init__(self, backend: Any = None, version: str = ENGINE_VERSION) -> None:
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.version = version
+        self._hits = 0
+        self._misses = 0
+        self.backend.retain_version(version)
+
+    def key(self, extractor: str, payload: Dict[str, Any]) -> str:
+        _, schema_version = self._extractor(extractor)
+        return cache_key(extractor, payload, schema_version, self.version)
+
+    def run(
+        self,
+        extractor: str,
+        payload: Dict[str, Any],
+        runner: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Output of ``extractor`` for ``payload``; ``runner`` overrides the registry.
+
+        Each runner has its own entries, so an override never reads or
+        replaces the registered runner's results.
+        """
+        default_runner, schema_version = self._extractor(extractor)
+        runner = runner or default_runner
+        key = cache_key(extractor, payload, schema_version, self.version, _runner_identity(runner))
+        timestamp = datetime.now(dt_timezone.utc).isoformat()
+        stored = self.backend.get(key)
+        if stored is not None:
+            self._hits += 1
+            profiling.count("result_cache_hits")
+            result = json.loads(stored)
+        else:
+            self._misses += 1
+            profiling.count("result_cache_misses")
+            result = runner(payload)
+            encoded = json.dumps(_strip_volatile(result), separators=(",", ":"))
+            self.backend.put(key, encoded.encode("utf-8"), self.version)
+        _stamp(result, timestamp)
+        return result
+
+    def stats(self) -> CacheStats:
+        entries, size = self.backend.usage()
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self.backend.evictions,
+            entries=entries,
+            size_bytes=size,
+        )
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    @staticmethod
+    def _extractor(extractor: str) -> Tuple[Callable[[Dict[str, Any]], Dict[str, Any]], str]:
+        try:
+            return CACHEABLE_EXTRACTORS[extractor]
+        except KeyError as exc:
+            raise ValueError(
+                f"Unknown extractor {extractor!r}; expected one of {sorted(CACHEABLE_EXTRACTORS)}"
+            ) from exc
@@ -0,0 +1,294 @@
+"""Sankranti and solar-return tables for Refraction Engine V1.
+
+The sidereal Sun is sampled once on a coarse grid for the whole span. Its
+unwrapped longitude only increases, so the grid interval holding every crossing
+of a target longitude is found with ``searchsorted`` and refined there by root
+finding. Sankrantis are crossings of multiples of 30 degrees; solar returns for
+annual, monthly and sixty-hour charts are crossings of the birth longitude plus
+multiples of 360, 30 and 2.5 degrees.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
+from math import ceil
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pytz
+from jhora import const
+
+from .ephemeris import (
+    bracketed_root,
+    datetime_to_jd,
+    jd_to_datetime,
+    sidereal_position,
+    sidereal_positions,
+    wrap_degrees,
+    year_start_jd,
+)
+from .graha import rasi_index_to_name
+from .profiling import instrumented
+
+SOLAR_INGRESS_SCHEMA_VERSION = "solar_ingress_spec_v1"
+# The Sun moves at most ~1.02 deg/day, so a 10 day grid keeps unwrapping safe.
+GRID_STEP_DAYS = 10.0
+SANKRANTI_STEP_DEG = 30.0
+RETURN_STEPS_DEG = {"YEARS": 360.0, "MONTHS": 30.0, "SIXTY_HOURS": 2.5}
+# Equation of centre plus the tropical/sidereal year drift keep a mean-motion
+# guess within a few days of the true return.
+RETURN_WINDOW_DAYS = 8.0
+CACHED_SPAN = (1900, 2100)
+BLOCK_YEARS = 10
+
+CROSSING_DTYPE = np.dtype([("jd_utc", "f8"), ("longitude", "f8"), ("step", "i8")])
+
+
+def _sun_longitude(
+    jd_utc: float, ayanamsa_mode: Optional[str], ayanamsa_value: Optional[float]
+) -> float:
+    return sidereal_position(jd_utc, "SUN", ayanamsa_mode, ayanamsa_value)[0]
+
+
+def solar_crossings(
+    start_jd_utc: float,
+    end_jd_utc: float,
+    step_deg: float = SANKRANTI_STEP_DEG,
+    offset_deg: float = 0.0,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+    tol_days: float = 1e-7,
+) -> np.ndarray:
+    """Times in ``[start, end)`` at which the Sun reaches ``offset + k * step``.
+
+    Returns a ``CROSSING_DTYPE`` array sorted by time. ``step`` is ``k``,
+    counted along the unwrapped longitude, and ``longitude`` is the target
+    reduced to ``[0, 360)``.
+    """
+    if end_jd_utc <= start_jd_utc:
+        raise ValueError("end_jd_utc must be after start_jd_utc")
+    if not 0.0 < step_deg <= 360.0:
+        raise ValueError("step_deg must lie in (0, 360]")
+    grid = np.append(np.arange(start_jd_utc, end_jd_utc, GRID_STEP_DAYS), end_jd_utc)
+    longitudes, _ = sidereal_positions(
+        grid, ["SUN"], ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value
+    )
+    unwrapped = np.unwrap(longitudes[:, 0], period=360.0)
+    return unwrapped_crossings(
+        grid,
+        unwrapped,
+        step_deg,
+        offset_deg,
+        lambda jd: _sun_longitude(jd, ayanamsa_mode, ayanamsa_value),
+        tol_days,
+    )
+
+
+def unwrapped_crossings(
+    grid: np.ndarray,
+    unwrapped: np.ndarray,
+    step_deg: float,
+    offset_deg: float,
+    angle_at: Callable[[float], float],
+    tol_days: float = 1e-7,
+) -> np.ndarray:
+    """Crossings of ``offset + k * step`` by an increasing angle sampled on ``grid``.
+
+    ``unwrapped`` holds the samples with 360 degree jumps removed and
+    ``angle_at`` evaluates the wrapped angle for refinement.
+    """
+    base = offset_deg + 360.0 * np.floor((unwrapped[0] - offset_deg) / 360.0)
+    first = ceil((unwrapped[0] - base) / step_deg)
+    steps = np.arange(first, ceil((unwrapped[-1] - base) / step_deg))
+    targets = base + steps * step_deg
+    intervals = np.searchsorted(unwrapped, targets, side="right") - 1
+
+    rows = []
+    for step, target, index in zip(steps.tolist(), targets.tolist(), intervals.tolist()):
+        longitude = target % 360.0
+
+        def _offset(jd: float, longitude: float = longitude) -> float:
+            return float(wrap_degrees(angle_at(jd) - longitude))
+
+        jd = bracketed_root(
+            _offset,
+            grid[index],
+            grid[index + 1],
+            f_lower=unwrapped[index] - target,
+            f_upper=unwrapped[index + 1] - target,
+            tol_days=tol_days,
+        )
+        rows.append((float(jd), longitude, step))
+    return np.array(rows, dtype=CROSSING_DTYPE)
+
+
+@lru_cache(maxsize=None)
+def _sankranti_block(year: int, ayanamsa_mode: Optional[str]) -> np.ndarray:
+    end_year = min(year + BLOCK_YEARS, CACHED_SPAN[1])
+    table = solar_crossings(
+        year_start_jd(year), year_start_jd(end_year), ayanamsa_mode=ayanamsa_mode
+    )
+    table.setflags(write=False)
+    return table
+
+
+def sankrantis(
+    start_jd_utc: float,
+    end_jd_utc: float,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> np.ndarray:
+    """Sun's sign entries in ``[start, end)``; the rasi entered is ``longitude // 30``.
+
+    Served from cached 10-year blocks inside ``CACHED_SPAN``.
+    """
+    cacheable = (
+        ayanamsa_value is None
+        and year_start_jd(CACHED_SPAN[0]) <= start_jd_utc
+        and end_jd_utc <= year_start_jd(CACHED_SPAN[1])
+    )
+    if not cacheable:
+        return solar_crossings(
+            start_jd_utc, end_jd_utc, ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value
+        )
+    mode = ayanamsa_mode.upper() if ayanamsa_mode else None
+    table = np.concatenate(
+        [
+            _sankranti_block(year, mode)
+            for year in range(CACHED_SPAN[0], CACHED_SPAN[1], BLOCK_YEARS)
+            if year_start_jd(year) < end_jd_utc
+            and year_start_jd(min(year + BLOCK_YEARS, CACHED_SPAN[1])) > start_jd_utc
+        ]
+    )
+    return table[(table["jd_utc"] >= start_jd_utc) & (table["jd_utc"] < end_jd_utc)]
+
+
+def _return_step(years: int, months: int, sixty_hours: int) -> Tuple[int, float]:
+    if min(years, months, sixty_hours) < 1:
+        raise ValueError("years, months and sixty_hours count from 1")
+    if sixty_hours > 1:
+        return (years - 1) * 144 + (months - 1) * 12 + sixty_hours - 1, RETURN_STEPS_DEG["SIXTY_HOURS"]
+    if months > 1:
+        return (years - 1) * 12 + months - 1, RETURN_STEPS_DEG["MONTHS"]
+    return years - 1, RETURN_STEPS_DEG["YEARS"]
+
+
+def solar_return_jd(
+    birth_jd_utc: float,
+    years: int = 1,
+    months: int = 1,
+    sixty_hours: int = 1,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+    tol_days: float = 1e-7,
+) -> float:
+    """UTC Julian day of one annual/monthly/sixty-hour return, as ``drik.next_solar_date``."""
+    count, step_deg = _return_step(years, months, sixty_hours)
+    if count == 0:
+        return birth_jd_utc
+    birth_longitude = _sun_longitude(birth_jd_utc, ayanamsa_mode, ayanamsa_value)
+    longitude = (birth_longitude + count * step_deg) % 360.0
+    guess = birth_jd_utc + count * step_deg / 360.0 * const.sidereal_year
+
+    def _offset(jd: float) -> float:
+        return float(wrap_degrees(_sun_longitude(jd, ayanamsa_mode, ayanamsa_value) - longitude))
+
+    return float(
+        bracketed_root(
+            _offset, guess - RETURN_WINDOW_DAYS, guess + RETURN_WINDOW_DAYS, tol_days=tol_days
+        )
+    )
+
+
+def solar_returns(
+    birth_jd_utc: float,
+    count: int,
+    step: str = "YEARS",
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> np.ndarray:
+    """The first ``count`` returns after birth, computed in one sweep.
+
+    The ``step`` of a row is its return number, so the row with ``step=n`` is
+    ``years`` (or ``months``/``sixty_hours``) ``n + 1`` of ``drik.next_solar_date``.
+    """
+    step = step.upper()
+    if step not in RETURN_STEPS_DEG:
+        raise ValueError(f"step must be one of {sorted(RETURN_STEPS_DEG)}")
+    if count < 1:
+        return np.empty(0, CROSSING_DTYPE)
+    step_deg = RETURN_STEPS_DEG[step]
+    birth_longitude = _sun_longitude(birth_jd_utc, ayanamsa_mode, ayanamsa_value)
+    end = birth_jd_utc + (count * step_deg / 360.0) * const.sidereal_year + RETURN_WINDOW_DAYS
+    table = solar_crossings(
+        birth_jd_utc,
+        end,
+        step_deg=step_deg,
+        offset_deg=birth_longitude,
+        ayanamsa_mode=ayanamsa_mode,
+        ayanamsa_value=ayanamsa_value,
+    )
+    return table[table["step"] >= 1][:count]
+
+
+def _crossing_record(row: np.void, tz: Any) -> Dict[str, Any]:
+    return {
+        "jd_utc": float(row["jd_utc"]),
+        "datetime": jd_to_datetime(row["jd_utc"]).astimezone(tz).isoformat(),
+    }
+
+
+@instrumented("solar_ingress")
+def run_solar_ingress(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload wrapper: ``solar`` holds the sankranti range and optional birth returns."""
+    solar = payload.get("solar")
+    if not solar:
+        raise ValueError("Missing 'solar' section in payload")
+    timezone_name = solar.get("timezone_name")
+    if not timezone_name:
+        raise ValueError("solar.timezone_name is required")
+    tz = pytz.timezone(timezone_name)
+
+    def _to_jd_utc(value: str) -> float:
+        parsed = datetime.fromisoformat(value)
+        parsed = tz.localize(parsed) if parsed.tzinfo is None else parsed
+        return datetime_to_jd(parsed)
+
+    config = payload.get("config") or {}
+    zodiac_type = str(config.get("zodiac_type", "SIDEREAL")).upper()
+    ayanamsa_mode = (
+        (config.get("ayanamsa_mode") or const._DEFAULT_AYANAMSA_MODE)
+        if zodiac_type == "SIDEREAL"
+        else None
+    )
+    ayanamsa_value = config.get("ayanamsa_value_deg")
+    start = _to_jd_utc(solar["start_datetime"])
+    end = _to_jd_utc(solar["end_datetime"])
+
+    entries: List[Dict[str, Any]] = []
+    for row in sankrantis(start, end, ayanamsa_mode, ayanamsa_value):
+        rasi = int(round(row["longitude"] / SANKRANTI_STEP_DEG)) % 12
+        entries.append(
+            {**_crossing_record(row, tz), "rasi_index": rasi, "rasi": rasi_index_to_name(rasi + 1)}
+        )
+    returns: Dict[str, List[Dict[str, Any]]] = {}
+    if solar.get("birth_datetime"):
+        birth = _to_jd_utc(solar["birth_datetime"])
+        for step in RETURN_STEPS_DEG:
+            count = int(solar.get(step.lower()) or 0)
+            if count:
+                table = solar_returns(birth, count, step, ayanamsa_mode, ayanamsa_value)
+                returns[step.lower()] = [
+                    {**_crossing_record(row, tz), "count": int(row["step"]) + 1} for row in table
+                ]
+    return {
+        "meta": {
+            "schema_version": SOLAR_INGRESS_SCHEMA_VERSION,
+            "timestamp_utc": datetime.now(dt_timezone.utc).isoformat(),
+            "start_jd_utc": start,
+            "end_jd_utc": end,
+        },
+        "sankrantis": entries,
+        "returns": returns,
+    }
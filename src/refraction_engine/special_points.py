@@ -15,6 +15,7 @@ from .graha import (
     nakshatra_from_longitude,
     nakshatra_index_to_name,
 )
+from .profiling import instrumented
 
 
 def _lagna_longitude(spec_lagna: Tuple[int, float]) -> float:
@@ -52,6 +53,7 @@ def _read_birth(payload: Dict[str, Any]) -> Tuple[datetime, Dict[str, Any]]:
     return dt, birth
 
 
+@instrumented("special_points")
 def run_special_points(payload: Dict[str, Any]) -> Dict[str, Any]:
     config = payload.get("config", {})
     person = payload.get("person", {})
@@ -0,0 +1,170 @@
+"""Retrograde/direct station finder for Mars through Saturn.
+
+Speeds of all planets are sampled together on one grid and every sign flip is
+refined by root finding on the speed. Stations of the common span are cached in
+blocks of years, so vakra reports for that span are table lookups.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from jhora import const
+
+from .ephemeris import bracketed_root, sidereal_position, sidereal_positions, year_start_jd
+
+STATION_PLANETS = ("MARS", "MERCURY", "JUPITER", "VENUS", "SATURN")
+RETROGRADE = -1
+DIRECT = 1
+# Mercury's shortest retrograde/direct phases last about three weeks.
+SAMPLE_STEP_DAYS = 2.0
+CACHED_SPAN = (1900, 2100)
+BLOCK_YEARS = 10
+
+STATION_DTYPE = np.dtype(
+    [("jd_utc", "f8"), ("planet", "u1"), ("direction", "i1"), ("longitude", "f8")]
+)
+
+
+def compute_stations(
+    start_jd_utc: float,
+    end_jd_utc: float,
+    planets: Sequence[str] = STATION_PLANETS,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+    step_days: float = SAMPLE_STEP_DAYS,
+    tol_days: float = 1e-6,
+) -> np.ndarray:
+    """Stations in ``[start, end)`` as a ``STATION_DTYPE`` array sorted by time.
+
+    ``planet`` indexes ``STATION_PLANETS``; ``direction`` is the motion after
+    the station (``RETROGRADE`` or ``DIRECT``).
+    """
+    if end_jd_utc <= start_jd_utc:
+        raise ValueError("end_jd_utc must be after start_jd_utc")
+    planets = [str(planet).upper() for planet in planets]
+    unknown = [planet for planet in planets if planet not in STATION_PLANETS]
+    if unknown:
+        raise ValueError(f"Stations are only defined for {STATION_PLANETS}, got {unknown}")
+    grid = np.append(np.arange(start_jd_utc, end_jd_utc, step_days), end_jd_utc)
+    _, speeds = sidereal_positions(
+        grid, planets, ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value
+    )
+
+    rows: List[Tuple[float, int, int, float]] = []
+    for col, planet in enumerate(planets):
+        speed = speeds[:, col]
+        for step in np.flatnonzero(np.sign(speed[1:]) * np.sign(speed[:-1]) < 0):
+
+            def _speed(jd: float, planet: str = planet) -> float:
+                return sidereal_position(jd, planet, ayanamsa_mode, ayanamsa_value)[1]
+
+            jd = float(
+                bracketed_root(
+                    _speed,
+                    grid[step],
+                    grid[step + 1],
+                    f_lower=speed[step],
+                    f_upper=speed[step + 1],
+                    tol_days=tol_days,
+                )
+            )
+            if jd >= end_jd_utc:
+                continue
+            longitude = sidereal_position(jd, planet, ayanamsa_mode, ayanamsa_value)[0]
+            direction = RETROGRADE if speed[step + 1] < 0 else DIRECT
+            rows.append((jd, STATION_PLANETS.index(planet), direction, longitude))
+    table = np.array(rows, dtype=STATION_DTYPE)
+    return table[np.argsort(table["jd_utc"], kind="stable")]
+
+
+@lru_cache(maxsize=None)
+def _station_block(year: int, ayanamsa_mode: Optional[str]) -> np.ndarray:
+    end_year = min(year + BLOCK_YEARS, CACHED_SPAN[1])
+    table = compute_stations(
+        year_start_jd(year), year_start_jd(end_year), ayanamsa_mode=ayanamsa_mode
+    )
+    table.setflags(write=False)
+    return table
+
+
+def find_stations(
+    start_jd_utc: float,
+    end_jd_utc: float,
+    planets: Optional[Sequence[str]] = None,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> np.ndarray:
+    """Stations in ``[start, end)``, served from cached blocks inside ``CACHED_SPAN``."""
+    planets = [str(planet).upper() for planet in (planets or STATION_PLANETS)]
+    cacheable = (
+        ayanamsa_value is None
+        and year_start_jd(CACHED_SPAN[0]) <= start_jd_utc
+        and end_jd_utc <= year_start_jd(CACHED_SPAN[1])
+    )
+    if not cacheable:
+        return compute_stations(
+            start_jd_utc, end_jd_utc, planets, ayanamsa_mode, ayanamsa_value
+        )
+    mode = ayanamsa_mode.upper() if ayanamsa_mode else None
+    blocks = [
+        _station_block(year, mode)
+        for year in range(CACHED_SPAN[0], CACHED_SPAN[1], BLOCK_YEARS)
+        if year_start_jd(year) < end_jd_utc
+        and year_start_jd(min(year + BLOCK_YEARS, CACHED_SPAN[1])) > start_jd_utc
+    ]
+    table = np.concatenate(blocks)
+    table = table[(table["jd_utc"] >= start_jd_utc) & (table["jd_utc"] < end_jd_utc)]
+    wanted = [STATION_PLANETS.index(planet) for planet in planets if planet in STATION_PLANETS]
+    return table[np.isin(table["planet"], wanted)]
+
+
+def precompute_station_tables(
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+) -> None:
+    """Fill every cached block of ``CACHED_SPAN`` up front."""
+    mode = ayanamsa_mode.upper() if ayanamsa_mode else None
+    for year in range(CACHED_SPAN[0], CACHED_SPAN[1], BLOCK_YEARS):
+        _station_block(year, mode)
+
+
+def vakra_periods(
+    stations: np.ndarray,
+    start_jd_utc: float,
+    end_jd_utc: float,
+    planet: str,
+    initially_retrograde: Optional[bool] = None,
+) -> List[Dict[str, Any]]:
+    """Retrograde intervals of ``planet`` clipped to the range.
+
+    A period open at either end of the range has no station on that side.
+    ``initially_retrograde`` is inferred from the first station when omitted.
+    """
+    own = stations[stations["planet"] == STATION_PLANETS.index(planet.upper())]
+    if initially_retrograde is None:
+        initially_retrograde = bool(own.size) and own["direction"][0] == DIRECT
+    periods: List[Dict[str, Any]] = []
+    start = start_jd_utc if initially_retrograde else None
+    start_station: Optional[float] = None
+    for jd, direction in zip(own["jd_utc"].tolist(), own["direction"].tolist()):
+        if direction == RETROGRADE:
+            start = start_station = jd
+        elif start is not None:
+            periods.append(_vakra_period(start, jd, start_station, jd))
+            start = start_station = None
+    if start is not None:
+        periods.append(_vakra_period(start, end_jd_utc, start_station, None))
+    return periods
+
+
+def _vakra_period(
+    start: float, end: float, start_station: Optional[float], end_station: Optional[float]
+) -> Dict[str, Any]:
+    return {
+        "jd_start": start,
+        "jd_end": end,
+        "start_station": start_station,
+        "end_station": end_station,
+    }
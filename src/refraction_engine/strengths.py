@@ -11,6 +11,7 @@ from jhora.panchanga import drik
 
 from .core_chart import _parse_core_chart_input
 from .graha import graha_const_to_string
+from .profiling import instrumented
 
 SHADBALA_PLANET_ORDER = [
     const._SUN,
@@ -41,6 +42,7 @@ def _birth_context(birth: Any, location: Any) -> Dict[str, Any]:
     return {"jd": jd, "place": place}
 
 
+@instrumented("strengths")
 def run_strengths(payload: Dict[str, Any]) -> Dict[str, Any]:
     """Compute Shadbala strengths for classical planets."""
     normalized = _parse_core_chart_input(payload)
@@ -0,0 +1,186 @@
+"""Vectorized Surya Siddhanta positions and panchanga over Julian-day arrays.
+
+``jhora.panchanga.surya_sidhantha`` runs the ahargana, mean-motion, mandaphala
+and sighra chain planet by planet in scalar Python and keeps intermediate
+results in module globals (``const.planet_mean_longitudes``,
+``mandaphala_of_sun``). This module runs the same chain on NumPy arrays of
+local Julian days: positions are ``(N, 9)`` longitudes in the sidereal
+``drik.planet_list`` order and need no ephemeris files, so millions of
+instants cost a few array passes.
+
+Every step reproduces the scalar arithmetic, quirks included: the sighra
+anomaly of both sighra steps uses the mean planet, the Sun and Moon mandaphala
+is always positive, and the bhujantara correction uses the Sun's mandaphala of
+the same instant (as ``planet_positions`` leaves it). Only the tithi and
+nakshatra end instants differ: the scalar functions add the hours left as days,
+here they are returned as Julian days. The ascendant of ``planet_positions``
+is not computed.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Tuple
+
+import numpy as np
+from jhora import const
+from jhora.panchanga import drik
+
+# drik.planet_list in sidereal mode; set_tropical_planets swaps the nodes out.
+PLANETS = (
+    const._SUN,
+    const._MOON,
+    const._MARS,
+    const._MERCURY,
+    const._JUPITER,
+    const._VENUS,
+    const._SATURN,
+    const._RAHU,
+    const._KETU,
+)
+_SUN, _MOON, _RAHU, _KETU = 0, 1, 7, 8
+# Planets with a mandaphala (Sun to Saturn) and, of those, with a sighra step.
+_MANDA = slice(0, 7)
+_SIGHRA = np.array([2, 3, 4, 5, 6])
+_INFERIOR = np.isin(np.array(PLANETS)[_SIGHRA], [const._MERCURY, const._VENUS])
+
+_MEAN_DAILY_MOTION = np.array(
+    [
+        round(const.planet_mean_revolutions_at_kali[planet] / const.civil_days_in_mahayuga * 360, 7)
+        for planet in PLANETS
+    ]
+)
+_DAILY_MEAN_MOTIONS = np.array([const.daily_mean_motions[planet] for planet in PLANETS])
+_MANDOCCA_REVOLUTIONS = np.array([const.madocca_revolutions[planet] for planet in PLANETS[_MANDA]])
+_MANDOCCA_AT_KALI = np.array([const.manodcca_positions_at_kali[planet] for planet in PLANETS[_MANDA]])
+_MANDA_PERIPHERY = np.array([const.planet_mandaphala_periphery_modern[planet] for planet in PLANETS[_MANDA]])
+_SIGHRA_PERIPHERY = np.array([const.planet_sighra_peripheries[PLANETS[index]] for index in _SIGHRA])
+_SINE_RADIUS = const.mandakendrajya_indian_sine_radius
+_ONE_STAR = 360 / 27
+_ONE_PADA = 360 / 108
+
+
+def _sind(degrees: np.ndarray) -> np.ndarray:
+    return np.sin(np.radians(degrees))
+
+
+def _cosd(degrees: np.ndarray) -> np.ndarray:
+    return np.cos(np.radians(degrees))
+
+
+def kali_ahargana(jd: Any) -> np.ndarray:
+    """Days since the Kali epoch, aligned to ``drik.vaara`` as the scalar does."""
+    jd = np.asarray(jd, dtype=float)
+    days = np.trunc(jd - const.mahabharatha_tithi_julian_day)
+    weekday = np.ceil(jd + 1) % 7
+    return days + weekday - 5 - days % 7
+
+
+def mean_longitudes(jd: Any, place: drik.Place) -> np.ndarray:
+    """``(N, 9)`` mean longitudes with the desantara correction for ``place``."""
+    ahargana = kali_ahargana(jd)[..., None]
+    mean = ((ahargana * _MEAN_DAILY_MOTION) + 360) % 360
+    mean[..., _RAHU:] = 180.0 - mean[..., _RAHU:]
+    mean[..., _KETU] = (180.0 + mean[..., _KETU]) % 360
+    desantara = (const.ujjain_lat_long[1] - place.longitude) / 360.0 * _DAILY_MEAN_MOTIONS
+    return (mean + desantara + 360.0) % 360
+
+
+def _mandakendra(ahargana: np.ndarray, longitudes: np.ndarray, planets: Any) -> np.ndarray:
+    motion = (ahargana / const.civil_days_in_mahayuga * _MANDOCCA_REVOLUTIONS[planets] * 360) % 360
+    return (_MANDOCCA_AT_KALI[planets] + motion - longitudes + 360) % 360
+
+
+def _mandaphala(ahargana: np.ndarray, longitudes: np.ndarray, planets: Any) -> np.ndarray:
+    """Equation of centre of ``planets`` (indices below 7) at ``longitudes``."""
+    kendra = _mandakendra(ahargana, longitudes, planets)
+    low, high = _MANDA_PERIPHERY[planets, 0], _MANDA_PERIPHERY[planets, 1]
+    periphery = high - (high - low) * np.abs(_sind(kendra))
+    correction = _SINE_RADIUS / 360.0 * periphery * _sind(kendra)
+    luminary = np.isin(np.arange(7)[planets], [_SUN, _MOON])
+    sign = np.where(kendra > 180.0, -1.0, 1.0)
+    return np.where(luminary, sign * correction, correction)
+
+
+def _sighraphala(anomaly: np.ndarray) -> np.ndarray:
+    low, high = _SIGHRA_PERIPHERY[:, 0], _SIGHRA_PERIPHERY[:, 1]
+    ratio = (high - (high - low) * np.abs(_sind(anomaly))) / 360.0
+    radius = _SINE_RADIUS * 60.0
+    dohphala = ratio * radius * _sind(anomaly)
+    sphutakoti = radius + ratio * radius * _cosd(anomaly)
+    karna = np.sqrt(sphutakoti * sphutakoti + dohphala * dohphala)
+    return np.degrees(np.arcsin(dohphala * radius / karna / radius))
+
+
+def true_longitudes(jd: Any, place: drik.Place) -> np.ndarray:
+    """``(N, 9)`` true longitudes as ``surya_sidhantha.planet_positions`` gives them."""
+    ahargana = kali_ahargana(jd)[..., None]
+    mean = mean_longitudes(jd, place)
+    mandaphala = _mandaphala(ahargana, mean[..., _MANDA], _MANDA)
+    bhujantara = _DAILY_MEAN_MOTIONS[_MANDA] * mandaphala[..., _SUN : _SUN + 1] / 360
+    true = mean.copy()
+    true[..., _MANDA] = (mean[..., _MANDA] + mandaphala + bhujantara + 360) % 360
+
+    planet = mean[..., _SIGHRA]
+    sun = mean[..., _SUN : _SUN + 1]
+    anomaly = np.where(_INFERIOR, planet - sun + 360, sun - planet + 360) % 360
+    sighraphala = _sighraphala(anomaly)
+    halfway = planet + 0.5 * sighraphala + 0.5 * mandaphala[..., _SIGHRA]
+    corrected = planet + _mandaphala(ahargana, halfway, _SIGHRA)
+    true[..., _SIGHRA] = (corrected + sighraphala + 360) % 360
+    return true % 360.0
+
+
+def true_daily_motions(jd: Any, place: drik.Place) -> np.ndarray:
+    """``(N, 2)`` true daily motions of the Sun and Moon in degrees."""
+    ahargana = kali_ahargana(jd)[..., None]
+    luminaries = np.array([_SUN, _MOON])
+    kendra = _mandakendra(ahargana, mean_longitudes(jd, place)[..., luminaries], luminaries)
+    low, high = _MANDA_PERIPHERY[luminaries, 0], _MANDA_PERIPHERY[luminaries, 1]
+    periphery = high - (high - low) * np.abs(_sind(kendra))
+    mean_motion = _DAILY_MEAN_MOTIONS[luminaries] - np.array([0.0, const.moon_apogee_mean_motion])
+    sine_difference = np.abs(225 * 0.991335735 * _cosd(1.024764846 * (180.0 - kendra - 3.75)))
+    correction = periphery * mean_motion * sine_difference / (360 * 225)
+    return mean_motion + np.where(kendra > 180.0, -1.0, 1.0) * correction
+
+
+def tithi(jd: Any, place: drik.Place) -> Tuple[np.ndarray, np.ndarray]:
+    """Tithi (1-30) at each instant and the local Julian day it ends."""
+    jd = np.asarray(jd, dtype=float)
+    true = true_longitudes(jd, place)
+    elongation = (true[..., _MOON] + 360 - true[..., _SUN]) % 360
+    number = np.ceil((elongation / 12) % 30)
+    motions = true_daily_motions(jd, place)
+    left = number * 12 - elongation
+    return number.astype(np.int64), jd + left / (motions[..., 1] - motions[..., 0])
+
+
+def nakshatra(jd: Any, place: drik.Place) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Nakshatra (1-27), pada (1-4) and the local Julian day the nakshatra ends."""
+    jd = np.asarray(jd, dtype=float)
+    moon = true_longitudes(jd, place)[..., _MOON]
+    number = np.trunc(moon / _ONE_STAR) + 1
+    pada = np.trunc((moon % _ONE_STAR) / _ONE_PADA) + 1
+    left = number / 27 * 360.0 - moon
+    end = jd + left / true_daily_motions(jd, place)[..., 1]
+    return number.astype(np.int64), pada.astype(np.int64), end
+
+
+def solar_month_and_date(jd: Any, place: drik.Place) -> Tuple[np.ndarray, np.ndarray]:
+    """Solar month (0-11) and day of month of each local date holding ``jd``.
+
+    Like the scalar, the Sun is taken at 10:00 local time and the month begins
+    on the last day its longitude within the sign lies in (0, 1) degree.
+    """
+    days = np.floor(np.asarray(jd, dtype=float) - 0.5) + 0.5 + 10.0 / 24.0
+    month = (true_longitudes(days, place)[..., _SUN] // 30).astype(np.int64)
+    first, last = days.min(), days.max()
+    margin = 40
+    while True:
+        grid = np.arange(first - margin, last + 0.5)
+        degrees = true_longitudes(grid, place)[:, _SUN] % 30
+        starts = np.where((degrees > 0) & (degrees < 1), np.arange(len(grid)), -1)
+        latest = np.maximum.accumulate(starts)
+        rows = np.rint(days - grid[0]).astype(np.int64)
+        if np.all(latest[rows] >= 0):
+            return month, rows - latest[rows] + 1
+        margin *= 2
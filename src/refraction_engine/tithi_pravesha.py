@@ -0,0 +1,292 @@
+"""Multi-year tithi pravesha tables for Refraction Engine V1.
+
+The Sun-Moon elongation is sampled once on a coarse grid for the whole span of
+requested years and every return to the birth elongation is refined by root
+finding. Each return takes the solar month from the cached sankranti table, and
+the returns inside a year's window around the birthday in the birth month are
+that year's tithi pravesha. ``vratha.tithi_pravesha`` instead scans every day
+of every window and interpolates linearly within the tithi, which lands up to
+an hour away from the exact return.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pytz
+from jhora import const, utils
+from jhora.horoscope.chart import charts
+from jhora.panchanga import drik
+
+from .ephemeris import (
+    EPHEMERIS_BODIES,
+    datetime_to_jd,
+    jd_to_datetime,
+    sidereal_positions,
+)
+from .graha import rasi_index_to_name
+from .profiling import instrumented
+from .solar_ingress import CROSSING_DTYPE, sankrantis, unwrapped_crossings
+from .varshaphal import chart_longitudes, chart_positions
+
+TITHI_PRAVESHA_SCHEMA_VERSION = "tithi_pravesha_spec_v1"
+# The Moon gains at most ~15.5 deg/day on the Sun, so a 5 day grid keeps
+# unwrapping safe.
+GRID_STEP_DAYS = 5.0
+TITHI_SPAN_DEG = 12.0
+PRAVESHA_WINDOW_DAYS = 30
+# Years per cached table behind charts.rasi_chart(pravesha_type=2).
+CHART_BLOCK_YEARS = 10
+# A return's solar month is the last sankranti before it, at most ~32 days back.
+_SANKRANTI_LOOKBACK_DAYS = 33.0
+
+
+def _elongation(jd_utc: float, ayanamsa_mode: Optional[str], ayanamsa_value: Optional[float]) -> float:
+    longitudes, _ = sidereal_positions(
+        [jd_utc], ["SUN", "MOON"], ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value
+    )
+    return float((longitudes[0, 1] - longitudes[0, 0]) % 360.0)
+
+
+def elongation_crossings(
+    start_jd_utc: float,
+    end_jd_utc: float,
+    step_deg: float = TITHI_SPAN_DEG,
+    offset_deg: float = 0.0,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+    tol_days: float = 1e-7,
+) -> np.ndarray:
+    """Times in ``[start, end)`` at which Moon minus Sun reaches ``offset + k * step``.
+
+    With the default step this is the tithi transition timeline; with a step of
+    360 and the birth elongation as offset it lists the tithi returns. Rows are
+    ``CROSSING_DTYPE`` as in ``solar_ingress.solar_crossings``.
+    """
+    if end_jd_utc <= start_jd_utc:
+        raise ValueError("end_jd_utc must be after start_jd_utc")
+    if not 0.0 < step_deg <= 360.0:
+        raise ValueError("step_deg must lie in (0, 360]")
+    grid = np.append(np.arange(start_jd_utc, end_jd_utc, GRID_STEP_DAYS), end_jd_utc)
+    longitudes, _ = sidereal_positions(
+        grid, ["SUN", "MOON"], ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value
+    )
+    unwrapped = np.unwrap((longitudes[:, 1] - longitudes[:, 0]) % 360.0, period=360.0)
+    table = unwrapped_crossings(
+        grid,
+        unwrapped,
+        step_deg,
+        offset_deg,
+        lambda jd: _elongation(jd, ayanamsa_mode, ayanamsa_value),
+        tol_days,
+    )
+    return table[table["jd_utc"] < end_jd_utc] if table.size else np.empty(0, CROSSING_DTYPE)
+
+
+@dataclass
+class TithiPraveshaTable:
+    """One row per tithi pravesha; ``years`` follows PyJHora (1 = birth year).
+
+    A year can hold zero or two praveshas when the birth solar month holds no
+    or two returns of the birth tithi inside its window.
+    """
+
+    birth_elongation: float
+    birth_rasi: int
+    years: np.ndarray
+    jd_utc: np.ndarray
+    jd_local: np.ndarray
+    longitudes: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    @property
+    def tithi(self) -> int:
+        """Birth tithi, 1-30 as ``drik.tithi``."""
+        return int(self.birth_elongation // TITHI_SPAN_DEG) + 1
+
+    def first(self, years: int) -> Optional[int]:
+        """Row of the first pravesha of ``years``, or None when it has none."""
+        rows = np.flatnonzero(self.years == years)
+        return int(rows[0]) if rows.size else None
+
+    def planet_positions(self, row: int) -> List[Any]:
+        """PyJHora chart list of one row, for the scalar chart helpers."""
+        return chart_positions(self.longitudes[row])
+
+
+def tithi_pravesha_table(
+    jd_at_dob: float,
+    place: drik.Place,
+    years: Sequence[int],
+    plus_or_minus_days: int = PRAVESHA_WINDOW_DAYS,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> TithiPraveshaTable:
+    """Tithi praveshas of every entry of ``years`` from one elongation sweep.
+
+    ``jd_at_dob`` and ``place`` are as in PyJHora. A pravesha of ``years`` is
+    an exact return of the birth elongation with the Sun in the birth sign,
+    within ``plus_or_minus_days`` local days of the birthday in year
+    ``birth_year + years - 1``.
+    """
+    years = np.unique(np.asarray(years, dtype=np.int64).reshape(-1))
+    if years.size == 0:
+        raise ValueError("years must not be empty")
+    if years.min() < 1:
+        raise ValueError("years count from 1 (the birth year)")
+    offset = place.timezone / 24.0
+    birth_jd_utc = jd_at_dob - offset
+    birth, _ = sidereal_positions(
+        [birth_jd_utc], ["SUN", "MOON"], ayanamsa_mode=ayanamsa_mode, ayanamsa_value=ayanamsa_value
+    )
+    birth_elongation = float((birth[0, 1] - birth[0, 0]) % 360.0)
+    birth_rasi = int(birth[0, 0] // 30.0)
+
+    birth_year, birth_month, birth_day, _ = utils.jd_to_gregorian(jd_at_dob)
+    birthdays = np.array(
+        [
+            utils.julian_day_number(drik.Date(birth_year + int(n) - 1, birth_month, birth_day), (0, 0, 0))
+            for n in years
+        ]
+    ) - offset
+    window_start = birthdays - plus_or_minus_days
+    window_end = birthdays + plus_or_minus_days + 1.0
+    returns = elongation_crossings(
+        float(window_start.min()),
+        float(window_end.max()),
+        step_deg=360.0,
+        offset_deg=birth_elongation,
+        ayanamsa_mode=ayanamsa_mode,
+        ayanamsa_value=ayanamsa_value,
+    )["jd_utc"]
+    entries = sankrantis(
+        float(window_start.min()) - _SANKRANTI_LOOKBACK_DAYS,
+        float(window_end.max()),
+        ayanamsa_mode,
+        ayanamsa_value,
+    )
+    solar_month = (
+        entries["longitude"][np.searchsorted(entries["jd_utc"], returns, side="right") - 1] // 30.0
+    ).astype(np.int64)
+
+    lo = np.searchsorted(returns, window_start, side="left")
+    hi = np.searchsorted(returns, window_end, side="left")
+    row_years = np.repeat(years, hi - lo)
+    rows = np.concatenate([np.arange(a, b) for a, b in zip(lo, hi)]).astype(np.int64)
+    keep = solar_month[rows] == birth_rasi
+    row_years, jd_utc = row_years[keep], returns[rows[keep]]
+    return TithiPraveshaTable(
+        birth_elongation=birth_elongation,
+        birth_rasi=birth_rasi,
+        years=row_years,
+        jd_utc=jd_utc,
+        jd_local=jd_utc + offset,
+        longitudes=chart_longitudes(jd_utc, place, ayanamsa_mode, ayanamsa_value)
+        if jd_utc.size
+        else np.empty((0, len(EPHEMERIS_BODIES) + 1)),
+    )
+
+
+@lru_cache(maxsize=64)
+def _chart_block(
+    jd_at_dob: float,
+    place_as_tuple: Tuple[Any, ...],
+    first_year: int,
+    ayanamsa_mode: Optional[str],
+    ayanamsa_value: Optional[float],
+) -> TithiPraveshaTable:
+    return tithi_pravesha_table(
+        jd_at_dob,
+        drik.Place(*place_as_tuple),
+        range(first_year, first_year + CHART_BLOCK_YEARS),
+        ayanamsa_mode=ayanamsa_mode,
+        ayanamsa_value=ayanamsa_value,
+    )
+
+
+def chart_pravesha_jd(
+    jd_at_dob: float,
+    place_as_tuple: Tuple[Any, ...],
+    years: int,
+    ayanamsa_mode: Optional[str],
+    ayanamsa_value: Optional[float],
+) -> Optional[float]:
+    """Local Julian day of the first pravesha of ``years``, or None when it has none.
+
+    Registered with ``charts.set_tithi_pravesha_provider``, so the rasi and
+    divisional tithi pravesha charts of ``CHART_BLOCK_YEARS`` consecutive years
+    share one cached table.
+    """
+    first_year = (years - 1) // CHART_BLOCK_YEARS * CHART_BLOCK_YEARS + 1
+    table = _chart_block(jd_at_dob, tuple(place_as_tuple), first_year, ayanamsa_mode, ayanamsa_value)
+    row = table.first(years)
+    return None if row is None else float(table.jd_local[row])
+
+
+def _pravesha_record(table: TithiPraveshaTable, row: int, tz: Any) -> Dict[str, Any]:
+    def _point(value: float) -> Dict[str, Any]:
+        sign = int(value // 30.0)
+        return {"sign": rasi_index_to_name(sign + 1), "longitude": float(value)}
+
+    longitudes = table.longitudes[row]
+    return {
+        "years": int(table.years[row]),
+        "jd_utc": float(table.jd_utc[row]),
+        "datetime": jd_to_datetime(table.jd_utc[row]).astimezone(tz).isoformat(),
+        "lagna": _point(longitudes[0]),
+        "planets": {body: _point(value) for body, value in zip(EPHEMERIS_BODIES, longitudes[1:])},
+    }
+
+
+@instrumented("tithi_pravesha")
+def run_tithi_pravesha(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload wrapper: ``tithi_pravesha`` holds the birth, place and years."""
+    section = payload.get("tithi_pravesha")
+    if not section:
+        raise ValueError("Missing 'tithi_pravesha' section in payload")
+    timezone_name = section.get("timezone_name")
+    location = section.get("location") or {}
+    if not timezone_name or "latitude" not in location or "longitude" not in location:
+        raise ValueError("tithi_pravesha.timezone_name and tithi_pravesha.location are required")
+    tz = pytz.timezone(timezone_name)
+    birth = datetime.fromisoformat(section["birth_datetime"])
+    birth = tz.localize(birth) if birth.tzinfo is None else birth
+    tz_offset = birth.utcoffset().total_seconds() / 3600.0
+    place = drik.Place(
+        location.get("place_name") or "Refraction",
+        float(location["latitude"]),
+        float(location["longitude"]),
+        tz_offset,
+    )
+    years = section.get("years") or list(range(1, int(section.get("count", 1)) + 1))
+
+    config = payload.get("config") or {}
+    zodiac_type = str(config.get("zodiac_type", "SIDEREAL")).upper()
+    table = tithi_pravesha_table(
+        datetime_to_jd(birth) + tz_offset / 24.0,
+        place,
+        years,
+        plus_or_minus_days=int(section.get("plus_or_minus_days", PRAVESHA_WINDOW_DAYS)),
+        ayanamsa_mode=(config.get("ayanamsa_mode") or const._DEFAULT_AYANAMSA_MODE)
+        if zodiac_type == "SIDEREAL"
+        else None,
+        ayanamsa_value=config.get("ayanamsa_value_deg"),
+    )
+    return {
+        "meta": {
+            "schema_version": TITHI_PRAVESHA_SCHEMA_VERSION,
+            "timestamp_utc": datetime.now(dt_timezone.utc).isoformat(),
+            "tithi": table.tithi,
+            "birth_rasi": rasi_index_to_name(table.birth_rasi + 1),
+        },
+        "praveshas": [_pravesha_record(table, row, tz) for row in range(len(table))],
+    }
+
+
+charts.set_tithi_pravesha_provider(chart_pravesha_jd)
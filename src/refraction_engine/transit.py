@@ -17,6 +17,7 @@ from .core_chart import (
     _build_position_record,
 )
 from .graha import GRAHA_ORDER, graha_id_to_string
+from .profiling import instrumented
 
 
 @dataclass
@@ -83,6 +84,7 @@ def _parse_transit_input(payload: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+@instrumented("transit")
 def run_transit(payload: Dict[str, Any]) -> Dict[str, Any]:
     parsed = _parse_transit_input(payload)
     config = parsed["config"]
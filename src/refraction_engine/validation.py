@@ -1,12 +1,179 @@
 """
 Input Validation
 Validates payloads against JSON schemas.
+
+``SchemaRegistry`` loads each ``docs/specs/<name>.schema.json`` once, runs
+``check_schema`` on it once, pulls every schema it ``$ref``s into a
+``referencing`` registry up front and caches the compiled validator, so
+validating a payload only walks the payload. When ``fastjsonschema`` is
+installed, a code-generated validator checks valid payloads first and the
+``jsonschema`` validator runs only to describe failures.
 """
 
+import json
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import urldefrag
 
 import jsonschema
+from referencing import Registry, Resource
+from referencing.exceptions import Unresolvable
+from referencing.jsonschema import DRAFT7
+
+SCHEMA_DIR = Path(__file__).resolve().parents[2] / "docs" / "specs"
+SCHEMA_SUFFIX = ".schema.json"
+
+
+def _refs(schema: Any) -> Iterator[str]:
+    """Every ``$ref`` string in ``schema``."""
+    if isinstance(schema, dict):
+        ref = schema.get("$ref")
+        if isinstance(ref, str):
+            yield ref
+        for value in schema.values():
+            yield from _refs(value)
+    elif isinstance(schema, list):
+        for value in schema:
+            yield from _refs(value)
+
+
+class CompiledSchema:
+    """A checked schema with its ``jsonschema`` validator and optional fast path."""
+
+    def __init__(
+        self,
+        name: str,
+        validator: jsonschema.protocols.Validator,
+        fast: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.name = name
+        self.validator = validator
+        self.fast = fast
+
+    def errors(self, payload: Any) -> List[str]:
+        """Errors of ``payload`` in the form ``jsonschema.validate`` raises them."""
+        if self.fast is not None:
+            try:
+                self.fast(payload)
+                return []
+            except Exception:
+                pass
+        error = jsonschema.exceptions.best_match(self.validator.iter_errors(payload))
+        return [] if error is None else [str(error)]
+
+
+class SchemaRegistry:
+    """Schemas of one directory, loaded, checked and compiled on first use.
+
+    ``fast=None`` uses ``fastjsonschema`` when it is installed, ``False``
+    never does.
+    """
+
+    def __init__(self, directory: Path = SCHEMA_DIR, fast: Optional[bool] = None):
+        self.directory = Path(directory)
+        self.fast = fast
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._registry: Registry = Registry()
+        self._compiled: Dict[str, CompiledSchema] = {}
+
+    def path(self, name: str) -> Path:
+        return self.directory / f"{name}{SCHEMA_SUFFIX}"
+
+    def _load(self, uri: str) -> Dict[str, Any]:
+        """Schema at ``uri``: a schema name, its file name or a loaded ``$id``."""
+        if uri in self._documents:
+            return self._documents[uri]
+        name = uri[: -len(SCHEMA_SUFFIX)] if uri.endswith(SCHEMA_SUFFIX) else uri
+        path = self.path(name)
+        if not path.exists():
+            raise ValueError(f"Schema not found: {uri}")
+        with path.open("r", encoding="utf-8") as f:
+            schema = json.load(f)
+        jsonschema.validators.validator_for(schema).check_schema(schema)
+
+        resource = Resource.from_contents(schema, default_specification=DRAFT7)
+        uris = {name, f"{name}{SCHEMA_SUFFIX}", schema.get("$id") or name}
+        self._registry = self._registry.with_resources((key, resource) for key in uris)
+        for key in uris:
+            self._documents[key] = schema
+        return schema
+
+    def _resolve_refs(self, uri: str, schema: Dict[str, Any]) -> None:
+        """Load every schema reachable through ``$ref`` and check each ref resolves."""
+        pending = [(uri, schema)]
+        seen = {uri}
+        while pending:
+            base, document = pending.pop()
+            base = document.get("$id") or base
+            for ref in _refs(document):
+                target = urldefrag(ref).url
+                if target and target not in seen:
+                    seen.add(target)
+                    pending.append((target, self._load(target)))
+            self._registry = self._registry.crawl()
+            resolver = self._registry.resolver(base_uri=base)
+            for ref in _refs(document):
+                try:
+                    resolver.lookup(ref)
+                except Unresolvable as exc:
+                    raise ValueError(f"Unresolvable $ref {ref!r} in schema {base}") from exc
+
+    def _fast_validator(self, schema: Dict[str, Any]) -> Optional[Callable[[Any], Any]]:
+        if self.fast is False:
+            return None
+        try:
+            import fastjsonschema
+        except ImportError:
+            return None
+        try:
+            # Match jsonschema.validate: no format checks and no defaults
+            # written into the payload.
+            return fastjsonschema.compile(
+                schema,
+                handlers={"": self._load},
+                use_default=False,
+                use_formats=False,
+            )
+        except Exception:
+            return None
+
+    def compiled(self, name: str) -> CompiledSchema:
+        """Cached ``CompiledSchema`` of ``name``; raises ``ValueError`` if missing."""
+        compiled = self._compiled.get(name)
+        if compiled is None:
+            schema = self._load(name)
+            self._resolve_refs(name, schema)
+            cls = jsonschema.validators.validator_for(schema)
+            validator = cls(schema, registry=self._registry)
+            compiled = CompiledSchema(name, validator, self._fast_validator(schema))
+            self._compiled[name] = compiled
+        return compiled
+
+    def validate(self, payload: Any, schema_name: str) -> List[str]:
+        try:
+            compiled = self.compiled(schema_name)
+        except ValueError as exc:
+            return [str(exc)]
+        return compiled.errors(payload)
+
+    def validate_batch(self, payloads: Iterable[Any], schema_name: str) -> List[List[str]]:
+        """Errors of each payload, in order, against one compiled schema."""
+        try:
+            compiled = self.compiled(schema_name)
+        except ValueError as exc:
+            return [[str(exc)] for _ in payloads]
+        return [compiled.errors(payload) for payload in payloads]
+
+
+_DEFAULT_REGISTRY: Optional[SchemaRegistry] = None
+
+
+def default_registry() -> SchemaRegistry:
+    """Process-wide registry over ``docs/specs``."""
+    global _DEFAULT_REGISTRY
+    if _DEFAULT_REGISTRY is None:
+        _DEFAULT_REGISTRY = SchemaRegistry()
+    return _DEFAULT_REGISTRY
 
 
 def validate_input(payload: Dict[str, Any], schema_name: str) -> List[str]:
@@ -16,25 +183,14 @@ def validate_input(payload: Dict[str, Any], schema_name: str) -> List[str]:
     Returns:
         List of errors (empty if valid)
     """
-    import json
-
-    schema_path = (
-        Path(__file__).resolve().parents[2]
-        / "docs"
-        / "specs"
-        / f"{schema_name}.schema.json"
-    )
-
-    if not schema_path.exists():
-        return [f"Schema not found: {schema_name}"]
+    return default_registry().validate(payload, schema_name)
 
-    with schema_path.open("r", encoding="utf-8") as f:
-        schema = json.load(f)
 
-    errors: List[str] = []
-    try:
-        jsonschema.validate(instance=payload, schema=schema)
-    except jsonschema.ValidationError as e:
-        errors.append(str(e))
+def validate_batch(payloads: Iterable[Dict[str, Any]], schema_name: str) -> List[List[str]]:
+    """
+    Validate many payloads against one JSON schema.
 
-    return errors
+    Returns:
+        One list of errors per payload (empty if valid)
+    """
+    return default_registry().validate_batch(payloads, schema_name)
@@ -0,0 +1,460 @@
+"""Batch Varshaphal (Tajaka annual chart) tables for Refraction Engine V1.
+
+All solar returns of a birth come from one ``solar_ingress`` sweep and the
+annual chart positions from one batched ephemeris call, so a table of many
+years costs about as much as a few PyJHora annual charts. Muntha, the 36
+Tajaka sahams, the Tajaka aspects, ithasala and the lord of the year are
+evaluated column-wise over all years.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone as dt_timezone
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pytz
+from jhora import const
+from jhora.horoscope.chart import house, strength
+from jhora.horoscope.transit import tajaka
+from jhora.panchanga import drik
+
+from .ephemeris import (
+    EPHEMERIS_BODIES,
+    datetime_to_jd,
+    jd_to_datetime,
+    sidereal_ascendants,
+    sidereal_positions,
+)
+from .graha import rasi_index_to_name
+from .profiling import instrumented
+from .solar_ingress import RETURN_WINDOW_DAYS, _sun_longitude, solar_crossings, solar_returns
+
+VARSHAPHAL_SCHEMA_VERSION = "varshaphal_spec_v1"
+
+# Column order of ``AnnualChartTable.longitudes``: the rows of a PyJHora chart.
+CHART_COLUMNS = ("LAGNA",) + tuple(EPHEMERIS_BODIES)
+SAHAM_NAMES = tuple(const._saham_list)
+_JALAPATNA_LONGITUDE = 105.0  # Cancer 15
+_SCORPIO, _AQUARIUS = 7, 10
+_HOUSE_OWNERS = np.asarray(const.house_owners)
+_MARS, _JUPITER = EPHEMERIS_BODIES.index("MARS"), EPHEMERIS_BODIES.index("JUPITER")
+_SEVEN_PLANETS = 7  # Sun..Saturn
+# Houses counted from a planet's sign, in the order tajaka.benefic_aspects_of_the_planet
+# (trinal, sextile) and tajaka.malefic_aspects_of_the_planet (square, conjunction,
+# opposition) list them.
+BENEFIC_ASPECT_OFFSETS = np.array([4, 8, 2, 10])
+MALEFIC_ASPECT_OFFSETS = np.array([3, 9, 0, 6])
+ITHASALA_TYPES = {1: "VARTHAMANA", 2: "POORNA", 3: "BHAVISHYA"}
+_DEEPTAAMSA = np.asarray(const.deeptaamsa_of_planets, dtype=float)
+_TRI_RASI_LORDS = np.asarray([const.tri_rasi_daytime_lords, const.tri_rasi_nighttime_lords])
+
+
+@dataclass
+class AnnualChartTable:
+    """One row per annual chart; ``years`` follows PyJHora (1 = birth year).
+
+    ``benefic_aspects`` and ``malefic_aspects`` hold, for Sun..Saturn, the
+    signs each planet aspects; ``ithasala[row, p1, p2]`` is the ithasala type
+    of a pair (0 for none, else a key of ``ITHASALA_TYPES``); ``lords`` is
+    ``tajaka.lord_of_the_year`` of ``years``.
+    """
+
+    years: np.ndarray
+    return_jd_utc: np.ndarray
+    return_jd_local: np.ndarray
+    longitudes: np.ndarray
+    night: np.ndarray
+    muntha: np.ndarray
+    sahams: np.ndarray
+    benefic_aspects: np.ndarray
+    malefic_aspects: np.ndarray
+    ithasala: np.ndarray
+    lords: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.years)
+
+    @property
+    def signs(self) -> np.ndarray:
+        return (self.longitudes // 30.0).astype(np.int64)
+
+    def planet_positions(self, row: int) -> List[Any]:
+        """PyJHora chart list of one row, for the scalar tajaka helpers."""
+        return chart_positions(self.longitudes[row])
+
+
+def chart_positions(longitudes: np.ndarray) -> List[Any]:
+    """``[['L', (sign, deg)], [0, (sign, deg)], ...]`` from one row of longitudes."""
+    labels = [const._ascendant_symbol] + list(range(len(longitudes) - 1))
+    return [
+        [label, (int(value // 30.0), float(value % 30.0))]
+        for label, value in zip(labels, longitudes.tolist())
+    ]
+
+
+def chart_longitudes(
+    jd_utc: Sequence[float],
+    place: drik.Place,
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> np.ndarray:
+    """``CHART_COLUMNS`` longitudes at each instant, with PyJHora's mean nodes."""
+    jd_utc = np.asarray(jd_utc, dtype=float).reshape(-1)
+    planets, _ = sidereal_positions(
+        jd_utc,
+        EPHEMERIS_BODIES,
+        ayanamsa_mode=ayanamsa_mode,
+        ayanamsa_value=ayanamsa_value,
+        node_mode="MEAN",
+    )
+    ascendants = sidereal_ascendants(
+        jd_utc, place.latitude, place.longitude, ayanamsa_mode, ayanamsa_value
+    )
+    return np.column_stack([ascendants, planets])
+
+
+def _c_between_b_to_a(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    """``saham._is_C_between_B_to_A`` over arrays.
+
+    Walking signs forward from B, C must be met no later than A. Values of
+    360 or more (house cusps added to the lagna) never match a sign, exactly
+    as in the scalar loop.
+    """
+    a_rasi, b_rasi, c_rasi = (np.floor(np.asarray(x) / 30.0).astype(np.int64) for x in (a, b, c))
+    steps_to_c = (c_rasi - b_rasi) % 12
+    steps_to_a = (a_rasi - b_rasi) % 12
+    c_found = (c_rasi < 12) & (steps_to_c != 0)
+    a_found = (a_rasi < 12) & (steps_to_a != 0)
+    return c_found & (~a_found | (steps_to_c <= steps_to_a))
+
+
+def _a_minus_b_plus_c(a: np.ndarray, b: np.ndarray, c: np.ndarray) -> np.ndarray:
+    value = a - b + c
+    return np.where(_c_between_b_to_a(a, b, c), value, value + 30.0)
+
+
+def _saham(
+    a: np.ndarray, b: np.ndarray, c: np.ndarray, night: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """A - B + C, with A and B swapped for night charts when ``night`` is given."""
+    value = _a_minus_b_plus_c(a, b, c)
+    if night is not None:
+        value = np.where(night, _a_minus_b_plus_c(b, a, c), value)
+    return np.mod(value, 360.0)
+
+
+def _sign_lords(longitudes: np.ndarray, signs: np.ndarray) -> np.ndarray:
+    """Owner of ``signs[i]`` in chart ``i``; Scorpio/Aquarius go through PyJHora."""
+    lords = _HOUSE_OWNERS[signs]
+    for row in np.flatnonzero((signs == _SCORPIO) | (signs == _AQUARIUS)):
+        lords[row] = house.house_owner_from_planet_positions(
+            chart_positions(longitudes[row]), int(signs[row])
+        )
+    return lords
+
+
+def compute_sahams(longitudes: np.ndarray, night: np.ndarray) -> np.ndarray:
+    """All ``SAHAM_NAMES`` for ``(N, 10)`` chart longitudes, as ``(N, 36)``.
+
+    Matches the ``saham.*_saham`` functions chart by chart, except that every
+    value is reduced to [0, 360) (``saham.jadya_saham`` skips that for day charts).
+    """
+    longitudes = np.atleast_2d(np.asarray(longitudes, dtype=float))
+    night = np.broadcast_to(np.asarray(night, dtype=bool), longitudes.shape[:1])
+    rows = np.arange(len(longitudes))
+    lagna = longitudes[:, 0]
+    sun, moon, mars, mercury, jupiter, venus, saturn = (longitudes[:, col] for col in range(1, 8))
+    signs = (longitudes // 30.0).astype(np.int64)
+
+    def _lord_longitude(target_signs: np.ndarray) -> np.ndarray:
+        return longitudes[rows, _sign_lords(longitudes, target_signs % 12) + 1]
+
+    lagna_lord = _sign_lords(longitudes, signs[:, 0])
+    # Mars owning the lagna is replaced by Jupiter with the day/night formulas swapped.
+    mars_lagna = lagna_lord == _MARS
+    samartha_lord = np.where(mars_lagna, _JUPITER, lagna_lord)
+    samartha_night = night ^ mars_lagna
+
+    punya = _saham(moon, sun, lagna, night)
+    sastra = _saham(jupiter, saturn, mercury, night)
+    karyasiddhi = np.where(
+        night,
+        _saham(saturn, moon, _lord_longitude(signs[:, 2])),
+        _saham(saturn, sun, _lord_longitude(signs[:, 1])),
+    )
+    values: Dict[str, np.ndarray] = {
+        "punya": punya,
+        "vidya": _saham(sun, moon, lagna, night),
+        "yasas": _saham(jupiter, punya, lagna, night),
+        "mitra": _saham(jupiter, punya, venus, night),
+        "mahatmaya": _saham(punya, mars, lagna, night),
+        "asha": _saham(saturn, mars, lagna, night),
+        "samartha": _saham(mars, longitudes[rows, samartha_lord + 1], lagna, samartha_night),
+        "bhratri": _saham(jupiter, saturn, lagna),
+        "gaurava": _saham(jupiter, moon, sun, night),
+        "pithri": _saham(saturn, sun, lagna, night),
+        "rajya": _saham(saturn, sun, lagna, night),
+        "maathri": _saham(moon, venus, lagna, night),
+        "puthra": _saham(jupiter, moon, lagna, night),
+        "jeeva": _saham(saturn, jupiter, lagna, night),
+        "karma": _saham(mars, mercury, lagna, night),
+        "roga": np.mod(2.0 * lagna - moon, 360.0),
+        "kali": _saham(jupiter, mars, lagna, night),
+        "sastra": sastra,
+        "bandhu": _saham(mercury, moon, lagna, night),
+        "mrithyu": _saham(lagna + 210.0, moon, lagna),
+        "paradesa": _saham(lagna + 240.0, _lord_longitude(signs[:, 0] + 8), lagna),
+        "artha": _saham(lagna + 30.0, _lord_longitude(signs[:, 0] + 1), lagna),
+        "paradara": _saham(venus, sun, lagna, night),
+        "vanika": _saham(moon, mercury, lagna, night),
+        "karyasiddhi": karyasiddhi,
+        "vivaha": _saham(venus, saturn, lagna, night),
+        "santapa": _saham(saturn, moon, lagna + 150.0, night),
+        "sraddha": _saham(venus, mars, lagna, night),
+        "preethi": _saham(sastra, punya, lagna, night),
+        "jadya": _saham(mars, saturn, mercury, night),
+        "vyaapaara": _saham(mars, saturn, lagna),
+        "sathru": _saham(mars, saturn, lagna, night),
+        "jalapatna": _saham(np.full_like(lagna, _JALAPATNA_LONGITUDE), saturn, lagna, night),
+        "bandhana": _saham(punya, saturn, lagna, night),
+        "apamrithyu": _saham(lagna + 210.0, mars, lagna, night),
+        "laabha": _saham(lagna + 300.0, _lord_longitude(signs[:, 0] + 10), lagna, night),
+    }
+    return np.stack([values[name] for name in SAHAM_NAMES], axis=1)
+
+
+def _night_returns(return_jd_local: np.ndarray, place: drik.Place) -> np.ndarray:
+    """Whether each return falls outside that local day's sunrise-sunset span."""
+    night = np.empty(len(return_jd_local), dtype=bool)
+    for row, jd_local in enumerate(return_jd_local.tolist()):
+        hours = drik.jd_to_gregorian(jd_local)[3]
+        night[row] = hours < drik.sunrise(jd_local, place)[0] or hours > drik.sunset(jd_local, place)[0]
+    return night
+
+
+def tajaka_aspects(longitudes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Signs aspected by Sun..Saturn, as ``(benefic, malefic)`` of shape ``(N, 7, 4)``.
+
+    Tajaka aspects go sign to sign, so each is the planet's sign plus
+    ``BENEFIC_ASPECT_OFFSETS`` or ``MALEFIC_ASPECT_OFFSETS``.
+    """
+    signs = (np.atleast_2d(longitudes)[:, 1 : _SEVEN_PLANETS + 1] // 30.0).astype(np.int64)
+    return (
+        (signs[:, :, None] + BENEFIC_ASPECT_OFFSETS) % 12,
+        (signs[:, :, None] + MALEFIC_ASPECT_OFFSETS) % 12,
+    )
+
+
+def ithasala_types(longitudes: np.ndarray) -> np.ndarray:
+    """``tajaka.both_planets_within_their_deeptamsa`` for every pair of Sun..Saturn.
+
+    ``(N, 7, 7)`` with 0 where the pair forms no ithasala; symmetric in the pair.
+    """
+    degrees = np.atleast_2d(longitudes)[:, 1 : _SEVEN_PLANETS + 1] % 30.0
+    d1, d2 = degrees[:, :, None], degrees[:, None, :]
+    orb1, orb2 = _DEEPTAAMSA[:, None], _DEEPTAAMSA[None, :]
+    chk1 = (d1 >= d2 - orb2) & (d1 <= orb2 + d2)
+    chk2 = (d2 >= d1 - orb1) & (d2 <= orb1 + d1)
+    near1 = ~chk1 & ((np.abs(d1 - (d2 - orb2)) <= 1.0) | (np.abs(d1 - (orb2 + d2)) <= 1.0))
+    near2 = ~chk2 & ((np.abs(d2 - (d1 - orb1)) <= 1.0) | (np.abs(d2 - (orb1 + d1)) <= 1.0))
+    found = (chk1 & chk2) | (chk1 & near2) | (chk2 & near1)
+    kinds = np.select(
+        [np.abs(d1 - d2) <= 1.0, chk1 & chk2, found], [2, 1, 3], default=0
+    )
+    return np.where(found, kinds, 0).astype(np.int8)
+
+
+def year_lords(
+    longitudes: np.ndarray,
+    night: np.ndarray,
+    natal_lagna_sign: int,
+    years: np.ndarray,
+    jd_local: np.ndarray,
+    place: drik.Place,
+) -> np.ndarray:
+    """``tajaka.lord_of_the_year`` for charts cast ``years`` sidereal years after birth.
+
+    The five candidates, their duplicates and the aspect shortlists are
+    evaluated over all rows; only rows the aspects leave undecided compute
+    PyJHora's pancha vargeeya bala. That bala has no Rahu or Ketu entry
+    (PyJHora raises there), so it only compares the candidates among Sun..Saturn.
+    """
+    longitudes = np.atleast_2d(np.asarray(longitudes, dtype=float))
+    night = np.asarray(night, dtype=bool)
+    rows = np.arange(len(longitudes))
+    signs = (longitudes // 30.0).astype(np.int64)
+    lagna = signs[:, 0]
+    candidates = np.column_stack(
+        [
+            _sign_lords(longitudes, np.where(night, signs[:, 2], signs[:, 1])),
+            _sign_lords(longitudes, np.full_like(lagna, natal_lagna_sign)),
+            _sign_lords(longitudes, tajaka.muntha_house(lagna, years)),
+            _sign_lords(longitudes, lagna),
+            _TRI_RASI_LORDS[night.astype(np.int64), lagna],
+        ]
+    )
+    repeated = np.zeros(candidates.shape, dtype=bool)
+    for column in range(1, candidates.shape[1]):
+        repeated[:, column] = (candidates[:, :column] == candidates[:, column : column + 1]).any(axis=1)
+    unique = ~repeated
+
+    houses_from_candidate = (lagna[:, None] - signs[rows[:, None], candidates + 1]) % 12
+    benefic = unique & np.isin(houses_from_candidate, BENEFIC_ASPECT_OFFSETS)
+    malefic = unique & np.isin(houses_from_candidate, MALEFIC_ASPECT_OFFSETS)
+    benefic_count, malefic_count = benefic.sum(axis=1), malefic.sum(axis=1)
+    by_malefic = (benefic_count == 0) & (malefic_count == 1)
+    lords = np.where(
+        by_malefic,
+        candidates[rows, np.argmax(malefic, axis=1)],
+        candidates[rows, np.argmax(benefic, axis=1)],
+    )
+    for row in np.flatnonzero((benefic_count != 1) & ~by_malefic):
+        pool = [c for c in candidates[row][unique[row]].tolist() if c < _SEVEN_PLANETS]
+        bala = strength.pancha_vargeeya_bala(float(jd_local[row]), place)
+        scores = [bala[candidate] for candidate in pool]
+        best = max(scores)
+        # PyJHora returns the strongest candidate's position in the list here.
+        lords[row] = scores.index(best) if best > const.pancha_vargeeya_bala_strength_threshold else pool[0]
+    return lords
+
+
+def _return_before_birth(
+    birth_jd_utc: float, ayanamsa_mode: Optional[str], ayanamsa_value: Optional[float]
+) -> float:
+    """``drik.next_solar_date(years=0)``: the solar return one year before birth."""
+    guess = birth_jd_utc - const.sidereal_year
+    crossings = solar_crossings(
+        guess - RETURN_WINDOW_DAYS,
+        guess + RETURN_WINDOW_DAYS,
+        step_deg=360.0,
+        offset_deg=_sun_longitude(birth_jd_utc, ayanamsa_mode, ayanamsa_value),
+        ayanamsa_mode=ayanamsa_mode,
+        ayanamsa_value=ayanamsa_value,
+    )
+    return float(crossings["jd_utc"][0])
+
+
+def annual_chart_table(
+    jd_at_dob: float,
+    place: drik.Place,
+    years: Sequence[int],
+    ayanamsa_mode: Optional[str] = const._DEFAULT_AYANAMSA_MODE,
+    ayanamsa_value: Optional[float] = None,
+) -> AnnualChartTable:
+    """Annual charts of ``tajaka.varsha_pravesh`` for every entry of ``years``.
+
+    ``jd_at_dob`` and ``place`` are as in PyJHora (local Julian day, fixed
+    timezone offset). ``years=0`` is the return before birth, as in
+    ``drik.next_solar_date``. Positions use PyJHora's mean nodes.
+
+    As in ``tajaka.lord_of_the_year``, the lord of ``years`` is read off the
+    chart exactly ``years`` sidereal years after birth; those charts go
+    through the same ephemeris call as the returns.
+    """
+    years = np.asarray(years, dtype=np.int64).reshape(-1)
+    if years.size == 0:
+        raise ValueError("years must not be empty")
+    if years.min() < 0:
+        raise ValueError("years count from 1 (the birth year); 0 is the return before birth")
+    birth_jd_utc = jd_at_dob - place.timezone / 24.0
+    returns = solar_returns(
+        birth_jd_utc, int(years.max()) - 1, "YEARS", ayanamsa_mode, ayanamsa_value
+    )["jd_utc"]
+    before = _return_before_birth(birth_jd_utc, ayanamsa_mode, ayanamsa_value) if years.min() == 0 else np.nan
+    return_jd_utc = np.concatenate([[before, birth_jd_utc], returns])[years]
+    return_jd_local = return_jd_utc + place.timezone / 24.0
+    lord_jd_utc = birth_jd_utc + years * const.sidereal_year
+
+    count = len(years)
+    all_longitudes = chart_longitudes(
+        np.concatenate([return_jd_utc, lord_jd_utc, [birth_jd_utc]]), place, ayanamsa_mode, ayanamsa_value
+    )
+    longitudes, lord_longitudes = all_longitudes[:count], all_longitudes[count:-1]
+    natal_lagna_sign = int(all_longitudes[-1, 0] // 30.0)
+    night = _night_returns(return_jd_local, place)
+    lord_jd_local = lord_jd_utc + place.timezone / 24.0
+    lagna_sign = (longitudes[:, 0] // 30.0).astype(np.int64)
+    benefic, malefic = tajaka_aspects(longitudes)
+    return AnnualChartTable(
+        years=years,
+        return_jd_utc=return_jd_utc,
+        return_jd_local=return_jd_local,
+        longitudes=longitudes,
+        night=night,
+        muntha=tajaka.muntha_house(lagna_sign, years),
+        sahams=compute_sahams(longitudes, night),
+        benefic_aspects=benefic,
+        malefic_aspects=malefic,
+        ithasala=ithasala_types(longitudes),
+        lords=year_lords(
+            lord_longitudes,
+            _night_returns(lord_jd_local, place),
+            natal_lagna_sign,
+            years,
+            lord_jd_local,
+            place,
+        ),
+    )
+
+
+def _year_record(table: AnnualChartTable, row: int, tz: Any) -> Dict[str, Any]:
+    def _point(value: float) -> Dict[str, Any]:
+        sign = int(value // 30.0)
+        return {"sign": rasi_index_to_name(sign + 1), "longitude": float(value)}
+
+    longitudes = table.longitudes[row]
+    return {
+        "years": int(table.years[row]),
+        "return_jd_utc": float(table.return_jd_utc[row]),
+        "return_datetime": jd_to_datetime(table.return_jd_utc[row]).astimezone(tz).isoformat(),
+        "night": bool(table.night[row]),
+        "lagna": _point(longitudes[0]),
+        "planets": {body: _point(value) for body, value in zip(EPHEMERIS_BODIES, longitudes[1:])},
+        "muntha_sign": rasi_index_to_name(int(table.muntha[row]) + 1),
+        "year_lord": EPHEMERIS_BODIES[int(table.lords[row])],
+        "sahams": {name: float(value) for name, value in zip(SAHAM_NAMES, table.sahams[row])},
+    }
+
+
+@instrumented("varshaphal")
+def run_varshaphal(payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Payload wrapper: ``varshaphal`` holds the birth, place and years."""
+    section = payload.get("varshaphal")
+    if not section:
+        raise ValueError("Missing 'varshaphal' section in payload")
+    timezone_name = section.get("timezone_name")
+    location = section.get("location") or {}
+    if not timezone_name or "latitude" not in location or "longitude" not in location:
+        raise ValueError("varshaphal.timezone_name and varshaphal.location are required")
+    tz = pytz.timezone(timezone_name)
+    birth = datetime.fromisoformat(section["birth_datetime"])
+    birth = tz.localize(birth) if birth.tzinfo is None else birth
+    tz_offset = birth.utcoffset().total_seconds() / 3600.0
+    place = drik.Place(
+        location.get("place_name") or "Refraction",
+        float(location["latitude"]),
+        float(location["longitude"]),
+        tz_offset,
+    )
+    years = section.get("years") or list(range(1, int(section.get("count", 1)) + 1))
+
+    config = payload.get("config") or {}
+    zodiac_type = str(config.get("zodiac_type", "SIDEREAL")).upper()
+    table = annual_chart_table(
+        datetime_to_jd(birth) + tz_offset / 24.0,
+        place,
+        years,
+        ayanamsa_mode=(config.get("ayanamsa_mode") or const._DEFAULT_AYANAMSA_MODE)
+        if zodiac_type == "SIDEREAL"
+        else None,
+        ayanamsa_value=config.get("ayanamsa_value_deg"),
+    )
+    return {
+        "meta": {
+            "schema_version": VARSHAPHAL_SCHEMA_VERSION,
+            "timestamp_utc": datetime.now(dt_timezone.utc).isoformat(),
+        },
+        "years": [_year_record(table, row, tz) for row in range(len(table))],
+    }
@@ -15,11 +15,13 @@ from .constants import (
     MALEFIC_PENALTY,
 )
 from .planet_utils import create_planet_lookup, get_planet_from_lookup
+from .profiling import instrumented
 from .validators import validate_planet_positions_safe
 
 logger = logging.getLogger(__name__)
 
 
+@instrumented("yogas")
 def run_yogas(payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     Produce the yogas payload aligned to yogas_spec_v1.
@@ -0,0 +1,99 @@
+import copy
+
+import numpy as np
+import pytest
+from jhora.horoscope.chart import ashtakavarga as pyjhora_ashtakavarga
+
+from refraction_engine.ashtakavarga import (
+    compute_ashtakavarga,
+    ekadhipatya_sodhana,
+    signs_from_chart,
+    transit_bindu_timeline,
+    trikona_sodhana,
+)
+
+BOOK_CHART_7 = ["6/1/7", "", "", "", "", "", "8/4", "L", "3/2", "0", "5", ""]
+
+
+def _random_signs(count: int, seed: int = 11) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    signs = rng.integers(0, 12, size=(count, 10))
+    signs[:, 8] = (signs[:, 7] + 6) % 12
+    return signs
+
+
+def _to_chart(signs) -> list:
+    chart = ["" for _ in range(12)]
+    for planet, sign in enumerate(signs[:9]):
+        chart[sign] += f"{planet}/"
+    chart[signs[9]] += "L/"
+    return [entry[:-1] for entry in chart]
+
+
+def test_signs_from_chart():
+    signs = signs_from_chart(BOOK_CHART_7)
+    assert signs.tolist() == [9, 0, 8, 8, 6, 10, 0, 0, 6, 7]
+
+
+def test_book_chart_7_sav():
+    tables = compute_ashtakavarga(signs_from_chart(BOOK_CHART_7))
+    assert tables.samudaya.tolist() == [27, 24, 25, 26, 34, 35, 31, 28, 26, 26, 34, 21]
+
+
+def test_batch_matches_pyjhora_tables():
+    signs = _random_signs(40)
+    tables = compute_ashtakavarga(signs)
+    assert tables.binna.shape == (40, 8, 12)
+    for row, chart_signs in enumerate(signs):
+        chart = _to_chart(chart_signs)
+        bav, sav, pav = pyjhora_ashtakavarga.get_ashtaka_varga(chart)
+        assert tables.binna[row].tolist() == bav
+        assert tables.samudaya[row].tolist() == sav
+        assert tables.prastara[row].tolist() == [p[:8] for p in pav]
+
+
+def test_sodhana_and_pindas_match_pyjhora():
+    signs = _random_signs(40, seed=5)
+    tables = compute_ashtakavarga(signs)
+    trikona = trikona_sodhana(tables.binna)
+    ekadhipatya = ekadhipatya_sodhana(trikona, signs)
+    raasi, graha, sodhya = tables.sodhya_pindas()
+    for row, chart_signs in enumerate(signs):
+        chart = _to_chart(chart_signs)
+        bav = tables.binna[row].tolist()
+        expected_trikona = pyjhora_ashtakavarga._trikona_sodhana(copy.deepcopy(bav))
+        assert trikona[row].tolist() == expected_trikona
+        expected_ekadhipatya = pyjhora_ashtakavarga._ekadhipatya_sodhana(
+            copy.deepcopy(expected_trikona), chart
+        )
+        assert ekadhipatya[row].tolist() == expected_ekadhipatya
+        expected = pyjhora_ashtakavarga.sodhaya_pindas(copy.deepcopy(bav), chart)
+        assert [raasi[row].tolist(), graha[row].tolist(), sodhya[row].tolist()] == [
+            list(map(int, values)) for values in expected
+        ]
+
+
+def test_compute_ashtakavarga_rejects_bad_vectors():
+    with pytest.raises(ValueError):
+        compute_ashtakavarga(np.zeros(8, dtype=int))
+    with pytest.raises(ValueError):
+        compute_ashtakavarga(np.full(10, 12))
+
+
+def test_transit_bindu_timeline():
+    signs = _random_signs(5)
+    tables = compute_ashtakavarga(signs)
+    start = 2460310.5
+    timeline = transit_bindu_timeline(tables, start, start + 60, step_days=1.0)
+    assert timeline.jd_utc.shape == (61,)
+    assert timeline.bav.shape == (5, 61, 7)
+    assert timeline.sav.shape == (5, 61, 7)
+    for col in range(7):
+        sign = timeline.transit_signs[10, col]
+        assert timeline.bav[2, 10, col] == tables.binna[2, col, sign]
+        assert timeline.sav[2, 10, col] == tables.samudaya[2, sign]
+
+    segments = timeline.segments(2)
+    suns = [segment for segment in segments if segment["planet"] == "SUN"]
+    assert len(suns) in (2, 3)
+    assert suns[0]["start_jd_utc"] == start
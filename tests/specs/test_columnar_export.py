@@ -0,0 +1,82 @@
+import json
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from refraction_engine import columnar_export
+from refraction_engine.pipeline import run_refraction_core
+
+from ._utils import load_json
+
+FIXTURES = [
+    "references/in/mehran_birth.json",
+    "references/in/athena_birth.json",
+    "references/in/minimal_birth.json",
+]
+
+
+@pytest.fixture(scope="module")
+def bundles():
+    return [run_refraction_core(load_json(fixture)) for fixture in FIXTURES]
+
+
+def test_record_batches_flatten_every_frame(bundles):
+    batches = columnar_export.record_batches(bundles, chart_ids=["a", "b", "c"])
+    assert set(batches) == set(columnar_export.TABLES)
+    for table, batch in batches.items():
+        assert batch.schema.equals(columnar_export.table_schema(table), check_metadata=True)
+        assert batch.schema.metadata[b"schema_version"] == columnar_export.COLUMNAR_SCHEMA_VERSION.encode()
+
+    bundle = bundles[0]
+    frame = bundle["frames"]["core_chart"]["frames"][0]
+    positions = batches["positions"].to_pydict()
+    rows = [row for row, chart_id in enumerate(positions["chart_id"]) if chart_id == "a"]
+    assert [positions["body"][row] for row in rows] == ["ASCENDANT"] + [planet["id"] for planet in frame["planets"]]
+    assert positions["longitude_deg"][rows[1]] == frame["planets"][0]["longitude_deg"]
+    assert positions["retrograde"][rows[0]] is None
+
+    periods = bundle["frames"]["dashas_vimshottari"]["frames"][0]["levels"][0]["periods"]
+    dashas = batches["dashas"].to_pydict()
+    assert dashas["chart_id"].count("a") == len(periods)
+    assert dashas["start"][0].isoformat() == periods[0]["start"]
+    strengths = batches["strengths"].to_pydict()
+    summary = bundle["frames"]["strengths"]["frames"]["summary"]
+    assert sum(strengths["is_strong"][: strengths["chart_id"].count("a")]) == len(summary["strong_planets"])
+    yogas = batches["yogas"].to_pydict()
+    first = bundle["frames"]["yogas"]["frames"]["yogas"][0]
+    assert yogas["planets"][0] == first["planets"]
+    assert json.loads(yogas["formation_details"][0]) == first["formation_details"]
+
+
+def test_parquet_export_streams_chunks_and_round_trips(bundles, tmp_path):
+    stream = (bundles[index % len(bundles)] for index in range(7))
+    chart_ids = [f"chart-{index}" for index in range(7)]
+    paths = columnar_export.export_bundles(stream, tmp_path, chunk_size=3, chart_ids=chart_ids)
+    assert pq.ParquetFile(paths["positions"]).num_row_groups == 3
+
+    tables = columnar_export.read_tables(tmp_path)
+    expected = columnar_export.record_batches([bundles[index % len(bundles)] for index in range(7)], chart_ids)
+    for table in columnar_export.TABLES:
+        assert tables[table].to_pydict() == expected[table].to_pydict()
+    assert sorted(set(tables["positions"].column("chart_id").to_pylist())) == sorted(chart_ids)
+
+
+def test_feather_round_trip_and_errors(bundles, tmp_path):
+    with columnar_export.ColumnarWriter(tmp_path, fmt="feather", chunk_size=1) as writer:
+        writer.write_many(bundles[:2])
+        # The minimal fixture has no person.id to key it by.
+        with pytest.raises(ValueError):
+            writer.write(bundles[2])
+        writer.write(bundles[2], chart_id="minimal")
+    assert writer.bundles_written == len(bundles)
+    tables = columnar_export.read_tables(tmp_path, fmt="feather")
+    ids = [bundle["person"]["id"] for bundle in bundles[:2]] + ["minimal"]
+    assert tables["positions"].column("chart_id").unique().to_pylist() == ids
+    assert tables["dashas"].schema.field("start").type == pa.timestamp("us", tz="UTC")
+
+    with pytest.raises(ValueError):
+        writer.write(bundles[0])
+    with pytest.raises(ValueError):
+        columnar_export.ColumnarWriter(tmp_path, fmt="csv")
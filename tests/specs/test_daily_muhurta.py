@@ -0,0 +1,126 @@
+from datetime import date
+
+import numpy as np
+import pytest
+from jhora import utils
+from jhora.panchanga import drik
+
+from refraction_engine import daily_muhurta
+from refraction_engine.ephemeris import sidereal_positions
+from refraction_engine.panchanga_calendar import CalendarLocation
+
+LOCATION = CalendarLocation(13.0878, 80.2785, "Asia/Kolkata", "Chennai")
+PLACE = drik.Place("Chennai", 13.0878, 80.2785, 5.5)
+START = date(2024, 3, 1)
+END = date(2024, 3, 14)
+# drik rounds its window edges to whole seconds.
+TOLERANCE_HOURS = 2.0 / 3600.0
+
+
+@pytest.fixture(autouse=True)
+def _english():
+    utils.set_language("en")
+
+
+@pytest.fixture(scope="module")
+def context():
+    return daily_muhurta.daily_muhurta_context(START, END, LOCATION)
+
+
+def _hours(context, row, jd_utc):
+    return (np.asarray(jd_utc) - context.days.day_start_jd_utc[row]) * 24.0
+
+
+def _dms(text):
+    hours, minutes, seconds = (float(part) for part in text.split(":"))
+    return hours + minutes / 60.0 + seconds / 3600.0
+
+
+def _clock(hours):
+    return (np.asarray(hours) + 12.0) % 24.0 - 12.0
+
+
+def test_windows_match_drik(context):
+    choghadiya, types = context.choghadiya()
+    horas, lords = context.horas()
+    muhurthas = context.muhurthas()
+    durmuhurtam = context.durmuhurtam()
+    for row, day in enumerate(context.days.dates):
+        jd = utils.julian_day_number((day.year, day.month, day.day), (10, 0, 0))
+        for col, (kind, _, end) in enumerate(drik.gauri_choghadiya(jd, PLACE)):
+            assert kind == types[row, col]
+            assert abs(_clock(_hours(context, row, choghadiya[row, col, 1]) - _dms(end))) < TOLERANCE_HOURS
+        for col, (lord, _, end) in enumerate(drik.shubha_hora(jd, PLACE)):
+            assert lord == lords[row, col]
+            assert abs(_clock(_hours(context, row, horas[row, col, 1]) - _dms(end))) < TOLERANCE_HOURS
+        expected = [_dms(value) for value in drik.durmuhurtam(jd, PLACE)]
+        actual = durmuhurtam[row][~np.isnan(durmuhurtam[row, :, 0])].ravel()
+        assert np.allclose(_hours(context, row, actual), expected, atol=TOLERANCE_HOURS)
+        abhijit = [_dms(value) for value in drik.abhijit_muhurta(jd, PLACE)]
+        assert np.allclose(_hours(context, row, context.abhijit_muhurta()[row]), abhijit, atol=TOLERANCE_HOURS)
+        for window, function in (
+            (context.brahma_muhurtha(), drik.brahma_muhurtha),
+            (context.nishita_kaala(), drik.nishita_kaala),
+        ):
+            assert np.allclose(_hours(context, row, window[row]), function(jd, PLACE), atol=1e-6)
+        expected = np.array([span for _, _, span in drik.muhurthas(jd, PLACE)])
+        assert np.allclose(_hours(context, row, muhurthas[row]), expected, atol=1e-6)
+
+
+def test_nakshatra_windows_follow_exact_spans(context):
+    boundaries = context.nakshatra_spans
+    assert np.all(boundaries[1:, 0] == boundaries[:-1, 1])
+    assert boundaries[0, 0] <= context.days.sunrise_jd_utc[0]
+    assert boundaries[-1, 1] >= context.days.next_sunrise_jd_utc[-1]
+    moon, _ = sidereal_positions(boundaries[:, 0], ["MOON"])
+    offset = (moon[:, 0] - (context.nakshatra - 1) * 360.0 / 27.0 + 180.0) % 360.0 - 180.0
+    assert np.allclose(offset, 0.0, atol=1e-5)
+
+    sunrise = context.days.sunrise_jd_utc[:, None]
+    next_sunrise = context.days.next_sunrise_jd_utc[:, None]
+    for windows, stars in (context.amrita_gadiya(), context.varjyam()):
+        present = stars > 0
+        assert np.all(np.where(present, windows[..., 0] >= sunrise, True))
+        assert np.all(np.where(present, windows[..., 0] < next_sunrise, True))
+    varjyam, stars = context.varjyam()
+    # Mula (19) is the one nakshatra with two varjyams.
+    assert np.count_nonzero(stars == 19) == 2
+    assert np.count_nonzero(context.amrita_gadiya()[1] == 19) == 1
+
+    # Where drik.nakshatra reports its start correctly the windows agree.
+    for day in (date(2024, 3, 10), date(2024, 3, 11)):
+        row = (day - START).days
+        jd = utils.julian_day_number((day.year, day.month, day.day), (10, 0, 0))
+        amrita, _ = context.amrita_gadiya()
+        assert np.allclose(_hours(context, row, amrita[row, 0]), drik.amrita_gadiya(jd, PLACE), atol=0.02)
+        assert np.allclose(_hours(context, row, varjyam[row, 0]), drik.varjyam(jd, PLACE), atol=0.02)
+
+
+def test_range_matches_single_days_and_payload(context):
+    day = date(2024, 3, 5)
+    single = daily_muhurta.daily_muhurta_context(day, day, LOCATION)
+    row = (day - START).days
+    assert np.allclose(single.choghadiya()[0][0], context.choghadiya()[0][row])
+    assert np.allclose(single.durmuhurtam()[0], context.durmuhurtam()[row], equal_nan=True)
+    assert single.varjyam()[1][0].tolist() == context.varjyam()[1][row, : single.varjyam()[1].shape[1]].tolist()
+
+    result = daily_muhurta.run_daily_muhurta(
+        {
+            "daily_muhurta": {
+                "start_date": day.isoformat(),
+                "location": {
+                    "latitude": LOCATION.latitude,
+                    "longitude": LOCATION.longitude,
+                    "timezone_name": LOCATION.timezone_name,
+                },
+            }
+        }
+    )
+    assert result["meta"]["schema_version"] == daily_muhurta.DAILY_MUHURTA_SCHEMA_VERSION
+    entry = result["days"][day.isoformat()]
+    assert len(entry["choghadiya"]) == 16 and len(entry["hora"]) == 24
+    assert len(entry["muhurtha"]) == 30 and entry["muhurtha"][0]["name"] == "RUDRA"
+    assert len(entry["varjyam"]) == 2
+    assert entry["abhijit_muhurta"]["start"].startswith(day.isoformat())
+    with pytest.raises(ValueError):
+        daily_muhurta.run_daily_muhurta({"daily_muhurta": {"start_date": "2024-03-05"}})
@@ -0,0 +1,81 @@
+import random
+
+import numpy as np
+import pytest
+from jhora import const
+from jhora.horoscope.chart import drishti, house
+
+
+def _random_charts(count, seed=11):
+    rng = random.Random(seed)
+    charts = []
+    for _ in range(count):
+        cells = [[] for _ in range(12)]
+        for planet in [const._ascendant_symbol, *range(9)]:
+            cells[rng.randrange(12)].append(str(planet))
+        charts.append(["/".join(cell) for cell in cells])
+    return charts
+
+
+def test_drishti_matrices_match_the_sign_and_planet_rules():
+    rd = drishti.RAASI_DRISHTI
+    assert rd.shape == (12, 12) and not rd.diagonal().any()
+    assert (rd == rd.T).all() and (rd.sum(axis=1) == 3).all()
+    for ms in const.movable_signs:
+        assert np.flatnonzero(rd[ms]).tolist() == [fs for fs in const.fixed_signs if abs(fs - ms) != 1]
+    for ds in const.dual_signs:
+        assert np.flatnonzero(rd[ds]).tolist() == [s for s in const.dual_signs if s != ds]
+    assert house._get_raasi_drishti() == {r: np.flatnonzero(row).tolist() for r, row in enumerate(rd)}
+    assert drishti.GRAHA_DRISHTI.shape == (9, 12)
+    for planet in range(9):
+        assert (np.flatnonzero(drishti.GRAHA_DRISHTI[planet]) + 1).tolist() == const.graha_drishti[planet]
+    with pytest.raises(ValueError):
+        rd[0, 0] = True
+
+
+def test_batch_aspects_match_the_string_api():
+    charts = _random_charts(60)
+    parsed = [drishti.chart_from_house_to_planet_list(chart) for chart in charts]
+    planet_houses = np.array([planets for planets, _, _ in parsed])
+    asc_houses = np.array([asc for _, asc, _ in parsed])
+    for kind, from_chart in (("graha", house.graha_drishti_from_chart), ("raasi", house.raasi_drishti_from_chart)):
+        aspected_raasis, aspects_to, aspected_by = drishti.chart_aspects(planet_houses, kind)
+        assert aspected_raasis.shape == (60, 9, 12) and aspects_to.shape == (60, 9, 9)
+        houses = drishti.aspected_houses(aspected_raasis, asc_houses)
+        for index, chart in enumerate(charts):
+            arp, ahp, app = from_chart(chart)
+            for planet in range(9):
+                assert sorted(arp[planet]) == np.flatnonzero(aspected_raasis[index, planet]).tolist()
+                assert sorted(ahp[planet]) == (np.flatnonzero(houses[index, planet]) + 1).tolist()
+                assert sorted(app[planet]) == np.flatnonzero(aspects_to[index, planet]).tolist()
+                assert np.flatnonzero(aspected_by[index, planet]).tolist() == [p for p in range(9) if planet in app[p]]
+        single = drishti.chart_aspects(planet_houses[0], kind)
+        assert all((a == b[0]).all() for a, b in zip(single, (aspected_raasis, aspects_to, aspected_by)))
+    both = drishti.chart_aspects(planet_houses, "both")[1]
+    assert (both == drishti.chart_aspects(planet_houses)[1] | drishti.chart_aspects(planet_houses, "raasi")[1]).all()
+
+
+def test_string_wrappers_accept_any_separator_and_reject_bad_charts():
+    chart = ["", "", "", "", "2", "7", "1/5", "0", "3/4", "L", "", "6/8"]
+    newline_chart = [cell.replace("/", "\n") for cell in chart]
+    assert house.graha_drishti_from_chart(chart) == house.graha_drishti_from_chart(newline_chart, "\n")
+    assert house.raasi_drishti_from_chart(chart) == house.raasi_drishti_from_chart(newline_chart, "\n")
+    for planet in range(9):
+        assert house.graha_drishti_of_the_planet(chart, planet) == house.graha_drishti_of_the_planet(
+            newline_chart, planet, "\n"
+        )
+    arp, ahp, app = house.graha_drishti_from_chart(chart)
+    # Saturn in Pisces aspects the 3rd, 7th and 10th raasis from it, in that order.
+    assert arp[6] == [1, 5, 8] and ahp[6] == [5, 9, 12] and app[6] == [7, 3, 4]
+    assert house.planets_aspecting_the_planet(chart, 4) == [6]
+    planet_positions = [[const._ascendant_symbol, (9, 1.0)]] + [
+        [planet, (int(drishti.chart_from_house_to_planet_list(chart)[0][planet]), 1.0)] for planet in range(9)
+    ]
+    planet_houses, asc_house = drishti.chart_from_planet_positions(planet_positions)
+    assert planet_houses.tolist() == [7, 6, 4, 8, 8, 6, 11, 5, 11] and asc_house == 9
+    with pytest.raises(KeyError):
+        house.graha_drishti_from_chart([cell.replace("3", "") for cell in chart])
+    with pytest.raises(ValueError):
+        drishti.chart_aspects([0] * 8)
+    with pytest.raises(ValueError):
+        drishti.chart_aspects([0] * 9, drishti="tajaka")
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+import swisseph as swe
+
+from refraction_engine.eclipses import EclipseCatalog, find_eclipses
+from refraction_engine.events import scan_events
+
+CHENNAI = (13.0827, 80.2707)
+
+
+@pytest.fixture(scope="module")
+def catalog():
+    return EclipseCatalog((2020, 2030))
+
+
+def test_catalog_matches_chained_searches(catalog):
+    start, end = swe.julday(2020, 1, 1, 0.0), swe.julday(2030, 1, 1, 0.0)
+    rows = catalog.between(start, end)
+    expected = []
+    for search in (swe.sol_eclipse_when_glob, swe.lun_eclipse_when):
+        cursor = start
+        while True:
+            jd_max = search(cursor)[1][0]
+            if jd_max >= end:
+                break
+            expected.append(jd_max)
+            cursor = jd_max + 1.0
+    assert np.allclose(rows["jd_max"], sorted(expected))
+    assert (np.diff(rows["jd_max"]) > 0).all()
+
+
+def test_range_query_and_types(catalog):
+    records = find_eclipses(
+        swe.julday(2024, 1, 1, 0.0), swe.julday(2025, 1, 1, 0.0), catalog=catalog
+    )
+    assert [(r["subtype"], r["eclipse_type"]) for r in records] == [
+        ("LUNAR", "PENUMBRAL"),
+        ("SOLAR", "TOTAL"),
+        ("LUNAR", "PARTIAL"),
+        ("SOLAR", "ANNULAR"),
+    ]
+    assert records[1]["saros"] == 139
+    assert "central_point" in records[1]
+
+
+def test_local_visibility_is_cached(catalog):
+    start, end = swe.julday(2025, 1, 1, 0.0), swe.julday(2027, 1, 1, 0.0)
+    visible = catalog.visible_between(start, end, *CHENNAI)
+    # 2025-09-07 total lunar eclipse is visible from India; the 2026-08-12
+    # solar eclipse is not.
+    assert any(row["kind"] == 1 and local["type"] == "TOTAL" for row, local in visible)
+    assert all(row["kind"] == 1 for row, _ in visible)
+    cached = len(catalog._local)
+    catalog.visible_between(start, end, *CHENNAI)
+    assert len(catalog._local) == cached
+
+
+def test_save_and_load(tmp_path, catalog):
+    catalog.precompute()
+    path = tmp_path / "eclipses.npz"
+    catalog.save(path)
+    loaded = EclipseCatalog.load(path)
+    assert loaded.span == catalog.span
+    assert loaded.table.tobytes() == catalog.table.tobytes()
+    with pytest.raises(ValueError):
+        loaded.between(swe.julday(2019, 1, 1, 0.0), swe.julday(2021, 1, 1, 0.0))
+
+
+def test_event_scan_includes_eclipses():
+    start = swe.julday(2024, 1, 1, 0.0)
+    events = scan_events(start, start + 366, event_types=["SOLAR_ECLIPSE"])
+    assert [event["eclipse_type"] for event in events] == ["TOTAL", "ANNULAR"]
+    assert all(event["type"] == "ECLIPSE" for event in events)
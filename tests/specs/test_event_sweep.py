@@ -0,0 +1,139 @@
+import json
+
+import numpy as np
+import pytest
+from jhora import utils
+from jhora.horoscope.chart import charts
+from jhora.panchanga import drik
+
+from refraction_engine import events as events_module
+from refraction_engine.ephemeris import bracketed_root, sidereal_position, sidereal_positions
+from refraction_engine.events import run_event_scan, scan_events
+from refraction_engine.graha import rasi_name_to_index
+
+START_JD = utils.julian_day_number((2024, 1, 1), (0, 0, 0))
+PLACE = drik.Place("Greenwich", 51.4769, 0.0, 0.0)
+
+
+@pytest.fixture(scope="module")
+def year_events():
+    return scan_events(START_JD, START_JD + 365, lagna_sign=3)
+
+
+def test_sankrantis_match_pyjhora(year_events):
+    sankrantis = [event for event in year_events if event["type"] == "SANKRANTI"]
+    assert len(sankrantis) == 12
+    expected, _ = drik.next_planet_entry_date(0, START_JD, PLACE)
+    assert sankrantis[0]["jd_utc"] == pytest.approx(expected, abs=1e-4)
+    assert sankrantis[0]["to_sign"] == "CAPRICORN"
+
+
+def test_sign_entries_land_on_boundaries(year_events):
+    for event in year_events:
+        if event["type"] != "SIGN_ENTRY" or event["planet"] in ("RAHU", "KETU"):
+            continue
+        longitude, _ = sidereal_position(event["jd_utc"], event["planet"])
+        assert min(longitude % 30, 30 - longitude % 30) < 1e-3
+
+
+def test_stations_have_zero_speed_and_pair_into_segments(year_events):
+    stations = [
+        event
+        for event in year_events
+        if event["type"] in ("RETROGRADE_START", "RETROGRADE_END")
+    ]
+    assert {event["planet"] for event in stations} >= {"MERCURY", "SATURN", "JUPITER"}
+    for event in stations:
+        _, speed = sidereal_position(event["jd_utc"], event["planet"])
+        assert abs(speed) < 1e-4
+    segments = [event for event in year_events if event["type"] == "RETROGRADE_SEGMENT"]
+    for segment in segments:
+        _, speed = sidereal_position(
+            (segment["jd_start"] + segment["jd_end"]) / 2, segment["planet"]
+        )
+        assert speed < 0
+
+
+def test_house_entries_follow_lagna(year_events):
+    houses = [event for event in year_events if event["type"] == "HOUSE_ENTRY"]
+    signs = [event for event in year_events if event["type"] == "SIGN_ENTRY"]
+    assert len(houses) == len(signs)
+    for event in houses:
+        to_sign = rasi_name_to_index(event["to_sign"]) - 1
+        assert event["to_house"] == (to_sign - 3) % 12 + 1
+
+
+def test_house_entries_follow_transit_lagna_at_each_entry():
+    location = (PLACE.latitude, PLACE.longitude)
+    houses = scan_events(
+        START_JD, START_JD + 60, planets=["SUN", "MARS"], event_types=["HOUSE_ENTRY"], location=location
+    )
+    assert houses
+    previous = {}
+    for event in houses:
+        # The rasi chart right after the entry, as event_scan_extract._house_info_at reads it.
+        chart = charts.rasi_chart(event["jd_utc"] + 1e-6, PLACE)
+        planet = {"SUN": 0, "MARS": 2}[event["planet"]]
+        assert event["to_house"] == (chart[planet + 1][1][0] - chart[0][1][0]) % 12 + 1
+        assert event["from_house"] != event["to_house"]
+        assert event["from_house"] == previous.get(event["planet"], event["from_house"])
+        previous[event["planet"]] = event["to_house"]
+
+
+def test_adaptive_sweep_jumps_between_events_without_missing_any():
+    bodies = ["JUPITER", "SATURN", "RAHU", "KETU"]
+    end = START_JD + 3 * 365
+    sweep = events_module._EventSweep(
+        START_JD, end, bodies, events_module.EventScanSettings(), sign_bodies=bodies
+    )
+    fixed_samples = (end - START_JD) / events_module.sweep_step_days(bodies)
+    assert len(sweep.grid) < fixed_samples / 2
+    assert np.all(np.diff(sweep.grid) <= events_module.MAX_HORIZON_DAYS + 1e-9)
+    dense = np.linspace(START_JD, end, 20000)
+    signs = (sidereal_positions(dense, bodies, node_mode="TRUE")[0] // 30).astype(int)
+    expected = int((signs[1:] != signs[:-1]).sum())
+    assert len(sweep.sign_entries()) == expected
+    horizon = events_module.event_horizon_days(sweep.longitudes, bodies, sign_bodies=bodies)
+    assert horizon.shape == sweep.grid.shape
+
+
+def test_conjunctions_are_exact():
+    events = scan_events(
+        START_JD, START_JD + 120, planets=["SUN", "MOON"], event_types=["CONJUNCTION"]
+    )
+    assert len(events) == 4
+    for event in events:
+        sun, _ = sidereal_position(event["jd_utc"], "SUN")
+        moon, _ = sidereal_position(event["jd_utc"], "MOON")
+        assert abs((sun - moon + 180) % 360 - 180) < 1e-3
+
+
+def test_filters_and_errors():
+    events = scan_events(
+        START_JD, START_JD + 60, planets=["MOON"], event_types=["SIGN_ENTRY"], max_events=5
+    )
+    assert len(events) == 5
+    assert all(event["planet"] == "MOON" for event in events)
+    with pytest.raises(ValueError):
+        scan_events(START_JD, START_JD - 1)
+    with pytest.raises(ValueError):
+        scan_events(START_JD, START_JD + 1, planets=["PLUTO"])
+    with pytest.raises(ValueError):
+        bracketed_root(lambda x: x * x + 1, -1.0, 1.0)
+
+
+def test_run_event_scan_payload():
+    report = run_event_scan(
+        {
+            "scan": {
+                "start_datetime": "2024-01-01T00:00:00",
+                "end_datetime": "2024-03-01T00:00:00",
+                "timezone_name": "Asia/Kolkata",
+                "planets": ["SUN"],
+                "event_types": ["SANKRANTI"],
+            }
+        }
+    )
+    assert [event["to_sign"] for event in report["events"]] == ["CAPRICORN", "AQUARIUS"]
+    assert report["events"][0]["datetime_local"].startswith("2024-01-15")
+    json.dumps(report)
@@ -0,0 +1,115 @@
+import numpy as np
+import pytest
+from jhora import const
+from jhora.horoscope.chart import ashtakavarga
+
+from refraction_engine import run_core_chart
+from refraction_engine.gochara import (
+    GOCHARA_BODIES,
+    NatalBatch,
+    compute_gochara,
+    compute_transit_snapshot,
+    run_gochara,
+)
+
+from ._utils import load_json
+
+NATAL_FIXTURES = [
+    "references/in/mehran_birth.json",
+    "references/in/athena_birth.json",
+    "references/in/arman_birth.json",
+]
+
+
+def _transit_payload():
+    payload = load_json("references/in/mehran_birth.json")
+    payload["reference"] = {
+        "datetime_local": "2024-01-15T09:00:00",
+        "timezone_name": "Asia/Tehran",
+        "location": {"latitude": 35.6892, "longitude": 51.389},
+    }
+    return payload
+
+
+@pytest.fixture(scope="module")
+def natal_charts():
+    return [run_core_chart(load_json(path)) for path in NATAL_FIXTURES]
+
+
+@pytest.fixture(scope="module")
+def overlay(natal_charts):
+    transit = compute_transit_snapshot(_transit_payload())
+    return compute_gochara(transit, NatalBatch.from_core_charts(natal_charts))
+
+
+def _house_to_planet_list(batch: NatalBatch, row: int):
+    chart = ["" for _ in range(12)]
+    for planet, sign in enumerate(batch.signs[row]):
+        chart[sign] += f"{planet}/"
+    chart[batch.lagna_sign[row]] += "L/"
+    return [entry[:-1] for entry in chart]
+
+
+def test_gochara_bodies_follow_pyjhora_order():
+    assert GOCHARA_BODIES == ["SUN", "MOON", "MARS", "MERCURY", "JUPITER", "VENUS", "SATURN", "RAHU", "KETU"]
+
+
+def test_gochara_shapes(overlay, natal_charts):
+    count = len(natal_charts)
+    assert overlay.houses_from_moon.shape == (count, len(GOCHARA_BODIES))
+    assert overlay.aspects.shape == (count, len(GOCHARA_BODIES), len(GOCHARA_BODIES) + 1)
+    assert overlay.bav_bindus.shape == (count, 7)
+    assert ((overlay.houses_from_lagna >= 1) & (overlay.houses_from_lagna <= 12)).all()
+    assert ((overlay.tara_index >= 1) & (overlay.tara_index <= 9)).all()
+
+
+def test_gochara_matches_scalar_ashtakavarga(overlay, natal_charts):
+    batch = NatalBatch.from_core_charts(natal_charts)
+    transit_signs = overlay.transit.signs
+    for row in range(len(batch)):
+        bav, sav, _ = ashtakavarga.get_ashtaka_varga(_house_to_planet_list(batch, row))
+        for planet in range(7):
+            assert overlay.bav_bindus[row, planet] == bav[planet][transit_signs[planet]]
+        for planet, sign in enumerate(transit_signs):
+            assert overlay.sav_bindus[row, planet] == sav[sign]
+
+
+def test_gochara_houses_from_moon(overlay, natal_charts):
+    batch = NatalBatch.from_core_charts(natal_charts)
+    for row in range(len(batch)):
+        moon_sign = int(batch.longitudes[row, GOCHARA_BODIES.index("MOON")] // 30)
+        for planet, longitude in enumerate(overlay.transit.longitudes):
+            expected = (int(longitude // 30) - moon_sign) % 12 + 1
+            assert overlay.houses_from_moon[row, planet] == expected
+
+
+def test_gochara_graha_drishti(overlay, natal_charts):
+    batch = NatalBatch.from_core_charts(natal_charts)
+    point_signs = (batch.point_longitudes // 30).astype(int) % 12
+    for row in range(len(batch)):
+        for planet, source in enumerate(overlay.transit.signs):
+            for target, sign in enumerate(point_signs[row]):
+                house = (sign - source) % 12 + 1
+                expected = house in const.graha_drishti[planet]
+                assert overlay.aspects[row, planet, target] == expected
+
+
+def test_run_gochara_large_batch():
+    rng = np.random.default_rng(7)
+    batch = NatalBatch(
+        longitudes=rng.uniform(0, 360, size=(20_000, len(GOCHARA_BODIES))),
+        ascendant=rng.uniform(0, 360, size=20_000),
+    )
+    overlay = compute_gochara(compute_transit_snapshot(_transit_payload()), batch)
+    assert overlay.sav_bindus.shape == (20_000, len(GOCHARA_BODIES))
+    assert (overlay.sav_bindus.sum(axis=1) > 0).all()
+
+
+def test_run_gochara_report(natal_charts):
+    batch = NatalBatch.from_core_charts(natal_charts, chart_ids=["mehran", "athena", "arman"])
+    result = run_gochara(_transit_payload(), batch)
+    assert result["meta"]["schema_version"] == "gochara_spec_v1"
+    assert result["meta"]["chart_count"] == len(natal_charts)
+    assert result["charts"][0]["chart_id"] == "mehran"
+    planets = result["charts"][0]["planets"]
+    assert [planet["id"] for planet in planets] == GOCHARA_BODIES
@@ -0,0 +1,113 @@
+import pickle
+
+import pytest
+from jhora import const, utils
+from jhora.horoscope import main
+from jhora.horoscope.chart import charts
+from jhora.panchanga import drik
+
+
+@pytest.fixture
+def horoscope():
+    # Horoscope() sets the global ayanamsa mode; give it back afterwards.
+    mode = const._DEFAULT_AYANAMSA_MODE
+    value = drik._ayanamsa_value
+    utils.set_language("en")
+    yield main.Horoscope(
+        latitude=13.0878,
+        longitude=80.2785,
+        timezone_offset=5.5,
+        date_in=drik.Date(1996, 12, 7),
+        birth_time="10:34:00",
+        ayanamsa_mode=mode,
+    )
+    drik.set_ayanamsa_mode(mode, value)
+    utils.set_language("en")
+
+
+def _count_divisional_charts(monkeypatch):
+    calls = []
+    divisional_chart = charts.divisional_chart
+    monkeypatch.setattr(
+        charts,
+        "divisional_chart",
+        lambda *args, **kwargs: calls.append(kwargs.get("divisional_chart_factor")) or divisional_chart(*args, **kwargs),
+    )
+    return calls
+
+
+def test_selected_sections_match_full_information(horoscope, monkeypatch):
+    calls = _count_divisional_charts(monkeypatch)
+    info, rasi_charts, ascendants = horoscope.get_horoscope_information(sections=[1, 9])
+    assert 2 not in calls and 9 in calls
+    assert [chart != [""] * 12 for chart in rasi_charts].count(True) == 2
+    assert ascendants[2] == -1
+
+    full_info, full_charts, full_ascendants = horoscope.get_horoscope_information()
+    assert all(full_info[key] == value for key, value in info.items())
+    assert full_charts[0] == rasi_charts[0] and full_charts[8] == rasi_charts[8]
+    assert -1 not in full_ascendants[: len(main.dhasavarga_dict) + 1]
+    with pytest.raises(ValueError):
+        horoscope.get_horoscope_information(sections=[13])
+
+
+def test_sections_and_dhasas_are_computed_once(horoscope, monkeypatch):
+    place, dob, tob = horoscope.Place, horoscope.Date, horoscope.birth_time
+    horoscope.get_horoscope_information()
+    calls = _count_divisional_charts(monkeypatch)
+    assert horoscope.get_horoscope_information()[0]
+    assert calls == []
+
+    vimsottari = horoscope._get_vimsottari_dhasa_bhukthi(dob, tob, place)
+    balance = horoscope._vimsottari_balance
+    horoscope._vimsottari_balance = ()
+    assert horoscope._get_vimsottari_dhasa_bhukthi(dob, tob, place) == vimsottari
+    # Attributes a method sets are set again when its saved result is returned.
+    assert horoscope._vimsottari_balance == balance
+    assert horoscope.calendar_info == horoscope.calendar_info
+    assert len(horoscope.bhava_chart_info) == 12
+
+
+def test_saved_sections_are_returned_as_copies(horoscope):
+    place, dob, tob = horoscope.Place, horoscope.Date, horoscope.birth_time
+    vimsottari = horoscope._get_vimsottari_dhasa_bhukthi(dob, tob, place)
+    expected = [list(row) for row in vimsottari]
+    vimsottari.clear()
+    calendar = horoscope.calendar_info
+    calendar.clear()
+    again = horoscope._get_vimsottari_dhasa_bhukthi(dob, tob, place)
+    assert [list(row) for row in again] == expected
+    assert again is not horoscope._get_vimsottari_dhasa_bhukthi(dob, tob, place)
+    assert horoscope.calendar_info
+
+
+def test_sections_use_horoscope_settings_without_keeping_them(horoscope):
+    tamil = main.Horoscope(
+        latitude=13.0878,
+        longitude=80.2785,
+        timezone_offset=5.5,
+        date_in=drik.Date(1996, 12, 7),
+        birth_time="10:34:00",
+        ayanamsa_mode="RAMAN",
+        language="ta",
+    )
+    utils.set_language("en")
+    drik.set_ayanamsa_mode("LAHIRI")
+    restored = pickle.loads(pickle.dumps(tamil))
+    # Unpickling leaves the process settings alone.
+    assert const._DEFAULT_LANGUAGE == "en" and drik._ayanamsa_mode == "LAHIRI"
+    calendar = restored.calendar_info
+    assert const._DEFAULT_LANGUAGE == "en" and drik._ayanamsa_mode == "LAHIRI"
+    utils.set_language("ta")
+    drik.set_ayanamsa_mode("RAMAN")
+    assert calendar == tamil.get_calendar_information()
+
+
+def test_horoscope_pickles_with_its_sections(horoscope, monkeypatch):
+    info = horoscope.get_horoscope_information(sections=[1])
+    calendar = horoscope.calendar_info
+    restored = pickle.loads(pickle.dumps(horoscope))
+    calls = _count_divisional_charts(monkeypatch)
+    assert restored.get_horoscope_information(sections=[1]) == info
+    assert restored.calendar_info == calendar and calls == []
+    assert restored.get_horoscope_information(sections=[9])[2][8] == horoscope.get_horoscope_information()[2][8]
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+import swisseph as swe
+from jhora import utils
+from jhora.horoscope.chart import charts
+from jhora.panchanga import drik
+
+from refraction_engine import house_cusps
+
+# (jd_utc, latitude, longitude, tz hours); the last one is above 60 degrees.
+CHARTS = [
+    (2460000.3, 13.08, 80.27, 5.5),
+    (2445000.9, 51.5, -0.12, 0.0),
+    (2451545.2, -33.9, 151.2, 10.0),
+    (2438000.6, 60.2, 24.9, 2.0),
+]
+
+
+@pytest.fixture(autouse=True)
+def _english():
+    utils.set_language("en")
+
+
+def _angle_error(a, b):
+    return np.abs((np.asarray(a) - np.asarray(b) + 180.0) % 360.0 - 180.0).max()
+
+
+def test_every_system_matches_drik_bhava_chart():
+    jd_utc, latitude, longitude, _ = np.array(CHARTS).T
+    houses = house_cusps.house_cusps(jd_utc, latitude, longitude)
+    assert houses.bhavas.shape == (len(CHARTS), len(house_cusps.HOUSE_SYSTEMS), 12, 3)
+    for row, (jd, lat, lon, tz) in enumerate(CHARTS):
+        place = drik.Place("chart", lat, lon, tz)
+        rasi, degrees = drik.ascendant(jd + tz / 24.0, place)[:2]
+        assert houses.ascendant[row] == pytest.approx(rasi * 30.0 + degrees, abs=1e-9)
+        for col, code in enumerate(houses.systems):
+            expected = charts.bhava_chart(jd + tz / 24.0, place, bhava_madhya_method=code)
+            assert _angle_error(houses.bhavas[row, col], [entry[1] for entry in expected]) < 1e-9
+            assert houses.rasi[row, col].tolist() == [entry[0] for entry in expected]
+
+
+def test_tropical_broadcast_matches_houses_ex():
+    latitudes = np.linspace(-55.0, 55.0, 7)
+    houses = house_cusps.house_cusps(2460000.3, latitudes, 80.27, systems=["k", "3"], ayanamsa_mode=None)
+    assert houses.systems == ("K", 3) and len(houses) == len(latitudes)
+    assert np.all(houses.ayanamsa == 0.0)
+    for row, lat in enumerate(latitudes):
+        cusps, angles = swe.houses_ex(2460000.3, lat, 80.27, b"K")
+        assert _angle_error(houses.system("K")[row, :, 0], cusps) < 1e-9
+        assert _angle_error([houses.ascendant[row], houses.mc[row]], angles[:2]) < 1e-9
+    with pytest.raises(ValueError):
+        house_cusps.house_cusps(2460000.3, 0.0, 0.0, systems=["Z"])
+    with pytest.raises(ValueError):
+        houses.system(1)
+
+
+def test_run_bhava_systems_lists_charts():
+    result = house_cusps.run_bhava_systems(
+        {
+            "bhava_systems": {
+                "timezone_name": "Asia/Kolkata",
+                "systems": ["1", "P"],
+                "charts": [
+                    {"id": "a", "datetime": "1996-12-07T10:34:00", "location": {"latitude": 13.08, "longitude": 80.27}},
+                    {"id": "b", "datetime": "2001-05-01T22:10:00", "location": {"latitude": 28.6, "longitude": 77.2}},
+                ],
+            }
+        }
+    )
+    assert result["meta"]["schema_version"] == house_cusps.BHAVA_SYSTEMS_SCHEMA_VERSION
+    assert [chart["id"] for chart in result["charts"]] == ["a", "b"]
+    equal = result["charts"][0]["systems"][0]
+    assert equal["code"] == "1" and len(equal["houses"]) == 12
+    assert equal["houses"][0]["cusp_deg"] == pytest.approx(result["charts"][0]["ascendant_deg"])
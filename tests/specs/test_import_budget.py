@@ -0,0 +1,56 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+# Generous wall-clock ceilings; the module checks below are the strict part.
+IMPORT_BUDGET_S = 0.5
+FIRST_CORE_CHART_BUDGET_S = 5.0
+HEAVY_MODULES = ("pandas", "geocoder", "requests", "geopy", "timezonefinder", "scipy", "matplotlib")
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import refraction_engine
+imported = time.perf_counter() - start
+after_import = sorted(sys.modules)
+with open("references/in/minimal_birth.json") as f:
+    payload = json.load(f)
+start = time.perf_counter()
+refraction_engine.run_core_chart(payload)
+core_chart = time.perf_counter() - start
+print(json.dumps({"import_s": imported, "core_chart_s": core_chart,
+                  "after_import": after_import, "after_core_chart": sorted(sys.modules)}))
+"""
+
+
+def _probe():
+    env = dict(os.environ, PYTHONPATH=str(ROOT / "src"))
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def test_import_and_core_chart_stay_within_budget():
+    result = _probe()
+    assert result["import_s"] < IMPORT_BUDGET_S
+    assert result["core_chart_s"] < FIRST_CORE_CHART_BUDGET_S
+    assert not {"jhora", "numpy", "swisseph"} & set(result["after_import"])
+
+    loaded = set(result["after_core_chart"])
+    assert not loaded & set(HEAVY_MODULES)
+    engine_modules = {name for name in loaded if name.startswith("refraction_engine.")}
+    assert engine_modules <= {
+        "refraction_engine.constants",
+        "refraction_engine.core_chart",
+        "refraction_engine.ephemeris",
+        "refraction_engine.graha",
+        "refraction_engine.planet_utils",
+        "refraction_engine.profiling",
+        "refraction_engine.resource_snapshot",
+        "refraction_engine.validators",
+    }
+    assert "jhora.panchanga.vratha" not in loaded
@@ -0,0 +1,134 @@
+from datetime import date
+
+import numpy as np
+import pytest
+from jhora import const, utils
+from jhora.panchanga import drik
+
+from refraction_engine.muhurta import (
+    ACTIVITY_PROFILES,
+    RULES,
+    MuhurtaConfig,
+    build_day_table,
+    run_muhurta,
+    score_muhurta_windows,
+)
+
+LAT, LON, TZ_NAME = 13.0827, 80.2707, "Asia/Kolkata"
+PLACE = drik.Place("Chennai", LAT, LON, 5.5)
+PLANETS = [const._SUN, const._MOON, const._MARS, const._MERCURY, const._JUPITER,
+           const._VENUS, const._SATURN, const._RAHU]
+
+
+@pytest.fixture(scope="module")
+def days():
+    return build_day_table(date(2024, 3, 1), date(2024, 3, 10), LAT, LON, TZ_NAME, "Chennai")
+
+
+@pytest.fixture(scope="module")
+def scores(days):
+    config = MuhurtaConfig(activity_type="CLASS_START", start_date="", end_date="", step_minutes=5)
+    return score_muhurta_windows(config, days)
+
+
+def test_trikalam_blocks_match_pyjhora(days):
+    for row, iso in enumerate(days.dates):
+        year, month, day = (int(part) for part in iso.split("-"))
+        jd = utils.julian_day_number((year, month, day), (0, 0, 0))
+        sunrise = drik.sunrise(jd, PLACE)[0]
+        day_length = drik.day_length(jd, PLACE)
+        weekday = drik.vaara(jd)
+        local_zero = days.day_start_jd_utc[row]
+        for col, option in enumerate(["raahu kaalam", "yamagandam", "gulikai"]):
+            offsets = {
+                "raahu kaalam": [0.875, 0.125, 0.75, 0.5, 0.625, 0.375, 0.25],
+                "gulikai": [0.75, 0.625, 0.5, 0.375, 0.25, 0.125, 0.0],
+                "yamagandam": [0.5, 0.375, 0.25, 0.125, 0.0, 0.75, 0.625],
+            }[option]
+            expected = sunrise + day_length * offsets[weekday]
+            actual = (days.blocks[row, col, 0] - local_zero) * 24.0
+            assert actual == pytest.approx(expected, abs=1e-6)
+            assert drik.trikalam(jd, PLACE, option)[0] == utils.to_dms(expected)
+
+
+def test_window_grid(scores):
+    assert len(scores) == 10 * 24 * 12
+    assert np.allclose(np.diff(scores.start_jd_utc), 5 / 1440.0)
+
+
+def test_scores_match_scalar_charts(scores):
+    profile = ACTIVITY_PROFILES["CLASS_START"]
+    for index in np.random.default_rng(3).choice(len(scores), size=25, replace=False):
+        jd_local = scores.start_jd_utc[index] + 5.5 / 24.0
+        longitudes = [drik.sidereal_longitude(jd_local - 5.5 / 24.0, p) for p in PLANETS]
+        longitudes.append((longitudes[-1] + 180.0) % 360.0)
+        lagna = drik.ascendant(jd_local, PLACE)[0]
+        tithi = int(((longitudes[1] - longitudes[0]) % 360.0) // 12) + 1
+        nakshatra = int(longitudes[1] // (360.0 / 27)) + 1
+        houses = [(int(lon // 30) - lagna) % 12 + 1 for lon in longitudes]
+        assert scores.tithi[index] == tithi
+        assert scores.nakshatra[index] == nakshatra
+        assert scores.lagna_sign[index] == lagna
+        flags = dict(zip(RULES, scores.flags[index]))
+        assert flags["FAVORABLE_TITHI"] == (tithi in profile["favorable_tithis"])
+        benefic_lagna = any(h == 1 for h, p in zip(houses, range(9)) if p in (1, 3, 4, 5))
+        assert flags["BENEFIC_LAGNA"] == benefic_lagna
+
+
+def test_timelines_cover_the_range(days):
+    for timeline, divisions in ((days.tithi, 30), (days.nakshatra, 27), (days.lagna, 12)):
+        assert timeline.end_jd_utc[-1] >= days.end_jd_utc
+        assert np.all(np.diff(timeline.end_jd_utc) > 0)
+        # Consecutive spans step to the next element.
+        assert np.all(np.diff(timeline.index) % divisions <= 1)
+    entries = days.lagna.end_jd_utc[:-1]
+    assert 10 * 12 - 2 <= entries.size <= 10 * 12 + 2
+    for jd_utc, sign in zip(entries[:12], days.lagna.index[1:13]):
+        jd_local = jd_utc + 5.5 / 24.0
+        assert drik.ascendant(jd_local + 1e-5, PLACE)[0] == sign
+        assert drik.ascendant(jd_local - 1e-5, PLACE)[0] == (sign - 1) % 12
+
+
+def test_yamaganda_is_reported_with_the_configured_weight(days, scores):
+    column = RULES.index("YAMAGANDA")
+    inside = np.flatnonzero(scores.flags[:, column])
+    assert inside.size
+    config = MuhurtaConfig(
+        activity_type="CLASS_START", start_date="", end_date="", step_minutes=5,
+        weights={"YAMAGANDA": -60.0},
+    )
+    weighted = score_muhurta_windows(config, days)
+    assert np.allclose(weighted.score[inside], scores.score[inside] - 60.0)
+    outside = np.flatnonzero(~scores.flags[:, column])
+    assert np.array_equal(weighted.score[outside], scores.score[outside])
+
+
+def test_top_windows_without_full_sort(scores):
+    top = scores.top(50)
+    full = np.lexsort((scores.start_jd_utc, -scores.score))[:50]
+    assert top.tolist() == full.tolist()
+    assert scores.top(0).size == 0
+    assert scores.top(None).size == len(scores)
+
+
+def test_run_muhurta_payload():
+    report = run_muhurta(
+        {
+            "muhurta": {
+                "activity_type": "TRAVEL",
+                "start_date": "2024-03-01",
+                "end_date": "2024-03-02",
+                "step_minutes": 30,
+                "max_windows": 5,
+                "timezone_name": TZ_NAME,
+                "location": {"latitude": LAT, "longitude": LON},
+            }
+        }
+    )
+    assert report["meta"]["window_count"] == 96
+    windows = report["windows"]
+    assert len(windows) == 5
+    assert [w["score"] for w in windows] == sorted((w["score"] for w in windows), reverse=True)
+    assert windows[0]["start_iso"].endswith("+05:30")
+    with pytest.raises(ValueError):
+        run_muhurta({"muhurta": {"start_date": "2024-03-01", "end_date": "2024-03-02"}})
@@ -0,0 +1,58 @@
+import itertools
+import sys
+
+import numpy as np
+import pytest
+from jhora import utils
+from jhora.panchanga import drik, pancha_paksha
+
+PLACE = drik.Place("Chennai,India", 13.0878, 80.2785, 5.5)
+BIRTHS = [(drik.Date(1996, 12, 7), (10, 34, 0)), (drik.Date(2024, 3, 1), (3, 0, 0))]
+
+
+@pytest.fixture(autouse=True)
+def _english():
+    utils.set_language("en")
+
+
+def test_table_rows_match_the_csv_database():
+    pd = pytest.importorskip("pandas")
+    db = pd.read_csv(pancha_paksha.PP_DB_FILE, usecols=range(pancha_paksha._LAST_COL_FOR_READING + 1))
+    table = pancha_paksha.get_pancha_pakshi_table()
+    assert table is pancha_paksha.get_pancha_pakshi_table()
+    assert table.shape == pancha_paksha._PP_TABLE_SHAPE
+    for bird, weekday, paksha in itertools.product(range(1, 6), range(1, 8), range(1, 3)):
+        matches = db[
+            (db.iloc[:, pancha_paksha._NAK_BIRD_INDEX] == bird - 1)
+            & (db.iloc[:, pancha_paksha._WEEK_DAY_INDEX] == weekday - 1)
+            & (db.iloc[:, pancha_paksha._PAKSHA_INDEX] == paksha - 1)
+        ]
+        assert pancha_paksha.get_matching_pancha_pakshi_data_from_db(bird, weekday, paksha) == matches.values.tolist()
+    with pytest.raises(ValueError):
+        pancha_paksha.get_pancha_pakshi_day_schedules(6, 1, 1)
+
+
+def test_information_is_built_without_pandas(monkeypatch):
+    monkeypatch.setitem(sys.modules, "pandas", None)
+    dob, tob = BIRTHS[0]
+    headers, top_level_list, child_level_list, parent_level_labels = (
+        pancha_paksha.construct_pancha_pakshi_information(dob, tob, PLACE, nakshathra_bird_index=3)
+    )
+    assert len(headers) == 11
+    assert len(top_level_list) == len(child_level_list) == len(parent_level_labels) == 10
+    assert all(len(children) == 5 for children in child_level_list)
+
+
+def test_batch_schedules_match_information_timings():
+    jds = [utils.julian_day_number(dob, tob) for dob, tob in BIRTHS]
+    rows, starts_jd, ends_jd = pancha_paksha.get_pancha_pakshi_schedules(np.repeat(jds, 5), PLACE, np.tile(range(1, 6), 2))
+    assert rows.shape == (10, 2, 5, 5, pancha_paksha._LAST_COL_FOR_READING + 1)
+    assert np.array_equal(starts_jd[:, :, :, 1:], ends_jd[:, :, :, :-1])
+    for index, ((dob, tob), bird) in enumerate(itertools.product(BIRTHS, range(1, 6))):
+        child_level_list = pancha_paksha.construct_pancha_pakshi_information(dob, tob, PLACE, bird)[2]
+        for yama, children in enumerate(child_level_list):
+            for sub, child in enumerate(children):
+                year, month, day, hours = utils.jd_to_gregorian(starts_jd[index].reshape(-1, 5)[yama, sub])
+                start = f"{year}-{month:02d}-{day:02d} " + utils.to_dms(hours, use_24hour_format=True)
+                assert child[0][1] == start
+        assert np.all(rows[index, ..., pancha_paksha._NAK_BIRD_INDEX] == bird - 1)
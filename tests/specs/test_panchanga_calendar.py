@@ -0,0 +1,129 @@
+from datetime import date
+
+import pytest
+from jhora import utils
+from jhora.panchanga import drik
+
+from refraction_engine import lunations
+from refraction_engine.ephemeris import sidereal_positions
+from refraction_engine.panchanga_calendar import (
+    CalendarLocation,
+    build_panchanga_calendar,
+    build_panchanga_calendars,
+    compute_calendar_days,
+    panchanga_transitions,
+    run_panchanga_calendar,
+)
+
+CHENNAI = CalendarLocation(13.0827, 80.2707, "Asia/Kolkata", "Chennai")
+PLACE = drik.Place("Chennai", 13.0827, 80.2707, 5.5)
+START, END = date(2024, 3, 1), date(2024, 3, 14)
+
+
+@pytest.fixture(scope="module")
+def days():
+    return compute_calendar_days(START, END, CHENNAI)
+
+
+@pytest.fixture(scope="module")
+def transitions(days):
+    return panchanga_transitions(days)
+
+
+def test_sunrise_sunset_match_pyjhora(days):
+    assert len(days) == 14
+    assert (days.next_sunrise_jd_utc[:-1] == days.sunrise_jd_utc[1:]).all()
+    for row, day in enumerate(days.dates):
+        jd = utils.julian_day_number((day.year, day.month, day.day), (0, 0, 0))
+        local_zero = jd - 5.5 / 24.0
+        assert days.sunrise_jd_utc[row] == pytest.approx(
+            local_zero + drik.sunrise(jd, PLACE)[0] / 24.0, abs=1e-9
+        )
+        assert days.sunset_jd_utc[row] == pytest.approx(
+            local_zero + drik.sunset(jd, PLACE)[0] / 24.0, abs=1e-9
+        )
+        assert days.weekday[row] == drik.vaara(jd)
+
+
+def test_elements_at_sunrise_match_pyjhora(days, transitions):
+    positions, _ = sidereal_positions(days.sunrise_jd_utc, ["SUN", "MOON"])
+    phase = (positions[:, 1] - positions[:, 0]) % 360
+    for row, day in enumerate(days.dates):
+        jd = utils.julian_day_number((day.year, day.month, day.day), (6, 0, 0))
+        # PyJHora interpolates end times; skip elements changing right at sunrise.
+        if min(phase[row] % 12, 12 - phase[row] % 12) > 0.2:
+            assert transitions["tithi"][row][0][0] == drik.tithi(jd, PLACE)[0]
+        moon = positions[row, 1] % (360 / 27)
+        if min(moon, 360 / 27 - moon) > 0.2:
+            assert transitions["nakshatra"][row][0][0] == drik.nakshatra(jd, PLACE)[0]
+
+
+def test_transition_ends_are_exact(days, transitions):
+    for element, span in (("tithi", 12.0), ("nakshatra", 360 / 27), ("yoga", 360 / 27)):
+        for row, spans in enumerate(transitions[element]):
+            ends = [end for _, end in spans if end is not None]
+            assert ends == sorted(ends)
+            assert all(days.sunrise_jd_utc[row] < end < days.next_sunrise_jd_utc[row] for end in ends)
+            assert spans[-1][1] is None
+            for end in ends:
+                ((sun, moon),), _ = sidereal_positions([end], ["SUN", "MOON"])
+                angle = {"tithi": moon - sun, "nakshatra": moon, "yoga": moon + sun}[element] % 360
+                assert min(angle % span, span - angle % span) < 1e-4
+
+
+def test_entries_and_trikalam(days):
+    entries = build_panchanga_calendar(CHENNAI, START, END, chunk_days=5)
+    assert list(entries) == [day.isoformat() for day in days.dates]
+    entry = entries["2024-03-05"]
+    assert entry["vaara"]["name"] == "TUESDAY"
+    jd = utils.julian_day_number((2024, 3, 5), (0, 0, 0))
+    rahu = drik.raahu_kaalam(jd, PLACE)
+    window = entry["inauspicious_windows"][0]
+    assert window["tag"] == "RAHU_KALAM"
+    assert window["start"][11:16] == rahu[0][:5]
+    assert len(entry["karana"]) >= 2
+
+
+def test_process_pool_matches_serial():
+    serial = build_panchanga_calendars([CHENNAI], START, END, chunk_days=4)
+    pooled = build_panchanga_calendars([CHENNAI], START, END, workers=2, chunk_days=4)
+    assert pooled == serial
+
+
+def test_run_panchanga_calendar_payload():
+    report = run_panchanga_calendar(
+        {
+            "calendar": {
+                "start_date": "2024-03-01",
+                "end_date": "2024-03-03",
+                "timezone_name": "Asia/Kolkata",
+                "locations": [
+                    {"latitude": 13.0827, "longitude": 80.2707, "place_name": "Chennai"},
+                    {"latitude": 28.6139, "longitude": 77.209, "place_name": "Delhi"},
+                ],
+            }
+        }
+    )
+    assert [len(item["days"]) for item in report["calendars"]] == [3, 3]
+    with pytest.raises(ValueError):
+        run_panchanga_calendar({"calendar": {"start_date": "2024-03-01"}})
+
+
+def test_lunar_months_agree_with_the_lunation_catalog():
+    # Spans the adhika Shravana of 2023.
+    calendar = build_panchanga_calendar(CHENNAI, date(2023, 7, 10), date(2023, 8, 25), chunk_days=20)
+    assert any(entry["lunar_month"]["adhika"] for entry in calendar.values())
+    previous = None
+    for iso, entry in calendar.items():
+        day = date.fromisoformat(iso)
+        jd = utils.julian_day_number((day.year, day.month, day.day), (0, 0, 0))
+        month, adhika, nija = lunations.lunar_month(jd, PLACE)
+        _, _, samvatsara, _, _ = lunations.lunar_month_date(jd, PLACE)
+        assert (entry["lunar_month"]["index"], entry["lunar_month"]["adhika"]) == (month, adhika)
+        assert entry["lunar_month"]["nija"] == nija
+        assert entry["samvatsara"]["index"] == samvatsara
+        # drik compares the local sunrise with new moons in UT, so it can lag a
+        # day at the start of a lunation.
+        if previous == entry["lunar_month"]:
+            assert drik.lunar_month(jd, PLACE)[:2] == [month, adhika]
+        previous = entry["lunar_month"]
@@ -0,0 +1,82 @@
+import copy
+import threading
+
+import swisseph as swe
+
+from refraction_engine import ephemeris, profiling, run_core_chart, run_refraction_core
+from refraction_engine.result_cache import ResultCache
+
+from ._utils import load_json
+
+PAYLOAD = load_json("references/in/minimal_birth.json")
+
+
+def _profiled_payload():
+    payload = copy.deepcopy(PAYLOAD)
+    payload["config"]["profile"] = True
+    return payload
+
+
+def test_profile_is_off_by_default():
+    original = swe.calc_ut
+    result = run_core_chart(PAYLOAD)
+    assert "profile" not in result["meta"]
+    assert swe.calc_ut is original
+
+
+def test_payload_flag_adds_profile_with_call_counts():
+    original = swe.calc_ut
+    result = run_core_chart(_profiled_payload())
+    profile = result["meta"]["profile"]
+    assert profile["name"] == "core_chart"
+    assert profile["wall_s"] > 0 and profile["cpu_s"] >= 0
+    assert profile["calls"]["calc_ut"] > 0
+    assert set(profiling.COUNTED_SWE_FUNCTIONS) <= set(profile["calls"])
+    assert swe.calc_ut is original
+
+
+def test_bundle_profile_has_one_stage_per_extractor():
+    seen = []
+    hook = lambda name, profile: seen.append(name)
+    profiling.add_metrics_hook(hook)
+    try:
+        with profiling.profiling():
+            bundle = run_refraction_core(PAYLOAD)
+    finally:
+        profiling.remove_metrics_hook(hook)
+    profile = bundle["meta"]["profile"]
+    stages = [stage["name"] for stage in profile["stages"]]
+    assert stages[:3] == ["core_chart", "panchanga", "dashas_vimshottari"]
+    assert "yogas" in stages and seen[-1] == "refraction_core"
+    assert profile["calls"]["calc_ut"] >= sum(stage["calls"]["calc_ut"] for stage in profile["stages"])
+    assert bundle["frames"]["panchanga"]["meta"]["profile"]["name"] == "panchanga"
+
+
+def test_result_cache_hits_are_counted_and_not_stored():
+    cache = ResultCache()
+    cache.run("core_chart", PAYLOAD)
+    with profiling.profiling(), profiling.stage("request") as request:
+        result = cache.run("core_chart", PAYLOAD)
+    assert request["calls"]["result_cache_hits"] == 1
+    assert request["calls"]["calc_ut"] == 0
+    assert "profile" not in result["meta"]
+
+
+def test_profiles_count_only_their_own_thread():
+    original = swe.calc_ut
+    seen = {}
+
+    def worker():
+        with profiling.profiling(), profiling.stage("worker") as profile:
+            ephemeris.sidereal_positions([2451545.0] * 5, ["SUN", "MOON"])
+        seen["worker"] = profile["calls"]["calc_ut"]
+
+    with profiling.profiling(), profiling.stage("main") as main:
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        ephemeris.sidereal_positions([2451545.0], ["SUN"])
+        assert swe.calc_ut is original
+    assert main["calls"]["calc_ut"] == 1
+    assert seen["worker"] == 10
+    assert swe.calc_ut is original
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from jhora import utils
+from jhora.panchanga import drik
+
+from refraction_engine.rectification import (
+    intersect_intervals,
+    rectification_windows,
+    run_rectification,
+)
+
+PLACE = drik.Place("Chennai", 13.0827, 80.2707, 5.5)
+BIRTH_JD = utils.julian_day_number(drik.Date(2010, 12, 1), (23, 40, 0))
+
+
+@pytest.fixture(scope="module")
+def windows():
+    return rectification_windows(BIRTH_JD, PLACE, hours=3.0, gender=0)
+
+
+def _samples(windows, name, count, margin_days):
+    boundaries = windows.intervals[name].ravel()
+    for offset in np.linspace(-2.9 / 24.0, 2.9 / 24.0, count):
+        jd_utc = windows.birth_jd_utc + offset
+        if np.min(np.abs(boundaries - jd_utc)) > margin_days:
+            inside = np.any((windows.intervals[name][:, 0] <= jd_utc) & (jd_utc < windows.intervals[name][:, 1]))
+            yield jd_utc + PLACE.timezone / 24.0, bool(inside)
+
+
+def test_intervals_agree_with_drik_checks(windows):
+    # drik counts a second since sunrise as one tharparai instead of 2.5, which
+    # moves its vighati bands by up to ~35 seconds; stay clear of the edges.
+    for jd, inside in _samples(windows, "janma_suddhi", 40, 40.0 / 86400.0):
+        assert inside == (not drik._birthtime_rectification_janma_suddhi(jd, PLACE, 0))
+    for jd, inside in _samples(windows, "nakshatra_suddhi", 40, 60.0 / 86400.0):
+        assert inside == (drik._birthtime_rectification_nakshathra_suddhi(jd, PLACE) == 0)
+    for jd, inside in _samples(windows, "lagna_suddhi", 12, 30.0 / 86400.0):
+        assert inside == (not drik._birthtime_rectification_lagna_suddhi(jd, PLACE))
+
+
+def test_valid_is_intersection_and_nearest_lies_in_it(windows):
+    expected = intersect_intervals(
+        intersect_intervals(windows.intervals["nakshatra_suddhi"], windows.intervals["lagna_suddhi"]),
+        windows.intervals["janma_suddhi"],
+    )
+    assert np.allclose(windows.valid(), expected)
+    nearest = windows.nearest()
+    assert np.any((expected[:, 0] <= nearest) & (nearest < expected[:, 1]))
+    assert all(
+        abs(nearest - windows.birth_jd_utc) <= abs(edge - windows.birth_jd_utc) + 1e-9
+        for edge in expected.ravel()
+    )
+    # Nakshatra suddhi bands are one quarter ghati (6 minutes) in every nine,
+    # cut short only where the Moon changes nakshatra.
+    widths = np.diff(windows.intervals["nakshatra_suddhi"], axis=1) * 1440.0
+    assert np.all(widths <= 6.0 + 1e-4) and np.median(widths) == pytest.approx(6.0, abs=1e-4)
+
+
+def test_run_rectification():
+    result = run_rectification(
+        {
+            "rectification": {
+                "birth_datetime": "2010-12-01T23:40:00",
+                "timezone_name": "Asia/Kolkata",
+                "location": {"latitude": 13.0827, "longitude": 80.2707},
+                "hours": 1.0,
+                "gender": "male",
+            }
+        }
+    )
+    assert set(result["criteria"]) == {"nakshatra_suddhi", "lagna_suddhi", "janma_suddhi"}
+    assert result["valid"]
+    assert abs(result["nearest"]["adjustment_minutes"]) <= 60.0
+    with pytest.raises(ValueError):
+        rectification_windows(BIRTH_JD, PLACE, gender=2)
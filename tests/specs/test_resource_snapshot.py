@@ -0,0 +1,59 @@
+import json
+import pickle
+
+import pytest
+from jhora import const, utils
+
+from refraction_engine import resource_snapshot
+
+
+@pytest.fixture
+def snapshot(tmp_path, monkeypatch):
+    path = tmp_path / "resources.snapshot"
+    monkeypatch.setenv(resource_snapshot.SNAPSHOT_ENV_VAR, str(path))
+    resource_snapshot.build_snapshot(path)
+    yield path
+    resource_snapshot._load_snapshot.cache_clear()
+    resource_snapshot._section.cache_clear()
+    utils.set_language_resource_provider(resource_snapshot.language_resources)
+    utils.set_language("en")
+
+
+def test_snapshot_matches_sources(snapshot):
+    with resource_snapshot.CORE_PRIMITIVES_PATH.open() as f:
+        assert resource_snapshot.core_primitives(snapshot) == json.load(f)
+    for language in set(const.available_languages.values()):
+        list_file, message_file = resource_snapshot._language_files(language)
+        lists, messages = resource_snapshot.language_resources(language, snapshot)
+        assert lists == utils._parse_resource_lists(str(list_file))
+        assert messages == utils._read_resource_messages_from_file(str(message_file))
+
+
+def test_stale_or_foreign_snapshot_is_ignored(snapshot, tmp_path):
+    with snapshot.open("rb") as f:
+        document = pickle.load(f)
+    stale = dict(document, fingerprint={**document["fingerprint"], "primitives": (0, 0)})
+    foreign = dict(document, format_version=resource_snapshot.SNAPSHOT_FORMAT_VERSION + 1)
+    for name, variant in (("stale", stale), ("foreign", foreign)):
+        path = tmp_path / name
+        with path.open("wb") as f:
+            pickle.dump(variant, f)
+        assert resource_snapshot.core_primitives(path) is None
+        assert resource_snapshot.language_resources("en", path) is None
+    assert resource_snapshot.core_primitives(tmp_path / "missing") is None
+
+
+def test_language_switch_does_not_reparse(snapshot, monkeypatch):
+    utils.set_language("ta")
+    tamil_planets = list(utils.PLANET_NAMES)
+    utils.set_language("en")
+
+    def _fail(*_):
+        raise AssertionError("resource file parsed again")
+
+    monkeypatch.setattr(utils, "_parse_resource_lists", _fail)
+    monkeypatch.setattr(utils, "_read_resource_messages_from_file", _fail)
+    utils.set_language("ta")
+    assert utils.PLANET_NAMES == tamil_planets
+    utils.set_language("en")
+    assert utils.resource_strings == utils.language_resources("en")[1]
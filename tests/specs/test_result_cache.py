@@ -0,0 +1,137 @@
+import copy
+
+import pytest
+
+from refraction_engine import run_core_chart, run_refraction_core
+from refraction_engine.core_chart import CORE_SCHEMA_VERSION
+from refraction_engine.result_cache import (
+    MemoryBackend,
+    ResultCache,
+    SQLiteBackend,
+    cache_key,
+)
+
+from ._utils import load_json
+
+PAYLOAD = load_json("references/in/minimal_birth.json")
+
+
+def _without_timestamps(result):
+    result = copy.deepcopy(result)
+    result["meta"].pop("timestamp_utc")
+    return result
+
+
+def test_equivalent_payloads_share_a_key():
+    variant = copy.deepcopy(PAYLOAD)
+    variant["config"] = dict(reversed(list(variant["config"].items())))
+    variant["config"]["zodiac_type"] = variant["config"]["zodiac_type"].lower()
+    assert cache_key("core_chart", variant, "v1") == cache_key("core_chart", PAYLOAD, "v1")
+    assert cache_key("core_chart", PAYLOAD, "v2") != cache_key("core_chart", PAYLOAD, "v1")
+    assert cache_key("core_chart", PAYLOAD, "v1", version="next") != cache_key(
+        "core_chart", PAYLOAD, "v1"
+    )
+    moved = copy.deepcopy(PAYLOAD)
+    moved["birth"]["location"]["lat"] = float(moved["birth"]["location"]["lat"]) + 0.5
+    assert cache_key("core_chart", moved, "v1") != cache_key("core_chart", PAYLOAD, "v1")
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_cache_hits_return_fresh_timestamp_and_same_result(tmp_path, backend):
+    store = MemoryBackend() if backend == "memory" else SQLiteBackend(tmp_path / "cache.db")
+    cache = ResultCache(store)
+    first = cache.run("core_chart", PAYLOAD)
+    second = cache.run("core_chart", PAYLOAD)
+    assert _without_timestamps(first) == _without_timestamps(second)
+    assert second["meta"]["timestamp_utc"] >= first["meta"]["timestamp_utc"]
+    assert first["frames"] == run_core_chart(PAYLOAD)["frames"]
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
+
+
+def test_bundle_frames_are_restamped():
+    cache = ResultCache()
+    cache.run("refraction_core", PAYLOAD)
+    bundle = cache.run("refraction_core", PAYLOAD)
+    stamps = {bundle["meta"]["timestamp_utc"]}
+    stamps |= {frame["meta"]["timestamp_utc"] for frame in bundle["frames"].values()}
+    assert len(stamps) == 1
+
+
+def _stamps_blanked(value):
+    if isinstance(value, dict):
+        return {
+            key: None if key == "timestamp_utc" else _stamps_blanked(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_stamps_blanked(item) for item in value]
+    return value
+
+
+def test_cached_output_has_the_shape_of_fresh_output():
+    def runner(payload):
+        return {
+            "meta": {"schema_version": "unstamped_v1"},
+            "rows": [{"schema_version": "row_v1", "value": 1}],
+            "stamped": {"meta": {"schema_version": "x_v1", "timestamp_utc": "then"}},
+        }
+
+    cache = ResultCache()
+    fresh = runner(PAYLOAD)
+    missed = cache.run("core_chart", PAYLOAD, runner=runner)
+    hit = cache.run("core_chart", PAYLOAD, runner=runner)
+    assert _stamps_blanked(missed) == _stamps_blanked(hit) == _stamps_blanked(fresh)
+    assert "timestamp_utc" not in hit["meta"] and "timestamp_utc" not in hit["rows"][0]
+    assert hit["stamped"]["meta"]["timestamp_utc"] != "then"
+
+    cache.run("refraction_core", PAYLOAD)
+    bundle = cache.run("refraction_core", PAYLOAD)
+    assert _stamps_blanked(bundle) == _stamps_blanked(run_refraction_core(PAYLOAD))
+
+
+def test_runners_have_their_own_entries():
+    def runner(payload):
+        return {"meta": {"schema_version": "other_v1", "profile": {"calls": 1}}}
+
+    cache = ResultCache()
+    registered = cache.run("core_chart", PAYLOAD)
+    missed = cache.run("core_chart", PAYLOAD, runner=runner)
+    assert missed["meta"] == {"schema_version": "other_v1", "profile": {"calls": 1}}
+    assert cache.run("core_chart", PAYLOAD, runner=runner)["meta"] == {"schema_version": "other_v1"}
+    assert _without_timestamps(cache.run("core_chart", PAYLOAD)) == _without_timestamps(registered)
+    assert cache.key("core_chart", PAYLOAD) == cache_key("core_chart", PAYLOAD, CORE_SCHEMA_VERSION)
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.entries) == (2, 2, 2)
+
+
+def test_size_eviction_is_least_recently_used():
+    backend = MemoryBackend(max_bytes=25)
+    for key in "abc":
+        backend.put(key, b"x" * 10, "v")
+    assert backend.get("a") is None and backend.evictions == 1
+    backend.get("b")
+    backend.put("d", b"x" * 10, "v")
+    assert backend.get("b") is not None and backend.get("c") is None
+
+
+def test_sqlite_eviction_and_version_bump(tmp_path):
+    path = tmp_path / "cache.db"
+    backend = SQLiteBackend(path, max_bytes=25)
+    for key in "abc":
+        backend.put(key, b"x" * 10, "old")
+    assert backend.usage() == (2, 20) and backend.evictions == 1
+
+    cache = ResultCache(SQLiteBackend(path), version="old")
+    cache.run("core_chart", PAYLOAD)
+    assert ResultCache(SQLiteBackend(path), version="old").stats().entries == 3
+    bumped = ResultCache(SQLiteBackend(path), version="new")
+    assert bumped.stats().entries == 0
+    bumped.run("core_chart", PAYLOAD)
+    assert bumped.stats().misses == 1
+
+
+def test_unknown_extractor_raises():
+    with pytest.raises(ValueError):
+        ResultCache().run("gochara", PAYLOAD)
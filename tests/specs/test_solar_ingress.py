@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from jhora import utils
+from jhora.panchanga import drik
+
+from refraction_engine.ephemeris import sidereal_positions, year_start_jd
+from refraction_engine.solar_ingress import (
+    run_solar_ingress,
+    sankrantis,
+    solar_crossings,
+    solar_return_jd,
+    solar_returns,
+)
+
+PLACE = drik.Place("Chennai", 13.0827, 80.2707, 5.5)
+BIRTH_JD = utils.julian_day_number((1985, 7, 4), (10, 34, 0))
+BIRTH_JD_UTC = BIRTH_JD - 5.5 / 24.0
+
+
+def test_sankrantis_match_pyjhora():
+    table = sankrantis(year_start_jd(2024), year_start_jd(2025))
+    assert len(table) == 12
+    assert np.all(np.diff(table["jd_utc"]) > 0)
+    # PyJHora moves sankrantis after sunset to the next (Tamil) day; the first
+    # three of 2024 fall in daytime.
+    for row in table[:3]:
+        y, m, d, _ = drik.jd_to_gregorian(row["jd_utc"] - 1.0)
+        sank_date, sank_hours, _, _ = drik.next_sankranti_date(drik.Date(y, m, d), PLACE)
+        local = drik.jd_to_gregorian(row["jd_utc"] + 5.5 / 24.0)
+        assert tuple(sank_date) == local[:3]
+        assert local[3] == pytest.approx(sank_hours, abs=1.0 / 3600)
+
+
+def test_cached_sankrantis_match_direct_computation():
+    start, end = year_start_jd(1990) + 100.0, year_start_jd(2012) - 40.0
+    cached = sankrantis(start, end)
+    direct = solar_crossings(start, end)
+    assert np.allclose(cached["jd_utc"], direct["jd_utc"], atol=1e-6)
+    assert np.array_equal(cached["longitude"], direct["longitude"])
+
+
+def test_solar_returns_match_next_solar_date():
+    annual = solar_returns(BIRTH_JD_UTC, 60)
+    assert annual["step"].tolist() == list(range(1, 61))
+    longitudes, _ = sidereal_positions(annual["jd_utc"], ["SUN"])
+    birth, _ = sidereal_positions([BIRTH_JD_UTC], ["SUN"])
+    assert np.allclose(longitudes[:, 0], birth[0, 0], atol=1e-5)
+    monthly = solar_returns(BIRTH_JD_UTC, 24, "MONTHS")
+    for years, months, row in ((2, 1, annual[0]), (41, 1, annual[39]), (1, 7, monthly[5]), (2, 11, monthly[21])):
+        expected = drik.next_solar_date(BIRTH_JD, PLACE, years, months) - 5.5 / 24.0
+        assert row["jd_utc"] == pytest.approx(expected, abs=2e-5)
+        assert solar_return_jd(BIRTH_JD_UTC, years, months) == pytest.approx(expected, abs=2e-5)
+    expected = drik.next_solar_date(BIRTH_JD, PLACE, 3, 2, 7) - 5.5 / 24.0
+    assert solar_return_jd(BIRTH_JD_UTC, 3, 2, 7) == pytest.approx(expected, abs=2e-5)
+    assert solar_return_jd(BIRTH_JD_UTC) == BIRTH_JD_UTC
+
+
+def test_run_solar_ingress_payload():
+    report = run_solar_ingress(
+        {
+            "solar": {
+                "start_datetime": "2024-01-01T00:00:00",
+                "end_datetime": "2024-07-01T00:00:00",
+                "timezone_name": "Asia/Kolkata",
+                "birth_datetime": "1985-07-04T10:34:00",
+                "years": 3,
+            }
+        }
+    )
+    assert [entry["rasi"] for entry in report["sankrantis"]][:2] == ["CAPRICORN", "AQUARIUS"]
+    assert [entry["count"] for entry in report["returns"]["years"]] == [2, 3, 4]
+    with pytest.raises(ValueError):
+        run_solar_ingress({"solar": {"start_datetime": "2024-01-01T00:00:00"}})
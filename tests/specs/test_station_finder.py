@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+from jhora import const
+from jhora.panchanga import drik
+
+from refraction_engine.ephemeris import sidereal_position, year_start_jd
+from refraction_engine.stations import (
+    DIRECT,
+    RETROGRADE,
+    STATION_PLANETS,
+    compute_stations,
+    find_stations,
+    vakra_periods,
+)
+
+START = year_start_jd(2024)
+END = year_start_jd(2026)
+GREENWICH = drik.Place("Greenwich", 51.4769, 0.0, 0.0)
+PYJHORA_PLANETS = {"MARS": 2, "MERCURY": 3, "JUPITER": 4, "VENUS": 5, "SATURN": 6}
+
+
+@pytest.fixture(scope="module")
+def stations():
+    return compute_stations(START, END)
+
+
+def test_stations_have_zero_speed_and_alternate(stations):
+    assert (np.diff(stations["jd_utc"]) > 0).all()
+    for row in stations:
+        _, speed = sidereal_position(row["jd_utc"], STATION_PLANETS[row["planet"]])
+        assert abs(speed) < 1e-5
+    for index in range(len(STATION_PLANETS)):
+        directions = stations["direction"][stations["planet"] == index]
+        assert (directions[1:] != directions[:-1]).all()
+    mercury = stations[stations["planet"] == STATION_PLANETS.index("MERCURY")]
+    assert (mercury["direction"] == RETROGRADE).sum() >= 6
+
+
+def test_stations_match_pyjhora(stations):
+    for planet, index in PYJHORA_PLANETS.items():
+        first = stations[stations["planet"] == STATION_PLANETS.index(planet)][0]
+        jd, sign = drik.next_planet_retrograde_change_date(
+            index, drik.Date(2024, 1, 1), GREENWICH
+        )
+        assert jd == pytest.approx(first["jd_utc"], abs=2 * const.conjunction_increment + 1e-4)
+        assert sign == first["direction"]
+
+
+def test_cached_tables_match_direct_computation(stations):
+    cached = find_stations(START, END)
+    assert np.allclose(cached["jd_utc"], stations["jd_utc"], atol=1e-5)
+    assert (cached["planet"] == stations["planet"]).all()
+    saturn = find_stations(START, END, planets=["SATURN"])
+    assert set(saturn["planet"]) == {STATION_PLANETS.index("SATURN")}
+
+
+def test_vakra_periods(stations):
+    periods = vakra_periods(stations, START, END, "MERCURY")
+    assert periods[0]["start_station"] is None  # Mercury is retrograde on 2024-01-01
+    for period in periods[1:]:
+        assert period["jd_start"] < period["jd_end"]
+        _, speed = sidereal_position((period["jd_start"] + period["jd_end"]) / 2, "MERCURY")
+        assert speed < 0
+    jupiter = vakra_periods(stations[:0], START, START + 10, "JUPITER", initially_retrograde=False)
+    assert jupiter == []
+
+
+def test_bad_inputs():
+    with pytest.raises(ValueError):
+        compute_stations(START, START - 1)
+    with pytest.raises(ValueError):
+        compute_stations(START, END, planets=["SUN"])
+    assert DIRECT == -RETROGRADE
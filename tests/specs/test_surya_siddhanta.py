@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+from jhora import const, utils
+from jhora.panchanga import drik
+from jhora.panchanga import surya_sidhantha as scalar
+
+from refraction_engine import surya_siddhanta
+
+PLACE = drik.Place("Chennai", 13.0878, 80.2785, 5.5)
+JDS = 2415020.5 + np.random.default_rng(7).uniform(0.0, 73000.0, 40)
+
+
+@pytest.fixture(autouse=True)
+def _sidereal_planets(monkeypatch):
+    utils.set_language("en")
+    # The scalar chain indexes its tables by drik.planet_list.
+    monkeypatch.setattr(drik, "planet_list", list(surya_siddhanta.PLANETS))
+
+
+def test_positions_match_scalar_chain():
+    true = surya_siddhanta.true_longitudes(JDS, PLACE)
+    assert true.shape == (len(JDS), 9)
+    for jd, row in zip(JDS, true):
+        positions = scalar.planet_positions(jd, PLACE)[1:]
+        expected = np.array([rasi * 30 + degrees for _, (rasi, degrees) in positions])
+        assert np.allclose((row - expected + 180.0) % 360.0 - 180.0, 0.0, atol=1e-9)
+    assert np.array_equal(
+        surya_siddhanta.kali_ahargana(JDS), [scalar.kali_ahargana(jd) for jd in JDS]
+    )
+
+
+def test_panchanga_elements_match_scalar(monkeypatch, capsys):
+    # The scalar daily motion reads a module level ``place`` and prints.
+    monkeypatch.setattr(scalar, "place", PLACE, raising=False)
+    motions = surya_siddhanta.true_daily_motions(JDS, PLACE)
+    tithis, tithi_ends = surya_siddhanta.tithi(JDS, PLACE)
+    stars, padas, star_ends = surya_siddhanta.nakshatra(JDS, PLACE)
+    for row, jd in enumerate(JDS):
+        assert motions[row, 0] == pytest.approx(scalar._true_daily_motion_planet(jd, const._SUN), abs=1e-12)
+        assert motions[row, 1] == pytest.approx(scalar._true_daily_motion_planet(jd, const._MOON), abs=1e-12)
+        assert scalar.tithi(jd, PLACE)[0] == tithis[row]
+        assert scalar.nakshatra(jd, PLACE)[:2] == [stars[row], padas[row]]
+    capsys.readouterr()
+    assert np.all((tithi_ends > JDS) & (tithi_ends < JDS + 1.5))
+    assert np.all((star_ends > JDS) & (star_ends < JDS + 1.5))
+
+
+def test_solar_month_and_date_matches_scalar():
+    dates = [(1996, 12, 7), (2024, 1, 15), (2024, 4, 13), (2024, 4, 14), (1950, 8, 20)]
+    jds = [utils.julian_day_number(day, (10, 0, 0)) for day in dates]
+    months, days = surya_siddhanta.solar_month_and_date(jds, PLACE)
+    expected = [scalar.solar_month_and_date(drik.Date(*day), PLACE) for day in dates]
+    assert list(zip(months.tolist(), days.tolist())) == expected
@@ -0,0 +1,129 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+from jhora import utils
+from jhora.horoscope.chart import charts
+from jhora.panchanga import drik, vratha
+
+from refraction_engine import tithi_pravesha
+from refraction_engine.ephemeris import sidereal_positions
+from refraction_engine.tithi_pravesha import (
+    elongation_crossings,
+    run_tithi_pravesha,
+    tithi_pravesha_table,
+)
+
+PLACE = drik.Place("Chennai", 13.0827, 80.2707, 5.5)
+BIRTH_DATE, BIRTH_TIME = drik.Date(1985, 7, 4), (10, 34, 0)
+BIRTH_JD = utils.julian_day_number(BIRTH_DATE, BIRTH_TIME)
+YEARS = list(range(14, 30))
+
+
+@pytest.fixture(scope="module")
+def table():
+    return tithi_pravesha_table(BIRTH_JD, PLACE, YEARS)
+
+
+def _elongation(jd_utc):
+    longitudes, _ = sidereal_positions(jd_utc, ["SUN", "MOON"])
+    return (longitudes[:, 1] - longitudes[:, 0]) % 360.0
+
+
+def test_tithi_timeline_matches_drik_tithi():
+    start = utils.julian_day_number((2024, 3, 1), (0, 0, 0)) - PLACE.timezone / 24.0
+    timeline = elongation_crossings(start, start + 30.0)
+    assert 28 <= len(timeline) <= 31
+    offset = (_elongation(timeline["jd_utc"]) - timeline["longitude"] + 180.0) % 360.0 - 180.0
+    assert np.allclose(offset, 0.0, atol=1e-5)
+    for row in timeline[:5]:
+        after = row["jd_utc"] + PLACE.timezone / 24.0 + 0.01
+        assert drik.tithi(after, PLACE)[0] == int(round(row["longitude"] / 12.0)) % 30 + 1
+
+
+def test_praveshas_return_to_birth_tithi_and_month(table):
+    assert table.tithi == drik.tithi(BIRTH_JD, PLACE)[0]
+    assert set(YEARS) <= set(table.years.tolist())
+    assert np.allclose(_elongation(table.jd_utc), table.birth_elongation, atol=1e-5)
+    assert np.all(table.longitudes[:, 1] // 30.0 == table.birth_rasi)
+
+
+def test_praveshas_agree_with_vratha(table):
+    utils.set_language("en")
+    for years in YEARS[::3]:
+        expected = vratha.tithi_pravesha(BIRTH_DATE, BIRTH_TIME, PLACE, BIRTH_DATE[0] + years - 1)
+        date, hours = expected[0][0], expected[0][1]
+        jd_local = utils.julian_day_number(drik.Date(*date), (0, 0, 0)) + hours / 24.0
+        # vratha interpolates linearly within the tithi; the exact return differs by < 1.5 h.
+        assert table.jd_local[table.first(years)] == pytest.approx(jd_local, abs=1.5 / 24.0)
+
+
+@pytest.fixture
+def restore_ayanamsa():
+    mode, value = drik._ayanamsa_mode, drik._ayanamsa_value
+    yield
+    drik.set_ayanamsa_mode(mode, value)
+
+
+def test_rasi_chart_tithi_pravesha_reads_the_table(table, restore_ayanamsa):
+    tithi_pravesha._chart_block.cache_clear()
+    first = charts.rasi_chart(BIRTH_JD, PLACE, years=28, pravesha_type=2)
+    charts.divisional_chart(BIRTH_JD, PLACE, divisional_chart_factor=9, years=28, pravesha_type=2)
+    charts.rasi_chart(BIRTH_JD, PLACE, years=25, pravesha_type=2)
+    # Years 21-30 share one table.
+    assert tithi_pravesha._chart_block.cache_info().misses == 1
+    assert tithi_pravesha._chart_block.cache_info().hits == 2
+    assert charts.rasi_chart(BIRTH_JD, PLACE, years=28, pravesha_type=2) == first
+    row = table.first(28)
+    sun_sign, sun_longitude = first[1][1]
+    assert sun_sign * 30.0 + sun_longitude == pytest.approx(table.longitudes[row, 1], abs=1e-4)
+    assert charts._tithi_pravesha_jd(BIRTH_JD, tuple(PLACE), 28, "LAHIRI", None) == table.jd_local[row]
+
+
+def test_rasi_chart_tithi_pravesha_uses_the_callers_ayanamsa(restore_ayanamsa):
+    raman = tithi_pravesha_table(BIRTH_JD, PLACE, [28], ayanamsa_mode="RAMAN")
+    drik.set_ayanamsa_mode("KP")
+    chart = charts.rasi_chart(BIRTH_JD, PLACE, ayanamsa_mode="RAMAN", years=28, pravesha_type=2)
+    sun_sign, sun_longitude = chart[1][1]
+    assert sun_sign * 30.0 + sun_longitude == pytest.approx(raman.longitudes[raman.first(28), 1], abs=1e-4)
+
+
+def test_jhora_searches_vratha_without_the_engine_provider(restore_ayanamsa):
+    charts.set_tithi_pravesha_provider(None)
+    try:
+        jd_years = charts._tithi_pravesha_jd(BIRTH_JD, tuple(PLACE), 28, "LAHIRI", None)
+    finally:
+        charts.set_tithi_pravesha_provider(tithi_pravesha.chart_pravesha_jd)
+    utils.set_language("en")
+    expected = vratha.tithi_pravesha(BIRTH_DATE, BIRTH_TIME, PLACE, BIRTH_DATE[0] + 27)
+    date, hours = expected[0][0], expected[0][1]
+    assert jd_years == pytest.approx(
+        utils.julian_day_number(drik.Date(*date), tuple(utils.to_dms(hours, as_string=False))), abs=1e-9
+    )
+    # jhora does not depend on the engine.
+    code = "import sys, jhora.horoscope.chart.charts; assert 'refraction_engine' not in sys.modules"
+    source_root = str(Path(charts.__file__).resolve().parents[3])
+    subprocess.run(
+        [sys.executable, "-c", code], check=True, capture_output=True, env={**os.environ, "PYTHONPATH": source_root}
+    )
+
+
+def test_run_tithi_pravesha_payload():
+    result = run_tithi_pravesha(
+        {
+            "tithi_pravesha": {
+                "birth_datetime": "1985-07-04T10:34:00",
+                "timezone_name": "Asia/Kolkata",
+                "location": {"latitude": 13.0827, "longitude": 80.2707},
+                "years": [40, 41],
+            }
+        }
+    )
+    assert result["meta"]["schema_version"] == "tithi_pravesha_spec_v1"
+    assert [entry["years"] for entry in result["praveshas"]][:2] == [40, 41]
+    assert result["praveshas"][0]["datetime"].startswith("2024-")
+    with pytest.raises(ValueError):
+        run_tithi_pravesha({"tithi_pravesha": {"birth_datetime": "1985-07-04T10:34:00"}})
@@ -0,0 +1,98 @@
+import json
+
+import jsonschema
+import pytest
+
+from refraction_engine import validation
+
+from ._utils import load_json
+
+FIXTURES = [
+    "references/in/mehran_birth.json",
+    "references/in/athena_birth.json",
+    "references/in/minimal_birth.json",
+]
+
+
+def _write(directory, name, schema):
+    path = directory / f"{name}{validation.SCHEMA_SUFFIX}"
+    path.write_text(json.dumps(schema), encoding="utf-8")
+
+
+def test_compiled_validator_is_checked_once_and_matches_jsonschema(monkeypatch):
+    schema = load_json("docs/specs/core_input_spec_v1.schema.json")
+    broken = dict(load_json(FIXTURES[0]))
+    broken.pop("birth", None)
+    broken["config"] = "sidereal"
+    with pytest.raises(jsonschema.ValidationError) as excinfo:
+        jsonschema.validate(instance=broken, schema=schema)
+    registry = validation.SchemaRegistry(fast=False)
+    checks = []
+    check_schema = jsonschema.Draft7Validator.check_schema
+    monkeypatch.setattr(
+        jsonschema.Draft7Validator,
+        "check_schema",
+        classmethod(lambda cls, schema: checks.append(schema) or check_schema(schema)),
+    )
+    for fixture in FIXTURES:
+        assert registry.validate(load_json(fixture), "core_input_spec_v1") == []
+    assert registry.validate(broken, "core_input_spec_v1") == [str(excinfo.value)]
+    assert len(checks) == 1
+    assert registry.compiled("core_input_spec_v1") is registry.compiled("core_input_spec_v1")
+    assert registry.validate({}, "missing_spec_v1") == ["Schema not found: missing_spec_v1"]
+    assert validation.validate_input(load_json(FIXTURES[2]), "core_input_spec_v1") == []
+
+
+def test_refs_across_schema_files_resolve_ahead_of_time(tmp_path):
+    _write(
+        tmp_path,
+        "angle_v1",
+        {"$schema": "http://json-schema.org/draft-07/schema#", "type": "number", "minimum": 0, "maximum": 360},
+    )
+    _write(
+        tmp_path,
+        "point_v1",
+        {
+            "$schema": "http://json-schema.org/draft-07/schema#",
+            "type": "object",
+            "properties": {"longitude": {"$ref": "angle_v1.schema.json"}, "twin": {"$ref": "#/definitions/twin"}},
+            "definitions": {"twin": {"$ref": "angle_v1.schema.json"}},
+            "required": ["longitude"],
+        },
+    )
+    _write(tmp_path, "dangling_v1", {"properties": {"x": {"$ref": "#/definitions/nothing"}}})
+    _write(tmp_path, "invalid_v1", {"type": 12})
+
+    registry = validation.SchemaRegistry(tmp_path, fast=False)
+    assert registry.validate({"longitude": 12.5, "twin": 3}, "point_v1") == []
+    errors = registry.validate({"longitude": 400}, "point_v1")
+    assert len(errors) == 1 and "400 is greater than the maximum of 360" in errors[0]
+    assert registry.validate({"twin": -1}, "point_v1") != []
+    with pytest.raises(ValueError, match="Unresolvable"):
+        registry.compiled("dangling_v1")
+    with pytest.raises(jsonschema.SchemaError):
+        registry.compiled("invalid_v1")
+
+
+def test_batch_validation_reports_each_payload():
+    payloads = [load_json(fixture) for fixture in FIXTURES] + [{"birth": 1}]
+    for registry in (validation.SchemaRegistry(fast=False), validation.SchemaRegistry()):
+        errors = registry.validate_batch(payloads, "core_input_spec_v1")
+        assert [bool(entry) for entry in errors] == [False, False, False, True]
+        assert errors[-1] == registry.validate(payloads[-1], "core_input_spec_v1")
+    assert validation.validate_batch(payloads[:2], "missing_spec_v1") == [["Schema not found: missing_spec_v1"]] * 2
+
+
+def test_fast_path_accepts_valid_payloads_and_defers_failures_to_jsonschema(monkeypatch):
+    pytest.importorskip("fastjsonschema")
+    payloads = [load_json(fixture) for fixture in FIXTURES] + [{"birth": 1}]
+    reference = validation.SchemaRegistry(fast=False).validate_batch(payloads, "core_input_spec_v1")
+    compiled = validation.SchemaRegistry().compiled("core_input_spec_v1")
+    assert compiled.fast is not None
+    calls = []
+    cls = type(compiled.validator)
+    iter_errors = cls.iter_errors
+    monkeypatch.setattr(cls, "iter_errors", lambda self, payload: calls.append(payload) or iter_errors(self, payload))
+    assert [compiled.errors(payload) for payload in payloads] == reference
+    assert calls == payloads[-1:]
+    assert validation.SchemaRegistry(fast=False).compiled("core_input_spec_v1").fast is None
@@ -0,0 +1,130 @@
+import numpy as np
+import pytest
+from jhora import utils
+from jhora.horoscope.transit import saham, tajaka
+from jhora.panchanga import drik
+
+from refraction_engine.ephemeris import EPHEMERIS_BODIES
+from refraction_engine.varshaphal import (
+    ITHASALA_TYPES,
+    SAHAM_NAMES,
+    annual_chart_table,
+    compute_sahams,
+    run_varshaphal,
+)
+
+PLACE = drik.Place("Chennai", 13.0827, 80.2707, 5.5)
+BIRTH_JD = utils.julian_day_number((1985, 7, 4), (10, 34, 0))
+YEARS = [1, 2, 9, 17, 30, 46, 58]
+
+
+@pytest.fixture(scope="module")
+def table():
+    return annual_chart_table(BIRTH_JD, PLACE, YEARS)
+
+
+def _pyjhora_saham(name, chart, night):
+    function = getattr(saham, f"{name}_saham")
+    try:
+        return function(chart, night_time_birth=night) % 360
+    except TypeError:
+        return function(chart) % 360
+
+
+def test_annual_charts_match_varsha_pravesh(table):
+    assert len(table) == len(YEARS)
+    assert table.return_jd_local[0] == pytest.approx(BIRTH_JD)
+    for row, years in enumerate(YEARS):
+        chart, _ = tajaka.varsha_pravesh(BIRTH_JD, PLACE, years=years)
+        assert table.return_jd_local[row] == pytest.approx(
+            drik.next_solar_date(BIRTH_JD, PLACE, years=years), abs=2e-5
+        )
+        for (label, (sign, degrees)), (own_label, (own_sign, own_degrees)) in zip(
+            chart, table.planet_positions(row)
+        ):
+            assert (label, sign) == (own_label, own_sign)
+            assert degrees == pytest.approx(own_degrees, abs=1e-4)
+        assert table.muntha[row] == tajaka.muntha_house(chart[0][1][0], years)
+
+
+@pytest.mark.parametrize("night", [False, True])
+def test_sahams_match_pyjhora(table, night):
+    values = compute_sahams(table.longitudes, night)
+    assert values.shape == (len(YEARS), len(SAHAM_NAMES))
+    for row in range(len(YEARS)):
+        chart = table.planet_positions(row)
+        expected = [_pyjhora_saham(name, chart, night) for name in SAHAM_NAMES]
+        assert np.allclose(values[row], expected, atol=1e-6)
+
+
+def test_table_sahams_use_return_day_or_night(table):
+    assert np.allclose(
+        table.sahams[table.night], compute_sahams(table.longitudes[table.night], True)
+    )
+    assert np.allclose(
+        table.sahams[~table.night], compute_sahams(table.longitudes[~table.night], False)
+    )
+    with pytest.raises(ValueError):
+        annual_chart_table(BIRTH_JD, PLACE, [-1, 3])
+
+
+def test_years_zero_is_the_return_before_birth():
+    table = annual_chart_table(BIRTH_JD, PLACE, [0, 1])
+    assert table.return_jd_local[0] == pytest.approx(
+        drik.next_solar_date(BIRTH_JD, PLACE, years=0), abs=2e-5
+    )
+    assert table.return_jd_local[1] == pytest.approx(BIRTH_JD)
+
+
+def test_aspects_and_ithasala_match_tajaka(table):
+    for row in range(len(YEARS)):
+        chart = table.planet_positions(row)
+        house_planets = utils.get_house_planet_list_from_planet_positions(chart)
+        for planet in range(7):
+            benefic, _ = tajaka.benefic_aspects_of_the_planet(house_planets, planet)
+            malefic, _ = tajaka.malefic_aspects_of_the_planet(house_planets, planet)
+            assert table.benefic_aspects[row, planet].tolist() == benefic
+            assert table.malefic_aspects[row, planet].tolist() == malefic
+            for other in range(7):
+                if other == planet:
+                    continue
+                match, kind = tajaka.both_planets_within_their_deeptamsa(chart, planet, other)
+                assert table.ithasala[row, planet, other] == (kind if match else 0)
+    assert set(np.unique(table.ithasala)) <= {0, *ITHASALA_TYPES}
+
+
+def test_year_lords_match_lord_of_the_year(monkeypatch):
+    # set_sideral_planets (used by the core chart runners) adds Uranus..Pluto to
+    # PyJHora charts, whose ids then match the Moon's in its string aspect lookups.
+    monkeypatch.setattr(drik, "planet_list", drik.planet_list[:9])
+    years = list(range(0, 40))
+    table = annual_chart_table(BIRTH_JD, PLACE, years)
+    compared = 0
+    for row, years_from_dob in enumerate(years):
+        try:
+            expected = tajaka.lord_of_the_year(BIRTH_JD, PLACE, years_from_dob)
+        except KeyError:  # a Rahu/Ketu candidate reached the pancha vargeeya bala
+            assert 0 <= table.lords[row] < 7
+            continue
+        assert table.lords[row] == expected
+        compared += 1
+    assert compared > len(years) // 2
+
+
+def test_run_varshaphal_payload():
+    report = run_varshaphal(
+        {
+            "varshaphal": {
+                "birth_datetime": "1985-07-04T10:34:00",
+                "timezone_name": "Asia/Kolkata",
+                "location": {"latitude": 13.0827, "longitude": 80.2707},
+                "count": 3,
+            }
+        }
+    )
+    assert [entry["years"] for entry in report["years"]] == [1, 2, 3]
+    assert set(report["years"][1]["sahams"]) == set(SAHAM_NAMES)
+    assert report["years"][0]["planets"]["SUN"]["sign"] == "GEMINI"
+    assert {entry["year_lord"] for entry in report["years"]} <= set(EPHEMERIS_BODIES)
+    with pytest.raises(ValueError):
+        run_varshaphal({"varshaphal": {"birth_datetime": "1985-07-04T10:34:00"}})